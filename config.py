@@ -59,9 +59,15 @@ ODDS_MARKETS = "player_pass_tds"  # QB passing TD props (requires paid tier)
 ODDS_MARKETS_FALLBACK = "h2h"  # Fallback to game lines if paid key not available
 ODDS_BOOKMAKERS = "draftkings,fanduel"  # Primary sportsbooks
 
+# Concurrent per-event player prop fetching
+ODDS_MAX_CONCURRENCY = 4        # Parallel /events/{id}/odds requests
+ODDS_REQUESTS_PER_SECOND = 5.0  # Token bucket rate shared by all requests
+ODDS_MAX_RETRIES = 3            # Retries on 429/5xx with jittered backoff
+
 # API Request Limits
 FREE_TIER_MAX_REQUESTS = 500    # 500 requests per month per free key
 PAID_TIER_MAX_REQUESTS = 20000  # 20K requests per month for paid tier
+PAID_KEY_RESERVE = 2000         # Paid credits kept for player props (not used as free-tier fallback)
 
 # Current NFL season
 CURRENT_YEAR = 2025
@@ -75,9 +81,8 @@ def get_current_week() -> int:
     Returns:
         Current NFL week number
     """
-    from utils.week_manager import WeekManager
-    wm = WeekManager()
-    return wm.get_current_week()
+    from utils.week_manager import get_week_manager
+    return get_week_manager().get_current_week()
 
 # Database Configuration
 DATABASE_PATH = DATABASE_DIR / "nfl_betting.db"
@@ -93,10 +98,43 @@ USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36
 REQUEST_TIMEOUT = 30  # seconds
 REQUEST_DELAY = 2  # seconds between requests to be polite
 
+# Record/replay HTTP cache for scrapers: "live" (default), "record" or "replay"
+HTTP_CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "live")
+HTTP_CACHE_DIR = BASE_DIR / "data" / "http_cache"
+
+# Shared HTTP client - keep-alive pooling, gzip, retries and conditional GETs
+HTTP_POOL_MAXSIZE = 10        # keep-alive connections kept per host
+HTTP_MAX_RETRIES = 2          # retries on 429/5xx and connection errors
+HTTP_RETRY_BASE_DELAY = 1.0   # seconds, full-jitter exponential backoff
+HTTP_CONDITIONAL_HOSTS = ("www.pro-football-reference.com",)  # hosts revalidated with ETag / Last-Modified
+HTTP_VALIDATORS_PATH = HTTP_CACHE_DIR / "validators.json"
+
+# Pipeline settings - independent scrape stages run concurrently
+PIPELINE_MAX_WORKERS = 4
+PIPELINE_HOST_CONCURRENCY = 1  # stages allowed to hit the same host at once
+
+# Edge API settings - strategies run concurrently, each with its own deadline
+STRATEGY_MAX_WORKERS = 3
+STRATEGY_TIMEOUT = float(os.getenv("STRATEGY_TIMEOUT", 10))  # seconds per strategy
+
+# Model calibration - bootstrap confidence intervals for Brier / calibration error / ROI
+CALIBRATION_BOOTSTRAP_RESAMPLES = 1000
+CALIBRATION_CONFIDENCE_LEVEL = 0.95
+CALIBRATION_MAX_WORKERS = 4          # processes used for the resamples
+CALIBRATION_PARALLEL_MIN_WORK = 2_000_000  # resamples x predictions below which resampling stays in-process
+
 # Schedule settings - Daily scraping Monday through Saturday
 SCRAPE_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
 SCRAPE_TIME = "09:00"  # 9am - Full scrape (stats + matchups + odds)
-ODDS_SCRAPE_TIME = "15:00"  # 3pm - Odds-only scrape (line movement tracking)
+ODDS_SCRAPE_TIME = "15:00"  # 3pm - Legacy fixed odds run (scheduler_odds.py now polls adaptively)
+SCHEDULER_MAX_JOBS = 2  # scheduled jobs running at once in the scheduler process
+SCHEDULER_JOB_TIMEOUT = 600  # seconds before a scheduled job is recorded as timed out
+
+# Adaptive odds polling (scheduler_odds.py) - poll each game more often as kickoff nears
+# (hours before kickoff, minutes between polls); the first tier that covers a game wins
+ODDS_POLL_TIERS = [(2, 10), (6, 20), (24, 60), (72, 180)]
+ODDS_EVENTS_REFRESH_MINUTES = 60  # re-read the events list (commence times) this often
+ODDS_POLL_MAX_SLEEP_MINUTES = 15  # longest the poller sleeps between checks
 
 # File naming templates
 DEFENSE_FILE_TEMPLATE = "defense_stats_week_{week}.csv"
@@ -11,11 +11,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.db_manager import DatabaseManager
 from utils.query_tools import DatabaseQueryTools
 from utils.edge_calculator import EdgeCalculator
-from utils.week_manager import WeekManager
+from utils.week_manager import get_week_manager
 from utils.data_validator import DataValidator
 from utils.data_quality_validator import DataQualityValidator
-from utils.strategy_aggregator import StrategyAggregator
-from config import get_current_week
+from utils.strategy_aggregator import Strategy, StrategyAggregator
+from config import get_current_week, STRATEGY_MAX_WORKERS, STRATEGY_TIMEOUT
 import importlib.util
 import logging
 
@@ -29,8 +29,11 @@ CORS(app)
 
 # Initialize components
 db = DatabaseManager()
-week_manager = WeekManager()
-strategy_aggregator = StrategyAggregator()  # NEW: Multi-strategy edge aggregator
+week_manager = get_week_manager()
+strategy_aggregator = StrategyAggregator(  # NEW: Multi-strategy edge aggregator
+    max_workers=STRATEGY_MAX_WORKERS,
+    strategy_timeout=STRATEGY_TIMEOUT
+)
 
 @app.route('/')
 def index():
@@ -59,7 +62,9 @@ def api_edges():
         model (str): 'v1' or 'v2' (deprecated, use strategy='qb_td_v1' or 'qb_td_v2')
 
     Returns:
-        JSON with edges, count, metadata
+        JSON with edges, count, metadata. strategy_status reports each strategy's
+        status ('ok', 'timeout' or 'error') and elapsed_ms; partial is true when
+        any strategy failed or missed its deadline.
     """
     try:
         # Get parameters
@@ -83,18 +88,19 @@ def api_edges():
             return jsonify({'error': 'Invalid week. Must be 1-18.'}), 400
 
         # Validate strategy
-        valid_strategies = ['all', 'first_half', 'qb_td_v1', 'qb_td_v2', 'kicker']
+        valid_strategies = ['all'] + [s.value for s in Strategy]
         if strategy not in valid_strategies:
             return jsonify({'error': f'Invalid strategy. Must be one of: {valid_strategies}'}), 400
 
         # Get edges using aggregator
         logger.info(f"Fetching edges: week={week}, strategy={strategy}, min_edge={min_edge}")
-        edges = strategy_aggregator.get_all_edges(
+        report = strategy_aggregator.get_edges_report(
             week=week,
             season=season,
             min_edge=min_edge,
             strategy=strategy if strategy != 'all' else None
         )
+        edges = report['edges']
 
         # Group edges by strategy for response metadata
         strategy_breakdown = {}
@@ -110,6 +116,10 @@ def api_edges():
             'strategy_filter': strategy,
             'min_edge': min_edge,
             'strategy_breakdown': strategy_breakdown,
+            'strategy_status': report['strategies'],
+            'partial': report['partial'],
+            'elapsed_ms': report['elapsed_ms'],
+            'cached': report['cached'],
             'success': True
         })
 
@@ -161,6 +171,19 @@ def api_edge_counts():
             'success': False
         }), 500
 
+@app.route('/api/edges/cache-stats', methods=['GET'])
+def api_edge_cache_stats():
+    """
+    Get result cache statistics for the edges endpoints.
+
+    Returns:
+        JSON: {"cache": {"enabled": true, "hits": 42, "misses": 3, ...}, "success": true}
+    """
+    return jsonify({
+        'cache': strategy_aggregator.get_cache_stats(),
+        'success': True
+    })
+
 @app.route('/api/week-range')
 def api_week_range():
     """Get available week range for filters"""
@@ -193,9 +216,8 @@ def api_weak_defenses():
 @app.route('/api/stats/summary')
 def api_stats_summary():
     """Get database statistics summary"""
-    db.connect()
+    # Reads go through this thread's pooled read-only connection
     stats = db.get_database_stats()
-    db.close()
 
     # Transform nested structure to flat structure expected by frontend
     flat_stats = {
@@ -239,12 +261,9 @@ def data_quality_page():
 def api_data_quality():
     """Get comprehensive data quality metrics for monitoring dashboard"""
     try:
-        import sqlite3
         from datetime import datetime
 
-        db.connect()
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
+        cursor = db.get_read_connection().cursor()
 
         # Query qb_stats_enhanced completeness
         cursor.execute("SELECT COUNT(*) FROM qb_stats_enhanced")
@@ -278,9 +297,6 @@ def api_data_quality():
         qb_name_populated = cursor.fetchone()[0]
         qb_name_percentage = (qb_name_populated / total_plays * 100) if total_plays > 0 else 0
 
-        conn.close()
-        db.close()
-
         # Calculate overall health score
         completeness_scores = [m['percentage'] for m in qb_stats_metrics.values()]
         completeness_scores.append(qb_name_percentage)
@@ -6,17 +6,33 @@ Runs all scrapers and handles data collection workflow
 import argparse
 import logging
 import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+from urllib.parse import urlsplit
 
 from scrapers.defense_stats_scraper import DefenseStatsScraper
 from scrapers.qb_stats_scraper import QBStatsScraper
 from scrapers.matchups_scraper import MatchupsScraper
+from scrapers.matchups_scraper_api import MatchupsScraperAPI
 from scrapers.odds_scraper import OddsScraper
-from config import LOG_LEVEL, LOG_FORMAT, DATA_DIR
+from config import (
+    LOG_LEVEL,
+    LOG_FORMAT,
+    DATA_DIR,
+    PFR_BASE_URL,
+    ODDS_API_BASE_URL,
+    PIPELINE_MAX_WORKERS,
+    PIPELINE_HOST_CONCURRENCY
+)
 from utils.db_manager import DatabaseManager
 from utils.historical_storage import HistoricalStorage
 from utils.data_validator import DataValidator
+from utils.http_cache import CacheMode, configure_http_cache
+from utils.http_client import get_http_client
 
 
 # Configure logging
@@ -31,11 +47,105 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Hosts each scrape stage talks to (stages sharing a host are rate limited together)
+PFR_HOST = urlsplit(PFR_BASE_URL).netloc
+ESPN_HOST = urlsplit(MatchupsScraperAPI.BASE_URL).netloc
+ODDS_API_HOST = urlsplit(ODDS_API_BASE_URL).netloc
+
+
+class PipelineStage:
+    """One node of the pipeline DAG"""
+
+    def __init__(self, name: str, run: Callable[[], bool], host: str, depends_on: Sequence[str] = ()):
+        """
+        Args:
+            name: Stage name (key in the stage timings)
+            run: Callable returning True on success
+            host: Remote host the stage scrapes (for per-host politeness limits)
+            depends_on: Names of stages that must succeed first
+        """
+        self.name = name
+        self.run = run
+        self.host = host
+        self.depends_on = tuple(depends_on)
+
+
+def run_stage_dag(stages: List[PipelineStage], max_workers: int = PIPELINE_MAX_WORKERS,
+                  host_concurrency: int = PIPELINE_HOST_CONCURRENCY) -> Dict[str, Dict]:
+    """
+    Run pipeline stages concurrently, respecting dependencies and per-host limits
+
+    A stage starts once all its dependencies have succeeded and fewer than
+    host_concurrency stages are running against its host. Ready stages start
+    in list order. Stages whose dependencies failed are skipped.
+
+    Args:
+        stages: Stages in dependency order (dependencies listed first)
+        max_workers: Stages running at once (1 = strictly sequential)
+        host_concurrency: Stages allowed to run against the same host at once
+
+    Returns:
+        Dict of stage name -> {'status': 'success' | 'failed' | 'skipped', 'elapsed_seconds'}
+
+    Raises:
+        ValueError: If a stage depends on an unknown or later stage
+    """
+    seen = set()
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in seen]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown or later stage(s): {missing}")
+        seen.add(stage.name)
+
+    def execute(stage):
+        start = time.perf_counter()
+        try:
+            ok = bool(stage.run())
+        except Exception as e:
+            logger.error(f"✗ Stage {stage.name} raised: {e}")
+            ok = False
+        return {
+            'status': 'success' if ok else 'failed',
+            'elapsed_seconds': round(time.perf_counter() - start, 3)
+        }
+
+    results = {}
+    pending = list(stages)
+    running = {}
+    busy_hosts = Counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="pipeline") as executor:
+        while pending or running:
+            for stage in list(pending):
+                statuses = [results.get(dep, {}).get('status') for dep in stage.depends_on]
+                if any(status in ('failed', 'skipped') for status in statuses):
+                    logger.warning(f"⚠️  Skipping {stage.name}: a dependency failed")
+                    results[stage.name] = {'status': 'skipped', 'elapsed_seconds': 0.0}
+                    pending.remove(stage)
+                elif (all(status == 'success' for status in statuses)
+                      and len(running) < max(1, max_workers)
+                      and busy_hosts[stage.host] < host_concurrency):
+                    busy_hosts[stage.host] += 1
+                    running[executor.submit(execute, stage)] = stage
+                    pending.remove(stage)
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                busy_hosts[stage.host] -= 1
+                results[stage.name] = future.result()
+
+    return results
+
 
 class DataPipeline:
     """Main data collection pipeline orchestrator"""
 
-    def __init__(self, week: int, year: int = 2025, save_to_db: bool = False, save_snapshots: bool = False):
+    def __init__(self, week: int, year: int = 2025, save_to_db: bool = False, save_snapshots: bool = False,
+                 write_csv: bool = True, interactive: bool = True):
         """
         Initialize the data pipeline
 
@@ -44,11 +154,17 @@ class DataPipeline:
             year: NFL season year
             save_to_db: Whether to save data to database
             save_snapshots: Whether to save historical snapshots
+            write_csv: Whether to write odds CSV files when saving to the database
+                       (always written without save_to_db or with save_snapshots)
+            interactive: Ask before overwriting a week that already has data; when
+                         False (scheduled runs) the week is refreshed without prompting
         """
         self.week = week
         self.year = year
         self.save_to_db = save_to_db
         self.save_snapshots = save_snapshots
+        self.write_csv = write_csv
+        self.interactive = interactive
         self.results = {
             'defense_stats': None,
             'qb_stats': None,
@@ -59,6 +175,8 @@ class DataPipeline:
         # Initialize database and historical storage if needed
         self.db_manager = None
         self.historical_storage = None
+        # Single thread that performs every database write while stages run concurrently
+        self._db_writer = None
         
         if self.save_to_db:
             self.db_manager = DatabaseManager()
@@ -86,10 +204,12 @@ class DataPipeline:
                 self.results['defense_stats'] = result
                 logger.info(f"✓ Defense stats saved: {result}")
                 
-                # Save to database if enabled
-                if self.save_to_db and self.db_manager:
+                # Save to database if enabled (an unchanged page that is already stored is skipped)
+                if scraper.unchanged and self._already_stored('defense_stats', 'week', self.week):
+                    logger.info("✓ Defense stats unchanged, database rows left as they are")
+                elif self.save_to_db and self.db_manager:
                     try:
-                        rows_inserted = self.db_manager.insert_from_csv('defense_stats', result, week=self.week)
+                        rows_inserted = self._db_write(self.db_manager.insert_from_csv, 'defense_stats', result, week=self.week)
                         logger.info(f"✓ Saved {rows_inserted} defense stats to database")
                     except Exception as e:
                         logger.error(f"✗ Error saving defense stats to database: {e}")
@@ -131,10 +251,12 @@ class DataPipeline:
                 self.results['qb_stats'] = result
                 logger.info(f"✓ QB stats saved: {result}")
                 
-                # Save to database if enabled
-                if self.save_to_db and self.db_manager:
+                # Save to database if enabled (an unchanged page that is already stored is skipped)
+                if scraper.unchanged and self._already_stored('qb_stats', 'year', self.year):
+                    logger.info("✓ QB stats unchanged, database rows left as they are")
+                elif self.save_to_db and self.db_manager:
                     try:
-                        rows_inserted = self.db_manager.insert_from_csv('qb_stats', result, year=self.year)
+                        rows_inserted = self._db_write(self.db_manager.insert_from_csv, 'qb_stats', result, year=self.year)
                         logger.info(f"✓ Saved {rows_inserted} QB stats to database")
                     except Exception as e:
                         logger.error(f"✗ Error saving QB stats to database: {e}")
@@ -157,6 +279,30 @@ class DataPipeline:
             logger.error(f"✗ Error in QB stats scraper: {e}")
             return False
 
+    def _already_stored(self, table: str, column: str, value) -> bool:
+        """
+        Check if a table already has rows for a week / season
+
+        Args:
+            table: Table name
+            column: Column to match ('week' or 'year')
+            value: Value to match
+
+        Returns:
+            True if saving to the database and matching rows exist, False otherwise
+        """
+        if not (self.save_to_db and self.db_manager):
+            return False
+
+        try:
+            cursor = self.db_manager.get_read_connection().execute(
+                f"SELECT 1 FROM {table} WHERE {column} = ? LIMIT 1", (value,)
+            )
+            return cursor.fetchone() is not None
+        except Exception as e:
+            logger.warning(f"Could not check existing {table} rows: {e}")
+            return False
+
     def _matchups_already_exist(self, week: int) -> bool:
         """
         Check if matchups for a week already exist in database
@@ -213,7 +359,7 @@ class DataPipeline:
                 # Save to database if enabled
                 if self.save_to_db and self.db_manager:
                     try:
-                        rows_inserted = self.db_manager.insert_from_csv('matchups', result, week=self.week)
+                        rows_inserted = self._db_write(self.db_manager.insert_from_csv, 'matchups', result, week=self.week)
                         logger.info(f"✓ Saved {rows_inserted} matchups to database")
                     except Exception as e:
                         logger.error(f"✗ Error saving matchups to database: {e}")
@@ -254,7 +400,10 @@ class DataPipeline:
             status = scraper.get_usage_report()
             logger.info(f"API Keys: {status['total_keys']} | Remaining requests: {status['remaining_requests']}")
 
-            result = scraper.run(week=self.week)
+            if self.save_to_db and self.db_manager:
+                result = self._ingest_odds(scraper)
+            else:
+                result = scraper.run(week=self.week)
 
             if result:
                 # Result is now a dictionary with market names and file paths
@@ -262,24 +411,7 @@ class DataPipeline:
                 logger.info(f"✓ Odds saved:")
                 for market, path in result.items():
                     logger.info(f"  - {market}: {path}")
-                
-                # Save to database if enabled
-                if self.save_to_db and self.db_manager:
-                    try:
-                        # Save each market to appropriate table
-                        for market, path in result.items():
-                            if market == 'spreads':
-                                rows_inserted = self.db_manager.insert_from_csv('odds_spreads', path, week=self.week)
-                                logger.info(f"✓ Saved {rows_inserted} spreads to database")
-                            elif market == 'totals':
-                                rows_inserted = self.db_manager.insert_from_csv('odds_totals', path, week=self.week)
-                                logger.info(f"✓ Saved {rows_inserted} totals to database")
-                            elif market == 'player_pass_tds':
-                                rows_inserted = self.db_manager.insert_from_csv('qb_props', path, week=self.week)
-                                logger.info(f"✓ Saved {rows_inserted} QB props to database")
-                    except Exception as e:
-                        logger.error(f"✗ Error saving odds to database: {e}")
-                
+
                 # Save historical snapshots if enabled
                 if self.save_snapshots and self.historical_storage:
                     try:
@@ -302,17 +434,82 @@ class DataPipeline:
             logger.error(f"✗ Error in odds scraper: {e}")
             return False
     
+    def _ingest_odds(self, scraper: OddsScraper):
+        """
+        Stream all odds markets straight into the database
+
+        Args:
+            scraper: OddsScraper to fetch with
+
+        Returns:
+            Dictionary with market names and their CSV paths (or row counts when
+            no CSV was written), or None if any market failed
+        """
+        write_csv = self.write_csv or self.save_snapshots
+
+        try:
+            # Network fetch stays on this stage's thread; only the write goes to the DB writer
+            payloads = scraper.fetch_all_odds_payloads()
+            ingested = self._db_write(scraper.ingest_all_odds, self.week, self.db_manager,
+                                      write_csv=write_csv, payloads=payloads)
+        except Exception as e:
+            logger.error(f"✗ Error saving odds to database: {e}")
+            return None
+
+        for market, info in ingested.items():
+            if info:
+                logger.info(f"✓ Saved {market} to database ({info['changed']} of {info['rows']} lines changed)")
+
+        if not all(ingested.values()):
+            logger.error("Failed to fetch all odds data")
+            return None
+
+        return {
+            market: info['csv'] or f"database ({info['rows']} rows)"
+            for market, info in ingested.items()
+        }
+
+    def _db_write(self, write, *args, **kwargs):
+        """
+        Run a database write on the single writer thread (or inline when none is running)
+
+        Args:
+            write: Callable performing the write
+            *args, **kwargs: Passed to write
+
+        Returns:
+            The callable's return value
+        """
+        if self._db_writer is None:
+            return write(*args, **kwargs)
+        return self._db_writer.submit(write, *args, **kwargs).result()
+
+    def _start_db_writer(self):
+        """Start the writer thread with its own pooled connection"""
+        if self.db_manager and self._db_writer is None:
+            self._db_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="db-writer", initializer=self.db_manager.connect
+            )
+
+    def _stop_db_writer(self):
+        """Release the writer thread's connection and stop it"""
+        if self._db_writer is not None:
+            self._db_writer.submit(self.db_manager.close).result()
+            self._db_writer.shutdown()
+            self._db_writer = None
+
     def cleanup(self):
         """Clean up database connections"""
         if self.db_manager:
             self.db_manager.close()
 
-    def run_all(self, skip_odds: bool = False) -> bool:
+    def run_all(self, skip_odds: bool = False, max_workers: int = PIPELINE_MAX_WORKERS) -> bool:
         """
-        Run all scrapers in sequence
+        Run all scrapers, independent stages concurrently
 
         Args:
             skip_odds: Whether to skip odds scraping (useful for Tuesday runs)
+            max_workers: Stages running at once (1 = strictly sequential)
 
         Returns:
             True if all succeeded, False otherwise
@@ -330,27 +527,41 @@ class DataPipeline:
 
             if self.week in available_weeks:
                 logger.warning(f"⚠️  WARNING: Week {self.week} already has data in database!")
-                response = input("   Overwrite existing data? (yes/no): ").strip().lower()
-                if response != 'yes':
-                    logger.info("   ❌ Scraping cancelled by user")
-                    return False
+                if not self.interactive:
+                    logger.info("   ✅ Non-interactive run - refreshing existing data")
                 else:
-                    logger.info("   ✅ User confirmed - proceeding with scrape")
-
-        success = True
-
-        # Run scrapers
-        success &= self.run_defense_stats()
-        success &= self.run_qb_stats()
-        success &= self.run_matchups()
+                    response = input("   Overwrite existing data? (yes/no): ").strip().lower()
+                    if response != 'yes':
+                        logger.info("   ❌ Scraping cancelled by user")
+                        return False
+                    else:
+                        logger.info("   ✅ User confirmed - proceeding with scrape")
+
+        # Run scrapers: stages don't share data until the DB write, so they run
+        # concurrently (one at a time per host) and funnel writes through one writer
+        stages = [
+            PipelineStage('defense_stats', self.run_defense_stats, host=PFR_HOST),
+            PipelineStage('qb_stats', self.run_qb_stats, host=PFR_HOST),
+            PipelineStage('matchups', self.run_matchups, host=ESPN_HOST),
+        ]
 
         if not skip_odds:
-            success &= self.run_odds()
+            stages.append(PipelineStage('odds', self.run_odds, host=ODDS_API_HOST))
         else:
             logger.info("\n" + "=" * 60)
             logger.info("STEP 4: Skipping odds (run manually on Thursday)")
             logger.info("=" * 60)
 
+        run_start = time.perf_counter()
+        self._start_db_writer()
+        try:
+            stage_timings = run_stage_dag(stages, max_workers=max_workers)
+        finally:
+            self._stop_db_writer()
+        elapsed_seconds = round(time.perf_counter() - run_start, 3)
+
+        success = all(timing['status'] == 'success' for timing in stage_timings.values())
+
         # Summary
         logger.info("\n" + "=" * 60)
         logger.info("PIPELINE SUMMARY")
@@ -373,6 +584,14 @@ class DataPipeline:
             else:
                 logger.info(f"✗ {name.replace('_', ' ').title()}: FAILED")
 
+        for name, timing in stage_timings.items():
+            logger.info(f"⏱  {name}: {timing['elapsed_seconds']:.1f}s ({timing['status']})")
+        logger.info(f"⏱  Total: {elapsed_seconds:.1f}s")
+
+        http = get_http_client().stats
+        logger.info(f"🌐 HTTP: {http['requests']} requests, {http['not_modified']} unchanged (304), "
+                    f"{http['bytes_received'] / 1024:.0f} KB received, {http['bytes_saved'] / 1024:.0f} KB saved")
+
         # Log scrape run to database if enabled
         if self.save_to_db and self.db_manager:
             try:
@@ -381,7 +600,9 @@ class DataPipeline:
                     week=self.week,
                     files_scraped=files_scraped,
                     api_requests_used=api_requests_used,
-                    status=status
+                    status=status,
+                    elapsed_seconds=elapsed_seconds,
+                    stage_timings=stage_timings
                 )
             except Exception as e:
                 logger.error(f"✗ Error logging scrape run: {e}")
@@ -404,9 +625,8 @@ def get_current_nfl_week() -> int:
     Returns:
         Current NFL week number
     """
-    from utils.week_manager import WeekManager
-    wm = WeekManager()
-    return wm.get_current_week()
+    from utils.week_manager import get_week_manager
+    return get_week_manager().get_current_week()
 
 
 def main():
@@ -458,8 +678,33 @@ def main():
         help='Save historical snapshots (Phase 1 feature)'
     )
 
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=PIPELINE_MAX_WORKERS,
+        help=f'Pipeline stages to run at once in the full workflow; 1 runs them in sequence '
+             f'(default: {PIPELINE_MAX_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--no-csv',
+        action='store_true',
+        help='With --save-to-db, write odds straight to the database without CSV files '
+             '(ignored with --save-snapshots)'
+    )
+
+    parser.add_argument(
+        '--http-cache',
+        choices=[mode.value for mode in CacheMode],
+        help='HTTP cache mode: live, record (store responses) or replay (offline, no API quota) '
+             '(default: HTTP_CACHE_MODE env var, else live)'
+    )
+
     args = parser.parse_args()
 
+    if args.http_cache:
+        configure_http_cache(args.http_cache)
+
     # Determine week
     week = args.week if args.week else get_current_nfl_week()
 
@@ -470,7 +715,8 @@ def main():
         week=week, 
         year=args.year, 
         save_to_db=args.save_to_db, 
-        save_snapshots=args.save_snapshots
+        save_snapshots=args.save_snapshots,
+        write_csv=not args.no_csv
     )
 
     # Run appropriate workflow
@@ -484,7 +730,7 @@ def main():
 
     else:
         logger.info("Running FULL workflow")
-        success = pipeline.run_all(skip_odds=args.skip_odds)
+        success = pipeline.run_all(skip_odds=args.skip_odds, max_workers=args.max_workers)
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
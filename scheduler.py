@@ -3,15 +3,16 @@
 Main Scheduler for automated NFL data scraping
 Runs scrapers daily Monday through Saturday at 9am:
 - All data: Defense stats, QB stats, matchups, and odds
-- Companion to scheduler_odds.py (which runs odds-only at 3pm)
+- Runs the pipeline in-process on a job queue (warm imports and connections,
+  per-run history in the job_runs table, SCHEDULER_JOB_TIMEOUT deadline per run)
+- Companion to scheduler_odds.py (which polls odds as kickoff approaches)
 """
 import schedule
+import sys
 import time
 import logging
-import subprocess
-import sys
 from datetime import datetime
-from pathlib import Path
+from typing import Dict, Optional
 
 from config import (
     SCRAPE_DAYS,
@@ -20,6 +21,8 @@ from config import (
     LOG_LEVEL,
     DATA_DIR
 )
+from utils.job_runner import JobRunner
+from utils.scheduler_lock import SCHEDULER_LOCKS, SchedulerLock
 
 # Configure logging
 logging.basicConfig(
@@ -37,46 +40,56 @@ logger = logging.getLogger(__name__)
 class NFLDataScheduler:
     """Scheduler for automated NFL data collection"""
 
-    def __init__(self):
-        """Initialize the scheduler"""
-        self.main_script = Path(__file__).parent / "main.py"
+    def __init__(self, runner: Optional[JobRunner] = None):
+        """
+        Initialize the scheduler
 
-        if not self.main_script.exists():
-            raise FileNotFoundError(f"Main script not found: {self.main_script}")
+        Args:
+            runner: Job runner for scheduled work (default: holds the main scheduler lock)
+        """
+        self.runner = runner or JobRunner(lock=SchedulerLock(SCHEDULER_LOCKS['main']))
 
         logger.info("NFL Data Scheduler initialized")
 
-    def run_daily_collection(self):
-        """Run daily data collection (all data sources)"""
+    def run_daily_collection(self, wait: bool = False) -> Optional[Dict]:
+        """
+        Queue daily data collection (all data sources)
+
+        Args:
+            wait: Block until the run finishes
+
+        Returns:
+            Run record when waiting, otherwise None
+        """
         logger.info("\n" + "=" * 80)
         logger.info(f"DAILY DATA COLLECTION - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("=" * 80)
 
-        try:
-            # Run main.py (collects all data by default)
-            result = subprocess.run(
-                [sys.executable, str(self.main_script)],
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout (needs more time for all data)
-            )
+        future = self.runner.submit('daily_collection', self.collect_all_data)
+        if wait and future:
+            return future.result()
+        return None
 
-            # Log output
-            if result.stdout:
-                logger.info(result.stdout)
+    def collect_all_data(self) -> bool:
+        """
+        Run the full pipeline (what `python main.py` does) in this process
 
-            if result.stderr:
-                logger.error(result.stderr)
+        Returns:
+            True if all stages succeeded, False otherwise
+        """
+        # Imported here so main.py's logging setup doesn't replace the scheduler's;
+        # the module stays loaded for later runs
+        from main import DataPipeline, get_current_nfl_week
 
-            if result.returncode == 0:
-                logger.info("✓ Daily data collection completed successfully")
-            else:
-                logger.error(f"✗ Daily data collection failed with code {result.returncode}")
+        # No one is at the terminal to answer the overwrite prompt
+        pipeline = DataPipeline(week=get_current_nfl_week(), interactive=False)
+        success = pipeline.run_all()
 
-        except subprocess.TimeoutExpired:
-            logger.error("✗ Daily data collection timed out")
-        except Exception as e:
-            logger.error(f"✗ Error running daily data collection: {e}")
+        if success:
+            logger.info("✓ Daily data collection completed successfully")
+        else:
+            logger.error("✗ Daily data collection failed")
+        return success
 
     def setup_schedule(self):
         """Configure the daily schedule"""
@@ -89,10 +102,13 @@ class NFLDataScheduler:
         logger.info("Schedule configured:")
         logger.info(f"  - {', '.join([day.title() for day in SCRAPE_DAYS])} at {SCRAPE_TIME}")
         logger.info(f"  - Collects: Defense stats, QB stats, matchups, and odds")
-        logger.info(f"  - Note: Odds-only scraper also runs at 3pm (see scheduler_odds.py)")
+        logger.info(f"  - Note: Odds are also polled as kickoff approaches (see scheduler_odds.py)")
 
     def run(self):
         """Run the scheduler (blocking)"""
+        if not self.runner.start():
+            sys.exit(1)
+
         self.setup_schedule()
 
         logger.info("\n" + "=" * 80)
@@ -112,6 +128,9 @@ class NFLDataScheduler:
             logger.info("\n" + "=" * 80)
             logger.info("SCHEDULER STOPPED BY USER")
             logger.info("=" * 80)
+        finally:
+            # Let a running collection finish before releasing the lock
+            self.runner.close()
 
 
 def main():
@@ -135,8 +154,9 @@ def main():
     # Handle test mode
     if args.test:
         logger.info("TEST MODE: Running daily data collection immediately")
-        scheduler.run_daily_collection()
-        return
+        with scheduler.runner:
+            record = scheduler.run_daily_collection(wait=True)
+        sys.exit(0 if record and record['status'] == 'success' else 1)
 
     # Normal mode: run scheduler
     scheduler.run()
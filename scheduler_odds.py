@@ -1,25 +1,31 @@
 #!/usr/bin/env python3
 """
-Odds-only Scheduler for automated NFL odds scraping
-Runs odds scraper daily Monday through Saturday at 3pm:
-- Odds data only: QB TD props, spreads, totals
+Adaptive odds scheduler for automated NFL odds scraping
+Runs as one long-lived process that polls each game more often as kickoff nears:
+- Reads commence_time for upcoming events (refreshed every ODDS_EVENTS_REFRESH_MINUTES)
+- Refreshes player props only for games inside the active window (ODDS_POLL_TIERS)
+- Refreshes spreads / totals at the tightest active interval
+- Stretches intervals when the plan would overrun the monthly API quota
 - Complements main scheduler (which runs at 9am with all data)
 """
-import schedule
+import sys
 import time
 import logging
-import subprocess
-import sys
-from datetime import datetime
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
 
 from config import (
-    SCRAPE_DAYS,
-    ODDS_SCRAPE_TIME,
     LOG_FORMAT,
     LOG_LEVEL,
-    DATA_DIR
+    DATA_DIR,
+    ODDS_EVENTS_REFRESH_MINUTES,
+    ODDS_POLL_MAX_SLEEP_MINUTES
 )
+from scrapers.odds_scraper import OddsScraper
+from utils.db_manager import DatabaseManager
+from utils.odds_poll_planner import OddsPollPlanner
+from utils.scheduler_lock import SCHEDULER_LOCKS, SchedulerLock
+from utils.week_manager import get_week_manager
 
 # Configure logging
 logging.basicConfig(
@@ -35,82 +41,159 @@ logger = logging.getLogger(__name__)
 
 
 class NFLOddsScheduler:
-    """Scheduler for automated NFL odds collection (afternoon runs)"""
+    """Kickoff-aware scheduler for automated NFL odds collection"""
+
+    def __init__(self, scraper: Optional[OddsScraper] = None, db_manager: Optional[DatabaseManager] = None,
+                 planner: Optional[OddsPollPlanner] = None, week: Optional[int] = None):
+        """
+        Initialize the odds scheduler
+
+        Args:
+            scraper: OddsScraper to poll with (default: configured API keys)
+            db_manager: Database to write odds to (default: main database)
+            planner: Polling plan (default: ODDS_POLL_TIERS)
+            week: NFL week to file odds under (default: WeekManager's current week)
+        """
+        self.scraper = scraper or OddsScraper()
+        self.db_manager = db_manager or DatabaseManager()
+        self.db_manager.connect()
+        self.planner = planner or OddsPollPlanner()
+        self.week = week
+
+        self.events = []
+        self.events_fetched_at = None
+        self.events_refresh = timedelta(minutes=ODDS_EVENTS_REFRESH_MINUTES)
+        self.max_sleep = timedelta(minutes=ODDS_POLL_MAX_SLEEP_MINUTES)
 
-    def __init__(self):
-        """Initialize the odds scheduler"""
-        self.main_script = Path(__file__).parent / "main.py"
+        logger.info("NFL Odds Scheduler initialized")
 
-        if not self.main_script.exists():
-            raise FileNotFoundError(f"Main script not found: {self.main_script}")
+    def refresh_events(self, now: datetime):
+        """Re-read the events list (commence times) when it is stale"""
+        if self.events_fetched_at is not None and now - self.events_fetched_at < self.events_refresh:
+            return
 
-        logger.info("NFL Odds Scheduler initialized")
+        events = self.scraper.fetch_events()
+        self.events_fetched_at = now
+        if events is None:
+            logger.warning("⚠️  Could not refresh events list, keeping previous schedule")
+            return
+
+        self.events = events
+        active = self.planner.active_events(events, now)
+        logger.info(f"Events refreshed: {len(events)} upcoming, {len(active)} inside the polling window")
+
+    def poll_once(self, now: Optional[datetime] = None) -> Dict:
+        """
+        Refresh the odds that are due and write them to the database
+
+        Args:
+            now: Current time (default: now, UTC)
+
+        Returns:
+            Dictionary with the events polled, whether game lines were polled,
+            the (props, game lines) quota stretch factors and the ingestion results
+        """
+        now = now or datetime.now(timezone.utc)
+        self.refresh_events(now)
+
+        props_stretch, lines_stretch = self._quota_stretch(now)
+        if props_stretch > 1 or lines_stretch > 1:
+            logger.warning(f"⚠️  Polling slowed to stay within the monthly API quota "
+                           f"(props {props_stretch:.1f}x, spreads/totals {lines_stretch:.1f}x)")
+
+        due = self.planner.due_events(self.events, now, props_stretch)
+        game_lines = self.planner.game_lines_due(self.events, now, lines_stretch)
+        summary = {'events': [event.get('id') for event in due], 'game_lines': game_lines,
+                   'stretch': (props_stretch, lines_stretch), 'results': {}}
+
+        if not due and not game_lines:
+            return summary
 
-    def run_odds_collection(self):
-        """Run odds-only data collection"""
         logger.info("\n" + "=" * 80)
-        logger.info(f"ODDS DATA COLLECTION - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"ODDS POLL - {now.strftime('%Y-%m-%d %H:%M:%S %Z')}: "
+                    f"{len(due)} game(s) due{', plus spreads/totals' if game_lines else ''}")
         logger.info("=" * 80)
 
+        payloads = {}
+        if game_lines:
+            payloads['spreads'] = self.scraper.fetch_odds_by_market('spreads')
+            payloads['totals'] = self.scraper.fetch_odds_by_market('totals')
+        if due:
+            payloads['player_pass_tds'] = self.scraper.fetch_event_payloads(events=due) or None
+
         try:
-            # Run main.py with --odds-only flag
-            result = subprocess.run(
-                [sys.executable, str(self.main_script), '--odds-only'],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout (odds-only is faster)
-            )
-
-            # Log output
-            if result.stdout:
-                logger.info(result.stdout)
-
-            if result.stderr:
-                logger.error(result.stderr)
-
-            if result.returncode == 0:
-                logger.info("✓ Odds collection completed successfully")
-            else:
-                logger.error(f"✗ Odds collection failed with code {result.returncode}")
-
-        except subprocess.TimeoutExpired:
-            logger.error("✗ Odds collection timed out")
+            week = self.week or get_week_manager().get_current_week()
+            summary['results'] = self.scraper.ingest_all_odds(week, self.db_manager, payloads=payloads)
         except Exception as e:
-            logger.error(f"✗ Error running odds collection: {e}")
+            logger.error(f"✗ Error saving odds to database: {e}")
+
+        # Mark as polled even on failure so a bad response is retried at the next interval
+        self.planner.mark_polled(due, now, game_lines=game_lines)
+        return summary
+
+    def seconds_until_next_poll(self, now: Optional[datetime] = None) -> float:
+        """
+        How long to sleep before the next poll_once()
+
+        Args:
+            now: Current time (default: now, UTC)
 
-    def setup_schedule(self):
-        """Configure the daily odds schedule"""
-        # Schedule for each day: Monday through Saturday at 3pm
-        for day in SCRAPE_DAYS:
-            getattr(schedule.every(), day).at(ODDS_SCRAPE_TIME).do(
-                self.run_odds_collection
-            )
+        Returns:
+            Seconds until the next game is due, the events list goes stale,
+            or the maximum sleep, whichever comes first (spreads / totals ride
+            along with the next props poll)
+        """
+        now = now or datetime.now(timezone.utc)
+        wake = now + self.max_sleep
 
-        logger.info("Odds schedule configured:")
-        logger.info(f"  - {', '.join([day.title() for day in SCRAPE_DAYS])} at {ODDS_SCRAPE_TIME}")
-        logger.info(f"  - Collects: QB TD props, spreads, totals (odds only)")
+        if self.events_fetched_at is not None:
+            wake = min(wake, self.events_fetched_at + self.events_refresh)
+
+        next_due = self.planner.next_due(self.events, now, self._quota_stretch(now)[0])
+        if next_due is not None:
+            wake = min(wake, next_due)
+
+        return max((wake - now).total_seconds(), 0.0)
+
+    def _quota_stretch(self, now: datetime):
+        """(player props, game lines) interval stretch from the remaining monthly quota"""
+        rotator = self.scraper.api_rotator
+        paid_remaining = rotator.get_paid_remaining()
+        free_remaining = rotator.get_remaining_requests() - paid_remaining
+        return self.planner.quota_stretch(self.events, now, paid_remaining, free_remaining)
 
     def run(self):
         """Run the scheduler (blocking)"""
-        self.setup_schedule()
+        lock = SchedulerLock(SCHEDULER_LOCKS['odds'])
+        if not lock.acquire():
+            sys.exit(1)
 
         logger.info("\n" + "=" * 80)
-        logger.info("NFL ODDS SCHEDULER STARTED")
+        logger.info("NFL ODDS SCHEDULER STARTED (adaptive polling)")
         logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Tiers (hours before kickoff -> minutes between polls): {self.planner.tiers}")
         logger.info("=" * 80 + "\n")
 
-        logger.info("Waiting for scheduled tasks...")
         logger.info("Press Ctrl+C to stop\n")
 
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                try:
+                    self.poll_once()
+                except Exception as e:
+                    logger.error(f"✗ Error in odds poll: {e}")
+
+                delay = self.seconds_until_next_poll()
+                logger.debug(f"Next odds check in {delay / 60:.1f} min")
+                time.sleep(max(delay, 1.0))
 
         except KeyboardInterrupt:
             logger.info("\n" + "=" * 80)
             logger.info("ODDS SCHEDULER STOPPED BY USER")
             logger.info("=" * 80)
+        finally:
+            self.db_manager.close()
+            lock.release()
 
 
 def main():
@@ -118,13 +201,13 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(
-        description='Automated scheduler for NFL odds scraping (afternoon runs)'
+        description='Adaptive scheduler for NFL odds scraping (polls more often near kickoff)'
     )
 
     parser.add_argument(
         '--test',
         action='store_true',
-        help='Run odds collection immediately (for testing)'
+        help='Run one poll immediately (for testing)'
     )
 
     args = parser.parse_args()
@@ -133,8 +216,10 @@ def main():
 
     # Handle test mode
     if args.test:
-        logger.info("TEST MODE: Running odds collection immediately")
-        scheduler.run_odds_collection()
+        logger.info("TEST MODE: Running one odds poll immediately")
+        summary = scheduler.poll_once()
+        logger.info(f"Polled {len(summary['events'])} game(s), game lines: {summary['game_lines']}")
+        scheduler.db_manager.close()
         return
 
     # Normal mode: run scheduler
@@ -8,12 +8,14 @@ import sys
 from pathlib import Path
 from typing import Optional
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.http_cache import HTTPCache, get_http_cache
+from utils.pfr_tables import read_table
+
 from config import (
     PFR_DEFENSE_URL_TEMPLATE,
     USER_AGENT,
@@ -29,54 +31,59 @@ logger = logging.getLogger(__name__)
 class DefenseStatsScraper:
     """Scrapes NFL defense stats from Pro Football Reference"""
 
-    def __init__(self, year: int = CURRENT_YEAR):
+    def __init__(self, year: int = CURRENT_YEAR, http_cache: Optional[HTTPCache] = None):
         """
         Initialize the defense stats scraper
 
         Args:
             year: NFL season year
+            http_cache: Record/replay cache (default: process-wide cache from config)
         """
         self.year = year
+        self.http_cache = http_cache or get_http_cache()
         self.url = PFR_DEFENSE_URL_TEMPLATE.format(year=year)
         self.headers = {"User-Agent": USER_AGENT}
+        # Set by scrape(): True when PFR answered 304 Not Modified
+        self.unchanged = False
 
-    def scrape(self) -> Optional[pd.DataFrame]:
+    def scrape(self, conditional: bool = False) -> Optional[pd.DataFrame]:
         """
         Scrape defense stats from Pro Football Reference
 
+        Args:
+            conditional: Revalidate with the page's stored ETag / Last-Modified;
+                         an unchanged page sets self.unchanged and returns None
+                         without being downloaded or parsed
+
         Returns:
-            DataFrame with defense stats or None if failed
+            DataFrame with defense stats or None if failed (or unchanged)
         """
         logger.info(f"Scraping defense stats for {self.year} season from {self.url}")
 
         try:
-            # Make request with delay to be polite
-            time.sleep(REQUEST_DELAY)
-            response = requests.get(
+            # Make request with delay to be polite (skipped when served from cache)
+            response = self.http_cache.get(
                 self.url,
                 headers=self.headers,
-                timeout=REQUEST_TIMEOUT
+                timeout=REQUEST_TIMEOUT,
+                delay=REQUEST_DELAY,
+                conditional=conditional
             )
+            self.unchanged = response.status_code == 304
+            if self.unchanged:
+                logger.info(f"✓ Defense stats page unchanged since last scrape (HTTP 304), skipping parse")
+                return None
             response.raise_for_status()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Find the Team Defense & Special Teams table
-            # The table ID is typically 'team_stats' or contains 'opp'
-            table = soup.find('table', {'id': 'team_stats'})
+            # Parse the stats table in one lxml pass (PFR sometimes uses id 'passing')
+            df = read_table(response.content, 'team_stats', 'passing')
 
-            if not table:
-                # Try alternate table ID
-                table = soup.find('table', {'id': 'passing'})
-
-            if not table:
+            if df is None:
                 logger.error("Could not find defense stats table on page")
+                # Re-download next time rather than trusting a 304 for a page we couldn't use
+                self.http_cache.client.forget(self.url)
                 return None
 
-            # Parse table into DataFrame
-            df = pd.read_html(str(table))[0]
-
             # Clean up the DataFrame
             df = self._clean_dataframe(df)
 
@@ -88,6 +95,7 @@ class DefenseStatsScraper:
             return None
         except Exception as e:
             logger.error(f"Unexpected error during scraping: {e}", exc_info=True)
+            self.http_cache.client.forget(self.url)
             return None
 
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -241,6 +249,9 @@ class DefenseStatsScraper:
         """
         Run the complete scraping workflow
 
+        If this week's CSV already exists, the page is revalidated first and an
+        unchanged page keeps the existing CSV (and database rows) as they are.
+
         Args:
             week: Current NFL week number
             save_to_db: If True, save to database using snapshot-then-upsert pattern
@@ -248,7 +259,11 @@ class DefenseStatsScraper:
         Returns:
             Path to saved CSV file, or None if failed
         """
-        df = self.scrape()
+        existing = DATA_DIR / DEFENSE_FILE_TEMPLATE.format(week=week)
+        df = self.scrape(conditional=existing.exists())
+
+        if self.unchanged:
+            return str(existing)
 
         if df is not None and not df.empty:
             if save_to_db:
@@ -5,9 +5,16 @@ Replaces fragile HTML parsing with stable JSON endpoint
 
 import requests
 import logging
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.http_cache import HTTPCache, get_http_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,8 +23,9 @@ class MatchupsScraperAPI:
 
     BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
 
-    def __init__(self, year: int = 2025):
+    def __init__(self, year: int = 2025, http_cache: Optional[HTTPCache] = None):
         self.year = year
+        self.http_cache = http_cache or get_http_cache()
 
     def scrape_week(self, week: int) -> List[Dict]:
         """
@@ -35,7 +43,7 @@ class MatchupsScraperAPI:
             url = f"{self.BASE_URL}?week={week}&seasontype=2&dates={self.year}"
 
             logger.info(f"Fetching matchups from ESPN API: week {week}")
-            response = requests.get(url, timeout=10)
+            response = self.http_cache.get(url, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -2,11 +2,14 @@
 Odds Scraper using The Odds API
 Fetches QB passing TD prop odds (over 0.5 TDs) from sportsbooks
 """
+import csv
 import logging
+import os
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 from datetime import datetime
 import requests
 import pandas as pd
@@ -20,17 +23,25 @@ from config import (
     ODDS_API_KEY_PAID,
     ODDS_SPORT,
     ODDS_REGIONS,
-    ODDS_MARKETS,
     ODDS_MARKETS_FALLBACK,
     ODDS_BOOKMAKERS,
     REQUEST_TIMEOUT,
     DATA_DIR,
     ODDS_FILE_TEMPLATE,
     FREE_TIER_MAX_REQUESTS,
-    PAID_TIER_MAX_REQUESTS
+    PAID_TIER_MAX_REQUESTS,
+    PAID_KEY_RESERVE,
+    ODDS_MAX_CONCURRENCY,
+    ODDS_REQUESTS_PER_SECOND,
+    ODDS_MAX_RETRIES
 )
 from utils.api_key_rotator import APIKeyRotator
-from utils.week_manager import WeekManager
+from utils.http_cache import HTTPCache, get_http_cache
+from utils.odds_history import OddsHistory
+from utils.quota_ledger import QuotaLedger
+from utils.rate_limiter import TokenBucket, backoff_delay, RETRYABLE_STATUS_CODES
+from utils.roster_index import RosterIndex
+from utils.week_manager import get_week_manager
 
 logger = logging.getLogger(__name__)
 
@@ -38,25 +49,94 @@ logger = logging.getLogger(__name__)
 class OddsScraper:
     """Scrapes QB TD prop odds using The Odds API"""
 
-    def __init__(self):
-        """Initialize the odds scraper"""
-        if not ODDS_API_KEYS:
+    # Longest wait honoured from a Retry-After header (seconds)
+    MAX_RETRY_AFTER = 30.0
+
+    # Market -> database table for direct ingestion
+    ODDS_TABLES = {
+        'spreads': 'odds_spreads',
+        'totals': 'odds_totals',
+        'player_pass_tds': 'qb_props',
+    }
+
+    # Columns written per table (also the header of the optional CSV output)
+    ODDS_COLUMNS = {
+        'odds_spreads': ['game', 'home_team', 'away_team', 'team', 'spread', 'odds',
+                         'sportsbook', 'game_time', 'week'],
+        'odds_totals': ['game', 'home_team', 'away_team', 'line_type', 'total', 'odds',
+                        'sportsbook', 'game_time', 'week'],
+        'qb_props': ['qb_name', 'odds_over_05_td', 'sportsbook', 'game', 'home_team',
+                     'away_team', 'game_time', 'week', 'team', 'opponent'],
+    }
+
+    CSV_TEMPLATES = {
+        'spreads': 'odds_spreads_week_{week}.csv',
+        'totals': 'odds_totals_week_{week}.csv',
+        'player_pass_tds': 'odds_qb_td_week_{week}.csv',
+    }
+
+    def __init__(
+        self,
+        api_keys: Optional[List[str]] = None,
+        paid_key: Optional[str] = None,
+        base_url: str = ODDS_API_BASE_URL,
+        max_concurrency: int = ODDS_MAX_CONCURRENCY,
+        requests_per_second: float = ODDS_REQUESTS_PER_SECOND,
+        max_retries: int = ODDS_MAX_RETRIES,
+        retry_base_delay: float = 0.5,
+        quota_ledger: Optional[QuotaLedger] = None,
+        http_cache: Optional[HTTPCache] = None,
+        roster_index: Optional[RosterIndex] = None
+    ):
+        """
+        Initialize the odds scraper
+
+        Args:
+            api_keys: API keys (default: ODDS_API_KEYS from config)
+            paid_key: Paid tier key, last in api_keys (default: ODDS_API_KEY_PAID)
+            base_url: API base URL (point at a local stand-in server for offline runs)
+            max_concurrency: Parallel per-event player prop requests (1 = serial)
+            requests_per_second: Token bucket rate shared by all requests
+            max_retries: Retries on 429/5xx/connection errors
+            retry_base_delay: Base delay for jittered exponential backoff (seconds)
+            quota_ledger: Persistent usage ledger (default: the main database's
+                          ledger when using the configured keys)
+            http_cache: Record/replay cache (default: process-wide cache from config)
+            roster_index: Player -> team index used to fill qb_props team/opponent
+                          (default: rebuilt from the database once per scrape)
+        """
+        if api_keys is None:
+            api_keys, paid_key = ODDS_API_KEYS, ODDS_API_KEY_PAID
+            if quota_ledger is None:
+                quota_ledger = QuotaLedger()
+
+        if not api_keys:
             raise ValueError("No Odds API keys configured. Please set ODDS_API_KEY_1 through ODDS_API_KEY_6 in .env file")
 
         # Pass the paid key and limits to the rotator
         self.api_rotator = APIKeyRotator(
-            ODDS_API_KEYS,
-            paid_key=ODDS_API_KEY_PAID,
+            api_keys,
+            paid_key=paid_key,
             free_tier_limit=FREE_TIER_MAX_REQUESTS,
-            paid_tier_limit=PAID_TIER_MAX_REQUESTS
+            paid_tier_limit=PAID_TIER_MAX_REQUESTS,
+            ledger=quota_ledger,
+            paid_reserve=PAID_KEY_RESERVE
         )
-        self.week_manager = WeekManager()
+        self.week_manager = get_week_manager()
+
+        self.base_url = base_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.rate_limiter = TokenBucket(requests_per_second)
+        self.http_cache = http_cache or get_http_cache()
+        self.roster_index = roster_index
 
-        free_count = len(ODDS_API_KEYS) - (1 if ODDS_API_KEY_PAID else 0)
-        logger.info(f"Initialized with {len(ODDS_API_KEYS)} API keys ({free_count} free tier, {1 if ODDS_API_KEY_PAID else 0} paid tier)")
+        free_count = len(api_keys) - (1 if paid_key else 0)
+        logger.info(f"Initialized with {len(api_keys)} API keys ({free_count} free tier, {1 if paid_key else 0} paid tier)")
 
         # Check if paid key is available for player props
-        if not ODDS_API_KEY_PAID:
+        if not paid_key:
             logger.warning("No paid tier API key configured - player props will not be available")
             logger.warning(f"Will use fallback market: {ODDS_MARKETS_FALLBACK}")
 
@@ -89,7 +169,7 @@ class OddsScraper:
                 return None
 
         # Build API request URL
-        url = f"{ODDS_API_BASE_URL}/sports/{ODDS_SPORT}/odds"
+        url = f"{self.base_url}/sports/{ODDS_SPORT}/odds"
 
         params = {
             'apiKey': api_key,
@@ -100,15 +180,8 @@ class OddsScraper:
         }
 
         try:
-            response = requests.get(
-                url,
-                params=params,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-
-            # Increment API key usage
-            self.api_rotator.increment_usage(api_key)
+            # Rate limited, retried on 429/5xx, usage counted on success
+            response = self._get(url, params, api_key)
 
             # Parse response
             data = response.json()
@@ -128,82 +201,6 @@ class OddsScraper:
             logger.error(f"Unexpected error fetching odds: {e}")
             return None
 
-    def _parse_odds_response(self, data: List[Dict]) -> List[Dict]:
-        """
-        Parse The Odds API response to extract QB TD props
-
-        Args:
-            data: Raw API response data
-
-        Returns:
-            List of parsed odds dictionaries
-        """
-        odds_list = []
-
-        for game in data:
-            try:
-                # Extract game info
-                home_team = game.get('home_team', '')
-                away_team = game.get('away_team', '')
-                commence_time = game.get('commence_time', '')
-
-                # Extract bookmaker odds
-                bookmakers = game.get('bookmakers', [])
-
-                for bookmaker in bookmakers:
-                    bookmaker_name = bookmaker.get('title', '')
-
-                    # Extract markets (player props)
-                    markets = bookmaker.get('markets', [])
-
-                    for market in markets:
-                        if market.get('key') == ODDS_MARKETS:
-                            # This is the QB passing TD market
-                            outcomes = market.get('outcomes', [])
-
-                            for outcome in outcomes:
-                                player_name = outcome.get('description', '')
-                                point = outcome.get('point', 0.5)  # Usually 0.5 for over/under 0.5 TDs
-                                odds = outcome.get('price', None)
-                                outcome_type = outcome.get('name', '')  # 'Over' or 'Under'
-
-                                # We only want 'Over 0.5 TD' props
-                                if outcome_type == 'Over' and point == 0.5:
-                                    # Determine which team the QB plays for
-                                    qb_team = self._determine_qb_team(player_name, home_team, away_team)
-
-                                    odds_list.append({
-                                        'qb_name': player_name,
-                                        'team': qb_team,
-                                        'opponent': away_team if qb_team == home_team else home_team,
-                                        'odds_over_05_td': odds,
-                                        'sportsbook': bookmaker_name,
-                                        'game_time': commence_time
-                                    })
-
-            except Exception as e:
-                logger.debug(f"Error parsing game odds: {e}")
-                continue
-
-        return odds_list
-
-    def _determine_qb_team(self, qb_name: str, home_team: str, away_team: str) -> str:
-        """
-        Determine which team a QB plays for
-        This is a simplified version - in production, you'd want a QB-to-team mapping
-
-        Args:
-            qb_name: Name of the quarterback
-            home_team: Home team name
-            away_team: Away team name
-
-        Returns:
-            Team name (best guess)
-        """
-        # For now, return empty - you'll need to implement team mapping
-        # or fetch this from your QB stats data
-        return ""
-
     def save_to_csv(self, odds_data: List[Dict], week: int) -> str:
         """
         Save odds data to CSV file
@@ -225,88 +222,247 @@ class OddsScraper:
 
         return str(filepath)
 
-    def fetch_player_props_for_all_events(self) -> List[Dict]:
+    def fetch_player_props_for_all_events(self, concurrent: bool = True) -> List[Dict]:
         """
         Fetch player props for all NFL events
         Player props require per-event API calls
 
+        Args:
+            concurrent: Fetch events in parallel (up to max_concurrency at once);
+                        results keep the events list order either way
+
         Returns:
             List of player prop dictionaries
         """
-        logger.info("Fetching events list to get player props...")
+        roster = self._scrape_roster()
+        results = self._map_events(lambda event, api_key: self._fetch_event_props(event, api_key, roster),
+                                   concurrent)
+        roster.report_unresolved()
+        return [prop for props in results for prop in props]
+
+    def _scrape_roster(self) -> RosterIndex:
+        """Roster index for one scrape: the injected index, else a fresh one from the database"""
+        if self.roster_index is not None:
+            return self.roster_index
+        return RosterIndex.from_database()
+
+    def fetch_event_payloads(self, concurrent: bool = True, events: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Fetch the raw player prop response for every NFL event
+
+        Args:
+            concurrent: Fetch events in parallel (up to max_concurrency at once)
+            events: Only fetch these events (default: every event in the events list)
+
+        Returns:
+            List of per-event API responses in events list order (failed events omitted)
+        """
+        results = self._map_events(self._fetch_event_odds, concurrent, events)
+        return [payload for payload in results if payload is not None]
+
+    def fetch_events(self) -> Optional[List[Dict]]:
+        """
+        Fetch upcoming NFL events (id, home_team, away_team, commence_time)
 
-        # First, get all events
-        events_url = f"{ODDS_API_BASE_URL}/sports/{ODDS_SPORT}/events"
+        Returns:
+            List of events, or None if the request failed
+        """
+        events_url = f"{self.base_url}/sports/{ODDS_SPORT}/events"
 
         # Use paid key for player props
         api_key = self.api_rotator.get_paid_key()
         if not api_key:
             logger.error("Paid tier API key required for player props")
-            return []
+            return None
 
         try:
-            response = requests.get(
-                events_url,
-                params={'apiKey': api_key},
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            self.api_rotator.increment_usage(api_key)
+            response = self._get(events_url, {'apiKey': api_key}, api_key)
+            return response.json()
+        except Exception as e:
+            logger.error(f"Failed to fetch events: {e}")
+            return None
+
+    def _map_events(self, fetch, concurrent: bool, events: Optional[List[Dict]] = None) -> List:
+        """
+        Apply fetch(event, api_key) to every event
+
+        Args:
+            fetch: Per-event function
+            concurrent: Run fetch in parallel (up to max_concurrency at once)
+            events: Events to fetch (default: fetch the events list first)
 
-            events = response.json()
+        Returns:
+            Per-event results in events list order (empty if the events list failed)
+        """
+        if events is None:
+            logger.info("Fetching events list to get player props...")
+            events = self.fetch_events()
+            if events is None:
+                return []
             logger.info(f"Found {len(events)} upcoming NFL events")
 
-            # Now fetch player props for each event
-            all_props = []
+        api_key = self.api_rotator.get_paid_key()
+        if not api_key:
+            logger.error("Paid tier API key required for player props")
+            return []
+
+        # Now fetch player props for each event
+        workers = min(self.max_concurrency, len(events)) if concurrent else 1
+        start = time.perf_counter()
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odds-props") as executor:
+                results = list(executor.map(lambda event: fetch(event, api_key), events))
+        else:
+            results = [fetch(event, api_key) for event in events]
+
+        logger.info(
+            f"Fetched props for {len(events)} events in {time.perf_counter() - start:.2f}s "
+            f"({workers} worker{'s' if workers != 1 else ''})"
+        )
+
+        return results
 
-            for event in events:
-                event_id = event.get('id')
-                home_team = event.get('home_team')
-                away_team = event.get('away_team')
-                commence_time = event.get('commence_time')
+    def _fetch_event_props(self, event: Dict, api_key: str, roster: Optional[RosterIndex] = None) -> List[Dict]:
+        """
+        Fetch and parse QB TD props for a single event
 
-                logger.info(f"Fetching player props for {away_team} @ {home_team}...")
+        Args:
+            event: Event from the /events endpoint (id, home_team, away_team)
+            api_key: Paid tier API key
+            roster: Index used to resolve each QB's team and opponent
 
-                # Get player props for this event
-                event_props_url = f"{ODDS_API_BASE_URL}/sports/{ODDS_SPORT}/events/{event_id}/odds"
+        Returns:
+            List of player prop dictionaries (empty if the request failed)
+        """
+        event_data = self._fetch_event_odds(event, api_key)
+        if event_data is None:
+            return []
 
-                params = {
-                    'apiKey': api_key,
-                    'regions': ODDS_REGIONS,
-                    'markets': 'player_pass_tds',
-                    'bookmakers': ODDS_BOOKMAKERS,
-                    'oddsFormat': 'american'
-                }
+        # Parse player props from this event
+        props = self._parse_event_player_props(event_data, roster=roster)
 
-                try:
-                    prop_response = requests.get(event_props_url, params=params, timeout=REQUEST_TIMEOUT)
-                    prop_response.raise_for_status()
-                    self.api_rotator.increment_usage(api_key)
+        logger.info(f"  ✓ Found {len(props)} QB props ({event.get('away_team')} @ {event.get('home_team')})")
+        return props
 
-                    event_data = prop_response.json()
+    def _fetch_event_odds(self, event: Dict, api_key: str) -> Optional[Dict]:
+        """
+        Fetch the raw player prop response for a single event
 
-                    # Parse player props from this event
-                    props = self._parse_event_player_props(event_data)
-                    all_props.extend(props)
+        Args:
+            event: Event from the /events endpoint (id, home_team, away_team)
+            api_key: Paid tier API key
+
+        Returns:
+            API response for the event, or None if the request failed
+        """
+        event_id = event.get('id')
+        home_team = event.get('home_team')
+        away_team = event.get('away_team')
 
-                    logger.info(f"  ✓ Found {len(props)} QB props")
+        logger.info(f"Fetching player props for {away_team} @ {home_team}...")
 
-                except Exception as e:
-                    logger.warning(f"  ✗ Failed to fetch props for this event: {e}")
-                    continue
+        # Get player props for this event
+        event_props_url = f"{self.base_url}/sports/{ODDS_SPORT}/events/{event_id}/odds"
 
-            return all_props
+        params = {
+            'apiKey': api_key,
+            'regions': ODDS_REGIONS,
+            'markets': 'player_pass_tds',
+            'bookmakers': ODDS_BOOKMAKERS,
+            'oddsFormat': 'american'
+        }
 
+        try:
+            return self._get(event_props_url, params, api_key).json()
         except Exception as e:
-            logger.error(f"Failed to fetch events: {e}")
-            return []
+            logger.warning(f"  ✗ Failed to fetch props for {away_team} @ {home_team}: {e}")
+            return None
 
-    def _parse_event_player_props(self, event_data: Dict) -> List[Dict]:
+    def _get(self, url: str, params: Dict, api_key: str) -> requests.Response:
+        """
+        GET through the shared rate limiter, retrying 429/5xx and connection errors
+
+        Waits for Retry-After when the API sends it, otherwise uses full-jitter
+        exponential backoff. Usage is counted against api_key once, for the
+        successful response only, along with the server-reported quota headers.
+        Responses served by the record/replay cache cost no quota and skip the
+        rate limiter.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            api_key: Key whose usage counter is incremented on success
+
+        Returns:
+            Successful response
+
+        Raises:
+            requests.exceptions.RequestException: After the final failed attempt
+        """
+        cached = self.http_cache.lookup(url, params)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            retries_left = attempt < self.max_retries
+
+            try:
+                # retries=0: this loop owns retries so quota is only counted on success
+                response = self.http_cache.fetch(url, params, timeout=REQUEST_TIMEOUT, retries=0)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retries_left:
+                    raise
+                delay = backoff_delay(attempt, self.retry_base_delay)
+                logger.warning(f"⚠️  Request error ({e}), retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and retries_left:
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"⚠️  HTTP {response.status_code}, retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            self.api_rotator.increment_usage(
+                api_key,
+                remaining=self._int_header(response, 'x-requests-remaining'),
+                used=self._int_header(response, 'x-requests-used')
+            )
+            return response
+
+    @staticmethod
+    def _int_header(response: requests.Response, name: str) -> Optional[int]:
+        """Integer value of a response header, or None if missing/invalid"""
+        try:
+            return int(float(response.headers[name]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if present, else jittered backoff"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        return backoff_delay(attempt, self.retry_base_delay)
+
+    def _parse_event_player_props(self, event_data: Dict, week: Optional[int] = None,
+                                  roster: Optional[RosterIndex] = None) -> List[Dict]:
         """
         Parse player props from a single event response
 
         Args:
             event_data: API response for a single event
+            week: Week of the event if already known (default: calculated from
+                  its commence_time)
+            roster: Index used to fill team/opponent (default: left blank)
 
         Returns:
             List of player prop dictionaries
@@ -318,8 +474,8 @@ class OddsScraper:
         commence_time = event_data.get('commence_time', '')
 
         # Calculate week from commence_time instead of using parameter
-        calculated_week = None
-        if commence_time:
+        calculated_week = week
+        if calculated_week is None and commence_time:
             try:
                 # Parse ISO 8601 datetime string
                 game_datetime = datetime.fromisoformat(commence_time.replace('Z', '+00:00'))
@@ -329,6 +485,8 @@ class OddsScraper:
                 logger.warning(f"Could not parse commence_time '{commence_time}': {e}")
 
         bookmakers = event_data.get('bookmakers', [])
+        # QB -> (team, opponent), resolved once per event rather than once per book
+        teams = {}
 
         for bookmaker in bookmakers:
             bookmaker_name = bookmaker.get('title', '')
@@ -359,6 +517,10 @@ class OddsScraper:
                             player_props[qb_name]['home_team'] = home_team
                             player_props[qb_name]['away_team'] = away_team
                             player_props[qb_name]['game_time'] = commence_time
+                            if qb_name not in teams:
+                                teams[qb_name] = (roster.resolve(qb_name, home_team, away_team)
+                                                  if roster is not None else ('', ''))
+                            player_props[qb_name]['team'], player_props[qb_name]['opponent'] = teams[qb_name]
                             if calculated_week is not None:
                                 player_props[qb_name]['week'] = calculated_week
 
@@ -378,14 +540,9 @@ class OddsScraper:
         """
         results = {}
 
-        # Market configurations
-        markets_to_fetch = {
-            'spreads': 'odds_spreads_week_{week}.csv',
-            'totals': 'odds_totals_week_{week}.csv',
-        }
-
         # Fetch regular markets (spreads, totals)
-        for market, filename_template in markets_to_fetch.items():
+        for market in ('spreads', 'totals'):
+            filename_template = self.CSV_TEMPLATES[market]
             logger.info(f"\n{'='*60}")
             logger.info(f"Fetching {market} market")
             logger.info(f"{'='*60}")
@@ -421,7 +578,7 @@ class OddsScraper:
         player_props = self.fetch_player_props_for_all_events()
 
         if player_props and len(player_props) > 0:
-            filename = 'odds_qb_td_week_{week}.csv'.format(week=week)
+            filename = self.CSV_TEMPLATES['player_pass_tds'].format(week=week)
             filepath = DATA_DIR / filename
             df = pd.DataFrame(player_props)
             df.to_csv(filepath, index=False)
@@ -433,6 +590,152 @@ class OddsScraper:
 
         return results
 
+    def fetch_all_odds_payloads(self) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Fetch the raw API responses for every market without parsing them
+
+        Returns:
+            Dictionary mapping market type to its raw responses (None if the fetch failed).
+            player_pass_tds holds one response per event.
+        """
+        payloads = {
+            'spreads': self.fetch_odds_by_market('spreads'),
+            'totals': self.fetch_odds_by_market('totals'),
+        }
+
+        logger.info("Fetching player_pass_tds market (per-event)")
+        payloads['player_pass_tds'] = self.fetch_event_payloads() or None
+
+        return payloads
+
+    def iter_odds_rows(self, payloads: Dict[str, Optional[List[Dict]]]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Flatten raw API responses into database rows, one at a time
+
+        Args:
+            payloads: Output of fetch_all_odds_payloads()
+
+        Yields:
+            (table_name, row) pairs ready for DatabaseManager.stream_insert()
+        """
+        for market in ('spreads', 'totals'):
+            table = self.ODDS_TABLES[market]
+            for line in self._iter_game_lines(payloads.get(market) or [], market):
+                if market == 'totals':
+                    line['line_type'] = line.pop('over_under')
+                yield table, line
+
+        # Weeks for every event in one vectorized lookup, teams from one roster index
+        events = payloads.get('player_pass_tds') or []
+        weeks = self.week_manager.weeks_for_dates([event.get('commence_time') for event in events])
+        roster = self._scrape_roster() if events else None
+        for event_data, week in zip(events, weeks):
+            week = None if pd.isna(week) else int(week)
+            for prop in self._parse_event_player_props(event_data, week=week, roster=roster):
+                yield self.ODDS_TABLES['player_pass_tds'], prop
+        if roster is not None:
+            roster.report_unresolved()
+
+    def ingest_all_odds(self, week: int, db_manager, write_csv: bool = False,
+                        payloads: Optional[Dict[str, Optional[List[Dict]]]] = None) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch all odds markets and write them straight to the database
+
+        Responses are fetched first, then parsed lazily into batched inserts on
+        odds_spreads, odds_totals and qb_props inside a single transaction, so the
+        write lock is never held during network I/O and a failed write leaves the
+        tables untouched. No DataFrame or CSV is needed on the way. Only lines
+        whose line or price moved since the last scrape are written (see
+        utils.odds_history); CSV files still hold the full snapshot.
+
+        Args:
+            week: NFL week number
+            db_manager: Connected DatabaseManager
+            write_csv: Also write the per-market CSV files (for snapshots / debugging)
+            payloads: Already fetched fetch_all_odds_payloads() output (default: fetch now);
+                      markets left out are not reported
+
+        Returns:
+            Dictionary mapping market type to {'rows': rows fetched, 'changed': rows
+            written, 'csv': CSV path or None}, or None for markets that failed or
+            returned no data
+        """
+        if payloads is None:
+            payloads = self.fetch_all_odds_payloads()
+        rows = self.iter_odds_rows(payloads)
+
+        csv_files = {}
+        if write_csv:
+            rows = self._tee_to_csv(rows, week, csv_files)
+
+        history = OddsHistory(db_manager)
+        try:
+            db_manager.ensure_qb_props_columns()
+            rows = history.changes_only(rows, week)
+            db_manager.stream_insert(rows, {**self.ODDS_COLUMNS, **history.COLUMNS}, week=week)
+        except Exception:
+            for tmp_path, _ in csv_files.values():
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+        results = {}
+        for market, table in self.ODDS_TABLES.items():
+            if market not in payloads:
+                continue
+
+            csv_path = None
+            if table in csv_files:
+                tmp_path, csv_path = csv_files[table]
+                os.replace(tmp_path, csv_path)
+                csv_path = str(csv_path)
+
+            if payloads.get(market) is None or not history.seen[table]:
+                logger.warning(f"✗ No {market} data ingested")
+                results[market] = None
+            else:
+                results[market] = {'rows': history.seen[table], 'changed': history.changed[table],
+                                   'csv': csv_path}
+
+        return results
+
+    def _tee_to_csv(self, rows: Iterable[Tuple[str, Dict]], week: int,
+                    csv_files: Dict) -> Iterator[Tuple[str, Dict]]:
+        """
+        Pass rows through while writing each table's rows to its CSV file
+
+        Files are written under a temporary name; the caller renames them once
+        the database write has succeeded.
+
+        Args:
+            rows: (table_name, row) pairs
+            week: NFL week number (for file names and the week column)
+            csv_files: Filled with table_name -> (temporary path, final path)
+
+        Yields:
+            The input rows, unchanged
+        """
+        filenames = {self.ODDS_TABLES[market]: template.format(week=week)
+                     for market, template in self.CSV_TEMPLATES.items()}
+        handles = {}
+        writers = {}
+
+        try:
+            for table, row in rows:
+                if table not in writers:
+                    final_path = DATA_DIR / filenames[table]
+                    tmp_path = final_path.with_suffix(f'.{os.getpid()}.tmp')
+                    handles[table] = open(tmp_path, 'w', newline='')
+                    writers[table] = csv.DictWriter(handles[table], fieldnames=self.ODDS_COLUMNS[table],
+                                                    extrasaction='ignore')
+                    writers[table].writeheader()
+                    csv_files[table] = (tmp_path, final_path)
+
+                writers[table].writerow({**row, 'week': week})
+                yield table, row
+        finally:
+            for handle in handles.values():
+                handle.close()
+
     def _parse_game_lines(self, data: List[Dict], market_type: str) -> List[Dict]:
         """
         Parse spreads or totals from The Odds API response
@@ -444,8 +747,19 @@ class OddsScraper:
         Returns:
             List of parsed game line dictionaries
         """
-        lines_list = []
+        return list(self._iter_game_lines(data, market_type))
+
+    def _iter_game_lines(self, data: List[Dict], market_type: str) -> Iterator[Dict]:
+        """
+        Yield spreads or totals from The Odds API response one line at a time
+
+        Args:
+            data: Raw API response data
+            market_type: 'spreads' or 'totals'
 
+        Yields:
+            Parsed game line dictionaries
+        """
         for game in data:
             try:
                 home_team = game.get('home_team', '')
@@ -459,51 +773,43 @@ class OddsScraper:
                     markets = bookmaker.get('markets', [])
 
                     for market in markets:
-                        if market.get('key') == market_type:
-                            outcomes = market.get('outcomes', [])
-
-                            if market_type == 'spreads':
-                                # Spreads have outcomes for each team
-                                for outcome in outcomes:
-                                    team = outcome.get('name', '')
-                                    point = outcome.get('point', 0)
-                                    price = outcome.get('price', 0)
-
-                                    lines_list.append({
-                                        'game': f"{away_team} @ {home_team}",
-                                        'home_team': home_team,
-                                        'away_team': away_team,
-                                        'team': team,
-                                        'spread': point,
-                                        'odds': price,
-                                        'sportsbook': bookmaker_name,
-                                        'game_time': commence_time
-                                    })
-
-                            elif market_type == 'totals':
-                                # Totals have Over/Under outcomes
-                                for outcome in outcomes:
-                                    over_under = outcome.get('name', '')  # 'Over' or 'Under'
-                                    point = outcome.get('point', 0)
-                                    price = outcome.get('price', 0)
-
-                                    lines_list.append({
-                                        'game': f"{away_team} @ {home_team}",
-                                        'home_team': home_team,
-                                        'away_team': away_team,
-                                        'total': point,
-                                        'over_under': over_under,
-                                        'odds': price,
-                                        'sportsbook': bookmaker_name,
-                                        'game_time': commence_time
-                                    })
+                        if market.get('key') != market_type:
+                            continue
+
+                        outcomes = market.get('outcomes', [])
+
+                        if market_type == 'spreads':
+                            # Spreads have outcomes for each team
+                            for outcome in outcomes:
+                                yield {
+                                    'game': f"{away_team} @ {home_team}",
+                                    'home_team': home_team,
+                                    'away_team': away_team,
+                                    'team': outcome.get('name', ''),
+                                    'spread': outcome.get('point', 0),
+                                    'odds': outcome.get('price', 0),
+                                    'sportsbook': bookmaker_name,
+                                    'game_time': commence_time
+                                }
+
+                        elif market_type == 'totals':
+                            # Totals have Over/Under outcomes
+                            for outcome in outcomes:
+                                yield {
+                                    'game': f"{away_team} @ {home_team}",
+                                    'home_team': home_team,
+                                    'away_team': away_team,
+                                    'total': outcome.get('point', 0),
+                                    'over_under': outcome.get('name', ''),  # 'Over' or 'Under'
+                                    'odds': outcome.get('price', 0),
+                                    'sportsbook': bookmaker_name,
+                                    'game_time': commence_time
+                                }
 
             except Exception as e:
                 logger.debug(f"Error parsing game line: {e}")
                 continue
 
-        return lines_list
-
     def run(self, week: int) -> Optional[Dict[str, str]]:
         """
         Run the complete odds fetching workflow (fetches all markets)
@@ -548,7 +854,7 @@ def main():
     if len(sys.argv) > 1:
         week = int(sys.argv[1])
     else:
-        week_manager = WeekManager()
+        week_manager = get_week_manager()
         week = week_manager.get_current_week()
         logger.info(f"Using current week from WeekManager: {week}")
 
@@ -153,9 +153,15 @@ if __name__ == "__main__":
     parser.add_argument('--week', type=int, help='Backfill specific week')
     parser.add_argument('--all', action='store_true', help='Backfill all missing weeks')
     parser.add_argument('--db', default='data/database/nfl_betting.db', help='Database path')
+    parser.add_argument('--http-cache', choices=['live', 'record', 'replay'],
+                        help='HTTP cache mode for API fallbacks (default: HTTP_CACHE_MODE env var)')
 
     args = parser.parse_args()
 
+    if args.http_cache:
+        from utils.http_cache import configure_http_cache
+        configure_http_cache(args.http_cache)
+
     if args.week:
         success = backfill_week(args.week, args.db)
         sys.exit(0 if success else 1)
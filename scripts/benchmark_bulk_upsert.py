@@ -0,0 +1,119 @@
+"""
+Benchmark bulk upserts against the legacy per-row DELETE + to_sql pattern
+
+Builds a throwaway database, generates a synthetic player_game_log frame and
+times an initial load plus a full re-import (every row updated) for both paths.
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_manager import DatabaseManager
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def build_game_log(rows, seed=42):
+    """Generate a synthetic player_game_log DataFrame with unique natural keys"""
+    rng = np.random.default_rng(seed)
+    weeks = 18
+    seasons = max(1, rows // (weeks * 2000) + 1)
+    idx = np.arange(rows)
+
+    return pd.DataFrame({
+        'player_id': [f'P{i // (weeks * seasons):06d}' for i in idx],
+        'player_name': [f'Player {i // (weeks * seasons)}' for i in idx],
+        'week': idx % weeks + 1,
+        'season': 2000 + (idx // weeks) % seasons,
+        'position': 'QB',
+        'team': 'KC',
+        'opponent': 'BUF',
+        'passing_attempts': rng.integers(10, 50, rows),
+        'passing_completions': rng.integers(5, 35, rows),
+        'passing_yards': rng.integers(50, 450, rows),
+        'passing_touchdowns': rng.integers(0, 5, rows),
+        'interceptions': rng.integers(0, 3, rows),
+        'red_zone_passes': rng.integers(0, 10, rows),
+        'red_zone_completions': rng.integers(0, 6, rows),
+    })
+
+
+def legacy_upsert(db, df):
+    """Pre-bulk implementation: one DELETE per row, then to_sql append"""
+    conn = db._get_connection()
+    for _, row in df.iterrows():
+        conn.execute(
+            "DELETE FROM player_game_log WHERE player_id=? AND season=? AND week=?",
+            (row['player_id'], row['season'], row['week'])
+        )
+    df.to_sql('player_game_log', conn, if_exists='append', index=False)
+    conn.commit()
+
+
+def time_run(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.2f}s")
+    return elapsed, result
+
+
+def run_benchmark(rows, batch_size, skip_legacy=False):
+    df = build_game_log(rows)
+    updated_df = df.assign(passing_touchdowns=df['passing_touchdowns'] + 1)
+
+    print("=" * 60)
+    print(f"Bulk upsert benchmark: {rows:,} player_game_log rows (batch size {batch_size:,})")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {}
+
+        if not skip_legacy:
+            db = DatabaseManager(db_path=Path(tmp_dir) / 'legacy.db')
+            db.connect()
+            db.create_tables()
+            print("Legacy (per-row DELETE + to_sql):")
+            results['legacy_insert'], _ = time_run("initial load", lambda: legacy_upsert(db, df))
+            results['legacy_update'], _ = time_run("re-import (all updates)", lambda: legacy_upsert(db, updated_df))
+            db.close()
+
+        db = DatabaseManager(db_path=Path(tmp_dir) / 'bulk.db', upsert_batch_size=batch_size)
+        db.connect()
+        db.create_tables()
+        print("Bulk (INSERT ... ON CONFLICT DO UPDATE):")
+        results['bulk_insert'], stats = time_run(
+            "initial load", lambda: db.bulk_upsert('player_game_log', df))
+        print(f"    {stats}")
+        results['bulk_update'], stats = time_run(
+            "re-import (all updates)", lambda: db.bulk_upsert('player_game_log', updated_df))
+        print(f"    {stats}")
+        db.close()
+
+    if not skip_legacy:
+        print("Speedup:")
+        print(f"  initial load               {results['legacy_insert'] / results['bulk_insert']:8.1f}x")
+        print(f"  re-import                  {results['legacy_update'] / results['bulk_update']:8.1f}x")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark DatabaseManager.bulk_upsert')
+    parser.add_argument('--rows', type=int, default=100_000, help='Rows to upsert (default: 100000)')
+    parser.add_argument('--batch-size', type=int, default=DatabaseManager.DEFAULT_UPSERT_BATCH_SIZE,
+                        help='Rows per transaction')
+    parser.add_argument('--skip-legacy', action='store_true', help='Only time the bulk path')
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.batch_size, skip_legacy=args.skip_legacy)
@@ -0,0 +1,110 @@
+"""
+Benchmark model calibration metrics: per-dict loops vs NumPy, plus bootstrap CIs
+
+Generates a synthetic history of completed predictions (multi-season scale)
+and times Brier score, calibration error and Kelly ROI with the legacy
+per-prediction loops and with PerformanceAnalyzer, then times the bootstrap
+confidence intervals in-process and across the process pool.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.model_calibration import PerformanceAnalyzer
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def build_predictions(count, seed=42):
+    """Synthetic completed predictions with roughly calibrated outcomes"""
+    rng = np.random.default_rng(seed)
+    probs = rng.uniform(0.4, 0.95, count)
+    outcomes = rng.random(count) < probs
+    odds = rng.choice([-450, -300, -200, -150, -110, 100, 130, 180], count)
+    return [
+        {'predicted_probability': float(p), 'actual_outcome': bool(o), 'odds': int(od)}
+        for p, o, od in zip(probs, outcomes, odds)
+    ]
+
+
+def legacy_metrics(predictions, bins=10, bankroll=1000):
+    """Pre-NumPy implementation: one pass per metric, one scan per bin"""
+    brier = sum((p['predicted_probability'] - (1.0 if p['actual_outcome'] else 0.0)) ** 2
+                for p in predictions) / len(predictions)
+
+    edges = np.linspace(0, 1, bins + 1)
+    total_error = 0.0
+    for i in range(bins):
+        in_bin = [p for p in predictions if edges[i] <= p['predicted_probability'] < edges[i + 1]]
+        if in_bin:
+            rate = sum(1 for p in in_bin if p['actual_outcome']) / len(in_bin)
+            total_error += abs((edges[i] + edges[i + 1]) / 2 - rate) * len(in_bin)
+
+    total_bet = total_winnings = 0.0
+    for p in predictions:
+        odds = p['odds']
+        decimal_odds = (100 / abs(odds)) + 1 if odds < 0 else (odds / 100) + 1
+        b = decimal_odds - 1
+        kelly = (b * p['predicted_probability'] - (1 - p['predicted_probability'])) / b
+        bet = bankroll * min(max(0, kelly * 0.25), 0.05)
+        total_bet += bet
+        if p['actual_outcome']:
+            total_winnings += bet * b
+
+    return brier, total_error / len(predictions), total_winnings / total_bet * 100
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(count, resamples, workers):
+    predictions = build_predictions(count)
+    analyzer = PerformanceAnalyzer(n_resamples=resamples, max_workers=workers)
+
+    print("=" * 60)
+    print(f"Calibration benchmark ({count:,} predictions, {resamples} resamples)")
+    print("=" * 60)
+
+    legacy_time, legacy = timed(legacy_metrics, predictions)
+    numpy_time, _ = timed(lambda: (analyzer.calculate_brier_score(predictions),
+                                   analyzer.calculate_calibration_error(predictions),
+                                   analyzer.calculate_roi(predictions)))
+    print(f"  {'metrics (legacy loops)':<32} {legacy_time:8.3f} s")
+    print(f"  {'metrics (NumPy)':<32} {numpy_time:8.3f} s  {legacy_time / numpy_time:6.1f}x")
+
+    analyzer.parallel_min_work = float('inf')
+    serial_time, intervals = timed(analyzer.bootstrap_confidence_intervals, predictions)
+    print(f"  {'bootstrap CIs (in-process)':<32} {serial_time:8.3f} s")
+
+    if analyzer.max_workers > 1:
+        analyzer.parallel_min_work = 0
+        pool_time, _ = timed(analyzer.bootstrap_confidence_intervals, predictions)
+        print(f"  {f'bootstrap CIs ({analyzer.max_workers} processes)':<32} {pool_time:8.3f} s  "
+              f"{serial_time / pool_time:6.1f}x")
+    else:
+        print("  (one CPU available - process pool not timed)")
+
+    print(f"\n  Brier {legacy[0]:.4f}  calibration error {legacy[1]:.4f}  ROI {legacy[2]:.1f}%")
+    for metric in PerformanceAnalyzer.METRICS:
+        print(f"  {metric:<18} {intervals[metric]['lower']:10.4f} – {intervals[metric]['upper']:.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark model calibration metrics')
+    parser.add_argument('--predictions', type=int, default=50_000, help='Completed predictions (default: 50,000)')
+    parser.add_argument('--resamples', type=int, default=1000, help='Bootstrap resamples (default: 1000)')
+    parser.add_argument('--workers', type=int, default=4, help='Bootstrap processes (default: 4)')
+    args = parser.parse_args()
+
+    run_benchmark(args.predictions, args.resamples, args.workers)
@@ -0,0 +1,78 @@
+"""
+Benchmark the vectorized edge engine against the per-row scalar path
+
+Generates synthetic QB x sportsbook rows and prices them both with
+EdgeCalculator.calculate_edge (one call per row) and VectorizedEdgeEngine.price.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.edge_calculator import EdgeCalculator, VectorizedEdgeEngine
+
+
+def build_inputs(rows, seed=42):
+    """Generate synthetic QB / defense / odds arrays"""
+    rng = np.random.default_rng(seed)
+    return {
+        'qb_tds': rng.integers(0, 40, rows).astype(float),
+        'qb_games': rng.integers(1, 17, rows).astype(float),
+        'defense_tds': rng.uniform(0.5, 3.0, rows),
+        'odds': rng.choice([-400, -250, -210, -150, -110, 100, 120, 150, 300], rows).astype(float),
+    }
+
+
+def run_scalar(inputs, model_version):
+    """Price rows one at a time through the scalar calculators"""
+    calc = EdgeCalculator(model_version=model_version)
+    context = {'is_home': True, 'is_division_game': False}
+    return [
+        calc.calculate_edge({'total_tds': tds, 'games_played': games},
+                            {'tds_per_game': def_tds}, odds, context)
+        for tds, games, def_tds, odds in zip(inputs['qb_tds'], inputs['qb_games'],
+                                             inputs['defense_tds'], inputs['odds'])
+    ]
+
+
+def run_vectorized(inputs, model_version):
+    """Price all rows in one pass"""
+    engine = VectorizedEdgeEngine(model_version)
+    return engine.price(is_home=True, is_division_game=False, **inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized edge engine')
+    parser.add_argument('--rows', type=int, default=100_000, help='Rows to price')
+    parser.add_argument('--model', choices=['v1', 'v2'], default='v1', help='Model version')
+    args = parser.parse_args()
+
+    inputs = build_inputs(args.rows)
+
+    start = time.perf_counter()
+    scalar = run_scalar(inputs, args.model)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = run_vectorized(inputs, args.model)
+    vector_time = time.perf_counter() - start
+
+    max_diff = np.max(np.abs(
+        vectorized['edge_percentage'].to_numpy() - np.array([e['edge_percentage'] for e in scalar])
+    ))
+
+    print(f"Rows:        {args.rows:,} ({args.model})")
+    print(f"Scalar:      {scalar_time:.3f}s")
+    print(f"Vectorized:  {vector_time:.3f}s")
+    print(f"Speedup:     {scalar_time / vector_time:.1f}x")
+    print(f"Max edge % difference: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark player name normalization: scalar vs memoized scalar vs Series path
+
+Generates a synthetic column of player names (a few thousand distinct names
+repeated like a game log, with suffixes, initials and stray whitespace) and
+times each way of normalizing it. The legacy path is normalize_player_name as
+it was before the patterns were precompiled and memoized, applied per row.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.name_normalizer import (
+    NAME_SUFFIXES,
+    _normalize_cached,
+    normalize_player_name,
+    normalize_player_names,
+)
+
+FIRST = ['Patrick', 'A.J.', 'C.J.', 'Josh', 'Gardner', 'T.J.', 'Jalen', 'D.K.', 'Michael', 'Kenny']
+LAST = ['Mahomes', 'Brown', 'Stroud', 'Allen', 'Minshew', 'Watt', 'Hurts', 'Metcalf', 'Penix', 'Pickett']
+SUFFIXES = ['', '', '', ' Jr.', ' II', ' III', ' Sr']
+
+
+def legacy_normalize(name):
+    """Pre-memoization implementation: regexes rebuilt and recompiled per call"""
+    if not name:
+        return ""
+    normalized = ' '.join(name.strip().split())
+    suffix_pattern = r'\s+(' + '|'.join(re.escape(s) for s in NAME_SUFFIXES) + r')\.?$'
+    normalized = re.sub(suffix_pattern, '', normalized, flags=re.IGNORECASE)
+    normalized = re.sub(r'([A-Z])\.(?=[A-Z]\.?\s)', r'\1', normalized)
+    normalized = re.sub(r'([A-Z])\.(\s)', r'\1\2', normalized)
+    normalized = ' '.join(normalized.split())
+    return normalized.strip()
+
+
+def build_names(rows, distinct, seed=42):
+    """Series of rows names drawn from distinct raw spellings"""
+    rng = np.random.default_rng(seed)
+    pool = [
+        f"{' ' * (i % 2)}{FIRST[i % len(FIRST)]}  {LAST[(i // len(FIRST)) % len(LAST)]}{i // 100 or ''}"
+        f"{SUFFIXES[i % len(SUFFIXES)]}"
+        for i in range(distinct)
+    ]
+    return pd.Series(np.array(pool, dtype=object)[rng.integers(0, distinct, rows)], name='player_name')
+
+
+def timed(func, names):
+    start = time.perf_counter()
+    result = func(names)
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(rows, distinct):
+    names = build_names(rows, distinct)
+
+    print("=" * 60)
+    print(f"Name normalization benchmark ({rows:,} names, {distinct:,} distinct)")
+    print("=" * 60)
+
+    _normalize_cached.cache_clear()
+    paths = [
+        ('legacy apply (uncached)', lambda s: s.apply(legacy_normalize)),
+        ('memoized apply (cold)', lambda s: s.apply(normalize_player_name)),
+        ('memoized apply (warm)', lambda s: s.apply(normalize_player_name)),
+        ('normalize_player_names', normalize_player_names),
+    ]
+
+    results = {}
+    expected = None
+    for label, func in paths:
+        elapsed, result = timed(func, names)
+        if expected is None:
+            expected = result
+        assert result.equals(expected), f"{label} output differs from legacy"
+        results[label] = elapsed
+
+    baseline = results['legacy apply (uncached)']
+    for label, elapsed in results.items():
+        print(f"  {label:<26} {elapsed:8.2f} s  {rows / elapsed:>12,.0f} names/s  {baseline / elapsed:6.1f}x")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark player name normalization')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Names to normalize (default: 1,000,000)')
+    parser.add_argument('--distinct', type=int, default=5_000, help='Distinct raw names (default: 5,000)')
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.distinct)
@@ -0,0 +1,64 @@
+"""
+Benchmark serial vs concurrent player prop fetching
+
+Runs OddsScraper.fetch_player_props_for_all_events against a local stand-in
+Odds API (tests/odds_api_server.py) with simulated network latency, so the
+wall-clock speedup can be measured offline without spending API quota.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+
+
+def run(api, concurrency, rate):
+    """Fetch the full slate once; returns (seconds, props, billed requests)"""
+    scraper = OddsScraper(
+        api_keys=['benchmark-paid'],
+        paid_key='benchmark-paid',
+        base_url=api.base_url,
+        max_concurrency=concurrency,
+        requests_per_second=rate
+    )
+
+    api.max_in_flight = 0
+    start = time.perf_counter()
+    props = scraper.fetch_player_props_for_all_events(concurrent=concurrency > 1)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, props, scraper.api_rotator.get_total_usage()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent player prop fetching')
+    parser.add_argument('--events', type=int, default=16, help='Games on the slate (max 16)')
+    parser.add_argument('--latency', type=float, default=0.25, help='Simulated seconds per request')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent requests')
+    parser.add_argument('--rate', type=float, default=20.0, help='Token bucket requests per second')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with StandInOddsAPI(events=args.events, latency=args.latency) as api:
+        serial_time, serial_props, serial_billed = run(api, 1, args.rate)
+        concurrent_time, concurrent_props, concurrent_billed = run(api, args.concurrency, args.rate)
+        max_in_flight = api.max_in_flight
+
+    print(f"Events: {args.events}, latency: {args.latency * 1000:.0f}ms/request, rate limit: {args.rate}/s")
+    print(f"Serial:            {serial_time:.2f}s ({len(serial_props)} props, {serial_billed} requests)")
+    print(f"Concurrent (x{args.concurrency}):  {concurrent_time:.2f}s ({len(concurrent_props)} props, "
+          f"{concurrent_billed} requests, max {max_in_flight} in flight)")
+    print(f"Speedup:           {serial_time / concurrent_time:.1f}x")
+    print(f"Identical results: {serial_props == concurrent_props}")
+
+
+if __name__ == "__main__":
+    main()
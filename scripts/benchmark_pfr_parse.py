@@ -0,0 +1,75 @@
+"""
+Benchmark PFR table parsing: single lxml pass vs BeautifulSoup + pd.read_html
+
+Parses the recorded fixture pages in tests/fixtures/pfr (or any saved PFR
+page) with both paths and reports the mean parse time per page. The legacy
+path is what DefenseStatsScraper / QBStatsScraper did before pfr_tables:
+BeautifulSoup over the whole page, str(table), then pd.read_html.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.pfr_tables import read_table
+
+logging.basicConfig(level=logging.WARNING)
+
+FIXTURES_DIR = Path(__file__).parent.parent / 'tests' / 'fixtures' / 'pfr'
+DEFAULT_PAGES = [
+    (FIXTURES_DIR / 'opp_2024.htm', 'team_stats'),
+    (FIXTURES_DIR / 'passing_2024.htm', 'passing'),
+]
+
+
+def legacy_parse(html, table_id):
+    """Pre-pfr_tables implementation: soup the page, re-serialize the table, read_html it"""
+    soup = BeautifulSoup(html, 'lxml')
+    table = soup.find('table', {'id': table_id})
+    return pd.read_html(StringIO(str(table)))[0]
+
+
+def time_parse(func, html, table_id, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        df = func(html, table_id)
+    return (time.perf_counter() - start) / iterations, df
+
+
+def run_benchmark(pages, iterations):
+    print("=" * 60)
+    print(f"PFR table parse benchmark ({iterations} iterations per page)")
+    print("=" * 60)
+
+    results = {}
+    for path, table_id in pages:
+        html = Path(path).read_bytes()
+        legacy, legacy_df = time_parse(legacy_parse, html, table_id, iterations)
+        fast, fast_df = time_parse(read_table, html, table_id, iterations)
+        results[Path(path).name] = (legacy, fast)
+
+        print(f"{Path(path).name} #{table_id} ({len(html) / 1024:.0f} KB, {len(fast_df)} rows):")
+        print(f"  {'BeautifulSoup + read_html':<28} {legacy * 1000:8.1f} ms")
+        print(f"  {'pfr_tables.read_table':<28} {fast * 1000:8.1f} ms")
+        print(f"  {'speedup':<28} {legacy / fast:8.1f}x")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark PFR table parsing')
+    parser.add_argument('--iterations', type=int, default=20, help='Parses per page (default: 20)')
+    parser.add_argument('--page', nargs=2, action='append', metavar=('PATH', 'TABLE_ID'),
+                        help='Saved PFR page and table id to time (default: the test fixtures)')
+    args = parser.parse_args()
+
+    run_benchmark(args.page or DEFAULT_PAGES, args.iterations)
@@ -61,6 +61,7 @@ def main():
     if len(sys.argv) < 2:
         print("\nUsage: python3 scripts/rescrape_weeks.py <week1> [week2] [week3] ...")
         print("Example: python3 scripts/rescrape_weeks.py 7 8")
+        print("Offline: HTTP_CACHE_MODE=replay python3 scripts/rescrape_weeks.py 7 8")
         sys.exit(1)
 
     weeks = [int(w) for w in sys.argv[1:]]
@@ -0,0 +1,126 @@
+"""Shared fixtures: a small but complete edge-detection database"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.connection_pool import close_all_pools
+from utils.db_manager import DatabaseManager
+
+MIGRATION_002 = Path(__file__).parent.parent / 'utils' / 'migrations' / '002_playerprofile_schema.sql'
+
+# (home_team, away_team, home QB, QB TDs, QB games, away defense TDs/game, FanDuel odds)
+WEEK_7_GAMES = [
+    ('Kansas City Chiefs', 'Las Vegas Raiders', 'Patrick Mahomes', 14, 6, 1.9, -250),
+    ('Buffalo Bills', 'Miami Dolphins', 'Josh Allen', 16, 6, 1.6, -300),
+    ('Philadelphia Eagles', 'New York Giants', 'Jalen Hurts', 9, 6, 1.1, -180),
+    ('Cincinnati Bengals', 'Cleveland Browns', 'Joe Burrow', 13, 6, 1.4, -210),
+    ('Detroit Lions', 'Chicago Bears', 'Jared Goff', 12, 6, 2.0, -190),
+]
+
+
+def populate_edge_db(db_path, season=2024, week=7):
+    """Create base + PlayerProfiler schema and seed one week of edge inputs"""
+    db = DatabaseManager(db_path=db_path)
+    db.connect()
+    db.create_tables()
+    db.conn.executescript(MIGRATION_002.read_text())
+
+    scraped_at = datetime(2024, 10, 15, 9, 0).isoformat()
+    cur = db.conn.cursor()
+
+    for home, away, qb, tds, games, def_tds, odds in WEEK_7_GAMES:
+        cur.execute(
+            "INSERT INTO matchups (home_team, away_team, game_date, week, scraped_at) VALUES (?, ?, ?, ?, ?)",
+            (home, away, '2024-10-20', week, scraped_at)
+        )
+        cur.execute(
+            "INSERT INTO qb_stats (qb_name, team, total_tds, games_played, is_starter, year, scraped_at) "
+            "VALUES (?, ?, ?, ?, 1, 2025, ?)",
+            (qb, home, tds, games, scraped_at)
+        )
+        for team, tds_per_game in ((away, def_tds), (home, 1.5)):
+            cur.execute(
+                "INSERT INTO defense_stats (team_name, pass_tds_allowed, games_played, tds_per_game, week, scraped_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (team, round(tds_per_game * 6), 6, tds_per_game, week, scraped_at)
+            )
+        cur.execute(
+            "INSERT INTO qb_props (qb_name, odds_over_05_td, sportsbook, game, home_team, away_team, game_time, week, scraped_at) "
+            "VALUES (?, ?, 'FanDuel', ?, ?, ?, ?, ?, ?)",
+            (qb, odds, f"{away} @ {home}", home, away, '2024-10-20T17:00:00Z', week, scraped_at)
+        )
+
+    # Enhanced stats for all but the last QB (exercises the v2 fallback path)
+    for home, _, qb, tds, games, _, _ in WEEK_7_GAMES[:-1]:
+        cur.execute(
+            "INSERT INTO qb_stats_enhanced (qb_name, team, season, games_played, total_pass_tds, passing_tds_per_game) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (qb, home, season, games, tds, tds / games)
+        )
+
+    # Game logs: red zone volume varies so each QB lands in a different bucket
+    red_zone = {'Patrick Mahomes': (3, 10), 'Josh Allen': (2, 12), 'Jalen Hurts': (1, 14), 'Joe Burrow': (1, 2)}
+    for week_num in range(3, 7):
+        for i, (qb, (tds, rz_passes)) in enumerate(red_zone.items()):
+            cur.execute(
+                "INSERT INTO player_game_log (player_id, player_name, week, season, passing_touchdowns, red_zone_passes) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (f'QB{i}', qb, week_num, season, tds, rz_passes)
+            )
+
+    db.conn.commit()
+    db.close()
+    return db_path
+
+
+# Teams whose games qualify for First Half Total Under (weak offense + strong defense)
+FIRST_HALF_TEAMS = ['KC', 'LV', 'BUF', 'MIA']
+
+
+def populate_team_metrics(db_path, season=2024, week=7):
+    """Seed 32 teams of team_metrics; FIRST_HALF_TEAMS rank bottom offense / top defense"""
+    db = DatabaseManager(db_path=db_path)
+    db.connect()
+    others = [f'T{i:02d}' for i in range(32 - len(FIRST_HALF_TEAMS))]
+
+    for i, team in enumerate(FIRST_HALF_TEAMS + others):
+        weak = team in FIRST_HALF_TEAMS
+        db.cursor.execute(
+            "INSERT INTO team_metrics (team_name, season, week, offensive_yards_per_play, defensive_yards_per_play) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (team, season, week, 4.0 + i * 0.1 if weak else 5.5 + i * 0.05,
+             4.0 + i * 0.1 if weak else 5.5 + i * 0.05)
+        )
+
+    db.conn.commit()
+    db.close()
+    return db_path
+
+
+@pytest.fixture
+def edge_db(tmp_path):
+    """Path to a populated week 7 / 2024 database"""
+    path = populate_edge_db(tmp_path / 'edges.db')
+    yield path
+    close_all_pools(path)
+
+
+class QueryCounter:
+    """Counts SELECT statements issued on a sqlite3 connection"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, statement):
+        if statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
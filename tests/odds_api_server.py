@@ -0,0 +1,250 @@
+"""
+Local stand-in for The Odds API
+
+Serves /sports/{sport}/events, /sports/{sport}/events/{id}/odds (synthetic
+QB TD props) and /sports/{sport}/odds (spreads / totals) with a
+configurable per-request latency, so OddsScraper
+can be tested and benchmarked offline. Can also inject 429/5xx responses.
+Successful responses carry x-requests-used / x-requests-remaining per apiKey.
+"""
+
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TEAMS = [
+    ('Kansas City Chiefs', 'Patrick Mahomes'), ('Buffalo Bills', 'Josh Allen'),
+    ('Philadelphia Eagles', 'Jalen Hurts'), ('Baltimore Ravens', 'Lamar Jackson'),
+    ('Cincinnati Bengals', 'Joe Burrow'), ('Miami Dolphins', 'Tua Tagovailoa'),
+    ('Dallas Cowboys', 'Dak Prescott'), ('Detroit Lions', 'Jared Goff'),
+    ('Houston Texans', 'C.J. Stroud'), ('Los Angeles Chargers', 'Justin Herbert'),
+    ('Green Bay Packers', 'Jordan Love'), ('San Francisco 49ers', 'Brock Purdy'),
+    ('Minnesota Vikings', 'Sam Darnold'), ('Los Angeles Rams', 'Matthew Stafford'),
+    ('Tampa Bay Buccaneers', 'Baker Mayfield'), ('Atlanta Falcons', 'Kirk Cousins'),
+    ('Washington Commanders', 'Jayden Daniels'), ('Seattle Seahawks', 'Geno Smith'),
+    ('Arizona Cardinals', 'Kyler Murray'), ('Denver Broncos', 'Bo Nix'),
+    ('Pittsburgh Steelers', 'Russell Wilson'), ('New York Jets', 'Aaron Rodgers'),
+    ('Indianapolis Colts', 'Anthony Richardson'), ('Chicago Bears', 'Caleb Williams'),
+    ('New Orleans Saints', 'Derek Carr'), ('Jacksonville Jaguars', 'Trevor Lawrence'),
+    ('Las Vegas Raiders', 'Gardner Minshew'), ('Carolina Panthers', 'Bryce Young'),
+    ('Tennessee Titans', 'Will Levis'), ('Cleveland Browns', 'Deshaun Watson'),
+    ('New England Patriots', 'Drake Maye'), ('New York Giants', 'Daniel Jones'),
+]
+
+EVENTS_PATH = re.compile(r'/v4/sports/[^/]+/events$')
+EVENT_ODDS_PATH = re.compile(r'/v4/sports/[^/]+/events/([^/]+)/odds$')
+GAME_ODDS_PATH = re.compile(r'/v4/sports/[^/]+/odds$')
+
+
+class StandInOddsAPI:
+    """
+    Threaded local HTTP server mimicking the Odds API endpoints OddsScraper uses
+
+    Usage:
+        with StandInOddsAPI(events=16, latency=0.05) as api:
+            scraper = OddsScraper(api_keys=['paid'], paid_key='paid', base_url=api.base_url)
+    """
+
+    def __init__(self, events: int = 16, latency: float = 0.0,
+                 kickoff: datetime = datetime(2024, 10, 20, 17, 0, tzinfo=timezone.utc),
+                 quota: int = 20000):
+        """
+        Args:
+            events: Number of games on the slate (max 16)
+            latency: Seconds each request sleeps before responding
+            kickoff: Commence time of the first game
+            quota: Credits per apiKey reported in the quota headers
+        """
+        self.latency = latency
+        self.quota = quota
+        self.credits_used = {}
+        self.events = [
+            {
+                'id': f'event{i:02d}',
+                'home_team': TEAMS[2 * i][0],
+                'away_team': TEAMS[2 * i + 1][0],
+                'commence_time': (kickoff + timedelta(hours=i % 3)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'qbs': (TEAMS[2 * i][1], TEAMS[2 * i + 1][1]),
+            }
+            for i in range(min(events, len(TEAMS) // 2))
+        ]
+
+        # event id -> list of status codes to return before succeeding
+        self.failures = {}
+        # event id -> amount added to every price for that event
+        self.price_moves = {}
+        # (event id, bookmaker title) pairs no longer offered
+        self.pulled = set()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/v4'
+
+    def fail(self, event_id: str, *status_codes: int):
+        """Return the given statuses for event_id's odds before succeeding"""
+        self.failures[event_id] = list(status_codes)
+
+    def move(self, event_id: str, points: int):
+        """Shift every price for event_id by points (simulates line movement)"""
+        self.price_moves[event_id] = self.price_moves.get(event_id, 0) + points
+
+    def pull(self, event_id: str, bookmaker: str):
+        """Stop offering bookmaker's lines for event_id in every market"""
+        self.pulled.add((event_id, bookmaker))
+
+    def start(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                api._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        url = urlparse(handler.path)
+        path = url.path
+        query = parse_qs(url.query)
+        api_key = query.get('apiKey', [''])[0]
+
+        with self._lock:
+            self.requests.append(path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            if EVENTS_PATH.match(path):
+                body = [{k: v for k, v in e.items() if k != 'qbs'} for e in self.events]
+                return self._send(handler, 200, body, headers=self._bill(api_key))
+
+            if GAME_ODDS_PATH.match(path):
+                market = query.get('markets', [''])[0]
+                body = [self._offered(self._game_lines(e, market, self.price_moves.get(e['id'], 0)))
+                        for e in self.events]
+                return self._send(handler, 200, body, headers=self._bill(api_key))
+
+            match = EVENT_ODDS_PATH.match(path)
+            event = next((e for e in self.events if match and e['id'] == match.group(1)), None)
+            if event is None:
+                return self._send(handler, 404, {'message': 'Event not found'})
+
+            with self._lock:
+                pending = self.failures.get(event['id'])
+                status = pending.pop(0) if pending else None
+            if status is not None:
+                return self._send(handler, status, {'message': 'injected failure'},
+                                  headers={'Retry-After': '0'} if status == 429 else None)
+
+            body = self._offered(self._event_odds(event, self.price_moves.get(event['id'], 0)))
+            return self._send(handler, 200, body, headers=self._bill(api_key))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _offered(self, event_body):
+        """Drop pulled bookmakers from an event's odds"""
+        event_body['bookmakers'] = [book for book in event_body['bookmakers']
+                                    if (event_body['id'], book['title']) not in self.pulled]
+        return event_body
+
+    def _bill(self, api_key):
+        """Charge one credit to api_key and return the quota headers"""
+        with self._lock:
+            used = self.credits_used[api_key] = self.credits_used.get(api_key, 0) + 1
+        return {'x-requests-used': str(used), 'x-requests-remaining': str(self.quota - used)}
+
+    @staticmethod
+    def _event_odds(event, move=0):
+        bookmakers = []
+        for offset, title in enumerate(['DraftKings', 'FanDuel']):
+            outcomes = []
+            for j, qb in enumerate(event['qbs']):
+                price = -300 + 40 * j - 15 * offset + move
+                outcomes.append({'name': 'Over', 'description': qb, 'price': price, 'point': 0.5})
+                outcomes.append({'name': 'Under', 'description': qb, 'price': 220, 'point': 0.5})
+            bookmakers.append({
+                'key': title.lower(),
+                'title': title,
+                'markets': [{'key': 'player_pass_tds', 'outcomes': outcomes}],
+            })
+
+        return {
+            'id': event['id'],
+            'home_team': event['home_team'],
+            'away_team': event['away_team'],
+            'commence_time': event['commence_time'],
+            'bookmakers': bookmakers,
+        }
+
+    @staticmethod
+    def _game_lines(event, market, move=0):
+        bookmakers = []
+        for offset, title in enumerate(['DraftKings', 'FanDuel']):
+            if market == 'spreads':
+                outcomes = [
+                    {'name': event['home_team'], 'price': -110 + move, 'point': -3.5 + offset},
+                    {'name': event['away_team'], 'price': -110 - move, 'point': 3.5 - offset},
+                ]
+            elif market == 'totals':
+                outcomes = [
+                    {'name': 'Over', 'price': -108 + move, 'point': 44.5 + offset},
+                    {'name': 'Under', 'price': -112 - move, 'point': 44.5 + offset},
+                ]
+            else:
+                outcomes = []
+            bookmakers.append({
+                'key': title.lower(),
+                'title': title,
+                'markets': [{'key': market, 'outcomes': outcomes}],
+            })
+
+        return {
+            'id': event['id'],
+            'home_team': event['home_team'],
+            'away_team': event['away_team'],
+            'commence_time': event['commence_time'],
+            'bookmakers': bookmakers,
+        }
+
+    @staticmethod
+    def _send(handler, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
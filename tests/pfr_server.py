@@ -0,0 +1,156 @@
+"""
+Local stand-in for Pro Football Reference pages
+
+Serves fixed HTML pages by path with ETag / Last-Modified validators and
+answers conditional requests with 304 Not Modified, optionally gzip
+encoded, so the shared HTTP client and the PFR scrapers can be tested
+offline. Can also inject 429/5xx responses. Records each request's
+headers and the client port (to check keep-alive reuse).
+"""
+
+import gzip
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+LAST_MODIFIED = 'Tue, 15 Oct 2024 08:00:00 GMT'
+
+
+def defense_page(teams):
+    """
+    Minimal opp.htm page
+
+    Args:
+        teams: (team, games, pass TDs allowed) tuples
+
+    Returns:
+        HTML with a team_stats table in PFR's layout
+    """
+    rows = ''.join(
+        f'<tr><th>{i}</th><td>{team}</td><td>{games}</td><td>{tds}</td><td>{tds * 2}</td></tr>'
+        for i, (team, games, tds) in enumerate(teams, start=1)
+    )
+    return (
+        '<html><body><table id="team_stats">'
+        '<thead><tr><th>Rk</th><th>Tm</th><th>G</th><th>TD</th><th>TD</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table></body></html>'
+    )
+
+
+class StandInPFR:
+    """
+    Threaded local HTTP/1.1 server serving PFR-like pages
+
+    Usage:
+        with StandInPFR({'/years/2025/opp.htm': html}) as pfr:
+            scraper.url = pfr.url('/years/2025/opp.htm')
+    """
+
+    def __init__(self, pages, gzip_responses: bool = False):
+        """
+        Args:
+            pages: Dict of path -> HTML
+            gzip_responses: Gzip-encode bodies for clients that accept it
+        """
+        self.pages = dict(pages)
+        self.gzip_responses = gzip_responses
+        self.requests = []   # (path, status, request headers)
+        self.ports = set()   # client ports seen (one per TCP connection)
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self._server.server_address[1]}"
+
+    def url(self, path: str) -> str:
+        return f"http://{self.host}{path}"
+
+    def fail(self, *status_codes: int):
+        """Answer the next requests with these statuses, in order"""
+        with self._lock:
+            self._failures.extend(status_codes)
+
+    def update(self, path: str, html: str):
+        """Change a page (its ETag changes with it)"""
+        self.pages[path] = html
+
+    def start(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                stand_in._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        path = urlparse(handler.path).path
+        with self._lock:
+            self.ports.add(handler.client_address[1])
+            failure = self._failures.pop(0) if self._failures else None
+
+        if failure:
+            self._record(path, failure, handler)
+            self._send(handler, failure, b'')
+            return
+
+        html = self.pages.get(path)
+        if html is None:
+            self._record(path, 404, handler)
+            self._send(handler, 404, b'not found')
+            return
+
+        body = html.encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        headers = {'ETag': etag, 'Last-Modified': LAST_MODIFIED, 'Content-Type': 'text/html'}
+
+        if handler.headers.get('If-None-Match') == etag:
+            self._record(path, 304, handler)
+            self._send(handler, 304, b'', headers)
+            return
+
+        if self.gzip_responses and 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+
+        self._record(path, 200, handler)
+        self._send(handler, 200, body, headers)
+
+    def _record(self, path, status, handler):
+        with self._lock:
+            self.requests.append((path, status, dict(handler.headers)))
+
+    @staticmethod
+    def _send(handler, status, body, headers=None):
+        handler.send_response(status)
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        if status != 304:
+            handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        if body:
+            handler.wfile.write(body)
@@ -0,0 +1,115 @@
+"""Unit tests for DatabaseManager bulk upserts"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database with the base schema"""
+    manager = DatabaseManager(db_path=tmp_path / 'test.db', upsert_batch_size=2)
+    manager.connect()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+def game_log_frame(touchdowns):
+    return pd.DataFrame({
+        'player_id': ['p1', 'p2', 'p3'],
+        'player_name': ['Patrick Mahomes', 'Josh Allen', 'Jalen Hurts'],
+        'week': [7, 7, 7],
+        'season': [2024, 2024, 2024],
+        'passing_touchdowns': touchdowns,
+    })
+
+
+class TestBulkUpsert:
+    """Test INSERT ... ON CONFLICT path"""
+
+    def test_reports_inserted_and_updated(self, db):
+        """First load inserts, second load updates in place."""
+        stats = db.bulk_upsert('player_game_log', game_log_frame([1, 2, 3]))
+        assert stats == {'inserted': 3, 'updated': 0, 'batches': 2}
+
+        stats = db.bulk_upsert('player_game_log', game_log_frame([4, 5, 6]))
+        assert stats['inserted'] == 0
+        assert stats['updated'] == 3
+
+        rows = db.conn.execute(
+            "SELECT player_id, passing_touchdowns FROM player_game_log ORDER BY player_id"
+        ).fetchall()
+        assert rows == [('p1', 4), ('p2', 5), ('p3', 6)]
+
+    def test_mixed_insert_and_update(self, db):
+        """Only new keys are counted as inserts."""
+        db.bulk_upsert('player_game_log', game_log_frame([1, 2, 3]))
+
+        df = game_log_frame([1, 2, 3])
+        df.loc[len(df)] = ['p4', 'Joe Burrow', 7, 2024, 2]
+        stats = db.upsert_player_game_log(df)
+
+        assert stats == 4
+        assert db.last_upsert_stats['inserted'] == 1
+        assert db.last_upsert_stats['updated'] == 3
+
+    def test_nan_and_numpy_values(self, db):
+        """NaN is stored as NULL and numpy scalars are bindable."""
+        df = game_log_frame(np.array([1.0, np.nan, 3.0]))
+        db.bulk_upsert('player_game_log', df)
+
+        value = db.conn.execute(
+            "SELECT passing_touchdowns FROM player_game_log WHERE player_id = 'p2'"
+        ).fetchone()[0]
+        assert value is None
+
+    def test_missing_key_column_raises(self, db):
+        """Upserting without the natural key is rejected."""
+        df = game_log_frame([1, 2, 3]).drop(columns=['player_id'])
+        with pytest.raises(ValueError):
+            db.bulk_upsert('player_game_log', df)
+
+    def test_datetimes_match_to_sql(self, db):
+        """Datetimes are stored as the same text to_sql wrote."""
+        df = pd.DataFrame({
+            'id': ['a', 'b', 'c'],
+            'at': pd.to_datetime(['2024-01-01 00:00:00', '2024-01-01 12:00:00.500', None], format='ISO8601'),
+        })
+        df.to_sql('dt_expected', db.conn, index=False)
+        db.conn.execute("CREATE TABLE dt_actual (id TEXT PRIMARY KEY, at TIMESTAMP)")
+        db.bulk_upsert('dt_actual', df, key_columns=['id'])
+
+        expected = db.conn.execute("SELECT id, at FROM dt_expected ORDER BY id").fetchall()
+        actual = db.conn.execute("SELECT id, at FROM dt_actual ORDER BY id").fetchall()
+        assert actual == expected == [
+            ('a', '2024-01-01 00:00:00'), ('b', '2024-01-01 12:00:00.500000'), ('c', None)
+        ]
+
+
+class TestDeleteFallback:
+    """Test tables without a matching UNIQUE index"""
+
+    def test_insert_dataframe_is_idempotent(self, db):
+        """defense_stats without migration 001 still replaces by natural key."""
+        df = pd.DataFrame({
+            'team_name': ['Chiefs', 'Bills', 'Dolphins'],
+            'pass_tds_allowed': [20, 18, 22],
+            'games_played': [7, 7, 7],
+            'tds_per_game': [2.9, 2.6, 3.1],
+        })
+
+        for _ in range(3):
+            assert db.insert_dataframe('defense_stats', df, week=7) == 3
+
+        count = db.conn.execute("SELECT COUNT(*) FROM defense_stats WHERE week = 7").fetchone()[0]
+        assert count == 3
+        assert db.last_upsert_stats['updated'] == 3
@@ -0,0 +1,115 @@
+"""Tests for vectorized calibration metrics and bootstrap confidence intervals"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.model_calibration import PerformanceAnalyzer
+
+
+def build_predictions(count, seed=0):
+    rng = np.random.default_rng(seed)
+    probs = rng.uniform(0.3, 0.95, count)
+    return [
+        {'predicted_probability': float(p), 'actual_outcome': bool(o), 'odds': int(od)}
+        for p, o, od in zip(probs, rng.random(count) < probs, rng.choice([-300, -150, -110, 120, 200], count))
+    ]
+
+
+def kelly_bet(pred, bankroll=1000):
+    odds = pred['odds']
+    decimal_odds = (100 / abs(odds)) + 1 if odds < 0 else (odds / 100) + 1
+    b = decimal_odds - 1
+    kelly = (b * pred['predicted_probability'] - (1 - pred['predicted_probability'])) / b
+    return bankroll * min(max(0, kelly * 0.25), 0.05), b
+
+
+class TestMetrics:
+
+    @pytest.fixture
+    def predictions(self):
+        return build_predictions(500) + [
+            {'predicted_probability': 1.0, 'actual_outcome': True, 'odds': -1000},
+            {'predicted_probability': 0.0, 'actual_outcome': False, 'odds': 150},
+        ]
+
+    def test_brier_score(self, predictions):
+        expected = sum((p['predicted_probability'] - p['actual_outcome']) ** 2 for p in predictions) / len(predictions)
+
+        assert PerformanceAnalyzer().calculate_brier_score(predictions) == pytest.approx(expected)
+
+    def test_calibration_bins(self, predictions):
+        result = PerformanceAnalyzer().calculate_calibration_error(predictions)
+
+        for stats in result['bins']:
+            in_bin = [p for p in predictions if stats['bin_min'] <= p['predicted_probability'] < stats['bin_max']]
+            assert stats['count'] == len(in_bin)
+            if in_bin:
+                assert stats['actual_rate'] == pytest.approx(sum(p['actual_outcome'] for p in in_bin) / len(in_bin))
+            else:
+                assert stats['actual_rate'] == 0.0 and stats['error'] == 0.0
+
+        # p == 1.0 falls outside every bin but still counts in the denominator
+        assert sum(stats['count'] for stats in result['bins']) == len(predictions) - 1
+        expected = sum(stats['error'] * stats['count'] for stats in result['bins']) / len(predictions)
+        assert result['calibration_error'] == pytest.approx(expected)
+        assert result['total_predictions'] == len(predictions)
+
+    def test_roi(self, predictions):
+        bets = [kelly_bet(p) for p in predictions]
+        total_bet = sum(bet for bet, _ in bets)
+        total_winnings = sum(bet * b for (bet, b), p in zip(bets, predictions) if p['actual_outcome'])
+
+        result = PerformanceAnalyzer().calculate_roi(predictions)
+        assert result['total_bets'] == pytest.approx(total_bet)
+        assert result['total_winnings'] == pytest.approx(total_winnings)
+        assert result['roi'] == pytest.approx(total_winnings / total_bet * 100)
+        assert result['num_predictions'] == len(predictions)
+
+    def test_empty(self):
+        analyzer = PerformanceAnalyzer()
+
+        assert analyzer.calculate_brier_score([]) == 0.0
+        assert analyzer.calculate_calibration_error([]) == {'bins': [], 'calibration_error': 0.0}
+        assert analyzer.calculate_roi([])['roi'] == 0.0
+        assert analyzer.bootstrap_confidence_intervals([]) == {}
+
+
+class TestBootstrap:
+
+    def test_intervals_contain_point_estimates(self):
+        predictions = build_predictions(2000)
+        analyzer = PerformanceAnalyzer(n_resamples=200)
+        intervals = analyzer.bootstrap_confidence_intervals(predictions, seed=1)
+
+        point = {
+            'brier_score': analyzer.calculate_brier_score(predictions),
+            'roi': analyzer.calculate_roi(predictions)['roi'],
+        }
+        for metric, value in point.items():
+            assert intervals[metric]['lower'] <= value <= intervals[metric]['upper']
+        # Resampling only adds bin noise to |expected - actual|, so that interval sits above the estimate
+        assert 0 <= intervals['calibration_error']['lower'] < intervals['calibration_error']['upper']
+        assert intervals['n_resamples'] == 200
+        assert intervals['confidence_level'] == analyzer.confidence_level
+
+    def test_reproducible_for_a_seed(self):
+        predictions = build_predictions(300)
+        analyzer = PerformanceAnalyzer(n_resamples=120)
+
+        assert analyzer.bootstrap_confidence_intervals(predictions, seed=7) == \
+            analyzer.bootstrap_confidence_intervals(predictions, seed=7)
+
+    def test_process_pool_matches_in_process(self):
+        predictions = build_predictions(300)
+        serial = PerformanceAnalyzer(n_resamples=120, max_workers=1)
+        parallel = PerformanceAnalyzer(n_resamples=120, parallel_min_work=0)
+        parallel.max_workers = 2  # regardless of the CPUs on this machine
+
+        assert parallel.bootstrap_confidence_intervals(predictions, seed=7) == \
+            serial.bootstrap_confidence_intervals(predictions, seed=7)
@@ -0,0 +1,231 @@
+"""Unit tests for the pooled SQLite connection layer"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.connection_pool import ConnectionPool, get_connection_pool, close_all_pools, transaction
+from utils.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'pool.db'
+    yield path
+    close_all_pools(path)
+
+
+class TestConnectionPool:
+    """Test per-thread connection handling"""
+
+    def test_writer_enables_wal(self, db_path):
+        """Writer connections switch the database to WAL with tuned pragmas."""
+        pool = ConnectionPool(db_path)
+        conn = pool.writer()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -ConnectionPool.CACHE_SIZE_KB
+        pool.close_all()
+
+    def test_connection_reused_within_thread(self, db_path):
+        """Repeated requests on one thread return the same connection."""
+        pool = ConnectionPool(db_path)
+        assert pool.writer() is pool.writer()
+        assert pool.reader() is pool.reader()
+        assert pool.reader() is not pool.writer()
+        pool.close_all()
+
+    def test_each_thread_gets_own_connection(self, db_path):
+        """Threads never share a connection."""
+        pool = ConnectionPool(db_path)
+        seen = []
+
+        def worker():
+            seen.append(pool.reader())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(conn) for conn in seen}) == 4
+        pool.close_all()
+        assert pool.open_connections == 0
+
+    def test_connections_closed_when_thread_ends(self, db_path):
+        """Short-lived threads (e.g. threaded Flask requests) do not leak connections."""
+        pool = ConnectionPool(db_path)
+        pool.writer()
+
+        def worker():
+            pool.writer().execute("SELECT 1")
+            pool.reader().execute("SELECT 1")
+
+        for _ in range(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        assert pool.open_connections == 1
+        pool.close_all()
+
+    def test_reader_is_read_only(self, db_path):
+        """Read-only handles reject writes but see committed data."""
+        pool = ConnectionPool(db_path)
+        writer = pool.writer()
+        writer.execute("CREATE TABLE t (x INTEGER)")
+        writer.execute("INSERT INTO t VALUES (1)")
+        writer.commit()
+
+        reader = pool.reader()
+        assert reader.execute("SELECT x FROM t").fetchall() == [(1,)]
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO t VALUES (2)")
+        pool.close_all()
+
+    def test_data_version_changes_on_commit(self, db_path):
+        """data_version is stable across reads and moves when any writer commits."""
+        pool = ConnectionPool(db_path)
+        assert pool.data_version() is None  # no database file yet
+
+        writer = pool.writer()
+        writer.execute("CREATE TABLE t (x INTEGER)")
+        writer.commit()
+
+        version = pool.data_version()
+        assert pool.data_version() == version
+
+        writer.execute("INSERT INTO t VALUES (1)")
+        writer.commit()
+
+        assert pool.data_version() != version
+        pool.close_all()
+
+    def test_registry_shares_pool_per_path(self, db_path):
+        """Relative and absolute paths resolve to one pool."""
+        assert get_connection_pool(db_path) is get_connection_pool(str(db_path))
+
+
+class TestDatabaseManagerPooling:
+    """Test DatabaseManager on top of the pool"""
+
+    def test_connection_is_thread_local(self, db_path):
+        """A shared DatabaseManager hands each thread its own connection."""
+        db = DatabaseManager(db_path=db_path)
+        db.connect()
+        db.create_tables()
+        main_conn = db.conn
+        other = {}
+
+        def worker():
+            other['before_connect'] = db.conn
+            other['stats'] = db.get_database_stats()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert other['before_connect'] is None
+        assert other['stats']['tables']['defense_stats']['row_count'] == 0
+        assert db.conn is main_conn
+
+    def test_close_keeps_pooled_connection_warm(self, db_path):
+        """close() releases the handle without closing the pooled connection."""
+        db = DatabaseManager(db_path=db_path)
+        db.connect()
+        first = db.conn
+        db.close()
+
+        assert db.conn is None
+        db.connect()
+        assert db.conn is first
+
+    def test_close_leaves_other_managers_transaction(self, db_path):
+        """Managers sharing a thread's writer do not roll back each other's work."""
+        first, second = DatabaseManager(db_path=db_path), DatabaseManager(db_path=db_path)
+        first.connect()
+        second.connect()
+        first.conn.execute("CREATE TABLE notes (body TEXT)")
+        first.conn.commit()
+        assert first.conn is second.conn
+
+        second.conn.execute("INSERT INTO notes VALUES ('pending')")
+        first.close()
+        assert second.conn.in_transaction
+        second.conn.commit()
+
+        second.conn.execute("INSERT INTO notes VALUES ('discarded')")
+        second.close()
+        rows = get_connection_pool(db_path).reader().execute("SELECT body FROM notes").fetchall()
+        assert rows == [('pending',)]
+
+    def test_writes_do_not_commit_or_discard_outer_transaction(self, db_path):
+        """Components sharing the writer nest their writes in savepoints."""
+        first, second = DatabaseManager(db_path=db_path), DatabaseManager(db_path=db_path)
+        first.connect()
+        second.connect()
+        first.conn.execute("CREATE TABLE notes (body TEXT, scraped_at TIMESTAMP)")
+        first.conn.commit()
+
+        first.conn.execute("INSERT INTO notes VALUES ('pending', NULL)")
+
+        def failing_rows():
+            yield 'notes', {'body': 'partial'}
+            raise RuntimeError("feed dropped")
+
+        with pytest.raises(RuntimeError):
+            second.stream_insert(failing_rows(), {'notes': ['body']}, batch_size=1)
+        assert first.conn.in_transaction
+
+        second.stream_insert(iter([('notes', {'body': 'streamed'})]), {'notes': ['body']})
+        assert first.conn.in_transaction
+        reader = get_connection_pool(db_path).reader()
+        assert reader.execute("SELECT COUNT(*) FROM notes").fetchone()[0] == 0
+
+        first.conn.commit()
+        rows = reader.execute("SELECT body FROM notes ORDER BY rowid").fetchall()
+        assert rows == [('pending',), ('streamed',)]
+
+
+class TestTransaction:
+    """Test the per-component transaction scope"""
+
+    def test_commits_on_its_own(self, db_path):
+        pool = ConnectionPool(db_path)
+        conn = pool.writer()
+        conn.execute("CREATE TABLE notes (body TEXT)")
+
+        with transaction(conn):
+            conn.execute("INSERT INTO notes VALUES ('kept')")
+
+        assert not conn.in_transaction
+        with pytest.raises(ValueError):
+            with transaction(conn):
+                conn.execute("INSERT INTO notes VALUES ('dropped')")
+                raise ValueError
+        assert conn.execute("SELECT body FROM notes").fetchall() == [('kept',)]
+        pool.close_all()
+
+    def test_nested_error_undoes_only_the_block(self, db_path):
+        pool = ConnectionPool(db_path)
+        conn = pool.writer()
+        conn.execute("CREATE TABLE notes (body TEXT)")
+        conn.commit()
+
+        conn.execute("INSERT INTO notes VALUES ('outer')")
+        with pytest.raises(ValueError):
+            with transaction(conn):
+                conn.execute("INSERT INTO notes VALUES ('inner')")
+                raise ValueError
+
+        assert conn.in_transaction
+        assert conn.execute("SELECT body FROM notes").fetchall() == [('outer',)]
+        pool.close_all()
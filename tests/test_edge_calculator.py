@@ -7,14 +7,21 @@ Kelly Criterion, and edge detection.
 import unittest
 import sys
 import os
+import math
+import tempfile
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.edge_calculator import (
-    ProbabilityCalculator, EdgeDetector, BetRecommender, EdgeCalculator
+    ProbabilityCalculator, EdgeDetector, BetRecommender, EdgeCalculator,
+    VectorizedEdgeEngine
 )
+from utils.connection_pool import close_all_pools
+from utils.query_tools import DatabaseQueryTools
 from utils.probability_models import AdvancedProbabilityModel
 
 
@@ -293,6 +300,100 @@ class TestEdgeCalculator(unittest.TestCase):
             pass
 
 
+class TestVectorizedEdgeEngine(unittest.TestCase):
+    """Test the columnar engine against the scalar calculators"""
+    
+    def setUp(self):
+        """Random grid of QB / defense / odds inputs"""
+        rng = np.random.default_rng(7)
+        n = 500
+        self.qb_tds = rng.integers(0, 40, n).astype(float)
+        self.qb_games = rng.integers(0, 17, n).astype(float)
+        self.defense_tds = rng.uniform(0.5, 3.0, n)
+        self.odds = rng.choice([-400, -250, -210, -150, -110, 100, 120, 150, 300], n).astype(float)
+        self.is_home = rng.random(n) < 0.5
+        self.is_division = rng.random(n) < 0.3
+    
+    def assert_close(self, vector_value, scalar_value):
+        self.assertTrue(math.isclose(vector_value, scalar_value, rel_tol=1e-12, abs_tol=1e-12),
+                        f"{vector_value} != {scalar_value}")
+    
+    def test_matches_scalar_path(self):
+        """Every column should match ProbabilityCalculator/EdgeDetector/BetRecommender"""
+        for model_version in ("v1", "v2"):
+            engine = VectorizedEdgeEngine(model_version)
+            scalar = EdgeCalculator(model_version=model_version)
+            priced = engine.price(self.qb_tds, self.qb_games, self.defense_tds, self.odds,
+                                  self.is_home, self.is_division)
+            
+            for i, row in priced.iterrows():
+                expected = scalar.calculate_edge(
+                    {'total_tds': self.qb_tds[i], 'games_played': self.qb_games[i]},
+                    {'tds_per_game': self.defense_tds[i]},
+                    self.odds[i],
+                    {'is_home': bool(self.is_home[i]), 'is_division_game': bool(self.is_division[i])}
+                )
+                for key in ('probability', 'implied_probability', 'decimal_odds',
+                            'edge', 'edge_percentage'):
+                    self.assert_close(row[key], expected[key])
+                self.assertEqual(row['confidence'], expected['confidence'])
+                self.assertEqual(row['is_positive_edge'], expected['is_positive_edge'])
+                
+                bet = expected['bet_recommendation']
+                self.assertEqual(row['tier'], bet['tier'])
+                self.assert_close(row['kelly_fraction'], bet['kelly_fraction'])
+                self.assert_close(row['recommended_bet'], bet['recommended_bet'])
+    
+    def test_unknown_model_version(self):
+        """Test that unknown model versions raise like the scalar path"""
+        with self.assertRaises(ValueError):
+            VectorizedEdgeEngine("v3").price([20], [10], [2.0], [-150])
+    
+    def test_find_edges_for_week_matches_scalar_loop(self):
+        """find_edges_for_week should equal pricing each matchup one at a time"""
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from conftest import populate_edge_db
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir) / "edges.db"
+            populate_edge_db(db_path)
+            
+            try:
+                for model_version in ("v1", "v2"):
+                    calc = EdgeCalculator(model_version=model_version, db_path=db_path)
+                    edges = calc.find_edges_for_week(7, threshold=-100)
+                    self.assertEqual(len(edges), 5)
+                    
+                    # Sorted by edge, highest first
+                    edge_pcts = [e['edge_percentage'] for e in edges]
+                    self.assertEqual(edge_pcts, sorted(edge_pcts, reverse=True))
+                    
+                    with DatabaseQueryTools(db_path) as db:
+                        matchups = db.find_qb_defense_matchups(7)
+                    
+                    expected = {}
+                    for _, matchup in matchups.iterrows():
+                        expected[matchup['home_qb']] = calc.calculate_edge(
+                            {'total_tds': matchup['home_qb_tds'],
+                             'games_played': matchup['home_qb_games']},
+                            {'tds_per_game': matchup['away_defense_tds_allowed']},
+                            matchup['home_qb_prop_odds'],
+                            {'is_home': True, 'is_division_game': False}
+                        )
+                    
+                    for edge in edges:
+                        scalar = expected[edge['qb_name']]
+                        self.assertEqual(set(scalar) | {'qb_name', 'qb_team', 'opponent',
+                                                        'sportsbook', 'game_date'}, set(edge))
+                        self.assert_close(edge['probability'], scalar['probability'])
+                        self.assert_close(edge['edge_percentage'], scalar['edge_percentage'])
+                        self.assertEqual(edge['bet_recommendation']['tier'],
+                                         scalar['bet_recommendation']['tier'])
+                        self.assertIsInstance(edge['game_date'], str)
+            finally:
+                close_all_pools()
+
+
 class TestAdvancedProbabilityModel(unittest.TestCase):
     """Test advanced probability model (v2)"""
     
@@ -0,0 +1,101 @@
+"""Tests for the record/replay HTTP cache"""
+
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.defense_stats_scraper import DefenseStatsScraper
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.http_cache import HTTPCache, ReplayMiss
+
+
+def make_scraper(base_url, cache, key='paid'):
+    return OddsScraper(api_keys=[key], paid_key=key, base_url=base_url,
+                       requests_per_second=1000, retry_base_delay=0.01, http_cache=cache)
+
+
+@pytest.fixture
+def api():
+    with StandInOddsAPI(events=4) as server:
+        yield server
+
+
+class TestRecordReplay:
+
+    def test_replay_matches_recording_offline(self, api, tmp_path):
+        recorded = make_scraper(api.base_url, HTTPCache(tmp_path, 'record')).fetch_player_props_for_all_events()
+        base_url = api.base_url
+        api.stop()
+
+        scraper = make_scraper(base_url, HTTPCache(tmp_path, 'replay'))
+        replayed = scraper.fetch_player_props_for_all_events()
+
+        assert len(recorded) == 16
+        assert replayed == recorded
+        # Served from disk: no quota spent
+        assert scraper.api_rotator.get_total_usage() == 0
+
+    def test_record_serves_fresh_entries(self, api, tmp_path):
+        cache = HTTPCache(tmp_path, 'record')
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+
+        assert len(api.requests) == 5
+        assert cache.stats == {'hits': 5, 'misses': 5, 'stores': 5}
+
+    def test_expired_entries_refetched(self, api, tmp_path):
+        cache = HTTPCache(tmp_path, 'record', ttls=[(r'/odds$', 0)])
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+
+        # Event list is still fresh (default TTL), per-event odds expired
+        assert len(api.requests) == 1 + 2 * 4
+
+    def test_key_ignores_api_key(self, api, tmp_path):
+        make_scraper(api.base_url, HTTPCache(tmp_path, 'record'), key='key-one').fetch_player_props_for_all_events()
+
+        replayed = make_scraper(api.base_url, HTTPCache(tmp_path, 'replay'), key='key-two')
+        assert len(replayed.fetch_player_props_for_all_events()) == 16
+
+        for path in tmp_path.rglob('*.gz'):
+            assert b'key-one' not in gzip.decompress(path.read_bytes())
+
+    def test_errors_not_recorded(self, api, tmp_path):
+        api.fail('event01', 500, 500)
+        cache = HTTPCache(tmp_path, 'record')
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+
+        assert cache.stats['stores'] == 5
+        assert len(list(tmp_path.rglob('*.gz'))) == 5
+
+    def test_live_mode_stores_nothing(self, api, tmp_path):
+        cache = HTTPCache(tmp_path, 'live')
+        make_scraper(api.base_url, cache).fetch_player_props_for_all_events()
+
+        assert list(tmp_path.rglob('*.gz')) == []
+
+
+class TestReplayMiss:
+
+    def test_replay_miss_raises(self, tmp_path):
+        cache = HTTPCache(tmp_path, 'replay')
+
+        with pytest.raises(ReplayMiss):
+            cache.get('https://example.com/data', params={'week': 7})
+
+    def test_scraper_handles_replay_miss(self, tmp_path):
+        scraper = DefenseStatsScraper(year=2024, http_cache=HTTPCache(tmp_path, 'replay'))
+
+        assert scraper.scrape() is None
+
+    def test_canonical_url_sorts_and_strips_secrets(self):
+        a = HTTPCache._canonical_url('https://x.test/odds?b=2', {'a': 1, 'apiKey': 'secret'})
+        b = HTTPCache._canonical_url('https://x.test/odds?a=1&apiKey=other', {'b': 2})
+
+        assert a == b == 'https://x.test/odds?a=1&b=2'
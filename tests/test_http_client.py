@@ -0,0 +1,149 @@
+"""Tests for the shared pooled HTTP client and conditional PFR requests"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scrapers.defense_stats_scraper as defense_module
+from scrapers.defense_stats_scraper import DefenseStatsScraper
+from tests.pfr_server import StandInPFR, defense_page
+from utils.http_cache import HTTPCache
+from utils.http_client import HTTPClient
+
+PAGE = '/years/2025/opp.htm'
+TEAMS = [('Kansas City Chiefs', 6, 8), ('Buffalo Bills', 6, 10), ('Miami Dolphins', 5, 12)]
+
+
+@pytest.fixture
+def pfr():
+    with StandInPFR({PAGE: defense_page(TEAMS)}) as server:
+        yield server
+
+
+def make_client(pfr, tmp_path, **kwargs):
+    return HTTPClient(conditional_hosts=(pfr.host,), validators_path=tmp_path / 'validators.json',
+                      retry_base_delay=0.01, **kwargs)
+
+
+class TestPooling:
+
+    def test_connections_reused(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path)
+        for _ in range(5):
+            assert client.get(pfr.url(PAGE), timeout=5).status_code == 200
+
+        assert len(pfr.ports) == 1
+        assert client.stats['requests'] == 5
+
+    def test_gzip_decoded_and_counted(self, tmp_path):
+        html = defense_page(TEAMS * 50)
+        with StandInPFR({PAGE: html}, gzip_responses=True) as pfr:
+            client = make_client(pfr, tmp_path)
+            response = client.get(pfr.url(PAGE), timeout=5)
+
+        assert response.text == html
+        assert client.stats['bytes_received'] < len(html)
+        assert client.stats['bytes_saved'] == len(html) - client.stats['bytes_received']
+
+    def test_retries_transient_errors(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path, max_retries=2)
+        pfr.fail(503, 429)
+
+        assert client.get(pfr.url(PAGE), timeout=5).status_code == 200
+        assert client.stats['retries'] == 2
+
+    def test_no_retries_when_caller_owns_them(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path, max_retries=2)
+        pfr.fail(503)
+
+        assert client.get(pfr.url(PAGE), retries=0, timeout=5).status_code == 503
+        assert client.stats['retries'] == 0
+
+
+class TestConditionalRequests:
+
+    def test_unchanged_page_not_resent(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path)
+        first = client.get(pfr.url(PAGE), conditional=True, timeout=5)
+        second = client.get(pfr.url(PAGE), conditional=True, timeout=5)
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b''
+        assert pfr.requests[1][2]['If-None-Match'] == first.headers['ETag']
+        assert pfr.requests[1][2]['If-Modified-Since'] == first.headers['Last-Modified']
+        assert client.stats['not_modified'] == 1
+        assert client.stats['bytes_saved'] == len(first.content)
+
+    def test_changed_page_downloaded(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path)
+        client.get(pfr.url(PAGE), conditional=True, timeout=5)
+        pfr.update(PAGE, defense_page(TEAMS[:2]))
+
+        assert client.get(pfr.url(PAGE), conditional=True, timeout=5).status_code == 200
+
+    def test_validators_survive_restart(self, pfr, tmp_path):
+        make_client(pfr, tmp_path).get(pfr.url(PAGE), timeout=5)
+
+        assert make_client(pfr, tmp_path).get(pfr.url(PAGE), conditional=True, timeout=5).status_code == 304
+
+    def test_only_conditional_when_asked(self, pfr, tmp_path):
+        client = make_client(pfr, tmp_path)
+        client.get(pfr.url(PAGE), timeout=5)
+
+        assert client.get(pfr.url(PAGE), timeout=5).status_code == 200
+        assert 'If-None-Match' not in pfr.requests[1][2]
+
+    def test_other_hosts_not_tracked(self, pfr, tmp_path):
+        client = HTTPClient(conditional_hosts=(), validators_path=tmp_path / 'validators.json')
+        client.get(pfr.url(PAGE), timeout=5)
+
+        assert client.get(pfr.url(PAGE), conditional=True, timeout=5).status_code == 200
+        assert not (tmp_path / 'validators.json').exists()
+
+
+class TestDefenseScraperRevalidation:
+
+    @pytest.fixture
+    def scraper(self, pfr, tmp_path, monkeypatch):
+        monkeypatch.setattr(defense_module, 'DATA_DIR', tmp_path)
+        monkeypatch.setattr(defense_module, 'REQUEST_DELAY', 0)
+        cache = HTTPCache(tmp_path / 'cache', 'live', client=make_client(pfr, tmp_path))
+        scraper = DefenseStatsScraper(year=2025, http_cache=cache)
+        scraper.url = pfr.url(PAGE)
+        return scraper
+
+    def test_unchanged_page_keeps_csv(self, scraper, pfr, tmp_path, monkeypatch):
+        first = scraper.run(week=7)
+        assert not scraper.unchanged
+
+        def no_parse(df):
+            raise AssertionError("unchanged page was parsed")
+
+        monkeypatch.setattr(scraper, '_clean_dataframe', no_parse)
+        second = scraper.run(week=7)
+
+        assert second == first
+        assert scraper.unchanged
+        assert [status for _, status, _ in pfr.requests] == [200, 304]
+
+    def test_new_week_downloads_full_page(self, scraper, pfr):
+        scraper.run(week=7)
+        path = scraper.run(week=8)
+
+        assert not scraper.unchanged
+        assert Path(path).name == 'defense_stats_week_8.csv'
+        assert [status for _, status, _ in pfr.requests] == [200, 200]
+
+    def test_unusable_page_forgotten(self, scraper, pfr, tmp_path):
+        pfr.update(PAGE, '<html><body>maintenance</body></html>')
+        assert scraper.run(week=7) is None
+
+        pfr.update(PAGE, defense_page(TEAMS))
+        scraper.run(week=7)
+        assert (tmp_path / 'defense_stats_week_7.csv').exists()
+        assert 'If-None-Match' not in pfr.requests[-1][2]
@@ -0,0 +1,191 @@
+"""Tests for the in-process scheduler job runner"""
+
+import sqlite3
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scheduler import NFLDataScheduler
+from utils.connection_pool import close_all_pools, get_connection_pool
+from utils.job_runner import JobRunner
+from utils.scheduler_lock import SchedulerLock
+
+
+@pytest.fixture
+def runner(tmp_path):
+    job_runner = JobRunner(max_workers=2, db_path=tmp_path / 'test.db')
+    yield job_runner
+    job_runner.shutdown()
+
+
+class TestJobRunner:
+
+    def test_outcomes_recorded(self, runner):
+        def broken():
+            raise ValueError("scrape failed")
+
+        assert runner.run('ok', lambda: True)['status'] == 'success'
+        assert runner.run('returns_none', lambda: None)['status'] == 'success'
+        assert runner.run('failed', lambda: False)['status'] == 'failed'
+        record = runner.run('broken', broken)
+
+        assert record['status'] == 'error'
+        assert record['error_message'] == 'scrape failed'
+        history = runner.history()
+        assert [row['job_name'] for row in history] == ['broken', 'failed', 'returns_none', 'ok']
+        assert history[0]['error_message'] == 'scrape failed'
+
+    def test_duration_and_peak_memory(self, runner):
+        def allocate():
+            block = b'x' * (64 * 1024 * 1024)
+            time.sleep(0.05)
+            return len(block) > 0
+
+        record = runner.run('allocate', allocate)
+
+        assert record['elapsed_seconds'] >= 0.05
+        assert record['peak_memory_mb'] >= 64
+        assert record['rss_growth_mb'] >= 0
+        stored = runner.history('allocate')[0]
+        assert (stored['peak_memory_mb'], stored['rss_growth_mb']) == (record['peak_memory_mb'],
+                                                                       record['rss_growth_mb'])
+
+    def test_no_allocation_tracing(self, runner):
+        assert runner.run('traced', tracemalloc.is_tracing)['status'] == 'failed'
+
+    def test_overrun_skips_next_run_until_finished(self, tmp_path):
+        release = threading.Event()
+        job_runner = JobRunner(db_path=tmp_path / 'test.db', job_timeout=0.1)
+        try:
+            first = job_runner.submit('collect', release.wait)
+            record = first.result(timeout=5)
+
+            assert record['status'] == 'timeout'
+            assert job_runner.history('collect')[0]['error_message'] == 'exceeded 0s deadline'
+            # Never two runs of one job at once, but other jobs still run
+            assert job_runner.submit('collect', lambda: True) is None
+            assert job_runner.run('other', lambda: True)['status'] == 'success'
+
+            release.set()
+            job_runner._overrunning['collect'].result(timeout=5)
+            assert job_runner.run('collect', lambda: True)['status'] == 'success'
+        finally:
+            release.set()
+            job_runner.shutdown()
+
+    def test_jobs_reuse_worker_connections(self, tmp_path):
+        db_path = tmp_path / 'test.db'
+        pool = get_connection_pool(db_path)
+        writers = []
+
+        def job():
+            writers.append(pool.writer())
+            pool.writer().execute("CREATE TABLE IF NOT EXISTS notes (body TEXT)")
+
+        job_runner = JobRunner(max_workers=1, db_path=db_path)
+        try:
+            for _ in range(5):
+                assert job_runner.run('write', job)['status'] == 'success'
+
+            assert all(conn is writers[0] for conn in writers)
+            # One writer for the job worker, one for recording runs
+            assert pool.open_connections == 2
+        finally:
+            job_runner.shutdown()
+            close_all_pools(db_path)
+
+    def test_adds_column_to_existing_history(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / 'old.db')
+        conn.execute("""
+            CREATE TABLE job_runs (id INTEGER PRIMARY KEY AUTOINCREMENT, job_name TEXT NOT NULL,
+                status TEXT NOT NULL, started_at TIMESTAMP NOT NULL, finished_at TIMESTAMP,
+                elapsed_seconds REAL, peak_memory_mb REAL, error_message TEXT)
+        """)
+        conn.close()
+
+        job_runner = JobRunner(db_path=tmp_path / 'old.db')
+        try:
+            job_runner.run('ok', lambda: True)
+            assert 'rss_growth_mb' in job_runner.history('ok')[0]
+        finally:
+            job_runner.shutdown()
+
+    def test_same_job_not_queued_twice(self, runner):
+        release = threading.Event()
+        first = runner.submit('collect', release.wait)
+
+        assert runner.submit('collect', release.wait) is None
+        release.set()
+        first.result()
+        assert runner.run('collect', lambda: True)['status'] == 'success'
+
+    def test_concurrency_limit(self, tmp_path):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def job():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        with JobRunner(max_workers=2, db_path=tmp_path / 'test.db') as job_runner:
+            futures = [job_runner.submit(f'job{i}', job) for i in range(5)]
+            for future in futures:
+                future.result()
+
+        assert max(peak) == 2
+        assert len(job_runner.history(limit=10)) == 5
+
+    def test_lock_blocks_second_runner(self, tmp_path):
+        lock_file = tmp_path / 'scheduler.lock'
+        first = JobRunner(db_path=tmp_path / 'test.db', lock=SchedulerLock(lock_file))
+        second = JobRunner(db_path=tmp_path / 'test.db', lock=SchedulerLock(lock_file))
+
+        assert first.start()
+        assert not second.start()
+        first.close()
+        assert second.start()
+        second.close()
+
+
+class TestNFLDataScheduler:
+
+    def test_daily_collection_runs_in_process(self, runner, monkeypatch):
+        calls = []
+        scheduler = NFLDataScheduler(runner=runner)
+        monkeypatch.setattr(scheduler, 'collect_all_data', lambda: calls.append(threading.get_ident()) or True)
+
+        first = scheduler.run_daily_collection(wait=True)
+        second = scheduler.run_daily_collection(wait=True)
+
+        assert first['status'] == second['status'] == 'success'
+        assert len(calls) == 2
+        assert [row['job_name'] for row in runner.history()] == ['daily_collection', 'daily_collection']
+
+    def test_pipeline_built_non_interactive(self, runner, monkeypatch):
+        import main
+        built = {}
+
+        class Pipeline:
+            def __init__(self, week, **kwargs):
+                built.update(kwargs, week=week)
+
+            def run_all(self):
+                return True
+
+        monkeypatch.setattr(main, 'DataPipeline', Pipeline)
+        monkeypatch.setattr(main, 'get_current_nfl_week', lambda: 7)
+
+        assert NFLDataScheduler(runner=runner).collect_all_data()
+        assert built == {'week': 7, 'interactive': False}
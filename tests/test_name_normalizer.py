@@ -0,0 +1,141 @@
+"""Tests for memoized and Series player name normalization and the fuzzy-match index"""
+
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.odds_api_server import TEAMS
+from utils.name_normalizer import (
+    FuzzyNameIndex,
+    _normalize_cached,
+    batch_normalize_names,
+    fuzzy_match_names,
+    normalize_player_name,
+    normalize_player_names,
+)
+
+EXAMPLES = {
+    'Gardner Minshew II': 'Gardner Minshew',
+    'Gardner  Minshew': 'Gardner Minshew',
+    'Patrick Mahomes Jr.': 'Patrick Mahomes',
+    'A.J. Brown': 'AJ Brown',
+    ' C.J. Stroud ': 'CJ Stroud',
+    'Kenny Pickett III': 'Kenny Pickett',
+    'Odell Beckham jr': 'Odell Beckham',
+    '': '',
+}
+
+
+class TestScalar:
+
+    def test_examples(self):
+        for raw, expected in EXAMPLES.items():
+            assert normalize_player_name(raw) == expected
+
+    def test_memoized(self):
+        _normalize_cached.cache_clear()
+        for _ in range(3):
+            normalize_player_name('A.J. Brown')
+
+        info = _normalize_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+class TestSeries:
+
+    def test_matches_scalar(self):
+        names = pd.Series(list(EXAMPLES) * 3, index=range(10, 10 + 3 * len(EXAMPLES)), name='player_name')
+        result = normalize_player_names(names)
+
+        assert result.tolist() == [normalize_player_name(name) for name in names]
+        assert result.index.equals(names.index)
+        assert result.name == 'player_name'
+
+    def test_matches_scalar_on_messy_input(self):
+        rng = random.Random(7)
+        alphabet = list("abAJC .'-\t\n 　") + [' Jr.', ' II', ' iii', ' V', ' sr', 'D.K. ']
+        names = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))) for _ in range(5000)]
+
+        assert normalize_player_names(pd.Series(names)).tolist() == [normalize_player_name(n) for n in names]
+
+    def test_missing_values_become_empty(self):
+        result = normalize_player_names(pd.Series(['A.J. Brown', None, float('nan')]))
+
+        assert result.tolist() == ['AJ Brown', '', '']
+
+    def test_batch_normalize_names(self):
+        assert batch_normalize_names(['Gardner Minshew II', 'A.J. Brown']) == {
+            'Gardner Minshew II': 'Gardner Minshew', 'A.J. Brown': 'AJ Brown'}
+        assert batch_normalize_names([]) == {}
+
+
+ROSTER = [qb for _, qb in TEAMS if qb != 'Gardner Minshew'] + ['Gardner Minshew II', 'Michael Penix Jr.', 'A.J. McCarron', 'Mac Jones']
+
+
+class TestFuzzyNameIndex:
+
+    def test_suffixes_and_initials(self):
+        index = FuzzyNameIndex(ROSTER)
+
+        assert index.match('Gardner Minshew') == ('Gardner Minshew II', 1.0)
+        assert index.match('Michael Penix') == ('Michael Penix Jr.', 1.0)
+        assert index.match('AJ McCarron') == ('A.J. McCarron', 1.0)
+        assert index.match('CJ Stroud') == ('C.J. Stroud', 1.0)
+
+    def test_typos_and_threshold(self):
+        index = FuzzyNameIndex(ROSTER)
+
+        name, score = index.match('Josh Alen')
+        assert name == 'Josh Allen' and 0.85 <= score < 1.0
+        assert index.match('Pat Mahomes') is None
+        assert index.match('Pat Mahomes', threshold=0.8)[0] == 'Patrick Mahomes'
+        assert index.match('Nobody Here') is None
+        assert index.match('') is None
+
+    def test_top_k(self):
+        results = FuzzyNameIndex(ROSTER).top_k('Jalen Hurts', k=3)
+
+        assert len(results) == 3
+        assert results[0] == ('Jalen Hurts', 1.0)
+        assert results[1][1] >= results[2][1]
+
+    def test_agrees_with_pairwise_matching(self):
+        rng = random.Random(3)
+        firsts = ['Josh', 'Jake', 'Drake', 'Dak', 'Sam', 'Zach', 'Tyler', 'Mac', 'Bo', 'Joe']
+        lasts = ['Johnson', 'Wilson', 'Smith', 'Allen', 'Jones', 'Davis', 'Moore', 'Young']
+        roster = sorted({f"{rng.choice(firsts)} {rng.choice(lasts)}{rng.choice(['', ' Jr.', ' II'])}"
+                         for _ in range(200)})
+        queries = [rng.choice(roster)[:-1] for _ in range(50)] + [
+            f"{rng.choice(firsts)} {rng.choice(lasts)}x" for _ in range(50)]
+        index = FuzzyNameIndex(roster)
+
+        for query in queries:
+            expected = any(fuzzy_match_names(query, name) for name in roster)
+            assert (index.match(query) is not None) == expected, query
+
+    def test_match_many(self):
+        results = FuzzyNameIndex(ROSTER).match_many(['Gardner Minshew', 'Nobody', 'Gardner Minshew'])
+
+        assert results == {'Gardner Minshew': ('Gardner Minshew II', 1.0), 'Nobody': None}
+
+    def test_from_database(self, tmp_path):
+        db_path = tmp_path / 'roster.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE player_roster (player_name TEXT, position TEXT, team TEXT, season INTEGER, "
+                     "week INTEGER, status TEXT)")
+        conn.executemany("INSERT INTO player_roster VALUES (?, ?, 'LV', 2025, ?, 'Active')",
+                         [('Gardner Minshew II', 'QB', 6), ('Gardner Minshew II', 'QB', 7),
+                          ('Brock Bowers', 'TE', 7)])
+        conn.commit()
+        conn.close()
+
+        assert len(FuzzyNameIndex.from_database(db_path)) == 2
+        index = FuzzyNameIndex.from_database(db_path, season=2025, week=7, position='QB')
+        assert len(index) == 1
+        assert index.match('Gardner Minshew') == ('Gardner Minshew II', 1.0)
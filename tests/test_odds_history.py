@@ -0,0 +1,194 @@
+"""Tests for change-only odds storage, current odds and odds reconstruction"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.db_manager import DatabaseManager
+from utils.http_cache import HTTPCache
+from utils.query_tools import DatabaseQueryTools
+
+PAID_KEY = 'paid-key'
+WEEK = 7
+
+
+@pytest.fixture
+def api():
+    with StandInOddsAPI(events=4) as server:
+        yield server
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(db_path=tmp_path / 'test.db')
+    manager.connect()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def scraper(api, tmp_path):
+    return OddsScraper(api_keys=['free-key', PAID_KEY], paid_key=PAID_KEY, base_url=api.base_url,
+                       requests_per_second=1000, http_cache=HTTPCache(tmp_path / 'cache', 'live'))
+
+
+@pytest.fixture
+def queries(db):
+    tools = DatabaseQueryTools(db.db_path)
+    tools.connect()
+    yield tools
+    tools.close()
+
+
+def count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestChangeOnlyStorage:
+
+    def test_only_moved_lines_written(self, api, scraper, db):
+        scraper.ingest_all_odds(WEEK, db)
+        api.move('event01', 5)
+        results = scraper.ingest_all_odds(WEEK, db)
+
+        # event01: 2 books x 2 outcomes moved in each market
+        assert {market: info['changed'] for market, info in results.items()} == {
+            'spreads': 4, 'totals': 4, 'player_pass_tds': 4
+        }
+        assert count(db, 'odds_spreads') == 16 + 4
+        assert count(db, 'odds_totals') == 16 + 4
+        assert count(db, 'odds_line_history') == 48 + 12
+        assert count(db, 'odds_current') == 48
+
+    def test_qb_props_upserted_to_new_price(self, api, scraper, db):
+        scraper.ingest_all_odds(WEEK, db)
+        api.move('event00', 20)
+        scraper.ingest_all_odds(WEEK, db)
+
+        rows = db.conn.execute(
+            "SELECT odds_over_05_td FROM qb_props WHERE qb_name = 'Patrick Mahomes' AND sportsbook = 'DraftKings'"
+        ).fetchall()
+        assert rows == [(-280,)]
+
+    def test_current_odds_track_latest(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        api.move('event00', 10)
+        scraper.ingest_all_odds(WEEK, db)
+
+        current = queries.get_current_odds(WEEK, market='player_pass_tds')
+        mahomes = current[(current['selection'] == 'Patrick Mahomes') & (current['sportsbook'] == 'DraftKings')]
+
+        assert len(current) == 16
+        assert mahomes['price'].tolist() == [-290]
+        assert mahomes['line'].tolist() == [0.5]
+
+    def test_pulled_lines_recorded(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        before_pull = datetime.now()
+        api.pull('event00', 'FanDuel')
+        scraper.ingest_all_odds(WEEK, db)
+
+        current = queries.get_current_odds(WEEK)
+        assert len(current) == 48 - 6
+        assert not ((current['game'] == 'Buffalo Bills @ Kansas City Chiefs') &
+                    (current['sportsbook'] == 'FanDuel')).any()
+        assert db.conn.execute("SELECT COUNT(*) FROM odds_line_history WHERE price IS NULL").fetchone()[0] == 6
+        assert len(queries.get_odds_at(WEEK, before_pull)) == 48
+        assert len(queries.get_odds_at(WEEK, datetime.now())) == 48 - 6
+
+        # Recorded once, and restored when the book offers the line again
+        scraper.ingest_all_odds(WEEK, db)
+        assert count(db, 'odds_line_history') == 48 + 6
+        api.pulled.clear()
+        scraper.ingest_all_odds(WEEK, db)
+        assert len(queries.get_current_odds(WEEK)) == 48
+
+    def test_snapshot_time_is_last_scrape(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        between = datetime.now()
+        scraper.ingest_all_odds(WEEK, db)
+
+        # Nothing moved on the second scrape, but the odds were still checked then
+        snapshots = queries.get_latest_snapshots(WEEK)
+        for table in ('odds_spreads', 'odds_totals', 'qb_props'):
+            assert snapshots[table] > between
+        assert snapshots['defense_stats'] is None
+        assert queries.get_latest_snapshots(WEEK + 1)['odds_spreads'] is None
+
+    def test_weeks_tracked_separately(self, scraper, db):
+        scraper.ingest_all_odds(WEEK, db)
+        results = scraper.ingest_all_odds(WEEK + 1, db)
+
+        assert results['spreads']['changed'] == 16
+        assert count(db, 'odds_current') == 96
+
+
+class TestReconstruction:
+
+    def test_odds_at_each_scrape(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        after_first = datetime.now()
+        api.move('event00', 10)
+        scraper.ingest_all_odds(WEEK, db)
+        after_second = datetime.now()
+
+        def mahomes_price(board):
+            row = board[(board['selection'] == 'Patrick Mahomes') & (board['sportsbook'] == 'DraftKings')]
+            return row['price'].tolist()
+
+        first = queries.get_odds_at(WEEK, after_first, market='player_pass_tds')
+        second = queries.get_odds_at(WEEK, after_second, market='player_pass_tds')
+
+        assert len(first) == len(second) == 16
+        assert mahomes_price(first) == [-300]
+        assert mahomes_price(second) == [-290]
+
+        latest = queries.get_current_odds(WEEK).drop(columns='scraped_at')
+        rebuilt = queries.get_odds_at(WEEK, after_second).drop(columns='scraped_at')
+        assert rebuilt.equals(latest)
+
+    def test_aware_as_of_uses_scrape_clock(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        # A zone away from the machine's, so a raw string comparison would be hours off
+        after_first = datetime.now().astimezone(timezone(timedelta(hours=-11)))
+        api.move('event00', 10)
+        scraper.ingest_all_odds(WEEK, db)
+
+        board = queries.get_odds_at(WEEK, after_first, market='player_pass_tds')
+        mahomes = board[(board['selection'] == 'Patrick Mahomes') & (board['sportsbook'] == 'DraftKings')]
+        assert mahomes['price'].tolist() == [-300]
+        assert len(queries.get_odds_at(WEEK, after_first.isoformat())) == 48
+
+    def test_before_first_scrape_is_empty(self, scraper, db, queries):
+        before = datetime.now()
+        scraper.ingest_all_odds(WEEK, db)
+
+        assert queries.get_odds_at(WEEK, before).empty
+
+    def test_line_movement_reads_history(self, api, scraper, db, queries):
+        scraper.ingest_all_odds(WEEK, db)
+        api.move('event00', 10)
+        scraper.ingest_all_odds(WEEK, db)
+
+        movement = queries.get_line_movement(WEEK)
+
+        props = movement['qb_props']
+        assert list(props.columns) == ['qb_name', 'odds_over_05_td', 'sportsbook', 'scraped_at']
+        assert props[props['qb_name'] == 'Patrick Mahomes']['odds_over_05_td'].tolist() == [-300, -290, -315, -305]
+        assert list(movement['spreads'].columns) == ['game', 'team', 'spread', 'odds', 'sportsbook', 'scraped_at']
+        assert len(movement['totals']) == 16 + 4
+
+    def test_line_movement_without_history_table(self, db, queries):
+        """Databases that predate odds_line_history fall back to the raw tables"""
+        movement = queries.get_line_movement(WEEK)
+
+        assert set(movement) == {'qb_props', 'spreads', 'totals'}
+        assert movement['spreads'].empty
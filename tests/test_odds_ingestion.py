@@ -0,0 +1,130 @@
+"""Tests for streaming odds ingestion straight into the database (against a local stand-in API)"""
+
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scrapers.odds_scraper as odds_scraper_module
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.db_manager import DatabaseManager
+from utils.http_cache import HTTPCache
+
+PAID_KEY = 'paid-key'
+WEEK = 7
+
+
+@pytest.fixture
+def api():
+    with StandInOddsAPI(events=4) as server:
+        yield server
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database with the base schema"""
+    manager = DatabaseManager(db_path=tmp_path / 'test.db', upsert_batch_size=5)
+    manager.connect()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def scraper(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(odds_scraper_module, 'DATA_DIR', tmp_path)
+    return OddsScraper(api_keys=['free-key', PAID_KEY], paid_key=PAID_KEY, base_url=api.base_url,
+                       requests_per_second=1000, retry_base_delay=0.01,
+                       http_cache=HTTPCache(tmp_path / 'cache', 'live'))
+
+
+def table_counts(db):
+    return {
+        table: db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ('odds_spreads', 'odds_totals', 'qb_props')
+    }
+
+
+class TestIngestAllOdds:
+
+    def test_rows_written_per_table(self, scraper, db, tmp_path):
+        results = scraper.ingest_all_odds(WEEK, db)
+
+        # 4 games x 2 books x 2 outcomes per market
+        assert table_counts(db) == {'odds_spreads': 16, 'odds_totals': 16, 'qb_props': 16}
+        assert results == {
+            'spreads': {'rows': 16, 'changed': 16, 'csv': None},
+            'totals': {'rows': 16, 'changed': 16, 'csv': None},
+            'player_pass_tds': {'rows': 16, 'changed': 16, 'csv': None},
+        }
+        assert list(tmp_path.glob('*.csv')) == []
+
+    def test_week_and_line_type_populated(self, scraper, db):
+        scraper.ingest_all_odds(WEEK, db)
+
+        assert db.conn.execute(
+            "SELECT DISTINCT line_type FROM odds_totals ORDER BY line_type").fetchall() == [('Over',), ('Under',)]
+        for table in ('odds_spreads', 'odds_totals', 'qb_props'):
+            assert db.conn.execute(f"SELECT DISTINCT week FROM {table}").fetchall() == [(WEEK,)]
+            assert db.conn.execute(f"SELECT COUNT(*) FROM {table} WHERE scraped_at IS NULL").fetchone()[0] == 0
+
+    def test_matches_csv_path(self, scraper, db, tmp_path):
+        """Streamed rows hold the same values the CSV workflow parses"""
+        csv_paths = scraper.fetch_all_odds(WEEK)
+        scraper.ingest_all_odds(WEEK, db)
+
+        with open(csv_paths['spreads']) as f:
+            expected = sorted((r['team'], float(r['spread']), int(r['odds']), r['sportsbook']) for r in csv.DictReader(f))
+        actual = sorted(db.conn.execute("SELECT team, spread, odds, sportsbook FROM odds_spreads").fetchall())
+        assert actual == expected
+
+        with open(csv_paths['player_pass_tds']) as f:
+            expected = sorted((r['qb_name'], int(r['odds_over_05_td']), r['sportsbook']) for r in csv.DictReader(f))
+        actual = sorted(db.conn.execute("SELECT qb_name, odds_over_05_td, sportsbook FROM qb_props").fetchall())
+        assert actual == expected
+
+    def test_optional_csv_output(self, scraper, db, tmp_path):
+        results = scraper.ingest_all_odds(WEEK, db, write_csv=True)
+
+        path = Path(results['totals']['csv'])
+        assert path == tmp_path / f'odds_totals_week_{WEEK}.csv'
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 16
+        assert rows[0]['line_type'] == 'Over'
+        assert list(tmp_path.glob('*.tmp')) == []
+
+    def test_reingest_unchanged_writes_nothing(self, scraper, db):
+        scraper.ingest_all_odds(WEEK, db)
+        results = scraper.ingest_all_odds(WEEK, db)
+
+        assert table_counts(db) == {'odds_spreads': 16, 'odds_totals': 16, 'qb_props': 16}
+        assert results['spreads'] == {'rows': 16, 'changed': 0, 'csv': None}
+
+    def test_failed_write_rolls_back(self, scraper, db, tmp_path):
+        def broken_rows(payloads):
+            yield from list(OddsScraper.iter_odds_rows(scraper, payloads))[:20]
+            raise RuntimeError("parse failure")
+
+        scraper.iter_odds_rows = broken_rows
+
+        with pytest.raises(RuntimeError):
+            scraper.ingest_all_odds(WEEK, db, write_csv=True)
+
+        assert table_counts(db) == {'odds_spreads': 0, 'odds_totals': 0, 'qb_props': 0}
+        assert list(tmp_path.glob('*.csv')) == []
+        assert list(tmp_path.glob('*.tmp')) == []
+
+    def test_failed_market_reported(self, scraper, db, api):
+        for event in api.events:
+            api.fail(event['id'], 404)
+
+        results = scraper.ingest_all_odds(WEEK, db)
+
+        assert results['player_pass_tds'] is None
+        assert results['spreads'] == {'rows': 16, 'changed': 16, 'csv': None}
@@ -0,0 +1,156 @@
+"""Tests for kickoff-aware odds polling (planner and long-lived scheduler)"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scheduler_odds import NFLOddsScheduler
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.db_manager import DatabaseManager
+from utils.http_cache import HTTPCache
+from utils.odds_poll_planner import OddsPollPlanner, hours_left_in_month, parse_commence_time
+
+NOW = datetime(2024, 10, 20, 12, 0, tzinfo=timezone.utc)
+TIERS = [(2, 10), (6, 20), (24, 60), (72, 180)]
+
+
+def event(event_id, hours_out):
+    kickoff = NOW + timedelta(hours=hours_out)
+    return {'id': event_id, 'commence_time': kickoff.strftime('%Y-%m-%dT%H:%M:%SZ')}
+
+
+class TestOddsPollPlanner:
+
+    def test_interval_tightens_near_kickoff(self):
+        planner = OddsPollPlanner(TIERS)
+
+        def interval(hours):
+            return planner.interval_for(NOW + timedelta(hours=hours), NOW)
+
+        assert interval(1) == timedelta(minutes=10)
+        assert interval(4) == timedelta(minutes=20)
+        assert interval(12) == timedelta(hours=1)
+        assert interval(48) == timedelta(hours=3)
+        assert interval(100) is None
+        assert interval(-0.5) is None
+
+    def test_only_due_events_refreshed(self):
+        planner = OddsPollPlanner(TIERS)
+        events = [event('soon', 1), event('later', 12), event('far', 200), event('started', -1)]
+        # 'soon' kicks off at NOW + 1h and drops out of the plan then
+
+        assert [e['id'] for e in planner.due_events(events, NOW)] == ['soon', 'later']
+        planner.mark_polled(planner.due_events(events, NOW), NOW)
+
+        assert planner.due_events(events, NOW + timedelta(minutes=5)) == []
+        assert [e['id'] for e in planner.due_events(events, NOW + timedelta(minutes=10))] == ['soon']
+        assert [e['id'] for e in planner.due_events(events, NOW + timedelta(hours=1))] == ['later']
+
+    def test_next_due(self):
+        planner = OddsPollPlanner(TIERS)
+        events = [event('soon', 1), event('later', 12)]
+        planner.mark_polled(events, NOW)
+
+        assert planner.next_due(events, NOW) == NOW + timedelta(minutes=10)
+        assert planner.next_due([event('far', 200)], NOW) is None
+
+    def test_game_lines_follow_tightest_interval(self):
+        planner = OddsPollPlanner(TIERS)
+        events = [event('soon', 1), event('later', 12)]
+
+        assert planner.game_lines_due(events, NOW)
+        planner.mark_polled([], NOW, game_lines=True)
+        assert not planner.game_lines_due(events, NOW + timedelta(minutes=9))
+        assert planner.game_lines_due(events, NOW + timedelta(minutes=10))
+
+    def test_quota_stretch(self):
+        planner = OddsPollPlanner(TIERS)
+        events = [event(f'g{i}', 1) for i in range(6)]  # 6 games x 6 polls/hour = 36 props/hour
+        hours = hours_left_in_month(NOW)
+
+        assert planner.quota_stretch(events, NOW, paid_remaining=100000, free_remaining=100000) == (1.0, 1.0)
+
+        props, lines = planner.quota_stretch(events, NOW, paid_remaining=int(18 * hours), free_remaining=100000)
+        assert props == pytest.approx(2.0, rel=0.01)
+        assert lines == 1.0
+
+        # Game lines: 2 requests x 6 polls/hour on the free keys
+        props, lines = planner.quota_stretch(events, NOW, paid_remaining=100000, free_remaining=int(3 * hours))
+        assert props == 1.0
+        assert lines == pytest.approx(4.0, rel=0.01)
+
+        props, _ = planner.quota_stretch(events, NOW, paid_remaining=0, free_remaining=100000)
+        assert props == float('inf')
+        assert planner.due_events(events, NOW, stretch=props) == []
+
+    def test_stretch_lengthens_intervals(self):
+        planner = OddsPollPlanner(TIERS)
+        events = [event('soon', 1)]
+        planner.mark_polled(events, NOW)
+
+        assert planner.due_events(events, NOW + timedelta(minutes=10), stretch=2.0) == []
+        assert planner.due_events(events, NOW + timedelta(minutes=20), stretch=2.0) == events
+
+    def test_parse_commence_time(self):
+        assert parse_commence_time('2024-10-20T17:00:00Z') == datetime(2024, 10, 20, 17, tzinfo=timezone.utc)
+        assert parse_commence_time(None) is None
+        assert parse_commence_time('not a date') is None
+
+    def test_hours_left_in_month(self):
+        assert hours_left_in_month(datetime(2024, 10, 31, 12, tzinfo=timezone.utc)) == 12
+        assert hours_left_in_month(datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc)) == 1.0
+
+
+class TestNFLOddsScheduler:
+
+    @pytest.fixture
+    def scheduler(self, tmp_path):
+        kickoff = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(minutes=90)
+        # Kickoffs at +1.5h, +2.5h, +3.5h, +1.5h
+        with StandInOddsAPI(events=4, kickoff=kickoff) as api:
+            scraper = OddsScraper(api_keys=['free-key', 'paid-key'], paid_key='paid-key',
+                                  base_url=api.base_url, requests_per_second=1000,
+                                  http_cache=HTTPCache(tmp_path / 'cache', 'live'))
+            db = DatabaseManager(db_path=tmp_path / 'test.db')
+            db.connect()
+            db.create_tables()
+            scheduler = NFLOddsScheduler(scraper=scraper, db_manager=db,
+                                         planner=OddsPollPlanner(TIERS), week=7)
+            scheduler.api = api
+            yield scheduler
+            db.close()
+
+    def test_polls_only_games_that_are_due(self, scheduler):
+        now = datetime.now(timezone.utc)
+
+        first = scheduler.poll_once(now)
+        assert first['events'] == ['event00', 'event01', 'event02', 'event03']
+        assert first['game_lines']
+        assert first['results']['player_pass_tds']['rows'] == 16
+
+        # 10 minutes later only games inside the 2 hour tier are due again
+        scheduler.api.requests.clear()
+        second = scheduler.poll_once(now + timedelta(minutes=10))
+        assert second['events'] == ['event00', 'event03']
+        assert second['results']['player_pass_tds']['changed'] == 0
+        assert not any('/events/event01/' in path for path in scheduler.api.requests)
+
+    def test_events_list_cached_between_polls(self, scheduler):
+        now = datetime.now(timezone.utc)
+        scheduler.poll_once(now)
+        scheduler.poll_once(now + timedelta(minutes=10))
+
+        assert sum(path.endswith('/events') for path in scheduler.api.requests) == 1
+
+    def test_sleeps_until_next_game_due(self, scheduler):
+        now = datetime.now(timezone.utc)
+        scheduler.poll_once(now)
+
+        assert scheduler.seconds_until_next_poll(now) == pytest.approx(600, abs=1)
+        assert scheduler.poll_once(now + timedelta(minutes=5))['events'] == []
@@ -0,0 +1,122 @@
+"""Tests for concurrent OddsScraper player prop fetching (against a local stand-in API)"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.api_key_rotator import APIKeyRotator
+from utils.rate_limiter import TokenBucket
+
+PAID_KEY = 'paid-key'
+
+
+def make_scraper(api, **kwargs):
+    options = dict(max_concurrency=4, requests_per_second=1000, retry_base_delay=0.01)
+    options.update(kwargs)
+    return OddsScraper(api_keys=['free-key', PAID_KEY], paid_key=PAID_KEY,
+                       base_url=api.base_url, **options)
+
+
+@pytest.fixture
+def api():
+    with StandInOddsAPI(events=8, latency=0.05) as server:
+        yield server
+
+
+class TestConcurrentPlayerProps:
+
+    def test_concurrent_matches_serial(self, api):
+        serial_scraper = make_scraper(api)
+        serial = serial_scraper.fetch_player_props_for_all_events(concurrent=False)
+
+        concurrent_scraper = make_scraper(api)
+        concurrent = concurrent_scraper.fetch_player_props_for_all_events()
+
+        # 8 events x 2 books x 2 QBs, in events-list order
+        assert len(serial) == 32
+        assert concurrent == serial
+
+    def test_usage_counts_one_per_request(self, api):
+        scraper = make_scraper(api)
+        scraper.fetch_player_props_for_all_events()
+
+        # events list + one odds request per event
+        assert scraper.api_rotator.request_counts[PAID_KEY] == 1 + len(api.events)
+        assert scraper.api_rotator.request_counts['free-key'] == 0
+
+    def test_concurrency_is_bounded_and_faster(self, api):
+        start = time.perf_counter()
+        make_scraper(api, max_concurrency=1).fetch_player_props_for_all_events()
+        serial_time = time.perf_counter() - start
+
+        api.max_in_flight = 0
+        start = time.perf_counter()
+        make_scraper(api, max_concurrency=4).fetch_player_props_for_all_events()
+        concurrent_time = time.perf_counter() - start
+
+        assert api.max_in_flight == 4
+        assert concurrent_time < serial_time / 2
+
+    def test_rate_limited_response_is_retried(self, api):
+        api.fail('event03', 429, 503)
+        scraper = make_scraper(api)
+
+        props = scraper.fetch_player_props_for_all_events()
+
+        assert len(props) == 32
+        assert api.requests.count('/v4/sports/americanfootball_nfl/events/event03/odds') == 3
+        # Failed attempts are not billed
+        assert scraper.api_rotator.request_counts[PAID_KEY] == 1 + len(api.events)
+
+    def test_event_skipped_after_retries_exhausted(self, api):
+        api.fail('event05', 500, 500, 500)
+        scraper = make_scraper(api, max_retries=2)
+
+        props = scraper.fetch_player_props_for_all_events()
+
+        assert len(props) == 28
+        assert 'Denver Broncos' not in {p['home_team'] for p in props}
+        assert scraper.api_rotator.request_counts[PAID_KEY] == len(api.events)
+
+    def test_no_paid_key_returns_empty(self, api):
+        scraper = OddsScraper(api_keys=['free-key'], base_url=api.base_url)
+
+        assert scraper.fetch_player_props_for_all_events() == []
+        assert api.requests == []
+
+
+class TestRateLimiting:
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        start = time.perf_counter()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.perf_counter() - start
+
+        # First token is immediate, the next five arrive every 20ms
+        assert elapsed >= 0.09
+
+    def test_rotator_counts_are_thread_safe(self):
+        rotator = APIKeyRotator(['a', 'b'], paid_key='b')
+
+        def hammer():
+            for _ in range(1000):
+                rotator.increment_usage('b')
+
+        threads = [threading.Thread(target=hammer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert rotator.request_counts['b'] == 8000
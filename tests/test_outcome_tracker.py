@@ -0,0 +1,151 @@
+"""Tests for the SQLite-backed OutcomeTracker and ModelCalibrator reads"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.model_calibration import ModelCalibrator, OutcomeTracker
+
+
+def prediction(week, qb, prob=0.7, odds=-200, version='v2'):
+    return {'week': week, 'qb_name': qb, 'team': 'KC', 'opponent': 'BUF', 'predicted_prob': prob,
+            'odds': odds, 'model_version': version}
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return OutcomeTracker(tmp_path / 'calibration.db', outcomes_dir=tmp_path / 'outcomes')
+
+
+class TestPredictions:
+
+    def test_record_and_read_back(self, tracker):
+        prediction_id = tracker.record_prediction(7, 'Patrick Mahomes', 'KC', 'BUF', 0.72, -250, 'v2', 'high')
+
+        [pred] = tracker.get_predictions_for_week(7)
+        assert pred['prediction_id'] == prediction_id
+        assert prediction_id.startswith('7_Patrick Mahomes_KC_BUF_')
+        assert pred['predicted_probability'] == 0.72
+        assert pred['confidence'] == 'high'
+        assert pred['outcome_recorded'] is False and pred['actual_outcome'] is None
+        assert tracker.get_predictions_for_week(8) == []
+
+    def test_batch_insert(self, tracker):
+        ids = tracker.record_predictions([prediction(7, f'QB {i}') for i in range(50)])
+
+        assert len(set(ids)) == 50
+        assert [p['prediction_id'] for p in tracker.get_predictions_for_week(7)] == ids
+
+    def test_model_versions_kept_apart(self, tracker):
+        ids = tracker.record_predictions([prediction(7, 'Patrick Mahomes', prob=0.7, version='v1'),
+                                          prediction(7, 'Patrick Mahomes', prob=0.75, version='v2')])
+
+        assert len(set(ids)) == 2
+        stored = {p['model_version']: p['predicted_probability'] for p in tracker.get_predictions_for_week(7)}
+        assert stored == {'v1': 0.7, 'v2': 0.75}
+
+    def test_repeats_in_one_batch_kept(self, tracker):
+        ids = tracker.record_predictions([prediction(7, 'Patrick Mahomes', prob=0.7),
+                                          prediction(7, 'Patrick Mahomes', prob=0.72)])
+
+        assert len(set(ids)) == 2
+        assert [p['predicted_probability'] for p in tracker.get_predictions_for_week(7)] == [0.7, 0.72]
+
+    def test_rerecording_keeps_outcome(self, tracker):
+        [prediction_id] = tracker.record_predictions([prediction(7, 'Josh Allen', prob=0.6)])
+        tracker.record_outcome(prediction_id, True)
+        tracker.record_predictions([prediction(7, 'Josh Allen', prob=0.65)])
+
+        [pred] = tracker.get_predictions_for_week(7)
+        assert pred['predicted_probability'] == 0.65
+        assert pred['actual_outcome'] is True
+
+
+class TestOutcomes:
+
+    def test_record_outcome(self, tracker):
+        prediction_id = tracker.record_prediction(7, 'Jalen Hurts', 'PHI', 'DAL', 0.8, -300, 'v2')
+
+        assert tracker.record_outcome(prediction_id, False)
+        assert not tracker.record_outcome('missing', True)
+
+        [pred] = tracker.get_completed_predictions()
+        assert pred['outcome_recorded'] is True and pred['actual_outcome'] is False
+        assert pred['outcome_recorded_at']
+
+    def test_batch_outcomes(self, tracker):
+        ids = tracker.record_predictions([prediction(week, f'QB {week}') for week in range(1, 6)])
+
+        assert tracker.record_outcomes({ids[0]: True, ids[3]: False, 'missing': True}) == 2
+        completed = {p['prediction_id']: p['actual_outcome'] for p in tracker.get_completed_predictions()}
+        assert completed == {ids[0]: True, ids[3]: False}
+
+    def test_completed_limited_to_recent(self, tracker):
+        ids = tracker.record_predictions([prediction(7, f'QB {i}') for i in range(30)])
+        tracker.record_outcomes({prediction_id: True for prediction_id in ids})
+
+        assert len(tracker.get_completed_predictions(weeks_back=2)) == 20
+
+    def test_completed_query_uses_index(self, tracker):
+        tracker.record_prediction(7, 'Jared Goff', 'DET', 'TB', 0.7, -200, 'v2')
+        plan = sqlite3.connect(tracker.db_path).execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM model_predictions "
+            "WHERE outcome_recorded = 1 ORDER BY predicted_at DESC LIMIT 40"
+        ).fetchall()
+
+        assert 'idx_predictions_completed' in str(plan)
+
+
+class TestJsonImport:
+
+    @pytest.fixture
+    def legacy_dir(self, tmp_path):
+        outcomes_dir = tmp_path / 'outcomes'
+        outcomes_dir.mkdir()
+        base = {'team': 'KC', 'opponent': 'BUF', 'odds': -200, 'model_version': 'v1', 'confidence': 'medium',
+                'outcome_recorded_at': None}
+        (outcomes_dir / 'predictions_week_6.json').write_text(json.dumps([
+            {**base, 'prediction_id': 'a', 'week': 6, 'qb_name': 'Patrick Mahomes', 'predicted_probability': 0.7,
+             'predicted_at': '2025-10-12T10:00:00', 'outcome_recorded': True, 'actual_outcome': True},
+            {**base, 'prediction_id': 'b', 'week': 6, 'qb_name': 'Josh Allen', 'predicted_probability': 0.6,
+             'predicted_at': '2025-10-12T10:00:01', 'outcome_recorded': False, 'actual_outcome': None},
+        ]))
+        (outcomes_dir / 'predictions_week_7.json').write_text('not json')
+        return outcomes_dir
+
+    def test_history_imported_on_first_use(self, tmp_path, legacy_dir):
+        tracker = OutcomeTracker(tmp_path / 'calibration.db', outcomes_dir=legacy_dir)
+
+        assert [p['prediction_id'] for p in tracker.get_predictions_for_week(6)] == ['a', 'b']
+        assert [p['actual_outcome'] for p in tracker.get_completed_predictions()] == [True]
+
+    def test_import_is_idempotent(self, tmp_path, legacy_dir):
+        tracker = OutcomeTracker(tmp_path / 'calibration.db', outcomes_dir=legacy_dir)
+        tracker.record_outcome('b', True)
+
+        assert tracker.import_json_history() == 0
+        assert len(tracker.get_completed_predictions()) == 2
+
+
+class TestModelCalibrator:
+
+    def test_analysis_reads_tracker(self, tmp_path):
+        calibrator = ModelCalibrator(tmp_path / 'calibration.db')
+        calibrator.outcome_tracker = OutcomeTracker(tmp_path / 'calibration.db', outcomes_dir=tmp_path / 'outcomes')
+        assert calibrator.analyze_model_performance()['status'] == 'no_data'
+
+        ids = calibrator.outcome_tracker.record_predictions(
+            [prediction(7, f'QB {i}', prob=0.8, version='v2' if i % 2 else 'v1') for i in range(10)])
+        calibrator.outcome_tracker.record_outcomes({prediction_id: i < 8 for i, prediction_id in enumerate(ids)})
+
+        analysis = calibrator.analyze_model_performance()
+        assert analysis['total_predictions'] == 10
+        assert analysis['overall_metrics']['brier_score'] == pytest.approx((8 * 0.2 ** 2 + 2 * 0.8 ** 2) / 10)
+        assert {v: m['count'] for v, m in analysis['model_version_metrics'].items()} == {'v1': 5, 'v2': 5}
+        assert set(analysis['confidence_intervals']) >= {'brier_score', 'calibration_error', 'roi'}
@@ -0,0 +1,126 @@
+"""Tests for the single-pass PFR table parser (against recorded-layout fixture pages)"""
+
+import sys
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scrapers.qb_stats_scraper as qb_module
+from scrapers.defense_stats_scraper import DefenseStatsScraper
+from scrapers.qb_stats_scraper import QBStatsScraper
+from tests.pfr_server import StandInPFR
+from utils.http_cache import HTTPCache
+from utils.http_client import HTTPClient
+from utils.pfr_tables import find_table, read_table
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'pfr'
+
+
+@pytest.fixture(scope='module')
+def opp_html():
+    return (FIXTURES / 'opp_2024.htm').read_bytes()
+
+
+@pytest.fixture(scope='module')
+def passing_html():
+    return (FIXTURES / 'passing_2024.htm').read_bytes()
+
+
+def legacy_parse(html, table_id):
+    """What the scrapers did before: BeautifulSoup, str(table), pd.read_html"""
+    table = BeautifulSoup(html, 'lxml').find('table', {'id': table_id})
+    return pd.read_html(StringIO(str(table)))[0]
+
+
+class TestFindTable:
+
+    def test_visible_table(self, opp_html):
+        assert find_table(opp_html, 'team_stats').get('id') == 'team_stats'
+
+    def test_table_inside_comment(self, opp_html, passing_html):
+        assert read_table(opp_html, 'passing').shape == (34, 16)
+        assert read_table(passing_html, 'advanced_air_yards')['Player'].iloc[0] == 'Patrick Mahomes'
+
+    def test_first_available_id_wins(self, opp_html):
+        assert find_table(opp_html, 'missing', 'rushing', 'team_stats').get('id') == 'rushing'
+
+    def test_missing_table(self, opp_html):
+        assert read_table(opp_html, 'kicking') is None
+        assert read_table(b'', 'team_stats') is None
+
+
+class TestReadTable:
+
+    def test_header_from_last_header_row(self, opp_html):
+        df = read_table(opp_html, 'team_stats')
+
+        assert list(df.columns[:5]) == ['Rk', 'Tm', 'G', 'PF', 'Yds']
+        assert list(df.columns).count('TD') == 2
+        assert df['Tm'].tolist()[-2:] == ['Avg Team', 'League Total']
+
+    def test_typed_columns(self, passing_html):
+        df = read_table(passing_html, 'passing')
+
+        assert df['G'].dtype == 'int64'
+        assert df['Cmp%'].dtype == 'float64'
+        assert df['Player'].dtype == object
+        assert df['QBrec'].dtype == object
+        assert df['QBR'].dtype == 'float64' and df['QBR'].isna().any()
+        # Thousands separators dropped
+        yards = df['Yds'].iloc[:, 0]
+        assert yards.dtype == 'int64' and yards.max() > 1000
+
+    def test_repeated_header_rows_skipped(self, passing_html):
+        df = read_table(passing_html, 'passing')
+
+        assert len(df) == 44
+        assert (df['Player'] != 'Player').all()
+
+    def test_table_without_thead(self):
+        html = '<table id="t"><tr><th>Tm</th><th>TD</th></tr><tr><td>KAN</td><td>1,024</td></tr></table>'
+        df = read_table(html, 't')
+
+        assert list(df.columns) == ['Tm', 'TD']
+        assert df['TD'].tolist() == [1024]
+
+
+class TestMatchesLegacyParse:
+    """Scraper output is unchanged by the switch from read_html"""
+
+    def test_defense_stats(self, opp_html):
+        scraper = DefenseStatsScraper(year=2024)
+        expected = scraper._clean_dataframe(legacy_parse(opp_html, 'team_stats'))
+        actual = scraper._clean_dataframe(read_table(opp_html, 'team_stats'))
+
+        pd.testing.assert_frame_equal(actual, expected)
+        assert len(actual) == 32
+
+    def test_qb_stats(self, passing_html):
+        scraper = QBStatsScraper(year=2024)
+        expected = scraper._clean_dataframe(legacy_parse(passing_html, 'passing'))
+        actual = scraper._clean_dataframe(read_table(passing_html, 'passing'))
+
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+class TestScrapersUseParser:
+
+    def test_qb_scraper_end_to_end(self, passing_html, tmp_path, monkeypatch):
+        monkeypatch.setattr(qb_module, 'DATA_DIR', tmp_path)
+        monkeypatch.setattr(qb_module, 'REQUEST_DELAY', 0)
+
+        with StandInPFR({'/years/2024/passing.htm': passing_html.decode()}) as pfr:
+            client = HTTPClient(conditional_hosts=(pfr.host,), validators_path=tmp_path / 'validators.json')
+            scraper = QBStatsScraper(year=2024, http_cache=HTTPCache(tmp_path / 'cache', 'live', client=client))
+            scraper.url = pfr.url('/years/2024/passing.htm')
+            df = scraper.scrape()
+
+        assert len(df) == 44
+        assert df.iloc[0]['total_tds'] == df['total_tds'].max()
+        assert set(df.columns) == {'qb_name', 'team', 'total_tds', 'games_played', 'is_starter'}
@@ -0,0 +1,196 @@
+"""Tests for concurrent pipeline stage execution in main.py"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from main import DataPipeline, PipelineStage, run_stage_dag
+from utils.db_manager import DatabaseManager
+
+
+class StageRecorder:
+    """Builds stages that sleep and record when they ran"""
+
+    def __init__(self):
+        self.spans = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name, host, duration=0.1, ok=True, depends_on=()):
+        def run():
+            start = time.perf_counter()
+            time.sleep(duration)
+            with self._lock:
+                self.spans[name] = (start, time.perf_counter())
+            return ok
+        return PipelineStage(name, run, host=host, depends_on=depends_on)
+
+    def overlapped(self, a, b):
+        return self.spans[a][0] < self.spans[b][1] and self.spans[b][0] < self.spans[a][1]
+
+
+class TestRunStageDag:
+
+    def test_independent_stages_overlap(self):
+        recorder = StageRecorder()
+        stages = [recorder.stage(name, host=name) for name in ('a', 'b', 'c')]
+
+        start = time.perf_counter()
+        results = run_stage_dag(stages, max_workers=3)
+
+        assert time.perf_counter() - start < 0.25
+        assert recorder.overlapped('a', 'c')
+        assert all(result['status'] == 'success' for result in results.values())
+        assert all(result['elapsed_seconds'] >= 0.1 for result in results.values())
+
+    def test_same_host_runs_one_at_a_time(self):
+        recorder = StageRecorder()
+        stages = [
+            recorder.stage('defense', host='pfr'),
+            recorder.stage('qb', host='pfr'),
+            recorder.stage('odds', host='odds-api'),
+        ]
+
+        run_stage_dag(stages, max_workers=3, host_concurrency=1)
+
+        assert not recorder.overlapped('defense', 'qb')
+        assert recorder.overlapped('defense', 'odds')
+
+    def test_dependency_failure_skips_dependents(self):
+        recorder = StageRecorder()
+        stages = [
+            recorder.stage('matchups', host='espn', ok=False),
+            recorder.stage('odds', host='odds-api', depends_on=['matchups']),
+            recorder.stage('report', host='local', depends_on=['odds']),
+            recorder.stage('defense', host='pfr'),
+        ]
+
+        results = run_stage_dag(stages)
+
+        assert results['matchups']['status'] == 'failed'
+        assert results['odds']['status'] == 'skipped'
+        assert results['report']['status'] == 'skipped'
+        assert results['defense']['status'] == 'success'
+        assert 'odds' not in recorder.spans
+
+    def test_exception_marks_stage_failed(self):
+        def boom():
+            raise RuntimeError("scraper crashed")
+
+        results = run_stage_dag([PipelineStage('defense', boom, host='pfr')])
+
+        assert results['defense']['status'] == 'failed'
+
+    def test_sequential_when_single_worker(self):
+        recorder = StageRecorder()
+        stages = [recorder.stage(name, host=name, duration=0.02) for name in ('a', 'b', 'c')]
+
+        run_stage_dag(stages, max_workers=1)
+
+        order = sorted(recorder.spans, key=lambda name: recorder.spans[name][0])
+        assert order == ['a', 'b', 'c']
+        assert not recorder.overlapped('a', 'b')
+
+    def test_unknown_dependency_rejected(self):
+        with pytest.raises(ValueError):
+            run_stage_dag([PipelineStage('odds', lambda: True, host='x', depends_on=['matchups'])])
+
+
+class TestPipelineRunAll:
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        manager = DatabaseManager(db_path=tmp_path / 'test.db')
+        manager.connect()
+        manager.create_tables()
+        yield manager
+        manager.close()
+
+    def make_pipeline(self, db, monkeypatch):
+        pipeline = DataPipeline(week=7)
+        pipeline.save_to_db = True
+        pipeline.db_manager = db
+        monkeypatch.setattr('main.DataValidator.get_available_weeks', lambda self: [])
+        return pipeline
+
+    def test_writes_go_through_one_thread(self, db, monkeypatch):
+        pipeline = self.make_pipeline(db, monkeypatch)
+        writer_threads = set()
+
+        def stage(name):
+            def run():
+                time.sleep(0.05)
+                pipeline._db_write(lambda: writer_threads.add(threading.current_thread().name))
+                pipeline.results[name] = f'{name}.csv'
+                return True
+            return run
+
+        for name in ('defense_stats', 'qb_stats', 'matchups', 'odds'):
+            monkeypatch.setattr(pipeline, f'run_{name}', stage(name))
+
+        assert pipeline.run_all()
+        assert len(writer_threads) == 1
+        assert next(iter(writer_threads)).startswith('db-writer')
+
+    def test_stage_timings_logged(self, db, monkeypatch, tmp_path):
+        pipeline = self.make_pipeline(db, monkeypatch)
+        for name in ('defense_stats', 'qb_stats', 'matchups'):
+            monkeypatch.setattr(pipeline, f'run_{name}', lambda: True)
+        monkeypatch.setattr(pipeline, 'run_odds', lambda: False)
+
+        assert not pipeline.run_all()
+
+        conn = sqlite3.connect(tmp_path / 'test.db')
+        status, elapsed, timings = conn.execute(
+            "SELECT status, elapsed_seconds, stage_timings FROM scrape_runs").fetchone()
+        conn.close()
+
+        timings = json.loads(timings)
+        assert status == 'partial'
+        assert elapsed >= 0
+        assert set(timings) == {'defense_stats', 'qb_stats', 'matchups', 'odds'}
+        assert timings['odds']['status'] == 'failed'
+
+
+    def test_non_interactive_refreshes_existing_week(self, db, monkeypatch):
+        pipeline = self.make_pipeline(db, monkeypatch)
+        pipeline.interactive = False
+        monkeypatch.setattr('main.DataValidator.get_available_weeks', lambda self: [7])
+        monkeypatch.setattr('builtins.input', lambda prompt='': pytest.fail("prompted in a scheduled run"))
+        for name in ('defense_stats', 'qb_stats', 'matchups', 'odds'):
+            monkeypatch.setattr(pipeline, f'run_{name}', lambda: True)
+
+        assert pipeline.run_all()
+
+class TestScrapeRunTimings:
+
+    def test_old_scrape_runs_table_migrated(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / 'old.db')
+        conn.execute("""
+            CREATE TABLE scrape_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                week INTEGER, files_scraped INTEGER, api_requests_used INTEGER,
+                status TEXT, error_message TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(db_path=tmp_path / 'old.db')
+        db.connect()
+        db.log_scrape_run(week=7, files_scraped=4, api_requests_used=0,
+                          elapsed_seconds=12.5, stage_timings={'odds': {'status': 'success', 'elapsed_seconds': 3.2}})
+
+        row = db.conn.execute("SELECT elapsed_seconds, stage_timings FROM scrape_runs").fetchone()
+        db.close()
+
+        assert row[0] == 12.5
+        assert json.loads(row[1])['odds']['elapsed_seconds'] == 3.2
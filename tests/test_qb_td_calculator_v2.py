@@ -0,0 +1,76 @@
+"""Unit tests for QBTDCalculatorV2 batched lookups"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.conftest import QueryCounter, WEEK_7_GAMES
+from utils.calculators.qb_td_calculator_v2 import QBTDCalculatorV2
+from utils.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def calculator(edge_db):
+    return QBTDCalculatorV2(DatabaseManager(db_path=edge_db))
+
+
+class TestBatchedLookups:
+    """Batched lookups must match the per-QB queries they replace"""
+
+    def test_red_zone_rates_match_single_queries(self, calculator):
+        lookups = calculator.load_v2_lookups(week=7, season=2024)
+
+        for _, _, qb, *_ in WEEK_7_GAMES:
+            single = calculator._calculate_red_zone_td_rate(qb, 2024)
+            assert lookups['red_zone_td_rates'].get(qb, 0.0) == pytest.approx(single)
+
+    def test_defense_quality_matches_single_queries(self, calculator):
+        lookups = calculator.load_v2_lookups(week=7, season=2024)
+
+        for _, away, *_ in WEEK_7_GAMES:
+            single = calculator._get_opponent_defense_quality(away, 2024)
+            batched = calculator._lookup_defense_quality(lookups, away)
+            assert batched['rank'] == single['rank']
+            assert batched['tds_per_game'] == pytest.approx(single['tds_per_game'])
+
+    def test_enhanced_stats_keyed_by_name(self, calculator):
+        lookups = calculator.load_v2_lookups(week=7, season=2024)
+
+        assert set(lookups['qb_stats']) == {qb for _, _, qb, *_ in WEEK_7_GAMES[:-1]}
+        assert lookups['qb_stats']['Josh Allen']['team'] == 'Buffalo Bills'
+
+    def test_missing_defense_uses_league_average(self, calculator):
+        lookups = calculator.load_v2_lookups(week=7, season=2024)
+        assert calculator._lookup_defense_quality(lookups, 'Nowhere FC') == {'tds_per_game': 1.5, 'rank': 'N/A'}
+
+
+class TestCalculateEdges:
+    """End-to-end v2 edges on the fixture slate"""
+
+    def test_edges_use_batched_metrics(self, calculator):
+        edges = calculator.calculate_edges(week=7, season=2024, min_edge_threshold=0.0)
+        by_qb = {edge['qb_name']: edge for edge in edges}
+
+        assert by_qb['Jared Goff']['model_version'] == 'v2_fallback'
+        mahomes = by_qb['Patrick Mahomes']
+        assert mahomes['model_version'] == 'v2'
+        assert mahomes['v2_metrics']['red_zone_td_rate'] == pytest.approx(0.3)
+        assert mahomes['v2_metrics']['opp_defense_rank'] == 'Weak'
+
+    def test_query_count_independent_of_slate_size(self, calculator):
+        """Lookups are three queries regardless of how many edges are enhanced."""
+        reader = calculator.db_manager.get_read_connection()
+        counter = QueryCounter()
+        reader.set_trace_callback(counter)
+        try:
+            edges = calculator.calculate_edges(week=7, season=2024, min_edge_threshold=0.0)
+        finally:
+            reader.set_trace_callback(None)
+
+        assert len(edges) == len(WEEK_7_GAMES)
+        # 1 matchup query for the v1 baseline + 3 batched lookups
+        assert counter.count == 4
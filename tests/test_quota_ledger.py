@@ -0,0 +1,195 @@
+"""Tests for the persistent API quota ledger and its use by APIKeyRotator"""
+
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import StandInOddsAPI
+from utils.api_key_rotator import APIKeyRotator
+from utils.connection_pool import close_all_pools
+from utils.quota_ledger import QuotaLedger, current_period, key_fingerprint
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    yield QuotaLedger(tmp_path / 'quota.db')
+    close_all_pools()
+
+
+class TestQuotaLedger:
+
+    def test_usage_persists_across_instances(self, ledger):
+        ledger.record_usage('key-a', 'free')
+        ledger.record_usage('key-a', 'free')
+
+        usage = QuotaLedger(ledger.db_path).usage(['key-a', 'key-b'])
+
+        assert usage == {'key-a': {'requests_used': 2, 'server_remaining': None, 'server_used': None}}
+        assert ledger.remaining('key-a', limit=500) == 498
+        assert ledger.remaining('key-b', limit=500) == 500
+
+    def test_server_remaining_preferred(self, ledger):
+        ledger.record_usage('key-a', 'paid', remaining=120, used=19880)
+        assert ledger.remaining('key-a', limit=20000) == 120
+
+        # No header on the next response: assume one credit
+        ledger.record_usage('key-a', 'paid')
+        assert ledger.remaining('key-a', limit=20000) == 119
+
+    def test_top_up_raises_remaining(self, ledger):
+        ledger.record_usage('key-a', 'paid', remaining=50, used=19950)
+        ledger.record_usage('key-a', 'paid', remaining=20049, used=19951)
+
+        assert ledger.remaining('key-a', limit=20000) == 20049
+
+    def test_out_of_order_report_does_not_overwrite_newer(self, ledger):
+        ledger.record_usage('key-a', 'paid', remaining=98, used=2)
+        ledger.record_usage('key-a', 'paid', remaining=99, used=1)
+
+        row = ledger.usage(['key-a'])['key-a']
+        assert (row['requests_used'], row['server_remaining'], row['server_used']) == (2, 98, 2)
+
+    def test_report_time_orders_reports_without_used(self, ledger):
+        received = datetime(2025, 10, 20, 12, 0, tzinfo=timezone.utc)
+        ledger.record_usage('key-a', 'paid', remaining=98, reported_at=received + timedelta(seconds=1))
+        ledger.record_usage('key-a', 'paid', remaining=99, reported_at=received)
+
+        assert ledger.remaining('key-a', limit=20000) == 98
+
+    def test_adds_report_column_to_existing_ledger(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / 'old.db')
+        conn.execute("""
+            CREATE TABLE api_quota_ledger (key_id TEXT NOT NULL, period TEXT NOT NULL, tier TEXT NOT NULL,
+                requests_used INTEGER NOT NULL DEFAULT 0, server_remaining INTEGER, server_used INTEGER,
+                updated_at TIMESTAMP, UNIQUE(key_id, period))
+        """)
+        conn.close()
+
+        ledger = QuotaLedger(tmp_path / 'old.db')
+        ledger.record_usage('key-a', 'free', remaining=400)
+        assert ledger.remaining('key-a', limit=500) == 400
+
+    def test_monthly_reset(self, ledger):
+        ledger.record_usage('key-a', 'free', remaining=0, period='2024-09')
+
+        assert ledger.remaining('key-a', limit=500, period='2024-09') == 0
+        assert ledger.remaining('key-a', limit=500) == 500
+
+    def test_raw_keys_not_stored(self, ledger):
+        ledger.record_usage('secret-key', 'free')
+
+        rows = ledger.pool.writer().execute("SELECT key_id FROM api_quota_ledger").fetchall()
+        assert rows == [(key_fingerprint('secret-key'),)]
+
+    def test_concurrent_processes(self, ledger):
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from utils.quota_ledger import QuotaLedger;"
+            "ledger = QuotaLedger(sys.argv[2]);"
+            "[ledger.record_usage('shared', 'paid') for _ in range(50)]"
+        )
+        workers = [
+            subprocess.Popen([sys.executable, '-c', script, str(REPO_ROOT), str(ledger.db_path)])
+            for _ in range(4)
+        ]
+        assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+        assert ledger.usage(['shared'])['shared']['requests_used'] == 200
+
+
+class TestRotatorWithLedger:
+
+    def test_counts_survive_new_process(self, ledger):
+        APIKeyRotator(['a', 'b'], ledger=ledger).increment_usage('a')
+
+        rotator = APIKeyRotator(['a', 'b'], ledger=ledger)
+
+        assert rotator.request_counts == {'a': 1, 'b': 0}
+        assert rotator.get_remaining_requests() == 999
+
+    def test_skips_key_exhausted_on_server(self, ledger):
+        rotator = APIKeyRotator(['a', 'b'], ledger=ledger)
+        rotator.increment_usage('a', remaining=0, used=500)
+
+        # Another process sees the stored budget, not its own zero count
+        assert APIKeyRotator(['a', 'b'], ledger=ledger).get_next_key() == 'b'
+
+    def test_paid_reserve_kept_for_props(self, ledger):
+        rotator = APIKeyRotator(['free', 'paid'], paid_key='paid', ledger=ledger, paid_reserve=100)
+        rotator.increment_usage('free', remaining=0)
+        rotator.increment_usage('paid', remaining=100)
+
+        assert rotator.get_next_key() is None
+        assert rotator.get_paid_key() == 'paid'
+
+    def test_reset_clears_ledger(self, ledger):
+        rotator = APIKeyRotator(['a'], ledger=ledger)
+        rotator.increment_usage('a', remaining=0)
+        rotator.reset_counts()
+
+        assert ledger.usage(['a']) == {}
+        assert rotator.get_next_key() == 'a'
+
+    def test_remaining_cached_between_writes(self, ledger, monkeypatch):
+        rotator = APIKeyRotator(['a'], ledger=ledger)
+        reads = []
+        remaining = ledger.remaining
+        monkeypatch.setattr(ledger, 'remaining', lambda *args, **kwargs: reads.append(1) or remaining(*args, **kwargs))
+
+        assert [rotator.get_next_key() for _ in range(5)] == ['a'] * 5
+        assert len(reads) == 1
+
+        rotator.increment_usage('a', remaining=0)
+        assert rotator.get_next_key() is None
+        assert len(reads) == 2
+
+    def test_ledger_written_outside_lock(self, ledger, monkeypatch):
+        rotator = APIKeyRotator(['a'], ledger=ledger)
+        held = []
+        record_usage = ledger.record_usage
+        monkeypatch.setattr(ledger, 'record_usage',
+                            lambda *args, **kwargs: held.append(rotator._lock._is_owned()) or
+                            record_usage(*args, **kwargs))
+
+        rotator.increment_usage('a')
+
+        assert held == [False]
+        assert ledger.usage(['a'])['a']['requests_used'] == 1
+
+    def test_ledger_read_outside_lock(self, ledger, monkeypatch):
+        rotator = APIKeyRotator(['free', 'paid'], paid_key='paid', ledger=ledger)
+        held = []
+        remaining = ledger.remaining
+        monkeypatch.setattr(ledger, 'remaining',
+                            lambda *args, **kwargs: held.append(rotator._lock._is_owned()) or
+                            remaining(*args, **kwargs))
+
+        assert rotator.get_next_key() == 'free'
+        rotator.increment_usage('paid')
+        assert rotator.get_paid_key() == 'paid'
+        rotator.reset_counts()
+
+        assert held and not any(held)
+
+    def test_scraper_stores_server_headers(self, ledger):
+        with StandInOddsAPI(events=3, quota=1000) as api:
+            scraper = OddsScraper(api_keys=['paid'], paid_key='paid', base_url=api.base_url,
+                                  requests_per_second=1000, quota_ledger=ledger)
+            scraper.fetch_player_props_for_all_events()
+
+        row = ledger.usage(['paid'])['paid']
+        assert row['requests_used'] == 4
+        assert row['server_used'] == 4
+        assert row['server_remaining'] == 996
+        assert current_period() in ledger.pool.writer().execute(
+            "SELECT period FROM api_quota_ledger").fetchone()
@@ -0,0 +1,96 @@
+"""Tests for VersionedResultCache"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.result_cache import VersionedResultCache
+
+
+class Version:
+    """Mutable data version for tests"""
+
+    def __init__(self):
+        self.value = 1
+
+    def __call__(self):
+        return self.value
+
+
+class TestVersionedResultCache:
+
+    def test_hit_after_miss(self):
+        cache = VersionedResultCache(Version())
+        calls = []
+
+        for _ in range(3):
+            result = cache.get_or_compute('k', lambda: calls.append(1) or [{'edge': 1}])
+
+        assert result == [{'edge': 1}]
+        assert len(calls) == 1
+        assert cache.stats()['hits'] == 2
+        assert cache.stats()['misses'] == 1
+
+    def test_results_are_copies(self):
+        cache = VersionedResultCache(Version())
+        cache.get_or_compute('k', lambda: [{'edge': 1}])
+
+        first = cache.get_or_compute('k', lambda: None)
+        first[0]['edge'] = 99
+
+        assert cache.get_or_compute('k', lambda: None) == [{'edge': 1}]
+
+    def test_version_change_invalidates(self):
+        version = Version()
+        cache = VersionedResultCache(version)
+        cache.get_or_compute('k', lambda: 'old')
+
+        version.value = 2
+
+        assert cache.get_or_compute('k', lambda: 'new') == 'new'
+        assert cache.stats()['invalidations'] == 1
+        assert cache.stats()['entries'] == 1
+
+    def test_stale_result_not_stored(self):
+        """A result computed before a data change is returned but not cached."""
+        version = Version()
+        cache = VersionedResultCache(version)
+
+        seen_version, _ = cache.lookup('k')
+        version.value = 2
+        cache.lookup('other')  # observes the new version
+        cache.store('k', seen_version, 'stale')
+
+        assert cache.lookup('k')[1] is VersionedResultCache.MISS
+
+    def test_lru_eviction_by_entries(self):
+        cache = VersionedResultCache(Version(), max_entries=2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: None)  # touch a
+        cache.get_or_compute('c', lambda: 3)     # evicts b
+
+        assert cache.lookup('a')[1] == 1
+        assert cache.lookup('b')[1] is VersionedResultCache.MISS
+        assert cache.stats()['evictions'] == 1
+
+    def test_memory_cap(self):
+        cache = VersionedResultCache(Version(), max_bytes=1000)
+        for i in range(10):
+            cache.get_or_compute(i, lambda: 'x' * 300)
+
+        stats = cache.stats()
+        assert stats['bytes'] <= 1000
+        assert stats['entries'] < 10
+
+    def test_no_version_bypasses_cache(self):
+        cache = VersionedResultCache(lambda: None)
+        calls = []
+
+        cache.get_or_compute('k', lambda: calls.append(1))
+        cache.get_or_compute('k', lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert cache.stats()['entries'] == 0
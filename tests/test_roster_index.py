@@ -0,0 +1,159 @@
+"""Tests for the roster index used to resolve which team a QB in an odds feed plays for"""
+
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.odds_scraper import OddsScraper
+from tests.odds_api_server import TEAMS, StandInOddsAPI
+from utils.db_manager import DatabaseManager
+from utils.http_cache import HTTPCache
+from utils.roster_index import RosterIndex, player_key, team_code
+
+# PFR team codes, as stored in qb_stats
+PFR_CODES = {'Kansas City Chiefs': 'KAN', 'Buffalo Bills': 'BUF', 'Green Bay Packers': 'GNB'}
+
+
+def game(home, away, players):
+    outcomes = [{'name': 'Over', 'description': name, 'point': 0.5, 'price': -300} for name in players]
+    return {
+        'home_team': home, 'away_team': away, 'commence_time': '2025-10-19T17:00:00Z',
+        'bookmakers': [{'title': 'FanDuel', 'markets': [{'key': 'player_pass_tds', 'outcomes': outcomes}]}],
+    }
+
+
+@pytest.fixture
+def roster_db(tmp_path):
+    db_path = tmp_path / 'roster.db'
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE qb_stats (qb_name TEXT, team TEXT, year INTEGER, scraped_at TIMESTAMP)")
+    conn.execute("CREATE TABLE player_roster (player_name TEXT, position TEXT, team TEXT, season INTEGER, "
+                 "week INTEGER, status TEXT)")
+    conn.executemany("INSERT INTO qb_stats VALUES (?, ?, 2025, '2025-10-01')",
+                     [('Patrick Mahomes', 'KAN'), ('Josh Allen', 'BUF'), ('Aaron Rodgers', 'NYJ'),
+                      ('Joe Flacco', '2TM')])
+    # Rodgers' weekly roster entries are newer than the season stats
+    conn.executemany("INSERT INTO player_roster VALUES (?, 'QB', ?, 2025, ?, 'Active')",
+                     [('Aaron Rodgers', 'NYJ', 1), ('Aaron Rodgers', 'PIT', 6), ('Jordan Love', 'GB', 6)])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestKeys:
+
+    def test_team_spellings_share_a_code(self):
+        assert team_code('KAN') == team_code('KC') == team_code('Kansas City Chiefs') == 'KC'
+        assert team_code('2TM') is None
+        assert team_code('') is None
+
+    def test_player_spellings_share_a_key(self):
+        assert player_key('C.J. Stroud') == player_key('CJ Stroud')
+        assert player_key('Michael Penix Jr.') == player_key('Michael Penix')
+        assert player_key("Aidan O'Connell") == player_key('Aidan OConnell')
+        assert player_key('Cam Ward') == player_key('Cameron Ward')
+
+
+class TestRosterIndex:
+
+    def test_resolves_home_and_away(self):
+        index = RosterIndex({qb: PFR_CODES.get(team, team) for team, qb in TEAMS})
+
+        assert index.resolve('Patrick Mahomes', 'Kansas City Chiefs', 'Buffalo Bills') == \
+            ('Kansas City Chiefs', 'Buffalo Bills')
+        assert index.resolve('Josh Allen', 'Kansas City Chiefs', 'Buffalo Bills') == \
+            ('Buffalo Bills', 'Kansas City Chiefs')
+        assert not index.unresolved
+
+    def test_unknown_or_other_team_unresolved(self):
+        index = RosterIndex({'Patrick Mahomes': 'KC'})
+
+        assert index.resolve('Nobody', 'Kansas City Chiefs', 'Buffalo Bills') == ('', '')
+        assert index.resolve('Patrick Mahomes', 'Miami Dolphins', 'Buffalo Bills') == ('', '')
+        assert set(index.unresolved) == {'Nobody', 'Patrick Mahomes'}
+
+    def test_from_database_prefers_latest_roster(self, roster_db):
+        index = RosterIndex.from_database(roster_db)
+
+        assert index.team_for('Patrick Mahomes') == 'KC'
+        assert index.team_for('Aaron Rodgers') == 'PIT'
+        assert index.team_for('Jordan Love') == 'GB'
+        # Multi-team season rows carry no usable team
+        assert index.team_for('Joe Flacco') is None
+
+    def test_from_database_tolerates_missing_tables(self, tmp_path):
+        db_path = tmp_path / 'empty.db'
+        sqlite3.connect(db_path).close()
+
+        assert len(RosterIndex.from_database(db_path)) == 0
+        assert len(RosterIndex.from_database(tmp_path / 'missing.db')) == 0
+
+    def test_unresolved_reported_once(self, caplog):
+        index = RosterIndex()
+        for _ in range(3):
+            index.resolve('Nobody', 'Kansas City Chiefs', 'Buffalo Bills')
+
+        with caplog.at_level(logging.WARNING, logger='utils.roster_index'):
+            assert index.report_unresolved() == ['Nobody']
+            assert index.report_unresolved() == []
+
+        assert len(caplog.records) == 1
+        assert '1 players (3 outcomes)' in caplog.text
+
+
+class TestOddsParsing:
+
+    def test_event_props_carry_team_and_opponent(self, roster_db):
+        scraper = OddsScraper(api_keys=['paid'], paid_key='paid')
+        roster = RosterIndex.from_database(roster_db)
+        rows = [row
+                for event in (game('Kansas City Chiefs', 'Buffalo Bills', ['Patrick Mahomes', 'Josh Allen']),
+                              game('Green Bay Packers', 'Pittsburgh Steelers', ['Aaron Rodgers', 'Backup QB']))
+                for row in scraper._parse_event_player_props(event, week=7, roster=roster)]
+
+        teams = {row['qb_name']: (row['team'], row['opponent']) for row in rows}
+        assert teams == {
+            'Patrick Mahomes': ('Kansas City Chiefs', 'Buffalo Bills'),
+            'Josh Allen': ('Buffalo Bills', 'Kansas City Chiefs'),
+            'Aaron Rodgers': ('Pittsburgh Steelers', 'Green Bay Packers'),
+            'Backup QB': ('', ''),
+        }
+
+    def test_ingest_stores_team_once_per_scrape(self, roster_db, tmp_path, monkeypatch):
+        builds = []
+        from_database = RosterIndex.from_database.__func__
+        monkeypatch.setattr(RosterIndex, 'from_database',
+                            classmethod(lambda cls, db_path=None: builds.append(1) or from_database(cls, roster_db)))
+        db = DatabaseManager(db_path=tmp_path / 'odds.db')
+        db.connect()
+        db.create_tables()
+
+        with StandInOddsAPI(events=2) as api:
+            scraper = OddsScraper(api_keys=['paid'], paid_key='paid', base_url=api.base_url,
+                                  requests_per_second=1000, http_cache=HTTPCache(tmp_path / 'cache', 'live'))
+            scraper.ingest_all_odds(7, db)
+
+        rows = db.conn.execute("SELECT DISTINCT qb_name, team, opponent FROM qb_props ORDER BY qb_name").fetchall()
+        db.close()
+        assert builds == [1]
+        assert rows == [('Jalen Hurts', '', ''), ('Josh Allen', 'Buffalo Bills', 'Kansas City Chiefs'),
+                        ('Lamar Jackson', '', ''), ('Patrick Mahomes', 'Kansas City Chiefs', 'Buffalo Bills')]
+
+    def test_existing_qb_props_table_migrated(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / 'old.db')
+        conn.execute("CREATE TABLE qb_props (id INTEGER PRIMARY KEY AUTOINCREMENT, qb_name TEXT, "
+                     "odds_over_05_td INTEGER, sportsbook TEXT, game TEXT, home_team TEXT, away_team TEXT, "
+                     "game_time TIMESTAMP, week INTEGER, scraped_at TIMESTAMP)")
+        conn.close()
+
+        db = DatabaseManager(db_path=tmp_path / 'old.db')
+        db.ensure_qb_props_columns()
+        columns = {row[1] for row in db.conn.execute("PRAGMA table_info(qb_props)")}
+        db.close()
+        assert {'team', 'opponent'} <= columns
@@ -8,7 +8,13 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.strategy_aggregator import StrategyAggregator
+import time
+
+from tests.conftest import QueryCounter, WEEK_7_GAMES, populate_team_metrics
+from utils.edge_calculator import EdgeCalculator
+from utils.db_manager import DatabaseManager
+from utils.strategy_aggregator import Strategy, StrategyAggregator
+from utils.strategy_context import StrategyContext
 
 
 class TestStrategyAggregatorInitialization:
@@ -227,5 +233,266 @@ class TestErrorHandling:
         assert counts['total'] >= 0, "Total should be non-negative"
 
 
+class TestSharedContext:
+    """Strategies share one per-request StrategyContext"""
+
+    def test_query_count_all_strategies(self, edge_db):
+        """strategy=all issues a fixed number of queries, none per edge."""
+        # Inline execution so every query goes through this thread's reader
+        agg = StrategyAggregator(str(edge_db), max_workers=1)
+        reader = agg.db_manager.get_read_connection()
+        counter = QueryCounter()
+        reader.set_trace_callback(counter)
+        try:
+            edges = agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+        finally:
+            reader.set_trace_callback(None)
+
+        assert len(edges) == 2 * len(WEEK_7_GAMES)
+        # First half: matchups + team metrics; QB TD: 1 matchup frame + 3 v2 lookups
+        # (previously 22: v1 and v2 each loaded matchups, v1 ran 3 queries per edge)
+        assert counter.count == 6
+
+    def test_each_input_loaded_once(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        context = StrategyContext(agg.db_manager, week=7, season=2024)
+
+        agg._get_first_half_edges(7, 2024, 0.0, context)
+        agg._get_qb_td_v1_edges(7, 2024, 0.0, context)
+        agg._get_qb_td_v2_edges(7, 2024, 0.0, context)
+
+        # matchups, team rankings, QB matchup frame, priced v1 edges, v2 lookups
+        assert context.stats['loads'] == 5
+        assert context.stats['hits'] >= 2
+
+    def test_request_views_share_values_not_errors(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        shared = StrategyContext(agg.db_manager, week=7, season=2024)
+        first, second = shared.for_request(), shared.for_request()
+
+        first.matchups()
+        first.record_error("qb_td_v2: database is locked")
+        second.matchups()
+
+        assert first.errors == ["qb_td_v2: database is locked"]
+        assert second.errors == [] and shared.errors == []
+        assert shared.stats == {'loads': 1, 'hits': 1}
+
+    def test_v1_comparison_fields_match_v2_strategy(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        edges = agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+
+        v1 = {e['matchup']: e for e in edges if 'v1' in e['strategy']}
+        v2 = {e['matchup']: e for e in edges if 'v2' in e['strategy']}
+
+        assert v1.keys() == v2.keys()
+        for matchup, edge in v1.items():
+            # v2 rounds the rate to 3 places
+            assert edge['red_zone_td_rate'] == pytest.approx(v2[matchup]['red_zone_td_rate'] or 0.0, abs=5e-4)
+
+
+class TestResultCache:
+    """Results are cached until the database changes"""
+
+    def test_repeat_request_served_from_cache(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        first = agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+
+        reader = agg.db_manager.get_read_connection()
+        counter = QueryCounter()
+        reader.set_trace_callback(counter)
+        try:
+            start = time.perf_counter()
+            second = agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+            elapsed = time.perf_counter() - start
+        finally:
+            reader.set_trace_callback(None)
+
+        assert second == first
+        assert counter.count == 0
+        assert elapsed < 0.001
+        assert agg.get_cache_stats()['hits'] == 1
+
+    def test_key_includes_parameters(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0, strategy='qb_td_v2')
+        agg.get_edge_counts(week=7, season=2024)
+
+        stats = agg.get_cache_stats()
+        assert stats['misses'] == 3
+        assert stats['entries'] == 3
+
+    def test_write_invalidates_cache(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+        before = agg.get_all_edges(week=7, season=2024, min_edge=0.0, strategy='qb_td_v1')
+
+        writer = DatabaseManager(db_path=edge_db)
+        writer.connect()
+        writer.cursor.execute("UPDATE qb_props SET odds_over_05_td = 300 WHERE qb_name = 'Jalen Hurts'")
+        writer.conn.commit()
+        writer.close()
+
+        after = agg.get_all_edges(week=7, season=2024, min_edge=0.0, strategy='qb_td_v1')
+
+        assert after != before
+        assert agg.get_cache_stats()['invalidations'] == 1
+
+    def test_failed_strategy_not_cached(self, edge_db, monkeypatch):
+        agg = StrategyAggregator(str(edge_db))
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(agg.first_half_calc, 'calculate_edges', boom)
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+
+        stats = agg.get_cache_stats()
+        assert stats['hits'] == 0
+        assert stats['entries'] == 0
+
+    def test_errors_do_not_outlive_request(self, edge_db, monkeypatch):
+        agg = StrategyAggregator(str(edge_db))
+        calculate_edges = agg.first_half_calc.calculate_edges
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(agg.first_half_calc, 'calculate_edges', boom)
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+        monkeypatch.setattr(agg.first_half_calc, 'calculate_edges', calculate_edges)
+        agg.get_all_edges(week=7, season=2024, min_edge=0.0)
+
+        assert agg.get_cache_stats()['entries'] == 1
+        assert all(not context.errors for context in agg._contexts.values())
+
+    def test_cache_can_be_disabled(self, edge_db):
+        agg = StrategyAggregator(str(edge_db), enable_cache=False)
+        agg.get_all_edges(week=7, season=2024)
+
+        assert agg.get_cache_stats() == {'enabled': False}
+
+
+class TestCountOnlyPath:
+    """get_edge_counts counts without building full edges"""
+
+    @pytest.fixture
+    def db_path(self, edge_db):
+        return str(populate_team_metrics(edge_db))
+
+    def test_counts_match_full_edges(self, db_path):
+        counts = StrategyAggregator(db_path).get_edge_counts(week=7, season=2024)
+        edges = StrategyAggregator(db_path).get_all_edges(week=7, season=2024, min_edge=0.0)
+
+        by_label = {
+            Strategy.FIRST_HALF.value: sum('First Half' in e['strategy'] for e in edges),
+            Strategy.QB_TD_V1.value: sum('v1' in e['strategy'] for e in edges),
+            Strategy.QB_TD_V2.value: sum('v2' in e['strategy'] for e in edges),
+        }
+
+        assert counts[Strategy.FIRST_HALF.value] == 2
+        for key, expected in by_label.items():
+            assert counts[key] == expected
+        assert counts[Strategy.KICKER.value] == 0
+        assert counts['total'] == len(edges)
+
+    def test_keys_are_strategy_enum(self, db_path):
+        counts = StrategyAggregator(db_path).get_edge_counts(week=7, season=2024)
+        assert set(counts) == {s.value for s in Strategy} | {'total'}
+
+    def test_skips_reasoning_and_standardization(self, db_path, monkeypatch):
+        agg = StrategyAggregator(db_path, enable_cache=False)
+        expected = agg.get_edge_counts(week=7, season=2024)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("count path built a full edge")
+
+        monkeypatch.setattr(agg.first_half_calc, '_create_edge_recommendation', fail)
+        monkeypatch.setattr(agg.qb_td_calc_v2, '_build_v2_reasoning', fail)
+        monkeypatch.setattr(EdgeCalculator, '_priced_row_to_edge', fail)
+
+        assert agg.get_edge_counts(week=7, season=2024) == expected
+
+    def test_counts_reuse_inputs_loaded_by_edges(self, db_path):
+        """The badge request that follows an edges request runs no queries."""
+        agg = StrategyAggregator(db_path)
+        agg.get_all_edges(week=7, season=2024)
+
+        reader = agg.db_manager.get_read_connection()
+        counter = QueryCounter()
+        reader.set_trace_callback(counter)
+        try:
+            counts = agg.get_edge_counts(week=7, season=2024)
+        finally:
+            reader.set_trace_callback(None)
+
+        assert counts['total'] > 0
+        assert counter.count == 0
+
+
+class TestParallelExecution:
+    """Strategies run concurrently with per-strategy deadlines"""
+
+    def test_parallel_matches_sequential(self, edge_db):
+        parallel = StrategyAggregator(str(edge_db), enable_cache=False)
+        sequential = StrategyAggregator(str(edge_db), enable_cache=False, max_workers=1)
+
+        report = parallel.get_edges_report(week=7, season=2024, min_edge=0.0)
+
+        assert report['edges'] == sequential.get_all_edges(week=7, season=2024, min_edge=0.0)
+        assert report['partial'] is False
+        assert set(report['strategies']) == {'first_half', 'qb_td_v1', 'qb_td_v2'}
+        for name, status in report['strategies'].items():
+            assert status['status'] == 'ok'
+            assert status['error'] is None
+            assert status['elapsed_ms'] >= 0
+
+    def test_slow_strategy_times_out_with_partial_results(self, edge_db, monkeypatch):
+        agg = StrategyAggregator(str(edge_db), strategy_timeouts={'first_half': 0.2})
+        original = agg.first_half_calc.calculate_edges
+
+        def slow(*args, **kwargs):
+            time.sleep(1.0)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(agg.first_half_calc, 'calculate_edges', slow)
+
+        start = time.perf_counter()
+        report = agg.get_edges_report(week=7, season=2024, min_edge=0.0)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.9
+        assert report['partial'] is True
+        assert report['strategies']['first_half']['status'] == 'timeout'
+        assert report['strategies']['qb_td_v1']['status'] == 'ok'
+        assert report['strategies']['qb_td_v2']['status'] == 'ok'
+        assert len(report['edges']) == 2 * len(WEEK_7_GAMES)
+        # Partial results are not cached
+        assert agg.get_cache_stats()['entries'] == 0
+
+    def test_error_status(self, edge_db, monkeypatch):
+        agg = StrategyAggregator(str(edge_db))
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(agg.qb_td_calc_v2, 'calculate_edges', boom)
+        report = agg.get_edges_report(week=7, season=2024, min_edge=0.0)
+
+        status = report['strategies']['qb_td_v2']
+        assert status['status'] == 'error'
+        assert status['error'] == 'database is locked'
+        assert status['count'] == 0
+        assert report['strategies']['qb_td_v1']['status'] == 'ok'
+        assert report['partial'] is True
+
+    def test_cached_flag(self, edge_db):
+        agg = StrategyAggregator(str(edge_db))
+
+        assert agg.get_edges_report(week=7, season=2024)['cached'] is False
+        assert agg.get_edges_report(week=7, season=2024)['cached'] is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+"""Tests for the incremental TeamMetricsCalculator"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.connection_pool import close_all_pools
+from utils.data_importers.team_metrics_calculator import TeamMetricsCalculator
+from utils.db_manager import DatabaseManager
+
+MIGRATION_002 = Path(__file__).parent.parent / 'utils' / 'migrations' / '002_playerprofile_schema.sql'
+
+
+def make_plays(week, home, away, yards, season=2024):
+    """One game: plays alternate offense, quarters cycle 1-4"""
+    game_key = f'{season}-{week}-{away}-{home}'
+    return [
+        {
+            'play_id': f'{game_key}-{i}',
+            'season': season,
+            'week': week,
+            'game_key': game_key,
+            'quarter': i % 4 + 1,
+            'offense': home if i % 2 == 0 else away,
+            'defense': away if i % 2 == 0 else home,
+            'yards_gained': gained,
+        }
+        for i, gained in enumerate(yards)
+    ]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """PlayerProfiler schema with two weeks of plays; snapshots go to tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    manager = DatabaseManager(db_path=tmp_path / 'metrics.db')
+    manager.connect()
+    manager.conn.executescript(MIGRATION_002.read_text())
+
+    plays = (
+        make_plays(1, 'KC', 'BUF', [10, 5, 0, 20, 4, 6, 8, 2])
+        + make_plays(2, 'KC', 'MIA', [3, 7, 12, 1])
+        + make_plays(2, 'BUF', 'NYJ', [15, 0, 5, 5])
+    )
+    manager.upsert_play_by_play(pd.DataFrame(plays))
+
+    yield manager
+
+    manager.close()
+    close_all_pools()
+
+
+def read_metrics(db, week):
+    return pd.read_sql_query(
+        "SELECT * FROM team_metrics WHERE week = ? ORDER BY team_name",
+        db.get_read_connection(), params=(week,)
+    ).set_index('team_name')
+
+
+class TestCumulativeMetrics:
+    """Cumulative values built from per-week deltas"""
+
+    def test_week_two_accumulates_week_one(self, db):
+        TeamMetricsCalculator(db).calculate_all_weeks(2024)
+        week2 = read_metrics(db, 2)
+
+        # KC offense: week 1 plays 0,2,4,6 (10+0+4+8) + week 2 plays 0,2 (3+12)
+        kc = week2.loc['KC']
+        assert kc['offensive_plays'] == 6
+        assert kc['offensive_yards'] == 37
+        assert kc['offensive_yards_per_play'] == pytest.approx(6.17)
+        # First half (Q1/Q2) offense yards: week 1 -> 10, 4; week 2 -> 3
+        assert kc['first_half_yards_avg'] == pytest.approx((10 + 4 + 3) / 2)
+        assert kc['defensive_plays'] == 6
+        assert kc['defensive_yards_allowed'] == 5 + 20 + 6 + 2 + 7 + 1
+
+        # Teams first seen in week 2 only contain week 2 plays
+        assert week2.loc['NYJ', 'offensive_plays'] == 2
+        assert week2.loc['NYJ', 'defensive_yards_allowed'] == 20
+
+    def test_percentiles_within_week(self, db):
+        TeamMetricsCalculator(db).calculate_all_weeks(2024)
+        week1 = read_metrics(db, 1)
+
+        assert set(week1.index) == {'KC', 'BUF'}
+        # BUF offense: 33 yards / 4 plays vs KC: 22 / 4
+        assert week1.loc['BUF', 'offensive_ypp_percentile'] == 100
+        assert week1.loc['KC', 'offensive_ypp_percentile'] == 50
+        # Lower defensive YPP ranks higher
+        assert week1.loc['KC', 'defensive_ypp_percentile'] == 50
+        assert week1.loc['BUF', 'defensive_ypp_percentile'] == 100
+
+    def test_calculate_for_week(self, db):
+        metrics = TeamMetricsCalculator(db).calculate_for_week(2024, 1)
+
+        assert sorted(metrics['team_name']) == ['BUF', 'KC']
+        assert (metrics['week'] == 1).all()
+        assert len(read_metrics(db, 2)) == 0
+
+
+class TestIncrementalRecompute:
+    """Only weeks from the first changed week onward are recomputed"""
+
+    def test_rerun_without_new_plays_is_noop(self, db):
+        calculator = TeamMetricsCalculator(db)
+        first = calculator.calculate_all_weeks(2024)
+
+        # Weeks 1 (2 teams) + 2..18 (4 teams)
+        assert first == 2 + 17 * 4
+        assert calculator.calculate_all_weeks(2024) == 0
+        assert calculator.calculate_all_weeks(2024, force=True) == first
+
+    def test_new_week_only_recomputes_from_that_week(self, db):
+        calculator = TeamMetricsCalculator(db)
+        calculator.calculate_all_weeks(2024)
+
+        db.upsert_play_by_play(pd.DataFrame(make_plays(3, 'MIA', 'NYJ', [9, 9])))
+
+        # Weeks 3..18 with 4 teams each
+        assert calculator.calculate_all_weeks(2024) == 16 * 4
+        assert read_metrics(db, 3).loc['MIA', 'offensive_plays'] == 3
+        assert read_metrics(db, 2).loc['MIA', 'offensive_plays'] == 2
+
+    def test_changed_play_recomputes_downstream_weeks(self, db):
+        calculator = TeamMetricsCalculator(db)
+        calculator.calculate_all_weeks(2024)
+
+        corrected = make_plays(1, 'KC', 'BUF', [50, 5, 0, 20, 4, 6, 8, 2])
+        db.upsert_play_by_play(pd.DataFrame(corrected))
+
+        assert calculator.calculate_all_weeks(2024) == 2 + 17 * 4
+        assert read_metrics(db, 1).loc['KC', 'offensive_yards'] == 62
+        assert read_metrics(db, 18).loc['KC', 'offensive_yards'] == 77
+
+    def test_failed_week_is_retried(self, db, monkeypatch):
+        calculator = TeamMetricsCalculator(db)
+        upsert = db.upsert_team_metrics
+
+        def failing_upsert(df):
+            if (df['week'] == 2).any() or (df['week'] == 5).any():
+                raise RuntimeError("database is locked")
+            return upsert(df)
+
+        monkeypatch.setattr(db, 'upsert_team_metrics', failing_upsert)
+        assert calculator.calculate_all_weeks(2024) == 2 + 15 * 4
+        monkeypatch.setattr(db, 'upsert_team_metrics', upsert)
+
+        # Week 2 (which has plays) and everything after it is recomputed
+        assert calculator.calculate_all_weeks(2024) == 17 * 4
+        assert read_metrics(db, 2).loc['KC', 'offensive_plays'] == 6
+        assert calculator.calculate_all_weeks(2024) == 0
+
+    def test_failed_week_without_plays_is_retried(self, db, monkeypatch):
+        calculator = TeamMetricsCalculator(db)
+        upsert = db.upsert_team_metrics
+
+        def failing_upsert(df):
+            if (df['week'] == 5).any():
+                raise RuntimeError("database is locked")
+            return upsert(df)
+
+        monkeypatch.setattr(db, 'upsert_team_metrics', failing_upsert)
+        calculator.calculate_all_weeks(2024)
+        monkeypatch.setattr(db, 'upsert_team_metrics', upsert)
+
+        assert len(read_metrics(db, 5)) == 0
+        assert calculator.calculate_all_weeks(2024) == 14 * 4
+        assert len(read_metrics(db, 5)) == 4
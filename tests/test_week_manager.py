@@ -0,0 +1,115 @@
+"""Tests for the cached WeekManager: config reload on change, season calendar, vectorized weeks"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.week_manager as week_manager_module
+from utils.week_manager import WeekManager, get_week_manager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / 'current_week.json'
+    path.write_text(json.dumps({'current_week': 7, 'season_year': 2025}))
+    return path
+
+
+def legacy_week(game_date):
+    """Previous day-count implementation (naive datetimes only)"""
+    if game_date < WeekManager.SEASON_START:
+        return 1
+    return min((game_date - WeekManager.SEASON_START).days // 7 + 1, WeekManager.REGULAR_SEASON_WEEKS)
+
+
+class TestConfigCache:
+
+    def test_config_parsed_once(self, config_path, monkeypatch):
+        wm = WeekManager(config_path)
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr(week_manager_module.json, 'load', lambda f: loads.append(1) or real_load(f))
+
+        assert [wm.get_current_week() for _ in range(5)] == [7] * 5
+        assert len(loads) == 1
+
+    def test_reloaded_when_file_changes(self, config_path):
+        wm = WeekManager(config_path)
+        assert wm.get_current_week() == 7
+
+        config_path.write_text(json.dumps({'current_week': 8, 'season_year': 2025}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert wm.get_current_week() == 8
+
+    def test_set_week_seen_by_other_instances(self, config_path):
+        reader, writer = WeekManager(config_path), WeekManager(config_path)
+        assert reader.get_current_week() == 7
+
+        writer.set_week(9)
+        assert writer.get_current_week() == 9
+        assert reader.get_current_week() == 9
+
+    def test_callers_cannot_mutate_cache(self, config_path):
+        wm = WeekManager(config_path)
+        wm.get_week_info()['current_week'] = 99
+
+        assert wm.get_current_week() == 7
+
+    def test_missing_file_falls_back_to_date(self, config_path):
+        wm = WeekManager(config_path)
+        wm.get_current_week()
+        config_path.unlink()
+
+        assert 1 <= wm.get_current_week() <= WeekManager.REGULAR_SEASON_WEEKS
+
+    def test_singleton_per_config_path(self, config_path, tmp_path):
+        assert get_week_manager(config_path) is get_week_manager(config_path)
+        assert get_week_manager(config_path) is not get_week_manager(tmp_path / 'other.json')
+
+
+class TestSeasonCalendar:
+
+    def test_matches_day_count(self):
+        start = WeekManager.SEASON_START
+        dates = [start + timedelta(hours=h) for h in range(-48, 24 * 7 * 20, 5)]
+        dates += [start, start + timedelta(weeks=1) - timedelta(microseconds=1), start + timedelta(weeks=1)]
+        wm = WeekManager()
+
+        assert [wm.calculate_week_from_game_date(d) for d in dates] == [legacy_week(d) for d in dates]
+
+    def test_aware_datetimes_use_eastern_time(self):
+        wm = WeekManager()
+        # Thursday 8:15pm ET kickoff is already Friday in UTC
+        thursday_night = datetime(2025, 10, 24, 0, 15, tzinfo=timezone.utc)
+
+        assert wm.calculate_week_from_game_date(thursday_night) == legacy_week(datetime(2025, 10, 23, 20, 15))
+        assert wm.calculate_week_from_game_date(thursday_night) == 7
+
+    def test_vectorized_matches_scalar(self):
+        wm = WeekManager()
+        times = ['2025-09-04T00:20:00Z', '2025-09-14T17:00:00Z', '2025-10-19T17:00:00Z',
+                 '2025-10-24T00:15:00Z', '2025-10-26T13:00:00-04:00', '2026-01-04T18:00:00Z']
+        expected = [wm.calculate_week_from_game_date(datetime.fromisoformat(t.replace('Z', '+00:00')))
+                    for t in times]
+
+        assert wm.weeks_for_dates(times).tolist() == expected
+        assert wm.weeks_for_dates(pd.Series(pd.to_datetime(times[:4]))).tolist() == expected[:4]
+
+    def test_vectorized_naive_and_missing(self):
+        wm = WeekManager()
+        dates = pd.Series([datetime(2025, 10, 23, 20, 15), None, 'not a date'], index=[3, 4, 5])
+        weeks = wm.weeks_for_dates(dates)
+
+        assert weeks.index.tolist() == [3, 4, 5]
+        assert weeks.iloc[0] == 7
+        assert weeks.iloc[1:].isna().all()
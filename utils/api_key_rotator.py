@@ -3,16 +3,31 @@ API Key Rotator for The Odds API
 Rotates through free API keys first, then falls back to paid tier key
 """
 import logging
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.quota_ledger import QuotaLedger
 
 logger = logging.getLogger(__name__)
 
 
 class APIKeyRotator:
-    """Rotates through multiple API keys to distribute request load"""
+    """
+    Rotates through multiple API keys to distribute request load
+
+    Safe to share between threads: key selection and usage counts are
+    updated under a lock so concurrent fetches never lose an increment.
+    Ledger reads and writes happen outside the lock, and each key's stored
+    remaining budget is cached until this rotator records usage or REMAINING_CACHE_TTL
+    passes (so other processes' usage is still picked up).
+    """
+
+    REMAINING_CACHE_TTL = 30.0  # seconds
 
     def __init__(self, api_keys: List[str], paid_key: Optional[str] = None,
-                 free_tier_limit: int = 500, paid_tier_limit: int = 20000):
+                 free_tier_limit: int = 500, paid_tier_limit: int = 20000,
+                 ledger: Optional[QuotaLedger] = None, paid_reserve: int = 0):
         """
         Initialize the API key rotator
 
@@ -21,6 +36,10 @@ class APIKeyRotator:
             paid_key: Optional paid tier API key (20K requests/month)
             free_tier_limit: Request limit for free tier keys (default 500)
             paid_tier_limit: Request limit for paid tier key (default 20000)
+            ledger: Optional persistent QuotaLedger; when set, usage is shared
+                    across processes and key selection uses the stored remaining budget
+            paid_reserve: Paid key credits kept for get_paid_key() (player props);
+                          get_next_key() won't fall back to the paid key below this
         """
         if not api_keys:
             raise ValueError("At least one API key must be provided")
@@ -31,10 +50,25 @@ class APIKeyRotator:
         self.request_counts = {key: 0 for key in api_keys}
         self.free_tier_limit = free_tier_limit
         self.paid_tier_limit = paid_tier_limit
+        self.ledger = ledger
+        self.paid_reserve = paid_reserve
+        self._lock = threading.RLock()
+
+        # api_key -> (ledger remaining, monotonic time read); bumped generation drops in-flight reads
+        self._remaining_cache: Dict[str, Tuple[int, float]] = {}
+        self._ledger_generation = 0
 
         # Identify which key is the paid key (last one in list if paid_key is set)
         self.paid_key_index = len(api_keys) - 1 if paid_key and paid_key in api_keys else None
 
+        # Start from this month's persisted usage instead of zero
+        if self.ledger is not None:
+            try:
+                for key, row in self.ledger.usage(api_keys).items():
+                    self.request_counts[key] = row['requests_used']
+            except Exception as e:
+                logger.warning(f"⚠️  Could not load API quota ledger, counting in memory only: {e}")
+
         logger.info(f"Initialized APIKeyRotator with {len(api_keys)} keys")
         if self.paid_key_index is not None:
             logger.info(f"Paid tier key available at index {self.paid_key_index} ({paid_tier_limit:,} requests/month limit)")
@@ -47,32 +81,36 @@ class APIKeyRotator:
         Returns:
             API key string, or None if all keys are exhausted
         """
-        # Try to find a key with available requests
-        attempts = 0
-        while attempts < len(self.api_keys):
-            key = self.api_keys[self.current_index]
+        # Read from the ledger before locking so selection never waits on SQLite
+        remaining = {key: self._remaining(key) for key in self.api_keys}
+
+        with self._lock:
+            # Try to find a key with available requests
+            attempts = 0
+            while attempts < len(self.api_keys):
+                key = self.api_keys[self.current_index]
 
-            # Check if this is the paid key (no limit) or has requests remaining
-            is_paid_key = (self.paid_key_index is not None and
-                          self.current_index == self.paid_key_index)
+                # Check if this is the paid key (no limit) or has requests remaining
+                is_paid_key = (self.paid_key_index is not None and
+                              self.current_index == self.paid_key_index)
 
-            if is_paid_key:
-                # Check paid key limit (20K requests/month)
-                if self.request_counts[key] < self.paid_tier_limit:
-                    logger.debug(f"Using PAID tier API key (used {self.request_counts[key]}/{self.paid_tier_limit:,})")
+                if is_paid_key:
+                    # Check paid key limit (20K requests/month), keeping the reserve for props
+                    if remaining[key] > self.paid_reserve:
+                        logger.debug(f"Using PAID tier API key (used {self.request_counts[key]}/{self.paid_tier_limit:,})")
+                        return key
+                elif remaining[key] > 0:
+                    # Free tier key with requests remaining
+                    logger.debug(f"Using FREE tier API key index {self.current_index} (used {self.request_counts[key]}/{self.free_tier_limit})")
                     return key
-            elif self.request_counts[key] < self.free_tier_limit:
-                # Free tier key with requests remaining
-                logger.debug(f"Using FREE tier API key index {self.current_index} (used {self.request_counts[key]}/{self.free_tier_limit})")
-                return key
 
-            # Move to next key
-            self.current_index = (self.current_index + 1) % len(self.api_keys)
-            attempts += 1
+                # Move to next key
+                self.current_index = (self.current_index + 1) % len(self.api_keys)
+                attempts += 1
 
-        # All keys exhausted (shouldn't happen if paid key exists)
-        logger.error("All API keys have reached their request limit")
-        return None
+            # All keys exhausted (shouldn't happen if paid key exists)
+            logger.error("All API keys have reached their request limit")
+            return None
 
     def get_paid_key(self) -> Optional[str]:
         """
@@ -87,29 +125,82 @@ class APIKeyRotator:
 
         key = self.api_keys[self.paid_key_index]
 
-        if self.request_counts[key] >= self.paid_tier_limit:
+        # Ledger read outside the lock; only the usage count is read under it
+        if self._remaining(key) <= 0:
             logger.error(f"Paid tier API key has reached monthly limit ({self.paid_tier_limit:,} requests)")
             return None
 
-        logger.info(f"Using PAID tier API key for player props (used {self.request_counts[key]}/{self.paid_tier_limit:,})")
+        with self._lock:
+            used = self.request_counts[key]
+        logger.info(f"Using PAID tier API key for player props (used {used}/{self.paid_tier_limit:,})")
         return key
 
-    def increment_usage(self, api_key: str) -> None:
+    def increment_usage(self, api_key: str, remaining: Optional[int] = None,
+                        used: Optional[int] = None) -> None:
         """
         Increment the usage counter for a specific API key
 
         Args:
             api_key: The API key that was used
+            remaining: Server-reported remaining credits (x-requests-remaining), if known
+            used: Server-reported used credits (x-requests-used), if known
         """
-        if api_key in self.request_counts:
+        with self._lock:
+            if api_key not in self.request_counts:
+                logger.warning(f"Attempted to increment unknown API key")
+                return
+
             self.request_counts[api_key] += 1
             # Determine which limit to show based on whether this is paid key
-            is_paid = (self.paid_key_index is not None and
-                      api_key == self.api_keys[self.paid_key_index])
+            is_paid = self._is_paid(api_key)
             limit = self.paid_tier_limit if is_paid else self.free_tier_limit
             logger.debug(f"API key usage: {self.request_counts[api_key]}/{limit}")
-        else:
-            logger.warning(f"Attempted to increment unknown API key")
+
+        if self.ledger is None:
+            return
+
+        # Written outside the lock so concurrent fetches don't queue behind SQLite
+        try:
+            self.ledger.record_usage(api_key, 'paid' if is_paid else 'free',
+                                     remaining=remaining, used=used)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not update API quota ledger: {e}")
+
+        with self._lock:
+            self._remaining_cache.pop(api_key, None)
+            self._ledger_generation += 1
+
+    def _is_paid(self, api_key: str) -> bool:
+        return (self.paid_key_index is not None and
+                api_key == self.api_keys[self.paid_key_index])
+
+    def _remaining(self, api_key: str) -> int:
+        """
+        Remaining budget for a key
+
+        Uses the ledger (server-reported remaining credits, shared across
+        processes) when available, else the configured limit minus in-memory usage.
+        """
+        limit = self.paid_tier_limit if self._is_paid(api_key) else self.free_tier_limit
+
+        if self.ledger is not None:
+            with self._lock:
+                cached = self._remaining_cache.get(api_key)
+                generation = self._ledger_generation
+            if cached is not None and time.monotonic() - cached[1] < self.REMAINING_CACHE_TTL:
+                return cached[0]
+
+            try:
+                remaining = self.ledger.remaining(api_key, limit)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not read API quota ledger: {e}")
+            else:
+                with self._lock:
+                    if generation == self._ledger_generation:
+                        self._remaining_cache[api_key] = (remaining, time.monotonic())
+                return remaining
+
+        return max(0, limit - self.request_counts[api_key])
 
     def get_total_usage(self) -> int:
         """
@@ -127,19 +218,30 @@ class APIKeyRotator:
         Returns:
             Number of remaining requests
         """
-        total_allowed = 0
-        for i, key in enumerate(self.api_keys):
-            if i == self.paid_key_index:
-                total_allowed += self.paid_tier_limit
-            else:
-                total_allowed += self.free_tier_limit
-        return total_allowed - self.get_total_usage()
+        return sum(self._remaining(key) for key in self.api_keys)
+
+    def get_paid_remaining(self) -> int:
+        """
+        Get remaining requests on the paid tier key (player props budget)
+
+        Returns:
+            Number of remaining requests (0 if no paid key is configured)
+        """
+        if self.paid_key_index is None:
+            return 0
+        return self._remaining(self.api_keys[self.paid_key_index])
 
     def reset_counts(self) -> None:
         """Reset all request counts (useful at the start of a new month)"""
-        self.request_counts = {key: 0 for key in self.api_keys}
-        self.current_index = 0
-        logger.info("Reset all API key usage counts")
+        if self.ledger is not None:
+            self.ledger.reset(self.api_keys)
+
+        with self._lock:
+            self.request_counts = {key: 0 for key in self.api_keys}
+            self.current_index = 0
+            self._remaining_cache.clear()
+            self._ledger_generation += 1
+            logger.info("Reset all API key usage counts")
 
     def get_status_report(self) -> dict:
         """
@@ -164,5 +266,9 @@ class APIKeyRotator:
             "per_key_usage": {
                 f"key_{i+1}": count
                 for i, (key, count) in enumerate(self.request_counts.items())
+            },
+            "per_key_remaining": {
+                f"key_{i+1}": self._remaining(key)
+                for i, key in enumerate(self.api_keys)
             }
         }
@@ -90,7 +90,8 @@ class FirstHalfTotalCalculator:
 
     def calculate_edges(self, week: int, season: int = 2024,
                        offensive_threshold: int = 8,
-                       defensive_threshold: int = 12) -> List[Dict]:
+                       defensive_threshold: int = 12,
+                       context=None) -> List[Dict]:
         """
         Find First Half Total Under edges for given week
 
@@ -99,6 +100,7 @@ class FirstHalfTotalCalculator:
             season: NFL season year
             offensive_threshold: Bottom N teams for offense (default 8)
             defensive_threshold: Top N teams for defense (default 12)
+            context: Optional StrategyContext shared with other strategies
 
         Returns:
             List of edge dicts with structure:
@@ -115,59 +117,29 @@ class FirstHalfTotalCalculator:
         edges = []
 
         try:
-            # Get matchups for the week
-            matchups = self._get_matchups(week, season)
-
-            if matchups.empty:
-                logger.warning(f"No matchups found for Week {week}, Season {season}")
-                return edges
+            matchups, rankings = self._load_inputs(week, season, context)
 
-            # Get team rankings for this week
-            rankings = self._calculate_team_rankings(week, season)
-
-            if rankings.empty:
-                logger.warning(f"No team metrics found for Week {week}, Season {season}")
+            if matchups.empty or rankings.empty:
                 return edges
 
             # Analyze each matchup
-            for _, matchup in matchups.iterrows():
-                home_team = self._normalize_team_name(matchup['home_team'])
-                away_team = self._normalize_team_name(matchup['away_team'])
-
-                # Get rankings for both teams
-                home_rankings = rankings[rankings['team_name'] == home_team]
-                away_rankings = rankings[rankings['team_name'] == away_team]
-
-                if home_rankings.empty or away_rankings.empty:
-                    logger.debug(f"Missing rankings for {home_team} vs {away_team}")
-                    continue
-
-                home_off_rank = home_rankings.iloc[0]['offensive_rank']
-                home_def_rank = home_rankings.iloc[0]['defensive_rank']
-                away_off_rank = away_rankings.iloc[0]['offensive_rank']
-                away_def_rank = away_rankings.iloc[0]['defensive_rank']
-
-                # Edge detection criteria:
-                # Both offenses rank bottom 8 (rank 25-32 out of 32)
-                # Both defenses rank top 12 (rank 1-12 out of 32)
-                both_weak_offense = (home_off_rank >= (32 - offensive_threshold + 1) and
-                                    away_off_rank >= (32 - offensive_threshold + 1))
-                both_strong_defense = (home_def_rank <= defensive_threshold and
-                                      away_def_rank <= defensive_threshold)
-
-                if both_weak_offense and both_strong_defense:
-                    edge = self._create_edge_recommendation(
-                        matchup=matchup,
-                        home_off_rank=home_off_rank,
-                        home_def_rank=home_def_rank,
-                        away_off_rank=away_off_rank,
-                        away_def_rank=away_def_rank,
-                        home_metrics=home_rankings.iloc[0],
-                        away_metrics=away_rankings.iloc[0],
-                        week=week
-                    )
-                    edges.append(edge)
-                    logger.info(f"Edge found: {home_team} vs {away_team} - {edge['edge_pct']:.1f}%")
+            qualifying = self._find_qualifying_matchups(
+                matchups, rankings, offensive_threshold, defensive_threshold
+            )
+
+            for matchup, home_rankings, away_rankings in qualifying:
+                edge = self._create_edge_recommendation(
+                    matchup=matchup,
+                    home_off_rank=home_rankings['offensive_rank'],
+                    home_def_rank=home_rankings['defensive_rank'],
+                    away_off_rank=away_rankings['offensive_rank'],
+                    away_def_rank=away_rankings['defensive_rank'],
+                    home_metrics=home_rankings,
+                    away_metrics=away_rankings,
+                    week=week
+                )
+                edges.append(edge)
+                logger.info(f"Edge found: {edge['home_team']} vs {edge['away_team']} - {edge['edge_pct']:.1f}%")
 
             logger.info(f"Found {len(edges)} First Half Total Under edges for Week {week}")
 
@@ -176,6 +148,105 @@ class FirstHalfTotalCalculator:
 
         return edges
 
+    def count_edges(self, week: int, season: int = 2024,
+                    offensive_threshold: int = 8,
+                    defensive_threshold: int = 12,
+                    context=None) -> int:
+        """
+        Count First Half Total Under edges without building recommendations
+
+        Args:
+            week: NFL week number
+            season: NFL season year
+            offensive_threshold: Bottom N teams for offense (default 8)
+            defensive_threshold: Top N teams for defense (default 12)
+            context: Optional StrategyContext shared with other strategies
+
+        Returns:
+            Number of edges calculate_edges() would return
+        """
+        matchups, rankings = self._load_inputs(week, season, context)
+
+        if matchups.empty or rankings.empty:
+            return 0
+
+        return len(self._find_qualifying_matchups(
+            matchups, rankings, offensive_threshold, defensive_threshold
+        ))
+
+    def _load_inputs(self, week: int, season: int, context=None):
+        """
+        Load matchups and team rankings (through the context when given)
+
+        Returns:
+            Tuple of (matchups, rankings) DataFrames; either may be empty
+        """
+        # Get matchups for the week
+        if context is not None:
+            matchups = context.matchups()
+        else:
+            matchups = self._get_matchups(week, season)
+
+        if matchups.empty:
+            logger.warning(f"No matchups found for Week {week}, Season {season}")
+            return matchups, pd.DataFrame()
+
+        # Get team rankings for this week
+        if context is not None:
+            rankings = context.load(
+                'team_rankings', lambda: self._calculate_team_rankings(week, season)
+            )
+        else:
+            rankings = self._calculate_team_rankings(week, season)
+
+        if rankings.empty:
+            logger.warning(f"No team metrics found for Week {week}, Season {season}")
+
+        return matchups, rankings
+
+    def _find_qualifying_matchups(self, matchups: pd.DataFrame, rankings: pd.DataFrame,
+                                  offensive_threshold: int,
+                                  defensive_threshold: int) -> List:
+        """
+        Apply the edge criteria to every matchup
+
+        Args:
+            matchups: Matchups for the week
+            rankings: Team rankings from _calculate_team_rankings()
+            offensive_threshold: Bottom N teams for offense
+            defensive_threshold: Top N teams for defense
+
+        Returns:
+            List of (matchup, home_rankings, away_rankings) tuples that qualify
+        """
+        rankings_by_team = {row['team_name']: row for _, row in rankings.iterrows()}
+        qualifying = []
+
+        for _, matchup in matchups.iterrows():
+            home_team = self._normalize_team_name(matchup['home_team'])
+            away_team = self._normalize_team_name(matchup['away_team'])
+
+            # Get rankings for both teams
+            home_rankings = rankings_by_team.get(home_team)
+            away_rankings = rankings_by_team.get(away_team)
+
+            if home_rankings is None or away_rankings is None:
+                logger.debug(f"Missing rankings for {home_team} vs {away_team}")
+                continue
+
+            # Edge detection criteria:
+            # Both offenses rank bottom 8 (rank 25-32 out of 32)
+            # Both defenses rank top 12 (rank 1-12 out of 32)
+            both_weak_offense = (home_rankings['offensive_rank'] >= (32 - offensive_threshold + 1) and
+                                 away_rankings['offensive_rank'] >= (32 - offensive_threshold + 1))
+            both_strong_defense = (home_rankings['defensive_rank'] <= defensive_threshold and
+                                   away_rankings['defensive_rank'] <= defensive_threshold)
+
+            if both_weak_offense and both_strong_defense:
+                qualifying.append((matchup, home_rankings, away_rankings))
+
+        return qualifying
+
     def _get_matchups(self, week: int, season: int) -> pd.DataFrame:
         """
         Get all matchups for week from matchups table
@@ -187,7 +258,7 @@ class FirstHalfTotalCalculator:
         Returns:
             DataFrame with matchup data
         """
-        conn = self.db_manager._get_connection()
+        conn = self.db_manager.get_read_connection()
 
         query = """
             SELECT home_team, away_team, game_date
@@ -214,7 +285,7 @@ class FirstHalfTotalCalculator:
         Returns:
             DataFrame with team rankings
         """
-        conn = self.db_manager._get_connection()
+        conn = self.db_manager.get_read_connection()
 
         # Get team metrics for all teams at this point in the season
         # Use the latest available data up to this week
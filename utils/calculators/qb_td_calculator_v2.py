@@ -48,7 +48,7 @@ class QBTDCalculatorV2:
         self.v1_calculator = EdgeCalculator(model_version="v1", db_path=db_manager.db_path)
 
     def calculate_edges(self, week: int, season: int = 2024,
-                       min_edge_threshold: float = 5.0) -> List[Dict]:
+                       min_edge_threshold: float = 5.0, context=None) -> List[Dict]:
         """
         Find QB TD 0.5+ edges with enhanced analysis
 
@@ -56,6 +56,7 @@ class QBTDCalculatorV2:
             week: NFL week number
             season: NFL season year
             min_edge_threshold: Minimum edge percentage to include (default 5%)
+            context: Optional StrategyContext shared with other strategies
 
         Returns:
             List of edge dicts with enhanced v2 metrics
@@ -64,7 +65,9 @@ class QBTDCalculatorV2:
 
         try:
             # Start with v1 edges as baseline
-            v1_edges = self.v1_calculator.find_edges_for_week(week, threshold=min_edge_threshold)
+            v1_edges = self.v1_calculator.find_edges_for_week(
+                week, threshold=min_edge_threshold, context=context
+            )
 
             if not v1_edges:
                 logger.info(f"No v1 edges found for Week {week} - no v2 edges to enhance")
@@ -72,13 +75,16 @@ class QBTDCalculatorV2:
 
             logger.info(f"Enhancing {len(v1_edges)} v1 edges with v2 metrics")
 
+            # Load every QB/team lookup in three set-based queries
+            lookups = self.get_v2_lookups(week, season, context)
+
             # Enhance each edge with v2 metrics
             for edge in v1_edges:
                 qb_name = edge['qb_name']
                 opponent = edge['opponent']
 
                 # Get enhanced QB stats
-                qb_stats = self._get_qb_enhanced_stats(qb_name, season)
+                qb_stats = lookups['qb_stats'].get(qb_name)
 
                 if not qb_stats:
                     logger.warning(f"No enhanced stats found for {qb_name}, using v1 data only")
@@ -97,11 +103,11 @@ class QBTDCalculatorV2:
                     edges.append(edge)
                     continue
 
-                # Calculate red zone TD rate from play-by-play
-                red_zone_td_rate = self._calculate_red_zone_td_rate(qb_name, season)
+                # Red zone TD rate from game log (0.0 when insufficient data)
+                red_zone_td_rate = lookups['red_zone_td_rates'].get(qb_name, 0.0)
 
                 # Get opponent defensive quality
-                opp_defense_quality = self._get_opponent_defense_quality(opponent, season)
+                opp_defense_quality = self._lookup_defense_quality(lookups, opponent)
 
                 # Store original v1 edge for comparison BEFORE updating it
                 if 'v1_edge_percentage' not in edge:
@@ -157,6 +163,177 @@ class QBTDCalculatorV2:
 
         return edges
 
+    def count_edges(self, week: int, season: int = 2024,
+                    min_edge_threshold: float = 5.0, context=None) -> int:
+        """
+        Count QB TD v2 edges without building reasoning or edge dicts
+
+        Applies the same v1 baseline, fallback and v2 adjustment rules as
+        calculate_edges().
+
+        Args:
+            week: NFL week number
+            season: NFL season year
+            min_edge_threshold: Minimum edge percentage to include (default 5%)
+            context: Optional StrategyContext shared with other strategies
+
+        Returns:
+            Number of edges calculate_edges() would return
+        """
+        priced = self.v1_calculator.priced_week(week, context)
+        priced = priced[priced['edge_percentage'] >= min_edge_threshold]
+
+        if priced.empty:
+            return 0
+
+        lookups = self.get_v2_lookups(week, season, context)
+        count = 0
+
+        for qb_name, opponent, edge_pct in zip(priced['qb_name'], priced['opponent'],
+                                               priced['edge_percentage']):
+            qb_stats = lookups['qb_stats'].get(qb_name)
+
+            # v1-only fallback edges are always kept
+            if not qb_stats:
+                count += 1
+                continue
+
+            adjusted_edge_pct = self._adjust_edge_with_v2_metrics(
+                base_edge_pct=edge_pct,
+                qb_stats=qb_stats,
+                red_zone_td_rate=lookups['red_zone_td_rates'].get(qb_name, 0.0),
+                opp_defense_quality=self._lookup_defense_quality(lookups, opponent)
+            )
+
+            if adjusted_edge_pct >= min_edge_threshold:
+                count += 1
+
+        return count
+
+    def get_v2_lookups(self, week: int, season: int, context=None) -> Dict[str, Dict]:
+        """
+        v2 lookups for a (week, season), shared through the context when given
+
+        Args:
+            week: NFL week number
+            season: NFL season year
+            context: Optional StrategyContext
+
+        Returns:
+            Same dict as load_v2_lookups()
+        """
+        if context is None:
+            return self.load_v2_lookups(week, season)
+
+        return context.load('v2_lookups', lambda: self.load_v2_lookups(week, season))
+
+    def load_v2_lookups(self, week: int, season: int, weeks_back: int = 4) -> Dict[str, Dict]:
+        """
+        Load all v2 lookup data for a (week, season) in three set-based queries
+
+        Replaces the per-edge enhanced stats, red zone and defense queries so v2
+        latency stays flat as the slate grows.
+
+        Args:
+            week: NFL week number
+            season: NFL season year
+            weeks_back: Red zone lookback window (default: 4)
+
+        Returns:
+            Dict with 'qb_stats' (qb_name -> stats), 'red_zone_td_rates'
+            (player_name -> rate) and 'defense_quality' (team_name -> metrics)
+        """
+        conn = self.db_manager.get_read_connection()
+
+        return {
+            'qb_stats': self._load_enhanced_stats(conn, season),
+            'red_zone_td_rates': self._load_red_zone_td_rates(conn, season, weeks_back),
+            'defense_quality': self._load_defense_quality(conn),
+        }
+
+    def _load_enhanced_stats(self, conn, season: int) -> Dict[str, Dict]:
+        """Enhanced stats for every QB in the season, keyed by qb_name"""
+        try:
+            cursor = conn.execute(
+                "SELECT * FROM qb_stats_enhanced WHERE season = ? ORDER BY id",
+                (season,)
+            )
+            columns = [col[0] for col in cursor.description]
+
+            stats_by_qb = {}
+            for row in cursor.fetchall():
+                record = dict(zip(columns, row))
+                stats_by_qb.setdefault(record['qb_name'], record)
+            return stats_by_qb
+
+        except Exception as e:
+            logger.warning(f"Error loading enhanced stats for {season}: {e}")
+            return {}
+
+    def _load_red_zone_td_rates(self, conn, season: int, weeks_back: int = 4) -> Dict[str, float]:
+        """Rolling red zone TD rate for every QB in the season, keyed by player_name"""
+        query = """
+            SELECT
+                player_name,
+                SUM(passing_touchdowns) as total_tds,
+                SUM(red_zone_passes) as total_rz_attempts,
+                COUNT(DISTINCT week) as weeks_with_data,
+                COUNT(*) as games
+            FROM player_game_log
+            WHERE season = ?
+              AND week >= (SELECT MAX(1, MAX(week) - ? + 1) FROM player_game_log WHERE season = ?)
+              AND week <= (SELECT MAX(week) FROM player_game_log WHERE season = ?)
+            GROUP BY player_name
+        """
+
+        try:
+            rows = conn.execute(query, (season, weeks_back, season, season)).fetchall()
+        except Exception as e:
+            logger.warning(f"Error loading red zone TD rates for {season}: {e}")
+            return {}
+
+        return {
+            player_name: self._red_zone_rate_from_totals(player_name, *totals)
+            for player_name, *totals in rows
+        }
+
+    def _load_defense_quality(self, conn) -> Dict[str, Dict]:
+        """Latest defensive quality for every team, keyed by team_name"""
+        query = """
+            SELECT team_name, pass_tds_allowed, games_played, tds_per_game
+            FROM (
+                SELECT
+                    team_name,
+                    pass_tds_allowed,
+                    games_played,
+                    tds_per_game,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY team_name ORDER BY scraped_at DESC, id DESC
+                    ) as recency
+                FROM defense_stats
+            )
+            WHERE recency = 1
+        """
+
+        try:
+            rows = conn.execute(query).fetchall()
+        except Exception as e:
+            logger.warning(f"Error loading defense quality: {e}")
+            return {}
+
+        return {
+            team_name: self._classify_defense(tds_per_game, pass_tds_allowed)
+            for team_name, pass_tds_allowed, _, tds_per_game in rows
+        }
+
+    def _lookup_defense_quality(self, lookups: Dict, opponent: str) -> Dict:
+        """Defense quality from preloaded lookups, league average if missing"""
+        quality = lookups['defense_quality'].get(opponent)
+        if quality is None:
+            logger.warning(f"No defense stats found for {opponent}")
+            return {'tds_per_game': 1.5, 'rank': 'N/A'}  # Use league average
+        return dict(quality)
+
     def _get_qb_enhanced_stats(self, qb_name: str, season: int) -> Optional[Dict]:
         """
         Get enhanced QB statistics from qb_stats_enhanced table
@@ -192,7 +369,7 @@ class QBTDCalculatorV2:
         Returns:
             Red zone TD rate (0.0-1.0), or 0.0 if insufficient data
         """
-        conn = self.db_manager._get_connection()
+        conn = self.db_manager.get_read_connection()
 
         # Get current week to determine lookback window
         current_week_query = "SELECT MAX(week) as current_week FROM player_game_log WHERE season = ?"
@@ -225,33 +402,47 @@ class QBTDCalculatorV2:
                 logger.debug(f"No game log data found for {qb_name}")
                 return 0.0
 
-            total_tds = result.iloc[0]['total_tds'] or 0
-            total_rz_attempts = result.iloc[0]['total_rz_attempts'] or 0
-            weeks_with_data = result.iloc[0]['weeks_with_data'] or 0
-            games = result.iloc[0]['games'] or 0
+            row = result.iloc[0]
+            return self._red_zone_rate_from_totals(
+                qb_name, row['total_tds'], row['total_rz_attempts'],
+                row['weeks_with_data'], row['games']
+            )
 
-            # Data quality checks
-            if weeks_with_data < 2:
-                logger.debug(f"{qb_name}: Insufficient weeks of data ({weeks_with_data} < 2)")
-                return 0.0
+        except Exception as e:
+            logger.warning(f"Error calculating red zone TD rate for {qb_name}: {e}")
+            return 0.0
 
-            if total_rz_attempts < 5:
-                logger.debug(f"{qb_name}: Insufficient red zone attempts ({total_rz_attempts} < 5)")
-                return 0.0
+    def _red_zone_rate_from_totals(self, qb_name: str, total_tds, total_rz_attempts,
+                                   weeks_with_data, games) -> float:
+        """
+        Apply red zone data quality checks to aggregated game log totals
 
-            # Calculate rate
-            rate = total_tds / total_rz_attempts if total_rz_attempts > 0 else 0.0
+        Returns:
+            Red zone TD rate (0.0-1.0), or 0.0 if insufficient data
+        """
+        total_tds = total_tds or 0
+        total_rz_attempts = total_rz_attempts or 0
+        weeks_with_data = weeks_with_data or 0
+        games = games or 0
+
+        # Data quality checks
+        if weeks_with_data < 2:
+            logger.debug(f"{qb_name}: Insufficient weeks of data ({weeks_with_data} < 2)")
+            return 0.0
 
-            logger.debug(
-                f"{qb_name} red zone TD rate: {rate:.3f} "
-                f"({total_tds}/{total_rz_attempts} over {weeks_with_data} weeks, {games} games)"
-            )
+        if total_rz_attempts < 5:
+            logger.debug(f"{qb_name}: Insufficient red zone attempts ({total_rz_attempts} < 5)")
+            return 0.0
 
-            return rate
+        # Calculate rate
+        rate = total_tds / total_rz_attempts if total_rz_attempts > 0 else 0.0
 
-        except Exception as e:
-            logger.warning(f"Error calculating red zone TD rate for {qb_name}: {e}")
-            return 0.0
+        logger.debug(
+            f"{qb_name} red zone TD rate: {rate:.3f} "
+            f"({total_tds}/{total_rz_attempts} over {weeks_with_data} weeks, {games} games)"
+        )
+
+        return rate
 
     def _get_opponent_defense_quality(self, opponent: str, season: int) -> Dict:
         """
@@ -264,7 +455,7 @@ class QBTDCalculatorV2:
         Returns:
             Dictionary with defensive quality metrics
         """
-        conn = self.db_manager._get_connection()
+        conn = self.db_manager.get_read_connection()
 
         query = """
             SELECT
@@ -274,7 +465,7 @@ class QBTDCalculatorV2:
                 tds_per_game
             FROM defense_stats
             WHERE team_name = ?
-            ORDER BY scraped_at DESC
+            ORDER BY scraped_at DESC, id DESC
             LIMIT 1
         """
 
@@ -285,29 +476,45 @@ class QBTDCalculatorV2:
                 logger.warning(f"No defense stats found for {opponent}")
                 return {'tds_per_game': 1.5, 'rank': 'N/A'}  # Use league average
 
-            tds_per_game = result.iloc[0]['tds_per_game']
-
-            # Calculate rank (simple approximation - could be enhanced)
-            # NFL average is ~1.5 TDs/game
-            # Strong defense: < 1.2 TDs/game (top 10)
-            # Weak defense: > 1.8 TDs/game (bottom 10)
-            if tds_per_game < 1.2:
-                rank = 'Strong'
-            elif tds_per_game > 1.8:
-                rank = 'Weak'
-            else:
-                rank = 'Average'
-
-            return {
-                'tds_per_game': tds_per_game,
-                'rank': rank,
-                'pass_tds_allowed': result.iloc[0]['pass_tds_allowed']
-            }
+            return self._classify_defense(
+                result.iloc[0]['tds_per_game'], result.iloc[0]['pass_tds_allowed']
+            )
 
         except Exception as e:
             logger.warning(f"Error getting defense quality for {opponent}: {e}")
             return {'tds_per_game': 1.5, 'rank': 'N/A'}
 
+    def _classify_defense(self, tds_per_game, pass_tds_allowed) -> Dict:
+        """
+        Bucket a defense by passing TDs allowed per game
+
+        Args:
+            tds_per_game: Passing TDs allowed per game
+            pass_tds_allowed: Total passing TDs allowed
+
+        Returns:
+            Dictionary with defensive quality metrics
+        """
+        if tds_per_game is None or pd.isna(tds_per_game):
+            return {'tds_per_game': 1.5, 'rank': 'N/A'}  # Use league average
+
+        # Calculate rank (simple approximation - could be enhanced)
+        # NFL average is ~1.5 TDs/game
+        # Strong defense: < 1.2 TDs/game (top 10)
+        # Weak defense: > 1.8 TDs/game (bottom 10)
+        if tds_per_game < 1.2:
+            rank = 'Strong'
+        elif tds_per_game > 1.8:
+            rank = 'Weak'
+        else:
+            rank = 'Average'
+
+        return {
+            'tds_per_game': tds_per_game,
+            'rank': rank,
+            'pass_tds_allowed': pass_tds_allowed
+        }
+
     def _adjust_edge_with_v2_metrics(self, base_edge_pct: float,
                                     qb_stats: Dict,
                                     red_zone_td_rate: float,
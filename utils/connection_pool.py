@@ -0,0 +1,291 @@
+"""Thread-local SQLite connection pool for NFL Edge Finder
+
+Each thread gets its own writer connection and its own read-only connection
+per database file. Connections are opened once, tuned with WAL pragmas and
+reused across requests, so scraper writes no longer block dashboard reads and
+connection setup drops out of request latency. A thread's connections are
+closed when the thread ends, so short-lived request threads do not leak them.
+
+Components on the same thread share its writer, so they open their writes with
+transaction() instead of calling commit()/rollback() directly: nested inside
+another component's open transaction, their work becomes a savepoint and never
+commits or discards the outer work.
+"""
+
+import itertools
+import sqlite3
+import threading
+import os
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+_savepoint_ids = itertools.count()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    Run a block of writes in its own transaction scope
+
+    Without an open transaction the block is committed on success and rolled
+    back on error. If another component on this thread already has a
+    transaction open on the shared writer, the block runs in a savepoint
+    instead: an error undoes only the block, and a successful block is left
+    for the outer transaction to commit.
+
+    Args:
+        conn: Writer connection (usually ConnectionPool.writer())
+
+    Yields:
+        The same connection
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return
+
+    name = f"scope_{next(_savepoint_ids)}"
+    conn.execute(f"SAVEPOINT {name}")
+    try:
+        yield conn
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
+
+
+class _ThreadMarker:
+    """Lives in a thread's local storage; collected when the thread ends"""
+
+
+class ConnectionPool:
+    """Hands out per-thread reader and writer connections for one database"""
+
+    # Pragmas applied to every pooled connection
+    MMAP_SIZE = 256 * 1024 * 1024   # 256 MB memory-mapped I/O
+    CACHE_SIZE_KB = 32000           # ~32 MB page cache per connection
+    BUSY_TIMEOUT_MS = 30000         # wait up to 30s for a competing writer
+
+    def __init__(self, db_path, mmap_size: int = MMAP_SIZE,
+                 cache_size_kb: int = CACHE_SIZE_KB,
+                 busy_timeout_ms: int = BUSY_TIMEOUT_MS):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file
+            mmap_size: Bytes of the database to memory-map
+            cache_size_kb: Page cache size per connection in KiB
+            busy_timeout_ms: Milliseconds to wait on a locked database
+        """
+        self.db_path = Path(db_path)
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._local = threading.local()
+        # Reentrant: a thread-exit finalizer may run while the lock is held
+        self._lock = threading.RLock()
+        self._connections = []
+
+        # Shared connection used only to read PRAGMA data_version
+        self._probe = None
+        self._probe_file_id = None
+        self._probe_lock = threading.Lock()
+
+    def writer(self) -> sqlite3.Connection:
+        """Get this thread's read-write connection (created on first use)"""
+        return self._get('writer')
+
+    def reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection (created on first use)"""
+        return self._get('reader')
+
+    def data_version(self):
+        """
+        Database-wide change token for cache invalidation
+
+        PRAGMA data_version is per connection, so it is read from one probe
+        connection shared by all threads. It changes whenever any other
+        connection (in this or another process) commits to the database.
+
+        Returns:
+            tuple: (file identity, data_version), or None if the file does not exist
+        """
+        file_id = self._file_id()
+        if file_id is None:
+            return None
+
+        with self._probe_lock:
+            if self._probe is None or self._probe_file_id != file_id:
+                if self._probe is not None:
+                    self._discard(self._probe)
+                self._probe = self._open_reader()
+                self._probe_file_id = file_id
+
+            return (file_id, self._probe.execute("PRAGMA data_version").fetchone()[0])
+
+    def _get(self, role: str) -> sqlite3.Connection:
+        conn = getattr(self._local, role, None)
+        file_id = self._file_id()
+
+        # Reopen if the database file was replaced (e.g. restored from backup)
+        if conn is not None and getattr(self._local, f'{role}_file_id', None) != file_id:
+            self._thread_connections().remove(conn)
+            self._discard(conn)
+            conn = None
+
+        if conn is None:
+            if role == 'reader':
+                if file_id is None:
+                    # Read-only connections cannot create the file; let the writer do it
+                    self.writer()
+                    file_id = self._file_id()
+                conn = self._open_reader()
+            else:
+                conn = self._open_writer()
+                file_id = self._file_id()
+
+            self._thread_connections().append(conn)
+            setattr(self._local, role, conn)
+            setattr(self._local, f'{role}_file_id', file_id)
+
+        return conn
+
+    def _thread_connections(self) -> list:
+        """Connections owned by the current thread, closed when it ends"""
+        owned = getattr(self._local, 'owned', None)
+        if owned is None:
+            owned = []
+            marker = _ThreadMarker()
+            # Thread-local storage is dropped when the thread exits, which
+            # collects the marker and releases that thread's connections
+            weakref.finalize(marker, self._release, owned)
+            self._local.owned = owned
+            self._local.marker = marker
+        return owned
+
+    def _release(self, owned: list):
+        while owned:
+            self._discard(owned.pop())
+
+    def _open_writer(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               timeout=self.busy_timeout_ms / 1000)
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._apply_pragmas(conn)
+        self._track(conn)
+        logger.debug(f"Opened pooled writer for {self.db_path} ({threading.current_thread().name})")
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               timeout=self.busy_timeout_ms / 1000)
+        self._apply_pragmas(conn)
+        conn.execute("PRAGMA query_only=ON")
+        self._track(conn)
+        logger.debug(f"Opened pooled reader for {self.db_path} ({threading.current_thread().name})")
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+
+    def _file_id(self):
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _track(self, conn: sqlite3.Connection):
+        with self._lock:
+            self._connections.append(conn)
+
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self):
+        """Close every connection opened by this pool (all threads)"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+        with self._probe_lock:
+            self._probe = None
+            self._probe_file_id = None
+
+    @property
+    def open_connections(self) -> int:
+        """Number of live pooled connections across all threads"""
+        with self._lock:
+            return len(self._connections)
+
+
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path) -> ConnectionPool:
+    """
+    Get the process-wide pool for a database file
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Shared ConnectionPool for the resolved path
+    """
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(key)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools(db_path: Optional[Path] = None):
+    """
+    Close pooled connections (for shutdown, backups and tests)
+
+    Args:
+        db_path: Only close the pool for this database (default: all pools)
+    """
+    with _pools_lock:
+        if db_path is not None:
+            pools = [_pools.pop(Path(db_path).resolve(), None)]
+        else:
+            pools = list(_pools.values())
+            _pools.clear()
+
+    for pool in pools:
+        if pool is not None:
+            pool.close_all()
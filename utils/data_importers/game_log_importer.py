@@ -28,7 +28,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from utils.db_manager import DatabaseManager
-from utils.name_normalizer import normalize_player_name
+from utils.name_normalizer import normalize_player_names
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -148,7 +148,7 @@ class GameLogImporter:
             # 2. Normalize names (remove suffixes like Jr., II, III, extra spaces)
             # Store original names for logging
             original_names = df_clean['player_name'].unique()
-            df_clean['player_name'] = df_clean['player_name'].apply(normalize_player_name)
+            df_clean['player_name'] = normalize_player_names(df_clean['player_name'])
             normalized_names = df_clean['player_name'].unique()
 
             # Log normalization changes
@@ -2,6 +2,12 @@
 
 Calculates team performance metrics from play-by-play data.
 This is a materialized view pattern - pre-calculate metrics for fast edge detection.
+
+Metrics are cumulative (week N = all plays through week N). Each week's plays
+are aggregated once per offense/defense with a grouped query, and running sums
+turn those per-week deltas into cumulative snapshots. A per-week fingerprint of
+the play-by-play data is stored in team_metrics_watermarks so that re-runs only
+recompute weeks from the first week whose plays changed.
 """
 
 import pandas as pd
@@ -9,36 +15,69 @@ import logging
 from pathlib import Path
 from datetime import datetime
 
+from utils.connection_pool import transaction
+
 logger = logging.getLogger(__name__)
 
 
 class TeamMetricsCalculator:
     """Calculate team metrics from play-by-play data"""
 
+    MAX_WEEK = 18
+
+    # Per-week fingerprint of play_by_play used to detect new/changed plays
+    FINGERPRINT_COLUMNS = ['play_count', 'max_play_id', 'total_yards']
+
     def __init__(self, db_manager):
         """Initialize calculator"""
         self.db_manager = db_manager
 
-    def calculate_all_weeks(self, season):
+    def calculate_all_weeks(self, season, force=False):
         """
         Calculate team metrics for all weeks in season
 
+        Only weeks from the first week with new or changed plays onward are
+        recomputed (cumulative metrics for later weeks depend on it).
+
         Args:
             season: Season year
+            force: Recompute every week even if no plays changed
 
         Returns:
             int: Total number of team-week metrics calculated
         """
+        weekly = self._aggregate_weekly(season)
+        if weekly is None:
+            logger.warning(f"      No play-by-play data for {season}")
+            return 0
+
+        fingerprints = self._week_fingerprints(weekly)
+        first_dirty_week = 1 if force else self._first_dirty_week(season, fingerprints)
+
+        if first_dirty_week is None:
+            logger.info(f"   Team metrics up to date for {season} (no new plays)")
+            return 0
+
+        logger.info(f"   Recomputing team metrics for weeks {first_dirty_week}-{self.MAX_WEEK}")
+
+        cumulative = self._cumulative_metrics(weekly, season)
         total_metrics = 0
+        failed_weeks = []
 
-        # Calculate metrics for weeks 1-18
-        for week in range(1, 19):
+        for week in range(first_dirty_week, self.MAX_WEEK + 1):
             try:
-                metrics_df = self.calculate_for_week(season, week)
-                if metrics_df is not None and not metrics_df.empty:
-                    total_metrics += len(metrics_df)
+                metrics_df = cumulative[cumulative['week'] == week].reset_index(drop=True)
+                if metrics_df.empty:
+                    continue
+
+                self._save_snapshot(metrics_df, season, week)
+                self.db_manager.upsert_team_metrics(metrics_df)
+                total_metrics += len(metrics_df)
             except Exception as e:
                 logger.warning(f"   Could not calculate metrics for Week {week}: {e}")
+                failed_weeks.append(week)
+
+        self._save_fingerprints(season, fingerprints, failed_weeks)
 
         return total_metrics
 
@@ -53,90 +92,131 @@ class TeamMetricsCalculator:
         Returns:
             DataFrame: Team metrics
         """
-        conn = self.db_manager._get_connection()
+        weekly = self._aggregate_weekly(season, max_week=week)
+
+        if weekly is None:
+            logger.warning(f"      No play-by-play data for Week {week}")
+            return None
+
+        cumulative = self._cumulative_metrics(weekly, season, weeks=[week])
+        metrics_df = cumulative[cumulative['week'] == week].reset_index(drop=True)
+
+        if metrics_df.empty:
+            return None
+
+        # Save snapshot
+        self._save_snapshot(metrics_df, season, week)
 
-        # Get all plays for season up to and including this week
-        plays_df = pd.read_sql_query(
+        # Upsert to database
+        self.db_manager.upsert_team_metrics(metrics_df)
+
+        return metrics_df
+
+    def _aggregate_weekly(self, season, max_week=None):
+        """
+        Aggregate each week's plays once, grouped by offense and by defense
+
+        Args:
+            season: Season year
+            max_week: Optional last week to include
+
+        Returns:
+            dict: {'offense': DataFrame, 'defense': DataFrame} of per-week
+            deltas, or None if there are no plays
+        """
+        conn = self.db_manager.get_read_connection()
+        max_week = max_week or self.MAX_WEEK
+
+        offense = pd.read_sql_query(
             """
-            SELECT * FROM play_by_play
+            SELECT week, offense AS team_name,
+                   COUNT(*) AS plays,
+                   COALESCE(SUM(yards_gained), 0) AS yards,
+                   COALESCE(SUM(CASE WHEN quarter IN (1, 2) THEN yards_gained END), 0) AS first_half_yards,
+                   COUNT(DISTINCT game_key) AS games,
+                   MAX(id) AS max_play_id
+            FROM play_by_play
             WHERE season = ? AND week <= ?
+            GROUP BY week, offense
             """,
             conn,
-            params=(season, week)
+            params=(season, max_week)
         )
 
-        if plays_df.empty:
-            logger.warning(f"      No play-by-play data for Week {week}")
+        if offense.empty:
             return None
 
-        # Get unique teams
-        teams = pd.concat([plays_df['offense'], plays_df['defense']]).unique()
-        metrics_list = []
+        defense = pd.read_sql_query(
+            """
+            SELECT week, defense AS team_name,
+                   COUNT(*) AS plays,
+                   COALESCE(SUM(yards_gained), 0) AS yards
+            FROM play_by_play
+            WHERE season = ? AND week <= ?
+            GROUP BY week, defense
+            """,
+            conn,
+            params=(season, max_week)
+        )
 
-        for team in teams:
-            metrics = self._calculate_team_metrics(team, plays_df, season, week)
-            if metrics:
-                metrics_list.append(metrics)
+        return {'offense': offense, 'defense': defense}
 
-        if not metrics_list:
-            return None
+    def _cumulative_metrics(self, weekly, season, weeks=None):
+        """
+        Turn per-week deltas into cumulative metrics (week N = week N-1 + delta)
 
-        metrics_df = pd.DataFrame(metrics_list)
+        Args:
+            weekly: Output of _aggregate_weekly
+            season: Season year
+            weeks: Weeks to emit (defaults to 1..MAX_WEEK)
 
-        # Calculate percentiles
-        if len(metrics_df) > 1:
-            metrics_df['offensive_ypp_percentile'] = metrics_df['offensive_yards_per_play'].rank(pct=True) * 100
-            metrics_df['defensive_ypp_percentile'] = metrics_df['defensive_yards_per_play'].rank(pct=True, ascending=False) * 100
-        else:
-            metrics_df['offensive_ypp_percentile'] = 50
-            metrics_df['defensive_ypp_percentile'] = 50
+        Returns:
+            DataFrame: One row per team per week, with percentiles within week
+        """
+        weeks = list(weeks or range(1, self.MAX_WEEK + 1))
+        all_weeks = range(1, max(weeks) + 1)
 
-        # Save snapshot
-        self._save_snapshot(metrics_df, season, week)
+        offense = weekly['offense'].set_index(['team_name', 'week'])[
+            ['plays', 'yards', 'first_half_yards', 'games']
+        ].add_prefix('off_')
+        defense = weekly['defense'].set_index(['team_name', 'week'])[
+            ['plays', 'yards']
+        ].add_prefix('def_')
 
-        # Upsert to database
-        self.db_manager.upsert_team_metrics(metrics_df)
+        teams = sorted(set(offense.index.get_level_values(0)) | set(defense.index.get_level_values(0)))
+        grid = pd.MultiIndex.from_product([teams, all_weeks], names=['team_name', 'week'])
 
-        return metrics_df
+        deltas = pd.concat([offense, defense], axis=1).reindex(grid).fillna(0).astype('int64')
+        totals = deltas.groupby(level='team_name').cumsum().reset_index()
+
+        # A team appears once it has run or faced at least one play
+        totals = totals[
+            totals['week'].isin(weeks) & ((totals['off_plays'] > 0) | (totals['def_plays'] > 0))
+        ]
+        if totals.empty:
+            return pd.DataFrame()
 
-    def _calculate_team_metrics(self, team, plays_df, season, week):
-        """Calculate metrics for a single team"""
-        # Offensive metrics (team as offense)
-        team_offense = plays_df[plays_df['offense'] == team]
-        off_plays = len(team_offense)
-        off_yards = team_offense['yards_gained'].sum()
-        off_ypp = off_yards / off_plays if off_plays > 0 else 0
-
-        # First half specific (quarters 1-2)
-        first_half = team_offense[team_offense['quarter'].isin([1, 2])]
-        fh_yards = first_half['yards_gained'].sum()
-        games_played = team_offense['game_key'].nunique()
-        fh_points_avg = 0  # Simplified - would need TD/FG data
-
-        # Defensive metrics (team as defense)
-        team_defense = plays_df[plays_df['defense'] == team]
-        def_plays = len(team_defense)
-        def_yards = team_defense['yards_gained'].sum()
-        def_ypp = def_yards / def_plays if def_plays > 0 else 0
-
-        return {
-            'team_name': team,
+        off_plays = totals['off_plays']
+        def_plays = totals['def_plays']
+
+        metrics_df = pd.DataFrame({
+            'team_name': totals['team_name'],
             'season': season,
-            'week': week,
-            'offensive_plays': off_plays,
-            'offensive_yards': off_yards,
-            'offensive_yards_per_play': round(off_ypp, 2),
+            'week': totals['week'],
+            'offensive_plays': off_plays.astype(int),
+            'offensive_yards': totals['off_yards'],
+            'offensive_yards_per_play': (totals['off_yards'] / off_plays.where(off_plays > 0)).fillna(0).round(2),
             'offensive_first_downs': 0,
             'offensive_touchdowns': 0,
-            'first_half_points_avg': round(fh_points_avg, 2),
-            'first_half_yards_avg': round(fh_yards / max(games_played, 1), 2),
+            'first_half_points_avg': 0.0,  # Simplified - would need TD/FG data
+            'first_half_yards_avg': (totals['off_first_half_yards'] / totals['off_games'].clip(lower=1)).round(2),
             'first_half_scoring_plays': 0,
             'red_zone_attempts': 0,
             'red_zone_touchdowns': 0,
             'red_zone_efficiency_pct': 0,
-            'defensive_plays': def_plays,
-            'defensive_yards_allowed': def_yards,
-            'defensive_yards_per_play': round(def_ypp, 2),
+            'defensive_plays': def_plays.astype(int),
+            'defensive_yards_allowed': totals['def_yards'],
+            'defensive_yards_per_play': (totals['def_yards'] / def_plays.where(def_plays > 0)).fillna(0).round(2),
             'defensive_touchdowns_allowed': 0,
             'defensive_first_downs_allowed': 0,
             'fg_attempts': 0,
@@ -144,9 +224,103 @@ class TeamMetricsCalculator:
             'fg_pct': 0,
             'kicker_points_avg': 0,
             'fg_blocks_allowed': 0,
-            'offensive_ypp_percentile': 50,  # Will calculate later
-            'defensive_ypp_percentile': 50   # Will calculate later
-        }
+        })
+
+        # Calculate percentiles within each week
+        by_week = metrics_df.groupby('week')
+        team_counts = by_week['team_name'].transform('count')
+        metrics_df['offensive_ypp_percentile'] = (
+            by_week['offensive_yards_per_play'].rank(pct=True) * 100
+        ).where(team_counts > 1, 50)
+        metrics_df['defensive_ypp_percentile'] = (
+            by_week['defensive_yards_per_play'].rank(pct=True, ascending=False) * 100
+        ).where(team_counts > 1, 50)
+
+        return metrics_df.sort_values(['week', 'team_name']).reset_index(drop=True)
+
+    def _week_fingerprints(self, weekly):
+        """Per-week play count / max play id / yards, used to detect new plays"""
+        offense = weekly['offense']
+        fingerprints = offense.groupby('week').agg(
+            play_count=('plays', 'sum'),
+            max_play_id=('max_play_id', 'max'),
+            total_yards=('yards', 'sum')
+        )
+        return fingerprints.astype(int)
+
+    def _ensure_watermark_table(self):
+        """Create the fingerprint table if needed"""
+        conn = self.db_manager._get_connection()
+        with transaction(conn):
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS team_metrics_watermarks (
+                    season INTEGER NOT NULL,
+                    week INTEGER NOT NULL,
+                    play_count INTEGER NOT NULL,
+                    max_play_id INTEGER NOT NULL,
+                    total_yards INTEGER NOT NULL,
+                    computed_at TIMESTAMP,
+                    UNIQUE(season, week)
+                )
+            """)
+
+    def _first_dirty_week(self, season, fingerprints):
+        """
+        Find the first week whose plays differ from the last calculation
+
+        Args:
+            season: Season year
+            fingerprints: Output of _week_fingerprints
+
+        Returns:
+            int or None: First week to recompute, None if nothing changed
+        """
+        self._ensure_watermark_table()
+
+        stored = pd.read_sql_query(
+            "SELECT week, play_count, max_play_id, total_yards "
+            "FROM team_metrics_watermarks WHERE season = ?",
+            self.db_manager.get_read_connection(),
+            params=(season,)
+        ).set_index('week')
+
+        weeks = fingerprints.index.union(stored.index)
+        current = fingerprints.reindex(weeks)
+        previous = stored[self.FINGERPRINT_COLUMNS].reindex(weeks)
+
+        changed = (current != previous).any(axis=1)
+        if not changed.any():
+            return None
+
+        return int(changed[changed].index.min())
+
+    def _save_fingerprints(self, season, fingerprints, failed_weeks=()):
+        """
+        Record the fingerprints the current metrics were built from
+
+        Args:
+            season: Season year
+            fingerprints: Output of _week_fingerprints
+            failed_weeks: Weeks whose metrics were not written
+        """
+        self._ensure_watermark_table()
+
+        # A failed week gets a fingerprint no real week has, so the next run
+        # sees it as changed and recomputes from the first failed week
+        fingerprints = fingerprints.copy()
+        for week in failed_weeks:
+            fingerprints.loc[week] = -1
+        fingerprints = fingerprints.sort_index()
+        fingerprints.index.name = 'week'
+
+        df = fingerprints.reset_index()
+        df.insert(0, 'season', season)
+        df['computed_at'] = datetime.now().isoformat()
+
+        conn = self.db_manager._get_connection()
+        with transaction(conn):
+            conn.execute("DELETE FROM team_metrics_watermarks WHERE season = ?", (season,))
+            self.db_manager.bulk_upsert('team_metrics_watermarks', df)
 
     def _save_snapshot(self, df, season, week):
         """Save historical snapshot"""
@@ -13,7 +13,7 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.name_normalizer import normalize_player_name, fuzzy_match_names
+from utils.name_normalizer import normalize_player_name, FuzzyNameIndex
 
 logger = logging.getLogger(__name__)
 
@@ -245,11 +245,8 @@ class DataQualityValidator:
         roster_names = [row[0] for row in result_roster]
 
         # Filter out orphans that have fuzzy matches in roster
-        true_orphans = []
-        for orphan in orphan_names:
-            has_fuzzy_match = any(fuzzy_match_names(orphan, roster_name) for roster_name in roster_names)
-            if not has_fuzzy_match:
-                true_orphans.append(orphan)
+        matches = FuzzyNameIndex(roster_names).match_many(orphan_names)
+        true_orphans = [orphan for orphan in orphan_names if matches[orphan] is None]
 
         orphan_qbs = len(true_orphans)
 
@@ -1,35 +1,97 @@
 """Database Manager for NFL Edge Finder"""
 
-import sqlite3
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
 import argparse
+import json
 import logging
+import threading
+import weakref
+
+from utils.connection_pool import get_connection_pool, transaction
 
 logger = logging.getLogger(__name__)
 
+# Per thread: id(pooled writer) -> DatabaseManager instances currently attached to it
+_writer_users = threading.local()
+
+
+def _attached_managers(conn):
+    """Instances on this thread sharing a pooled writer connection"""
+    users = getattr(_writer_users, 'by_conn', None)
+    if users is None:
+        users = _writer_users.by_conn = {}
+    return users.setdefault(id(conn), weakref.WeakSet())
+
 
 class DatabaseManager:
     """Manages SQLite database operations for NFL betting data"""
+
+    # Natural keys backing each table's UNIQUE constraint (used as ON CONFLICT targets)
+    UPSERT_KEYS = {
+        'play_by_play': ['play_id'],
+        'team_metrics': ['team_name', 'season', 'week'],
+        'team_metrics_watermarks': ['season', 'week'],
+        'kicker_stats': ['kicker_name', 'team', 'season'],
+        'qb_stats_enhanced': ['qb_name', 'team', 'season'],
+        'player_roster': ['player_name', 'team', 'season', 'week'],
+        'player_game_log': ['player_id', 'season', 'week'],
+        'defense_stats': ['team_name', 'week'],
+        'matchups': ['home_team', 'away_team', 'week'],
+        'qb_props': ['qb_name', 'week', 'sportsbook'],
+        'odds_current': ['market', 'week', 'game', 'sportsbook', 'selection'],
+        'odds_last_seen': ['odds_table', 'week'],
+    }
+
+    DEFAULT_UPSERT_BATCH_SIZE = 5000
     
-    def __init__(self, db_path='data/database/nfl_betting.db'):
+    def __init__(self, db_path='data/database/nfl_betting.db', upsert_batch_size=DEFAULT_UPSERT_BATCH_SIZE):
         """
         Initialize database manager
         
         Args:
             db_path: Path to SQLite database file
+            upsert_batch_size: Rows per transaction for bulk upserts
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = None
-        self.cursor = None
+        self.pool = get_connection_pool(self.db_path)
+        self._local = threading.local()
+        self.upsert_batch_size = upsert_batch_size
+        self.last_upsert_stats = None
+        self._conflict_target_cache = {}
+        self._scrape_run_columns_ready = False
+        self._qb_props_columns_ready = False
     
+    @property
+    def conn(self):
+        """This thread's pooled writer connection (None until connect())"""
+        return getattr(self._local, 'conn', None)
+
+    @property
+    def cursor(self):
+        """Cursor on this thread's pooled writer connection"""
+        return getattr(self._local, 'cursor', None)
+
     def connect(self):
-        """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
-        logger.info(f"✅ Connected to: {self.db_path}")
+        """Attach this thread to its pooled writer connection"""
+        conn = self.pool.writer()
+        if self.conn is not conn:
+            if self.conn is not None:
+                _attached_managers(self.conn).discard(self)
+            _attached_managers(conn).add(self)
+            self._local.conn = conn
+            self._local.cursor = conn.cursor()
+            logger.info(f"✅ Connected to: {self.db_path}")
+
+    def get_read_connection(self):
+        """
+        Get this thread's pooled read-only connection
+
+        Use for queries only; reads do not block (or get blocked by) writers in WAL mode.
+        """
+        return self.pool.reader()
     
     def create_tables(self):
         """Create all database tables with proper schema"""
@@ -162,6 +224,8 @@ class DatabaseManager:
                 away_team TEXT,
                 game_time TIMESTAMP,
                 week INTEGER,
+                team TEXT,
+                opponent TEXT,
                 scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
@@ -175,7 +239,9 @@ class DatabaseManager:
                 files_scraped INTEGER,
                 api_requests_used INTEGER,
                 status TEXT,
-                error_message TEXT
+                error_message TEXT,
+                elapsed_seconds REAL,
+                stage_timings TEXT
             )
         """)
         
@@ -282,27 +348,14 @@ class DatabaseManager:
             if year is not None:
                 df_copy['year'] = year
             
-            # Determine natural key based on table
-            natural_keys = {
-                'defense_stats': ['team_name', 'week'],
-                'matchups': ['home_team', 'away_team', 'week'],
-                'qb_props': ['qb_name', 'week', 'sportsbook'],
-                # odds tables have no unique constraint (multiple books)
-            }
-            
-            # Delete existing records if natural key exists
-            if table_name in natural_keys and week:
-                keys = natural_keys[table_name]
-                for _, row in df_copy.iterrows():
-                    where_clause = ' AND '.join([f"{key} = ?" for key in keys])
-                    values = [row[key] for key in keys]
-                    self.cursor.execute(
-                        f"DELETE FROM {table_name} WHERE {where_clause}",
-                        values
-                    )
-            
-            # Insert new records
-            df_copy.to_sql(table_name, self.conn, if_exists='append', index=False)
+            # Tables with a natural key are upserted; odds tables have no
+            # unique constraint (multiple books) and are appended
+            natural_key_tables = ('defense_stats', 'matchups', 'qb_props')
+
+            if table_name in natural_key_tables and week:
+                self.bulk_upsert(table_name, df_copy)
+            else:
+                df_copy.to_sql(table_name, self.conn, if_exists='append', index=False)
             
             rows_inserted = len(df_copy)
             logger.info(f"✅ Upserted {rows_inserted} rows into {table_name}")
@@ -312,7 +365,8 @@ class DatabaseManager:
             logger.error(f"❌ Error upserting DataFrame into {table_name}: {e}")
             return 0
     
-    def log_scrape_run(self, week, files_scraped, api_requests_used, status='success', error_message=None):
+    def log_scrape_run(self, week, files_scraped, api_requests_used, status='success', error_message=None,
+                       elapsed_seconds=None, stage_timings=None):
         """
         Log a scrape run to the database
         
@@ -322,19 +376,49 @@ class DatabaseManager:
             api_requests_used: Number of API requests used
             status: Run status ('success', 'partial', 'failed')
             error_message: Error message if applicable
+            elapsed_seconds: Wall-clock time of the whole run
+            stage_timings: Dict of stage name -> {'status', 'elapsed_seconds'} (stored as JSON)
         """
         try:
-            self.cursor.execute("""
-                INSERT INTO scrape_runs (week, files_scraped, api_requests_used, status, error_message)
-                VALUES (?, ?, ?, ?, ?)
-            """, (week, files_scraped, api_requests_used, status, error_message))
-            
-            self.conn.commit()
+            self._ensure_scrape_run_columns()
+            with transaction(self.conn):
+                self.cursor.execute("""
+                    INSERT INTO scrape_runs
+                        (week, files_scraped, api_requests_used, status, error_message, elapsed_seconds, stage_timings)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (week, files_scraped, api_requests_used, status, error_message, elapsed_seconds,
+                      json.dumps(stage_timings) if stage_timings is not None else None))
+
             logger.info(f"✅ Logged scrape run: Week {week}, {files_scraped} files, {api_requests_used} API calls")
             
         except Exception as e:
             logger.error(f"❌ Error logging scrape run: {e}")
+
+    def _ensure_scrape_run_columns(self):
+        """Add the timing columns to scrape_runs tables created before they existed"""
+        if self._scrape_run_columns_ready:
+            return
+
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(scrape_runs)")}
+        with transaction(self.conn):
+            for column, column_type in (('elapsed_seconds', 'REAL'), ('stage_timings', 'TEXT')):
+                if existing and column not in existing:
+                    self.conn.execute(f"ALTER TABLE scrape_runs ADD COLUMN {column} {column_type}")
+        self._scrape_run_columns_ready = True
     
+    def ensure_qb_props_columns(self):
+        """Add the QB team/opponent columns to qb_props tables created before they existed"""
+        if self._qb_props_columns_ready:
+            return
+
+        conn = self._get_connection()
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(qb_props)")}
+        with transaction(conn):
+            for column in ('team', 'opponent'):
+                if existing and column not in existing:
+                    conn.execute(f"ALTER TABLE qb_props ADD COLUMN {column} TEXT")
+        self._qb_props_columns_ready = True
+
     def get_table_info(self, table_name):
         """
         Get information about a table
@@ -346,13 +430,15 @@ class DatabaseManager:
             Dictionary with table information
         """
         try:
+            cursor = self.get_read_connection().cursor()
+
             # Get row count
-            self.cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            row_count = self.cursor.fetchone()[0]
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            row_count = cursor.fetchone()[0]
             
             # Get column info
-            self.cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = self.cursor.fetchall()
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            columns = cursor.fetchall()
             
             return {
                 'table_name': table_name,
@@ -387,10 +473,19 @@ class DatabaseManager:
         return stats
     
     def close(self):
-        """Close database connection"""
+        """Release this thread's connection back to the pool"""
         if self.conn:
-            self.conn.close()
-            logger.info("✅ Database connection closed")
+            users = _attached_managers(self.conn)
+            users.discard(self)
+            # Match sqlite3 close(): uncommitted work is discarded, not left holding the lock.
+            # Other managers on this thread share the writer, so leave their transaction alone.
+            if not users:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                _writer_users.by_conn.pop(id(self.conn), None)
+            self._local.conn = None
+            self._local.cursor = None
+            logger.info("✅ Database connection released")
 
     # ========================================================================
     # PLAYERPROFILE DATA METHODS (Phase 1 - Migration 002)
@@ -402,6 +497,241 @@ class DatabaseManager:
             self.connect()
         return self.conn
 
+    # ========================================================================
+    # BULK UPSERT ENGINE
+    # ========================================================================
+
+    def bulk_upsert(self, table_name, df, key_columns=None, batch_size=None):
+        """
+        Set-based upsert of a DataFrame using INSERT ... ON CONFLICT DO UPDATE
+
+        Rows are written with executemany, one transaction per batch (a
+        savepoint when the caller already has a transaction open). When the
+        table has no UNIQUE index matching the natural key (e.g. databases that
+        predate migration 001) the batch falls back to a set-based DELETE of
+        the matching keys followed by a plain INSERT, in the same transaction.
+
+        Args:
+            table_name: Target database table
+            df: pandas DataFrame whose columns match the table schema
+            key_columns: Natural key columns (defaults to UPSERT_KEYS[table_name])
+            batch_size: Rows per transaction (defaults to self.upsert_batch_size)
+
+        Returns:
+            dict: {'inserted': int, 'updated': int, 'batches': int}
+        """
+        conn = self._get_connection()
+        key_columns = list(key_columns or self.UPSERT_KEYS[table_name])
+        batch_size = batch_size or self.upsert_batch_size
+        stats = {'inserted': 0, 'updated': 0, 'batches': 0}
+
+        if df.empty:
+            self.last_upsert_stats = stats
+            return stats
+
+        missing_keys = [key for key in key_columns if key not in df.columns]
+        if missing_keys:
+            raise ValueError(f"Missing key columns for {table_name}: {missing_keys}")
+
+        if not self._table_exists(table_name):
+            # Preserve to_sql's implicit table creation for unmigrated databases
+            df.head(0).to_sql(table_name, conn, index=False)
+
+        columns = list(df.columns)
+        insert_sql, delete_sql = self._upsert_statements(table_name, columns, key_columns)
+        use_on_conflict = delete_sql is None
+        key_positions = [columns.index(key) for key in key_columns]
+
+        rows = self._dataframe_to_rows(df)
+        cursor = conn.cursor()
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            with transaction(conn):
+                cursor.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table_name}")
+                max_rowid_before = cursor.fetchone()[0]
+
+                replaced = 0
+                if not use_on_conflict:
+                    cursor.executemany(
+                        delete_sql,
+                        [tuple(row[pos] for pos in key_positions) for row in batch]
+                    )
+                    replaced = max(cursor.rowcount, 0)
+
+                cursor.executemany(insert_sql, batch)
+
+                # New rows are the only ones with a rowid above the pre-batch maximum
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM {table_name} WHERE rowid > ?",
+                    (max_rowid_before,)
+                )
+                new_rows = cursor.fetchone()[0]
+
+            if use_on_conflict:
+                stats['inserted'] += new_rows
+                stats['updated'] += len(batch) - new_rows
+            else:
+                updated = min(replaced, len(batch))
+                stats['inserted'] += len(batch) - updated
+                stats['updated'] += updated
+            stats['batches'] += 1
+
+        self.last_upsert_stats = stats
+        return stats
+
+    def _upsert_statements(self, table_name, columns, key_columns=None):
+        """
+        Build the write statements for a table
+
+        Args:
+            table_name: Target database table
+            columns: Columns bound by each row, in order
+            key_columns: Natural key columns, or None for a plain append
+
+        Returns:
+            tuple: (insert_sql, delete_sql). delete_sql is None unless the table
+            lacks a UNIQUE index on key_columns, in which case matching keys
+            must be deleted before inserting.
+        """
+        column_sql = ', '.join(columns)
+        placeholders = ', '.join('?' * len(columns))
+        insert_sql = f"INSERT INTO {table_name} ({column_sql}) VALUES ({placeholders})"
+
+        if not key_columns:
+            return insert_sql, None
+
+        if self._has_conflict_target(table_name, key_columns):
+            update_columns = [col for col in columns if col not in key_columns]
+            if update_columns:
+                assignments = ', '.join(f"{col} = excluded.{col}" for col in update_columns)
+                conflict_action = f"DO UPDATE SET {assignments}"
+            else:
+                conflict_action = "DO NOTHING"
+            insert_sql += f" ON CONFLICT ({', '.join(key_columns)}) {conflict_action}"
+            return insert_sql, None
+
+        delete_sql = "DELETE FROM {} WHERE {}".format(
+            table_name, ' AND '.join(f"{key} = ?" for key in key_columns)
+        )
+        return insert_sql, delete_sql
+
+    def stream_insert(self, rows, columns, week=None, batch_size=None):
+        """
+        Write (table, row) pairs from an iterator in a single transaction
+
+        Rows are consumed lazily and flushed with executemany every batch_size
+        rows per table, so no DataFrame or intermediate file is built. Tables
+        with a natural key in UPSERT_KEYS are upserted; the rest are appended.
+        Nothing is committed unless the whole iterator is written; inside a
+        transaction already open on this thread's writer, the rows are written
+        in a savepoint and committed with it.
+
+        Args:
+            rows: Iterable of (table_name, row dict)
+            columns: Dict of table_name -> columns to write (other row keys are ignored)
+            week: Week number stamped on every row (if applicable)
+            batch_size: Rows per executemany (defaults to self.upsert_batch_size)
+
+        Returns:
+            dict: Rows written per table
+        """
+        conn = self._get_connection()
+        batch_size = batch_size or self.upsert_batch_size
+        scraped_at = datetime.now().isoformat()
+
+        statements = {}
+        batches = {}
+        counts = {table: 0 for table in columns}
+
+        def flush(table):
+            insert_sql, delete_sql, key_positions = statements[table]
+            batch = batches[table]
+            if delete_sql:
+                conn.executemany(delete_sql, [tuple(row[pos] for pos in key_positions) for row in batch])
+            conn.executemany(insert_sql, batch)
+            counts[table] += len(batch)
+            batches[table] = []
+
+        with transaction(conn):
+            for table, row in rows:
+                if table not in statements:
+                    table_columns = list(columns[table]) + ['scraped_at']
+                    key_columns = self.UPSERT_KEYS.get(table)
+                    insert_sql, delete_sql = self._upsert_statements(table, table_columns, key_columns)
+                    key_positions = [table_columns.index(key) for key in key_columns or []]
+                    statements[table] = (insert_sql, delete_sql, key_positions)
+                    batches[table] = []
+
+                if week is not None:
+                    row = {**row, 'week': week}
+                batches[table].append(tuple(row.get(col) for col in columns[table]) + (scraped_at,))
+
+                if len(batches[table]) >= batch_size:
+                    flush(table)
+
+            for table in statements:
+                if batches[table]:
+                    flush(table)
+
+        logger.info("✅ Streamed " + ", ".join(f"{n} rows into {t}" for t, n in counts.items()))
+        return counts
+
+    def _table_exists(self, table_name):
+        """Check whether a table exists in the database"""
+        row = self._get_connection().execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table_name,)
+        ).fetchone()
+        return row is not None
+
+    def _has_conflict_target(self, table_name, key_columns):
+        """
+        Check whether a UNIQUE index exactly covers key_columns
+
+        SQLite rejects ON CONFLICT targets that do not match a unique index,
+        so this decides between the ON CONFLICT path and the DELETE fallback.
+        """
+        cache_key = (table_name, tuple(key_columns))
+        if cache_key in self._conflict_target_cache:
+            return self._conflict_target_cache[cache_key]
+
+        conn = self._get_connection()
+        wanted = set(key_columns)
+        found = False
+
+        for index_row in conn.execute(f"PRAGMA index_list({table_name})").fetchall():
+            index_name, is_unique = index_row[1], index_row[2]
+            if not is_unique:
+                continue
+            index_columns = {
+                info[2] for info in conn.execute(f"PRAGMA index_info('{index_name}')").fetchall()
+            }
+            if index_columns == wanted:
+                found = True
+                break
+
+        self._conflict_target_cache[cache_key] = found
+        return found
+
+    @staticmethod
+    def _dataframe_to_rows(df):
+        """Convert a DataFrame into a list of sqlite3-bindable tuples (NaN -> NULL)"""
+        converted = df.copy()
+        for col in converted.columns:
+            if pd.api.types.is_datetime64_any_dtype(converted[col]):
+                # Same text as to_sql / sqlite3's datetime adapter: isoformat(' '),
+                # fractional seconds and UTC offset only when present
+                converted[col] = pd.Series(
+                    [None if pd.isna(value) else value.isoformat(' ')
+                     for value in converted[col].dt.to_pydatetime()],
+                    index=converted.index, dtype=object
+                )
+
+        # object dtype turns numpy scalars into native Python values
+        converted = converted.astype(object).where(pd.notna(converted), None)
+        return list(converted.itertuples(index=False, name=None))
+
     def upsert_play_by_play(self, df):
         """
         Insert or update play-by-play data (upsert on play_id)
@@ -412,19 +742,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
-
-        # SQLite UPSERT: DELETE existing rows with same play_id, then INSERT
-        play_ids = df['play_id'].tolist()
-        if play_ids:
-            placeholders = ','.join('?' * len(play_ids))
-            conn.execute(f"DELETE FROM play_by_play WHERE play_id IN ({placeholders})", play_ids)
-
-        # Insert new records
-        df.to_sql('play_by_play', conn, if_exists='append', index=False)
-        conn.commit()
+        stats = self.bulk_upsert('play_by_play', df)
 
-        logger.info(f"✅ Upserted {len(df)} plays into play_by_play")
+        logger.info(f"✅ Upserted {len(df)} plays into play_by_play "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def upsert_team_metrics(self, df):
@@ -437,20 +758,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
-
-        # Delete existing rows for (team, season, week) tuples
-        for _, row in df.iterrows():
-            conn.execute(
-                "DELETE FROM team_metrics WHERE team_name=? AND season=? AND week=?",
-                (row['team_name'], row['season'], row['week'])
-            )
+        stats = self.bulk_upsert('team_metrics', df)
 
-        # Insert new records
-        df.to_sql('team_metrics', conn, if_exists='append', index=False)
-        conn.commit()
-
-        logger.info(f"✅ Upserted {len(df)} team metrics into team_metrics")
+        logger.info(f"✅ Upserted {len(df)} team metrics into team_metrics "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def upsert_kicker_stats(self, df):
@@ -463,20 +774,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
+        stats = self.bulk_upsert('kicker_stats', df)
 
-        # Delete existing rows for (kicker, team, season) tuples
-        for _, row in df.iterrows():
-            conn.execute(
-                "DELETE FROM kicker_stats WHERE kicker_name=? AND team=? AND season=?",
-                (row['kicker_name'], row['team'], row['season'])
-            )
-
-        # Insert new records
-        df.to_sql('kicker_stats', conn, if_exists='append', index=False)
-        conn.commit()
-
-        logger.info(f"✅ Upserted {len(df)} kicker stats into kicker_stats")
+        logger.info(f"✅ Upserted {len(df)} kicker stats into kicker_stats "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def upsert_qb_stats_enhanced(self, df):
@@ -489,20 +790,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
-
-        # Delete existing rows for (qb, team, season) tuples
-        for _, row in df.iterrows():
-            conn.execute(
-                "DELETE FROM qb_stats_enhanced WHERE qb_name=? AND team=? AND season=?",
-                (row['qb_name'], row['team'], row['season'])
-            )
+        stats = self.bulk_upsert('qb_stats_enhanced', df)
 
-        # Insert new records
-        df.to_sql('qb_stats_enhanced', conn, if_exists='append', index=False)
-        conn.commit()
-
-        logger.info(f"✅ Upserted {len(df)} QB stats into qb_stats_enhanced")
+        logger.info(f"✅ Upserted {len(df)} QB stats into qb_stats_enhanced "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def upsert_player_roster(self, df):
@@ -515,20 +806,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
-
-        # Delete existing rows for (player, team, season, week) tuples
-        for _, row in df.iterrows():
-            conn.execute(
-                "DELETE FROM player_roster WHERE player_name=? AND team=? AND season=? AND week=?",
-                (row['player_name'], row['team'], row['season'], row['week'])
-            )
-
-        # Insert new records
-        df.to_sql('player_roster', conn, if_exists='append', index=False)
-        conn.commit()
+        stats = self.bulk_upsert('player_roster', df)
 
-        logger.info(f"✅ Upserted {len(df)} roster entries into player_roster")
+        logger.info(f"✅ Upserted {len(df)} roster entries into player_roster "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def get_team_metrics(self, team_name, season, week):
@@ -547,7 +828,7 @@ class DatabaseManager:
             SELECT * FROM team_metrics
             WHERE team_name = ? AND season = ? AND week = ?
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(team_name, season, week))
 
         if not result.empty:
@@ -569,7 +850,7 @@ class DatabaseManager:
             SELECT * FROM kicker_stats
             WHERE kicker_name = ? AND season = ?
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(kicker_name, season))
 
         if not result.empty:
@@ -591,7 +872,7 @@ class DatabaseManager:
             SELECT * FROM qb_stats_enhanced
             WHERE qb_name = ? AND season = ?
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(qb_name, season))
 
         if not result.empty:
@@ -614,7 +895,7 @@ class DatabaseManager:
             SELECT player_name, team FROM player_roster
             WHERE position = ? AND week = ? AND season = ? AND status = 'Active'
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(position, week, season))
 
         return result.to_dict('records')
@@ -629,20 +910,10 @@ class DatabaseManager:
         Returns:
             int: Number of rows inserted
         """
-        conn = self._get_connection()
+        stats = self.bulk_upsert('player_game_log', df)
 
-        # Delete existing rows for (player_id, season, week) tuples
-        for _, row in df.iterrows():
-            conn.execute(
-                "DELETE FROM player_game_log WHERE player_id=? AND season=? AND week=?",
-                (row['player_id'], row['season'], row['week'])
-            )
-
-        # Insert new records
-        df.to_sql('player_game_log', conn, if_exists='append', index=False)
-        conn.commit()
-
-        logger.info(f"✅ Upserted {len(df)} game log entries into player_game_log")
+        logger.info(f"✅ Upserted {len(df)} game log entries into player_game_log "
+                    f"({stats['inserted']} inserted, {stats['updated']} updated)")
         return len(df)
 
     def get_player_game_log(self, player_name, season, weeks_back=4):
@@ -664,7 +935,7 @@ class DatabaseManager:
             ORDER BY week DESC
             LIMIT ?
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(player_name, season, weeks_back))
 
         return result
@@ -688,7 +959,7 @@ class DatabaseManager:
             WHERE player_name = ? AND season = ? AND week BETWEEN ? AND ?
             ORDER BY week ASC
         """
-        conn = self._get_connection()
+        conn = self.get_read_connection()
         result = pd.read_sql_query(query, conn, params=(player_name, season, start_week, end_week))
 
         return result
@@ -316,6 +316,149 @@ class BetRecommender:
         }
 
 
+class VectorizedEdgeEngine:
+    """
+    Columnar version of ProbabilityCalculator -> EdgeDetector -> BetRecommender
+
+    Prices a whole frame of QB/defense/odds rows with NumPy array operations.
+    Results match the scalar classes within floating-point tolerance.
+    """
+
+    # Edge % upper bounds -> (tier, Kelly multiplier), mirrors BetRecommender
+    TIER_BOUNDS = [5.0, 10.0, 20.0]
+    TIER_NAMES = np.array(["PASS", "SMALL EDGE", "GOOD EDGE", "STRONG EDGE"])
+    TIER_KELLY_MULTIPLIERS = np.array([0.0, 0.15, 0.25, 0.25])
+
+    def __init__(self, model_version: str = "v1", max_bankroll_fraction: float = 0.05,
+                 bankroll: float = 1000, league_average_tds: float = 1.5):
+        """
+        Initialize vectorized engine
+
+        Args:
+            model_version: Model version to use ("v1" or "v2")
+            max_bankroll_fraction: Kelly cap (matches BetRecommender)
+            bankroll: Bankroll used for recommended bet amounts
+            league_average_tds: League average passing TDs per game
+        """
+        self.model_version = model_version
+        self.max_bankroll_fraction = max_bankroll_fraction
+        self.bankroll = bankroll
+        self.league_average_tds = league_average_tds
+
+    def price(self, qb_tds, qb_games, defense_tds, odds,
+              is_home=True, is_division_game=False) -> pd.DataFrame:
+        """
+        Price every row in one pass
+
+        Args:
+            qb_tds: Array of QB season passing TDs
+            qb_games: Array of QB games played
+            defense_tds: Array of opponent passing TDs allowed per game
+            odds: Array of American odds
+            is_home: Scalar or array of home flags
+            is_division_game: Scalar or array of division-game flags (v2 only)
+
+        Returns:
+            DataFrame with probability, implied probability, decimal odds,
+            edge %, Kelly fraction, tier and confidence columns
+        """
+        qb_tds = np.asarray(qb_tds, dtype=float)
+        qb_games = np.asarray(qb_games, dtype=float)
+        defense_tds = np.asarray(defense_tds, dtype=float)
+        odds = np.asarray(odds, dtype=float)
+        n = len(odds)
+        is_home = np.broadcast_to(np.asarray(is_home, dtype=bool), (n,))
+        is_division_game = np.broadcast_to(np.asarray(is_division_game, dtype=bool), (n,))
+
+        qb_td_per_game = qb_tds / np.maximum(qb_games, 1)
+
+        if self.model_version == "v1":
+            columns = self._v1_probability(qb_td_per_game, defense_tds, is_home)
+        elif self.model_version == "v2":
+            columns = self._v2_probability(qb_td_per_game, defense_tds, qb_games,
+                                           is_home, is_division_game)
+        else:
+            raise ValueError(f"Unknown model version: {self.model_version}")
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            probability = columns['probability']
+            abs_odds = np.abs(odds)
+            favorite = odds < 0
+
+            implied = np.where(favorite, abs_odds / (abs_odds + 100), 100 / (odds + 100))
+            edge = probability - implied
+            edge_pct = np.where(implied > 0, edge / implied * 100, 0.0)
+            decimal_odds = np.where(favorite, 100 / abs_odds + 1, odds / 100 + 1)
+
+            tier_idx = np.searchsorted(self.TIER_BOUNDS, edge_pct, side='right')
+            b = decimal_odds - 1
+            kelly = (b * probability - (1 - probability)) / b
+            kelly_fraction = np.minimum(
+                np.maximum(0, kelly * self.TIER_KELLY_MULTIPLIERS[tier_idx]),
+                self.max_bankroll_fraction
+            )
+
+        columns.update({
+            'true_probability': probability,
+            'implied_probability': implied,
+            'edge': edge,
+            'edge_percentage': edge_pct,
+            'odds': odds,
+            'decimal_odds': decimal_odds,
+            'is_positive_edge': edge > 0,
+            'tier': self.TIER_NAMES[tier_idx],
+            'kelly_fraction': kelly_fraction,
+            'recommended_bet': self.bankroll * kelly_fraction,
+            'bankroll_percentage': kelly_fraction * 100,
+        })
+        return pd.DataFrame(columns)
+
+    def _v1_probability(self, qb_td_per_game, defense_tds, is_home) -> Dict[str, np.ndarray]:
+        """Vectorized ProbabilityCalculator._calculate_simple_probability"""
+        base_prob = qb_td_per_game * 0.6 + defense_tds * 0.4
+        home_field_advantage = np.where(is_home, 0.1, 0.0)
+        adjusted_prob = base_prob * (1 + home_field_advantage)
+
+        return {
+            'probability': np.clip(adjusted_prob * 0.6, 0.05, 0.95),
+            'confidence': np.full(len(base_prob), 'medium'),
+            'model_version': np.full(len(base_prob), 'v1'),
+            'qb_td_per_game': qb_td_per_game,
+            'defense_tds_per_game': defense_tds,
+            'home_field_advantage': home_field_advantage,
+            'base_probability': base_prob,
+            'adjusted_probability': adjusted_prob,
+        }
+
+    def _v2_probability(self, qb_td_per_game, defense_tds, qb_games,
+                        is_home, is_division_game) -> Dict[str, np.ndarray]:
+        """Vectorized ProbabilityCalculator._calculate_advanced_probability"""
+        qb_vs_league = qb_td_per_game / self.league_average_tds
+        def_vs_league = defense_tds / self.league_average_tds
+        composite_score = qb_vs_league * 0.6 + def_vs_league * 0.4
+
+        probability = np.clip(1 / (1 + np.exp(-2 * (composite_score - 1.0))), 0.05, 0.95)
+        probability = np.where(is_home, probability * 1.1, probability)
+        probability = np.where(is_division_game, probability * 0.95, probability)
+        probability = np.clip(probability, 0.05, 0.95)
+
+        confidence = np.select([qb_games >= 8, qb_games >= 4], ['high', 'medium'], default='low')
+
+        return {
+            'probability': probability,
+            'confidence': confidence,
+            'model_version': np.full(len(probability), 'v2'),
+            'qb_td_per_game': qb_td_per_game,
+            'defense_tds_per_game': defense_tds,
+            'qb_vs_league': qb_vs_league,
+            'def_vs_league': def_vs_league,
+            'composite_score': composite_score,
+            'range_low': np.maximum(0.05, probability - 0.1),
+            'range_high': np.minimum(0.95, probability + 0.1),
+            'games_played': qb_games,
+        }
+
+
 class EdgeCalculator:
     """Main orchestrator for edge detection calculations"""
     
@@ -334,6 +477,7 @@ class EdgeCalculator:
         self.prob_calculator = ProbabilityCalculator(model_version)
         self.edge_detector = EdgeDetector()
         self.bet_recommender = BetRecommender()
+        self.engine = VectorizedEdgeEngine(model_version)
     
     def calculate_edge(self, qb_stats: Dict, defense_stats: Dict, odds: int,
                       matchup_context: Optional[Dict] = None) -> Dict:
@@ -369,13 +513,15 @@ class EdgeCalculator:
             'bet_recommendation': bet_recommendation
         }
     
-    def find_edges_for_week(self, week: int, threshold: float = 5.0) -> List[Dict]:
+    def find_edges_for_week(self, week: int, threshold: float = 5.0, context=None) -> List[Dict]:
         """
         Find all edge opportunities for a given week
         
         Args:
             week: NFL week number
             threshold: Minimum edge percentage to include
+            context: Optional StrategyContext; the week is then priced once
+                     per model version and shared with other strategies
             
         Returns:
             List of edge opportunities
@@ -383,65 +529,167 @@ class EdgeCalculator:
         edges = []
         
         try:
-            with DatabaseQueryTools(self.db_path) as db:
-                # Get QB vs Defense matchups
-                matchups = db.find_qb_defense_matchups(week)
-                
-                for _, matchup in matchups.iterrows():
-                    if pd.isna(matchup['home_qb_prop_odds']) or pd.isna(matchup['away_defense_tds_allowed']):
-                        continue
-                    
-                    # Prepare QB stats
-                    qb_stats = {
-                        'total_tds': matchup['home_qb_tds'],
-                        'games_played': matchup['home_qb_games']
-                    }
-                    
-                    # Prepare defense stats
-                    defense_stats = {
-                        'tds_per_game': matchup['away_defense_tds_allowed']
-                    }
-                    
-                    # Prepare matchup context
-                    matchup_context = {
-                        'is_home': True,  # QB is at home
-                        'is_division_game': False  # TODO: Add division detection
-                    }
-                    
-                    # Calculate edge
-                    edge_result = self.calculate_edge(
-                        qb_stats, defense_stats, 
-                        matchup['home_qb_prop_odds'], matchup_context
-                    )
-                    
-                    # Add matchup info
-                    # Convert game_date to string for JSON serialization
-                    game_date = matchup['game_date']
-                    if hasattr(game_date, 'strftime'):
-                        game_date = game_date.strftime('%Y-%m-%d')
-                    elif game_date is not None:
-                        game_date = str(game_date)
-
-                    edge_result.update({
-                        'qb_name': matchup['home_qb'],
-                        'qb_team': matchup['home_qb_team'],
-                        'opponent': matchup['away_team'],
-                        'sportsbook': matchup['prop_sportsbook'],
-                        'game_date': game_date
-                    })
-                    
-                    # Filter by threshold
-                    if edge_result['edge_percentage'] >= threshold:
-                        edges.append(edge_result)
-                
-                # Sort by edge percentage
-                edges.sort(key=lambda x: x['edge_percentage'], reverse=True)
+            priced = self.priced_week(week, context)
+            priced = priced[priced['edge_percentage'] >= threshold]
+            
+            # Sort by edge percentage (stable, so ties keep matchup order)
+            priced = priced.sort_values('edge_percentage', ascending=False, kind='stable')
+            
+            edges = [self._priced_row_to_edge(row) for row in priced.to_dict('records')]
                 
         except Exception as e:
             logger.error(f"Error finding edges for week {week}: {e}")
         
         return edges
     
+    def count_edges_for_week(self, week: int, threshold: float = 5.0, context=None) -> int:
+        """
+        Count edge opportunities without building edge dicts
+        
+        Args:
+            week: NFL week number
+            threshold: Minimum edge percentage to include
+            context: Optional StrategyContext shared with other strategies
+            
+        Returns:
+            Number of edges find_edges_for_week() would return
+        """
+        priced = self.priced_week(week, context)
+        return int((priced['edge_percentage'] >= threshold).sum())
+    
+    def priced_week(self, week: int, context=None) -> pd.DataFrame:
+        """
+        Priced FanDuel QB props for a week, computed once per context
+        
+        Args:
+            week: NFL week number
+            context: Optional StrategyContext
+            
+        Returns:
+            DataFrame from price_matchups()
+        """
+        if context is None:
+            return self.price_week(week)
+        
+        return context.load(
+            ('priced_qb_matchups', self.model_version),
+            lambda: self.price_matchups(context.qb_matchups())
+        )
+    
+    def price_week(self, week: int, sportsbook: Optional[str] = 'FanDuel') -> pd.DataFrame:
+        """
+        Price every QB prop for a week in one vectorized pass
+        
+        Args:
+            week: NFL week number
+            sportsbook: Sportsbook to price, or None for every sportsbook
+            
+        Returns:
+            DataFrame with one priced row per QB x sportsbook
+        """
+        with DatabaseQueryTools(self.db_path) as db:
+            matchups = db.find_qb_defense_matchups(week, sportsbook=sportsbook)
+        
+        return self.price_matchups(matchups)
+    
+    def price_weeks(self, weeks: List[int], sportsbook: Optional[str] = None) -> pd.DataFrame:
+        """
+        Price several weeks at once (e.g. for backtesting)
+        
+        Args:
+            weeks: NFL week numbers
+            sportsbook: Sportsbook to price, or None for every sportsbook
+            
+        Returns:
+            DataFrame with one priced row per week x QB x sportsbook
+        """
+        with DatabaseQueryTools(self.db_path) as db:
+            frames = [db.find_qb_defense_matchups(week, sportsbook=sportsbook) for week in weeks]
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return self.price_matchups(pd.DataFrame())
+        
+        return self.price_matchups(pd.concat(frames, ignore_index=True))
+    
+    def price_matchups(self, matchups: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the columnar engine over a matchup frame
+        
+        Args:
+            matchups: Output of DatabaseQueryTools.find_qb_defense_matchups
+            
+        Returns:
+            DataFrame with matchup info plus probability, edge and Kelly columns
+        """
+        info_columns = {
+            'home_qb': 'qb_name',
+            'home_qb_team': 'qb_team',
+            'away_team': 'opponent',
+            'prop_sportsbook': 'sportsbook',
+            'game_date': 'game_date',
+            'week': 'week'
+        }
+        
+        if matchups.empty:
+            return pd.DataFrame(columns=list(info_columns.values()) + ['edge_percentage'])
+        
+        # Rows without odds or opponent defense data can't be priced
+        matchups = matchups.dropna(subset=['home_qb_prop_odds', 'away_defense_tds_allowed'])
+        
+        priced = self.engine.price(
+            qb_tds=matchups['home_qb_tds'].to_numpy(dtype=float),
+            qb_games=matchups['home_qb_games'].to_numpy(dtype=float),
+            defense_tds=matchups['away_defense_tds_allowed'].to_numpy(dtype=float),
+            odds=matchups['home_qb_prop_odds'].to_numpy(dtype=float),
+            is_home=True,  # QB is at home
+            is_division_game=False  # TODO: Add division detection
+        )
+        
+        info = matchups[[c for c in info_columns if c in matchups.columns]].rename(columns=info_columns)
+        return pd.concat([priced, info.reset_index(drop=True)], axis=1)
+    
+    def _priced_row_to_edge(self, row: Dict) -> Dict:
+        """Convert a priced row back into the edge dict shape of calculate_edge()"""
+        if row['model_version'] == 'v1':
+            prob_keys = ['probability', 'confidence', 'model_version', 'qb_td_per_game',
+                         'defense_tds_per_game', 'home_field_advantage',
+                         'base_probability', 'adjusted_probability']
+        else:
+            prob_keys = ['probability', 'confidence', 'model_version', 'qb_td_per_game',
+                         'defense_tds_per_game', 'qb_vs_league', 'def_vs_league',
+                         'composite_score', 'range', 'games_played']
+            row['range'] = (row['range_low'], row['range_high'])
+        
+        edge_keys = ['true_probability', 'implied_probability', 'edge', 'edge_percentage',
+                     'odds', 'decimal_odds', 'is_positive_edge']
+        
+        edge = {key: row[key] for key in prob_keys + edge_keys}
+        edge['bet_recommendation'] = {
+            'tier': row['tier'],
+            'recommended_bet': row['recommended_bet'],
+            'kelly_fraction': row['kelly_fraction'],
+            'edge_percentage': row['edge_percentage'],
+            'confidence': 'medium',  # EdgeDetector output carries no confidence
+            'bankroll_percentage': row['bankroll_percentage']
+        }
+        
+        # Convert game_date to string for JSON serialization
+        game_date = row.get('game_date')
+        if hasattr(game_date, 'strftime'):
+            game_date = game_date.strftime('%Y-%m-%d')
+        elif game_date is not None:
+            game_date = str(game_date)
+        
+        edge.update({
+            'qb_name': row.get('qb_name'),
+            'qb_team': row.get('qb_team'),
+            'opponent': row.get('opponent'),
+            'sportsbook': row.get('sportsbook'),
+            'game_date': game_date
+        })
+        return edge
+    
     def calculate_edge_from_csv(self, qb_name: str, opponent: str, odds: int,
                                qb_stats_df: pd.DataFrame, defense_stats_df: pd.DataFrame,
                                matchup_context: Optional[Dict] = None) -> Dict:
@@ -0,0 +1,290 @@
+"""
+Record/replay HTTP response cache for the scrapers
+
+Modes:
+    live   - every request goes to the network (default, nothing stored)
+    record - serve fresh cached responses, fetch and store the rest
+    replay - serve only from the cache (any age); a miss raises ReplayMiss
+
+Responses are stored gzip-compressed under HTTP_CACHE_DIR, one file per
+request, keyed by method + URL + sorted query parameters. Credentials
+(apiKey) are left out of the key and never written to disk, so a recording
+replays regardless of which rotated key made the request. Freshness in
+record mode is decided by per-endpoint TTLs.
+
+Replay mode lets past weeks be re-parsed and the pipeline benchmarked
+offline without spending Odds API quota.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.http_client import HTTPClient, get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class CacheMode(str, Enum):
+    """How HTTPCache treats requests"""
+
+    LIVE = "live"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class ReplayMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no recorded response"""
+
+
+# Query parameters that identify the caller, not the resource
+SECRET_PARAMS = frozenset({'apiKey', 'api_key', 'apikey'})
+
+# Response headers kept with a recording (quota headers, content type, caching)
+STORED_HEADERS = ('content-type', 'etag', 'last-modified',
+                  'x-requests-remaining', 'x-requests-used', 'x-requests-last')
+
+# (pattern matched against host + path, TTL seconds); first match wins
+DEFAULT_TTLS: Tuple[Tuple[str, int], ...] = (
+    (r'/events/[^/]+/odds$', 15 * 60),           # player props move quickly
+    (r'/sports/[^/]+/odds$', 15 * 60),           # spreads / totals
+    (r'/sports/[^/]+/events$', 60 * 60),         # event list
+    (r'pro-football-reference\.com', 12 * 3600), # season stat tables
+    (r'espn\.com', 6 * 3600),                    # schedule / scoreboard
+)
+DEFAULT_TTL = 24 * 3600
+
+
+class HTTPCache:
+    """Transparent on-disk response cache with live/record/replay modes"""
+
+    def __init__(self, cache_dir, mode: str = CacheMode.LIVE,
+                 ttls: Sequence[Tuple[str, int]] = DEFAULT_TTLS,
+                 default_ttl: int = DEFAULT_TTL, client: Optional[HTTPClient] = None):
+        """
+        Initialize HTTP cache
+
+        Args:
+            cache_dir: Directory for recorded responses
+            mode: 'live', 'record' or 'replay'
+            ttls: (regex, seconds) rules matched against host + path
+            default_ttl: TTL for URLs no rule matches (seconds)
+            client: HTTP client for network requests (default: shared pooled client)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.mode = CacheMode(mode)
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.default_ttl = default_ttl
+        self.client = client or get_http_client()
+
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0}
+
+    def get(self, url: str, params: Optional[Dict] = None, delay: float = 0.0,
+            **kwargs) -> requests.Response:
+        """
+        GET through the cache
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            delay: Seconds to sleep before a network request (politeness delay;
+                   skipped for cache hits)
+            **kwargs: Passed to HTTPClient.get (headers, timeout, conditional, ...)
+
+        Returns:
+            Live or recorded response (recorded ones have from_cache=True)
+
+        Raises:
+            ReplayMiss: In replay mode when nothing was recorded for the request
+        """
+        response = self.lookup(url, params)
+        if response is not None:
+            return response
+
+        if delay:
+            time.sleep(delay)
+        return self.fetch(url, params, **kwargs)
+
+    def lookup(self, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """
+        Cached response for a request, if the current mode allows serving it
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Recorded response, or None if the request must go to the network
+
+        Raises:
+            ReplayMiss: In replay mode when nothing was recorded for the request
+        """
+        if self.mode == CacheMode.LIVE:
+            return None
+
+        canonical = self._canonical_url(url, params)
+        path = self._path(canonical)
+        entry = self._read(path)
+
+        if entry is not None and self.mode == CacheMode.RECORD:
+            meta, _ = entry
+            if time.time() - meta['stored_at'] > self._ttl(canonical):
+                entry = None
+
+        if entry is None:
+            self._count('misses')
+            if self.mode == CacheMode.REPLAY:
+                raise ReplayMiss(f"No recorded response for {canonical}")
+            return None
+
+        self._count('hits')
+        logger.debug(f"HTTP cache hit: {canonical}")
+        return self._to_response(*entry)
+
+    def fetch(self, url: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """
+        Make the request over the network, recording it in record mode
+
+        Only 200 responses are stored, so errors, rate limits and 304s are never replayed.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            **kwargs: Passed to HTTPClient.get (headers, timeout, conditional, retries, ...)
+
+        Raises:
+            ReplayMiss: In replay mode (the network is never used)
+        """
+        if self.mode == CacheMode.REPLAY:
+            raise ReplayMiss(f"Network disabled in replay mode: {self._canonical_url(url, params)}")
+
+        response = self.client.get(url, params=params, **kwargs)
+        response.from_cache = False
+
+        if self.mode == CacheMode.RECORD and response.status_code == 200:
+            self._store(self._canonical_url(url, params), response)
+
+        return response
+
+    def _store(self, canonical: str, response: requests.Response):
+        meta = {
+            'url': canonical,
+            'status': response.status_code,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() in STORED_HEADERS},
+            'encoding': response.encoding,
+            'stored_at': time.time(),
+        }
+
+        path = self._path(canonical)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        with gzip.open(tmp, 'wb') as f:
+            f.write(json.dumps(meta).encode() + b'\n')
+            f.write(response.content)
+        os.replace(tmp, path)
+
+        self._count('stores')
+
+    @staticmethod
+    def _read(path: Path):
+        try:
+            with gzip.open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable HTTP cache entry {path}: {e}")
+            return None
+
+        header, _, body = raw.partition(b'\n')
+        return json.loads(header), body
+
+    @staticmethod
+    def _to_response(meta: Dict, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = meta['status']
+        response._content = body
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = meta.get('encoding')
+        response.url = meta['url']
+        response.from_cache = True
+        return response
+
+    @staticmethod
+    def _canonical_url(url: str, params: Optional[Dict] = None) -> str:
+        """URL with merged, sorted query parameters and credentials removed"""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query += [(k, str(v)) for k, v in (params or {}).items() if v is not None]
+        query = sorted((k, v) for k, v in query if k not in SECRET_PARAMS)
+
+        canonical = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        return f"{canonical}?{urlencode(query)}" if query else canonical
+
+    def _path(self, canonical: str) -> Path:
+        digest = hashlib.sha256(f"GET {canonical}".encode()).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.gz"
+
+    def _ttl(self, canonical: str) -> int:
+        target = canonical.split('://', 1)[-1].split('?', 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(target):
+                return ttl
+        return self.default_ttl
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+_default_cache: Optional[HTTPCache] = None
+_default_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """
+    Process-wide cache configured from HTTP_CACHE_MODE / HTTP_CACHE_DIR
+
+    Returns:
+        Shared HTTPCache used by scrapers that aren't given one explicitly
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            from config import HTTP_CACHE_DIR, HTTP_CACHE_MODE
+            _default_cache = HTTPCache(HTTP_CACHE_DIR, HTTP_CACHE_MODE)
+        return _default_cache
+
+
+def configure_http_cache(mode: str, cache_dir=None) -> HTTPCache:
+    """
+    Replace the process-wide cache (e.g. from a --http-cache CLI flag)
+
+    Args:
+        mode: 'live', 'record' or 'replay'
+        cache_dir: Directory for recordings (default: HTTP_CACHE_DIR)
+
+    Returns:
+        The new shared HTTPCache
+    """
+    global _default_cache
+    if cache_dir is None:
+        from config import HTTP_CACHE_DIR
+        cache_dir = HTTP_CACHE_DIR
+
+    with _default_lock:
+        _default_cache = HTTPCache(cache_dir, mode)
+        logger.info(f"HTTP cache mode: {_default_cache.mode.value} ({cache_dir})")
+        return _default_cache
@@ -0,0 +1,232 @@
+"""
+Shared HTTP client for the scrapers
+
+One requests.Session per process with a keep-alive connection pool, gzip
+transfer encoding and jittered retries on 429/5xx and connection errors,
+so repeated requests to the same host reuse TCP/TLS connections instead
+of reconnecting every time.
+
+For hosts in HTTP_CONDITIONAL_HOSTS (Pro Football Reference) the client
+remembers each page's ETag / Last-Modified and, when the caller asks for
+it, sends If-None-Match / If-Modified-Since. A 304 Not Modified answer
+lets the scraper keep its previous output without downloading, parsing
+or re-inserting the page. Validators are kept in HTTP_VALIDATORS_PATH so
+they survive between runs.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BASE_DELAY,
+    HTTP_CONDITIONAL_HOSTS,
+    HTTP_VALIDATORS_PATH
+)
+from utils.rate_limiter import RETRYABLE_STATUS_CODES, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClient:
+    """Pooled, retrying HTTP client with conditional GET support"""
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE, max_retries: int = HTTP_MAX_RETRIES,
+                 retry_base_delay: float = HTTP_RETRY_BASE_DELAY,
+                 conditional_hosts: Sequence[str] = HTTP_CONDITIONAL_HOSTS,
+                 validators_path=HTTP_VALIDATORS_PATH):
+        """
+        Initialize HTTP client
+
+        Args:
+            pool_maxsize: Keep-alive connections kept per host
+            max_retries: Default retries on 429/5xx and connection errors
+            retry_base_delay: Base delay for full-jitter backoff (seconds)
+            conditional_hosts: Hosts whose ETag / Last-Modified are remembered
+            validators_path: JSON file validators persist to (None = memory only)
+        """
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.conditional_hosts = frozenset(conditional_hosts)
+        self.validators_path = Path(validators_path) if validators_path else None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+        self._lock = threading.Lock()
+        self._validators = self._load_validators()
+        self.stats = {
+            'requests': 0,           # network round trips (including retries)
+            'retries': 0,
+            'not_modified': 0,       # 304s: downloads (and re-parses) avoided
+            'bytes_received': 0,     # bytes on the wire (compressed when gzipped)
+            'bytes_saved': 0         # by gzip, plus the size of each page a 304 didn't resend
+        }
+
+    def get(self, url: str, params: Optional[Dict] = None, conditional: bool = False,
+            retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        GET over the pooled session
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            conditional: Send stored validators; an unchanged page answers 304
+                         with an empty body
+            retries: Retries on 429/5xx and connection errors (default: max_retries;
+                     0 for callers with their own retry policy)
+            **kwargs: Passed to Session.get (headers, timeout, ...)
+
+        Returns:
+            Response (the last one when retries run out)
+
+        Raises:
+            requests.exceptions.RequestException: Connection error after the final retry
+        """
+        retries = self.max_retries if retries is None else retries
+        key = self._validator_key(url)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        validator = self._validators.get(key) if conditional and key else None
+        if validator:
+            if validator.get('etag'):
+                headers['If-None-Match'] = validator['etag']
+            if validator.get('last_modified'):
+                headers['If-Modified-Since'] = validator['last_modified']
+
+        for attempt in range(retries + 1):
+            retries_left = attempt < retries
+            self._count('requests')
+
+            try:
+                response = self.session.get(url, params=params, headers=headers, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retries_left:
+                    raise
+                delay = backoff_delay(attempt, self.retry_base_delay)
+                logger.warning(f"⚠️  Request error ({e}), retry {attempt + 1}/{retries} in {delay:.2f}s")
+                self._count('retries')
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and retries_left:
+                delay = backoff_delay(attempt, self.retry_base_delay)
+                logger.warning(f"⚠️  HTTP {response.status_code}, retry {attempt + 1}/{retries} in {delay:.2f}s")
+                self._count('retries')
+                time.sleep(delay)
+                continue
+
+            break
+
+        self._account(response, validator)
+        if key and response.status_code == 200:
+            self._remember(key, response)
+        return response
+
+    def forget(self, url: str):
+        """Drop a page's validators (e.g. when its content could not be used)"""
+        key = self._validator_key(url)
+        with self._lock:
+            if self._validators.pop(key, None) is not None:
+                self._save_validators()
+
+    def _validator_key(self, url: str) -> Optional[str]:
+        """Validator key for URLs on conditional hosts, else None"""
+        parts = urlsplit(url)
+        if parts.netloc not in self.conditional_hosts:
+            return None
+        return f"{parts.netloc}{parts.path}?{parts.query}" if parts.query else f"{parts.netloc}{parts.path}"
+
+    def _account(self, response: requests.Response, validator: Optional[Dict]):
+        """Update the byte and 304 counters for a response"""
+        if response.status_code == 304:
+            with self._lock:
+                self.stats['not_modified'] += 1
+                self.stats['bytes_saved'] += (validator or {}).get('size', 0)
+            return
+
+        size = len(response.content)
+        try:
+            wire = int(response.headers['Content-Length']) if response.headers.get('Content-Encoding') else size
+        except (KeyError, ValueError):
+            wire = size
+        with self._lock:
+            self.stats['bytes_received'] += wire
+            self.stats['bytes_saved'] += max(size - wire, 0)
+
+    def _remember(self, key: str, response: requests.Response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._validators[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': len(response.content)
+            }
+            self._save_validators()
+
+    def _load_validators(self) -> Dict[str, Dict]:
+        if self.validators_path is None:
+            return {}
+        try:
+            with open(self.validators_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable HTTP validators file {self.validators_path}: {e}")
+            return {}
+
+    def _save_validators(self):
+        """Write validators atomically (caller holds the lock)"""
+        if self.validators_path is None:
+            return
+        try:
+            self.validators_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.validators_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self._validators, f, indent=2)
+            os.replace(tmp, self.validators_path)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not save HTTP validators: {e}")
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+
+_default_client: Optional[HTTPClient] = None
+_default_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Process-wide HTTP client
+
+    Returns:
+        Shared HTTPClient used by HTTPCache instances that aren't given one explicitly
+    """
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
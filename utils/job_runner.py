@@ -0,0 +1,279 @@
+"""
+In-process job runner for the schedulers
+
+Scheduled work runs on a bounded thread pool inside the long-lived
+scheduler process instead of spawning a fresh interpreter per run, so
+imports, pooled database connections and other warm state carry over
+between jobs. A job that is still queued or running is not queued again
+under the same name (a slow run never stacks up behind itself).
+
+Jobs run on a second pool of long-lived worker threads while the queue
+thread waits for them up to the job's deadline. Python threads cannot be
+killed, so a job that overruns is recorded as 'timeout' and left to finish
+on its worker; further runs of that job are skipped until it does, so two
+runs of one job never write at once.
+
+Every run is recorded in the job_runs table: start and finish time,
+duration, process peak RSS (and how much the job raised it) and outcome.
+"""
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from config import SCHEDULER_JOB_TIMEOUT, SCHEDULER_MAX_JOBS
+from utils.connection_pool import get_connection_pool, transaction
+from utils.scheduler_lock import SchedulerLock
+
+logger = logging.getLogger(__name__)
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process so far, in MB
+
+    Read from getrusage (no allocation tracing overhead). Returns 0.0 where
+    the resource module is unavailable.
+    """
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 2)
+
+
+class JobRunner:
+    """Bounded in-process job queue with a SQLite run history"""
+
+    def __init__(self, max_workers: int = SCHEDULER_MAX_JOBS, db_path=None,
+                 lock: Optional[SchedulerLock] = None,
+                 job_timeout: Optional[float] = SCHEDULER_JOB_TIMEOUT):
+        """
+        Initialize job runner
+
+        Args:
+            max_workers: Jobs running at once (further jobs wait in the queue)
+            db_path: Path to SQLite database for job_runs (default: config database path)
+            lock: Scheduler lock held while the runner is open (prevents a second
+                  scheduler instance running the same jobs)
+            job_timeout: Seconds a job may run before it is recorded as 'timeout'
+                         (None = no deadline)
+        """
+        if db_path is None:
+            from config import get_database_path
+            db_path = get_database_path()
+
+        self.db_path = Path(db_path)
+        self.pool = get_connection_pool(self.db_path)
+        self.lock = lock
+        # Queue threads enforce deadlines and record runs; job bodies run on the
+        # worker threads, which live as long as the runner so connections carry over
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job")
+        self._workers = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job-worker")
+        self._jobs: Dict[str, Future] = {}
+        self._jobs_lock = threading.Lock()
+        self.job_timeout = job_timeout
+        # Job name -> future of a run that overran its deadline
+        self._overrunning: Dict[str, Future] = {}
+        self._table_ready = False
+
+    def start(self) -> bool:
+        """
+        Acquire the scheduler lock (if any)
+
+        Returns:
+            True if this runner may run jobs, False if another scheduler holds the lock
+        """
+        return self.lock is None or self.lock.acquire()
+
+    def close(self):
+        """Wait for queued and running jobs, then release the lock"""
+        try:
+            self.shutdown()
+        finally:
+            if self.lock is not None:
+                self.lock.release()
+
+    def __enter__(self):
+        """Context manager entry"""
+        if not self.start():
+            raise RuntimeError("Failed to acquire scheduler lock")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    def submit(self, name: str, func: Callable, *args, **kwargs) -> Optional[Future]:
+        """
+        Queue a job
+
+        Args:
+            name: Job name (recorded in job_runs; one queued/running job per name)
+            func: Callable to run; returning False marks the run as failed
+            *args, **kwargs: Passed to func
+
+        Returns:
+            Future resolving to the run record, or None if a job with this
+            name is already queued or running (including a run that overran
+            its deadline and has not finished)
+        """
+        with self._jobs_lock:
+            current = self._jobs.get(name)
+            if current is not None and not current.done():
+                logger.warning(f"⚠️  Job {name} is still running, not queuing another")
+                return None
+            overrunning = self._overrunning.get(name)
+            if overrunning is not None and not overrunning.done():
+                logger.warning(f"⚠️  Job {name} timed out earlier and is still running, not starting another")
+                return None
+            future = self.executor.submit(self._execute, name, func, args, kwargs)
+            self._jobs[name] = future
+            return future
+
+    def run(self, name: str, func: Callable, *args, **kwargs) -> Optional[Dict]:
+        """
+        Queue a job and wait for it
+
+        Returns:
+            Run record, or None if a job with this name was already running
+        """
+        future = self.submit(name, func, *args, **kwargs)
+        return future.result() if future else None
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs (waits for queued and running jobs by default)"""
+        self.executor.shutdown(wait=wait)
+        # Runs past their deadline are not waited for here
+        with self._jobs_lock:
+            overrunning = any(not future.done() for future in self._overrunning.values())
+        self._workers.shutdown(wait=wait and not overrunning)
+
+    def _execute(self, name: str, func: Callable, args, kwargs) -> Dict:
+        """Run one job on a worker thread, wait up to the deadline and record it"""
+        started = threading.Event()
+
+        def target():
+            started.set()
+            return func(*args, **kwargs)
+
+        job = self._workers.submit(target)
+        # The deadline counts from when a worker picks the job up
+        while not started.wait(1) and not job.done():
+            pass
+
+        started_at = datetime.now()
+        start = time.perf_counter()
+        rss_before = peak_rss_mb()
+        error_message = None
+
+        done, _ = wait_for([job], timeout=self.job_timeout)
+        if not done:
+            status = 'timeout'
+            error_message = f"exceeded {self.job_timeout:.0f}s deadline"
+            logger.error(f"✗ Job {name} {error_message}; leaving it to finish in the background")
+            with self._jobs_lock:
+                self._overrunning[name] = job
+        elif job.exception() is not None:
+            logger.error(f"✗ Job {name} raised: {job.exception()}")
+            status = 'error'
+            error_message = str(job.exception())
+        else:
+            status = 'failed' if job.result() is False else 'success'
+
+        peak_memory_mb = peak_rss_mb()
+        record = {
+            'job_name': name,
+            'status': status,
+            'started_at': started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'elapsed_seconds': round(time.perf_counter() - start, 3),
+            'peak_memory_mb': peak_memory_mb,
+            'rss_growth_mb': round(max(0.0, peak_memory_mb - rss_before), 2),
+            'error_message': error_message
+        }
+
+        symbol = '✓' if status == 'success' else '✗'
+        logger.info(f"{symbol} Job {name} {status} in {record['elapsed_seconds']:.1f}s "
+                    f"(peak RSS {peak_memory_mb:.1f} MB, +{record['rss_growth_mb']:.1f} MB)")
+
+        try:
+            self._record(record)
+        except Exception as e:
+            logger.error(f"✗ Error recording job run: {e}")
+
+        return record
+
+    def _connection(self):
+        conn = self.pool.writer()
+        if not self._table_ready:
+            self._ensure_table(conn)
+            self._table_ready = True
+        return conn
+
+    def _ensure_table(self, conn):
+        """Create the run-history table if needed"""
+        with transaction(conn):
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    started_at TIMESTAMP NOT NULL,
+                    finished_at TIMESTAMP,
+                    elapsed_seconds REAL,
+                    peak_memory_mb REAL,
+                    rss_growth_mb REAL,
+                    error_message TEXT
+                )
+            """)
+            # Tables created before rss_growth_mb existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(job_runs)")}
+            if 'rss_growth_mb' not in columns:
+                conn.execute("ALTER TABLE job_runs ADD COLUMN rss_growth_mb REAL")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_job_runs_name ON job_runs(job_name, started_at)")
+
+    def _record(self, record: Dict):
+        conn = self._connection()
+        with transaction(conn):
+            conn.execute("""
+                INSERT INTO job_runs
+                    (job_name, status, started_at, finished_at, elapsed_seconds, peak_memory_mb,
+                     rss_growth_mb, error_message)
+                VALUES (:job_name, :status, :started_at, :finished_at, :elapsed_seconds, :peak_memory_mb,
+                        :rss_growth_mb, :error_message)
+            """, record)
+
+    def history(self, name: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Most recent job runs
+
+        Args:
+            name: Only runs of this job (default: all jobs)
+            limit: Maximum rows
+
+        Returns:
+            Run records, newest first
+        """
+        conn = self._connection()
+        query = "SELECT * FROM job_runs"
+        params = []
+        if name is not None:
+            query += " WHERE job_name = ?"
+            params.append(name)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        cursor = conn.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -18,31 +18,104 @@ import logging
 import sys
 import os
 import json
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.connection_pool import get_connection_pool, transaction
 from utils.query_tools import DatabaseQueryTools
-from config import get_database_path, get_historical_dir
+from config import (
+    get_database_path,
+    get_historical_dir,
+    CALIBRATION_BOOTSTRAP_RESAMPLES,
+    CALIBRATION_CONFIDENCE_LEVEL,
+    CALIBRATION_MAX_WORKERS,
+    CALIBRATION_PARALLEL_MIN_WORK,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class OutcomeTracker:
-    """Tracks actual game outcomes for model calibration"""
-    
-    def __init__(self, db_path: Optional[Path] = None):
+    """Tracks actual game outcomes for model calibration
+
+    Predictions live in the model_predictions table (one row per prediction,
+    indexed by week and by completion time), so recording a prediction or an
+    outcome is a single indexed write instead of rewriting a weekly JSON file.
+    History from the old predictions_week_N.json files is imported the first
+    time the table is created (see import_json_history).
+    """
+
+    # Columns in the order predictions are returned as dicts
+    COLUMNS = ['prediction_id', 'week', 'qb_name', 'team', 'opponent', 'predicted_probability',
+               'odds', 'model_version', 'confidence', 'predicted_at', 'outcome_recorded',
+               'actual_outcome', 'outcome_recorded_at']
+
+    def __init__(self, db_path: Optional[Path] = None, outcomes_dir: Optional[Path] = None):
         """
         Initialize outcome tracker
         
         Args:
             db_path: Path to database
+            outcomes_dir: Directory of legacy predictions_week_N.json files and
+                          exported reports (default: historical/outcomes)
         """
         self.db_path = db_path or get_database_path()
         self.historical_dir = get_historical_dir()
-        self.outcomes_dir = self.historical_dir / "outcomes"
+        self.outcomes_dir = Path(outcomes_dir) if outcomes_dir else self.historical_dir / "outcomes"
         self.outcomes_dir.mkdir(parents=True, exist_ok=True)
-    
+        self.pool = get_connection_pool(self.db_path)
+        self._table_ready = False
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = self.pool.writer()
+        if not self._table_ready:
+            with self._lock:
+                if not self._table_ready:
+                    if self._ensure_table(conn):
+                        self.import_json_history()
+                    self._table_ready = True
+        return conn
+
+    def _read_connection(self):
+        self._connection()
+        return self.pool.reader()
+
+    def _ensure_table(self, conn) -> bool:
+        """Create the predictions table if needed; True if it was just created"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'model_predictions'"
+        ).fetchone()
+        with transaction(conn):
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS model_predictions (
+                    prediction_id TEXT PRIMARY KEY,
+                    week INTEGER NOT NULL,
+                    qb_name TEXT NOT NULL,
+                    team TEXT,
+                    opponent TEXT,
+                    predicted_probability REAL NOT NULL,
+                    odds INTEGER,
+                    model_version TEXT,
+                    confidence TEXT,
+                    predicted_at TEXT NOT NULL,
+                    outcome_recorded INTEGER NOT NULL DEFAULT 0,
+                    actual_outcome INTEGER,
+                    outcome_recorded_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_week ON model_predictions (week)")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_predictions_completed
+                ON model_predictions (outcome_recorded, predicted_at)
+            """)
+        return exists is None
+
     def record_prediction(self, week: int, qb_name: str, team: str, opponent: str,
                         predicted_prob: float, odds: int, model_version: str,
                         confidence: str = "medium") -> str:
@@ -62,45 +135,63 @@ class OutcomeTracker:
         Returns:
             Prediction ID for tracking
         """
-        prediction_id = f"{week}_{qb_name}_{team}_{opponent}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        prediction = {
-            'prediction_id': prediction_id,
-            'week': week,
-            'qb_name': qb_name,
-            'team': team,
-            'opponent': opponent,
-            'predicted_probability': predicted_prob,
-            'odds': odds,
-            'model_version': model_version,
+        prediction_id = self.record_predictions([{
+            'week': week, 'qb_name': qb_name, 'team': team, 'opponent': opponent,
+            'predicted_prob': predicted_prob, 'odds': odds, 'model_version': model_version,
             'confidence': confidence,
-            'predicted_at': datetime.now().isoformat(),
-            'outcome_recorded': False,
-            'actual_outcome': None,
-            'outcome_recorded_at': None
-        }
-        
-        # Save to weekly predictions file
-        predictions_file = self.outcomes_dir / f"predictions_week_{week}.json"
-        
-        # Load existing predictions
-        predictions = []
-        if predictions_file.exists():
-            try:
-                with open(predictions_file, 'r') as f:
-                    predictions = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                predictions = []
-        
-        # Add new prediction
-        predictions.append(prediction)
-        
-        # Save updated predictions
-        with open(predictions_file, 'w') as f:
-            json.dump(predictions, f, indent=2)
-        
+        }])[0]
         logger.info(f"Recorded prediction: {prediction_id}")
         return prediction_id
+
+    def record_predictions(self, predictions: List[Dict]) -> List[str]:
+        """
+        Record many predictions in one transaction
+        
+        Args:
+            predictions: Dicts with the record_prediction arguments (week, qb_name,
+                         team, opponent, predicted_prob, odds, model_version and
+                         optionally confidence)
+            
+        Returns:
+            Prediction IDs, in input order (one per prediction, all distinct)
+        """
+        now = datetime.now()
+        stamp, predicted_at = now.strftime('%Y%m%d_%H%M%S'), now.isoformat()
+
+        rows = []
+        seen = Counter()
+        for pred in predictions:
+            prediction_id = (f"{pred['week']}_{pred['qb_name']}_{pred['team']}_{pred['opponent']}_"
+                             f"{pred['model_version']}_{stamp}")
+            # Repeats within one batch are separate predictions, as in the JSON files
+            seen[prediction_id] += 1
+            if seen[prediction_id] > 1:
+                prediction_id += f"_{seen[prediction_id]}"
+            rows.append((
+                prediction_id, pred['week'], pred['qb_name'], pred['team'], pred['opponent'],
+                pred['predicted_prob'], pred['odds'], pred['model_version'],
+                pred.get('confidence', 'medium'), predicted_at,
+            ))
+
+        # Re-recording the same matchup and model version within the same second
+        # (a separate call) replaces the prediction but keeps any outcome already
+        # recorded for it
+        conn = self._connection()
+        with transaction(conn):
+            conn.executemany("""
+                INSERT INTO model_predictions
+                    (prediction_id, week, qb_name, team, opponent, predicted_probability,
+                     odds, model_version, confidence, predicted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(prediction_id) DO UPDATE SET
+                    predicted_probability = excluded.predicted_probability,
+                    odds = excluded.odds,
+                    model_version = excluded.model_version,
+                    confidence = excluded.confidence,
+                    predicted_at = excluded.predicted_at
+            """, rows)
+
+        return [row[0] for row in rows]
     
     def record_outcome(self, prediction_id: str, actual_outcome: bool) -> bool:
         """
@@ -113,31 +204,33 @@ class OutcomeTracker:
         Returns:
             True if successfully recorded
         """
-        # Find prediction in all weekly files
-        for week_file in self.outcomes_dir.glob("predictions_week_*.json"):
-            try:
-                with open(week_file, 'r') as f:
-                    predictions = json.load(f)
-                
-                # Find and update prediction
-                for i, pred in enumerate(predictions):
-                    if pred['prediction_id'] == prediction_id:
-                        predictions[i]['outcome_recorded'] = True
-                        predictions[i]['actual_outcome'] = actual_outcome
-                        predictions[i]['outcome_recorded_at'] = datetime.now().isoformat()
-                        
-                        # Save updated predictions
-                        with open(week_file, 'w') as f:
-                            json.dump(predictions, f, indent=2)
-                        
-                        logger.info(f"Recorded outcome for {prediction_id}: {actual_outcome}")
-                        return True
-                        
-            except (json.JSONDecodeError, FileNotFoundError):
-                continue
-        
+        if self.record_outcomes({prediction_id: actual_outcome}):
+            logger.info(f"Recorded outcome for {prediction_id}: {actual_outcome}")
+            return True
+
         logger.warning(f"Prediction not found: {prediction_id}")
         return False
+
+    def record_outcomes(self, outcomes: Dict[str, bool]) -> int:
+        """
+        Record outcomes for many predictions in one transaction
+        
+        Args:
+            outcomes: Prediction ID -> actual outcome
+            
+        Returns:
+            Number of predictions updated (unknown IDs are skipped)
+        """
+        recorded_at = datetime.now().isoformat()
+        conn = self._connection()
+        with transaction(conn):
+            before = conn.total_changes
+            conn.executemany("""
+                UPDATE model_predictions
+                SET outcome_recorded = 1, actual_outcome = ?, outcome_recorded_at = ?
+                WHERE prediction_id = ?
+            """, [(bool(outcome), recorded_at, prediction_id) for prediction_id, outcome in outcomes.items()])
+            return conn.total_changes - before
     
     def get_predictions_for_week(self, week: int) -> List[Dict]:
         """
@@ -149,16 +242,7 @@ class OutcomeTracker:
         Returns:
             List of predictions
         """
-        predictions_file = self.outcomes_dir / f"predictions_week_{week}.json"
-        
-        if not predictions_file.exists():
-            return []
-        
-        try:
-            with open(predictions_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        return self._query("WHERE week = ? ORDER BY predicted_at, rowid", (week,))
     
     def get_completed_predictions(self, weeks_back: int = 4) -> List[Dict]:
         """
@@ -168,36 +252,165 @@ class OutcomeTracker:
             weeks_back: Number of weeks to look back
             
         Returns:
-            List of completed predictions
+            List of completed predictions, most recent first
+        """
+        # Assume max 10 predictions per week
+        return self._query("WHERE outcome_recorded = 1 ORDER BY predicted_at DESC LIMIT ?", (weeks_back * 10,))
+
+    def _query(self, clause: str, params: Tuple) -> List[Dict]:
+        rows = self._read_connection().execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM model_predictions {clause}", params
+        ).fetchall()
+
+        predictions = []
+        for row in rows:
+            pred = dict(zip(self.COLUMNS, row))
+            pred['outcome_recorded'] = bool(pred['outcome_recorded'])
+            if pred['actual_outcome'] is not None:
+                pred['actual_outcome'] = bool(pred['actual_outcome'])
+            predictions.append(pred)
+        return predictions
+
+    def import_json_history(self, outcomes_dir: Optional[Path] = None) -> int:
         """
-        completed = []
+        Import predictions from the legacy predictions_week_N.json files
+        
+        Safe to run repeatedly: predictions already in the table are left as
+        they are. The JSON files are not modified.
         
-        for week_file in self.outcomes_dir.glob("predictions_week_*.json"):
+        Args:
+            outcomes_dir: Directory holding the files (default: self.outcomes_dir)
+            
+        Returns:
+            Number of predictions imported
+        """
+        rows = []
+        for week_file in sorted(Path(outcomes_dir or self.outcomes_dir).glob("predictions_week_*.json")):
             try:
                 with open(week_file, 'r') as f:
                     predictions = json.load(f)
-                
-                # Filter for completed predictions
-                week_completed = [
-                    pred for pred in predictions 
-                    if pred.get('outcome_recorded', False)
-                ]
-                completed.extend(week_completed)
-                
-            except (json.JSONDecodeError, FileNotFoundError):
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                logger.warning(f"Skipping {week_file.name}: {e}")
                 continue
-        
-        # Sort by prediction date and limit to recent weeks
-        completed.sort(key=lambda x: x['predicted_at'], reverse=True)
-        return completed[:weeks_back * 10]  # Assume max 10 predictions per week
+
+            for pred in predictions:
+                actual = pred.get('actual_outcome')
+                rows.append((
+                    pred['prediction_id'], pred['week'], pred['qb_name'], pred.get('team'),
+                    pred.get('opponent'), pred['predicted_probability'], pred.get('odds'),
+                    pred.get('model_version'), pred.get('confidence'), pred['predicted_at'],
+                    bool(pred.get('outcome_recorded', False)),
+                    None if actual is None else bool(actual),
+                    pred.get('outcome_recorded_at'),
+                ))
+
+        if not rows:
+            return 0
+
+        conn = self.pool.writer()
+        self._ensure_table(conn)
+        with transaction(conn):
+            before = conn.total_changes
+            conn.executemany(f"""
+                INSERT OR IGNORE INTO model_predictions ({', '.join(self.COLUMNS)})
+                VALUES ({', '.join('?' * len(self.COLUMNS))})
+            """, rows)
+            imported = conn.total_changes - before
+
+        logger.info(f"✓ Imported {imported} predictions from JSON history ({len(rows)} found)")
+        return imported
+
+
+def _prediction_arrays(predictions: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Predicted probabilities, outcomes (0/1) and American odds as arrays"""
+    probs = np.fromiter((pred['predicted_probability'] for pred in predictions), dtype=float, count=len(predictions))
+    outcomes = np.fromiter((1.0 if pred['actual_outcome'] else 0.0 for pred in predictions),
+                           dtype=float, count=len(predictions))
+    odds = np.fromiter((pred['odds'] for pred in predictions), dtype=float, count=len(predictions))
+    return probs, outcomes, odds
+
+
+def _kelly_stakes(probs: np.ndarray, odds: np.ndarray, bankroll: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Quarter-Kelly stake (capped at 5% of bankroll) and decimal odds per prediction"""
+    # Convert American odds to decimal
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decimal_odds = np.where(odds < 0, 100 / np.abs(odds) + 1, odds / 100 + 1)
+        b = decimal_odds - 1
+        kelly = (b * probs - (1 - probs)) / b
+    kelly_fraction = np.clip(np.nan_to_num(kelly * 0.25, nan=0.0, posinf=0.0, neginf=0.0), 0, 0.05)
+    return bankroll * kelly_fraction, decimal_odds
+
+
+def _bin_index(probs: np.ndarray, bins: int) -> np.ndarray:
+    """Probability bin per prediction (bin_min <= p < bin_max); `bins` for p outside [0, 1)"""
+    index = np.digitize(probs, np.linspace(0, 1, bins + 1)) - 1
+    return np.where((index >= 0) & (index < bins), index, bins)
+
+
+def _bootstrap_metrics(probs: np.ndarray, outcomes: np.ndarray, bets: np.ndarray, winnings: np.ndarray,
+                       bin_index: np.ndarray, bins: int, n_resamples: int, seed) -> np.ndarray:
+    """
+    Brier score, calibration error and ROI for n_resamples bootstrap resamples
+
+    Runs in worker processes, so it takes plain arrays. Resamples are drawn
+    in blocks to bound memory.
+
+    Returns:
+        Array of shape (n_resamples, 3)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(probs)
+    centers = (np.linspace(0, 1, bins + 1)[:-1] + np.linspace(0, 1, bins + 1)[1:]) / 2
+    block = max(1, 2_000_000 // max(n, 1))
+    results = np.empty((n_resamples, 3))
+
+    for start in range(0, n_resamples, block):
+        rows = min(block, n_resamples - start)
+        sample = rng.integers(0, n, size=(rows, n))
+
+        results[start:start + rows, 0] = ((probs[sample] - outcomes[sample]) ** 2).mean(axis=1)
+
+        # Per-row bin counts / successes via one bincount over row-offset bins
+        flat = (bin_index[sample] + np.arange(rows)[:, None] * (bins + 1)).ravel()
+        counts = np.bincount(flat, minlength=rows * (bins + 1)).reshape(rows, bins + 1)[:, :bins]
+        successes = np.bincount(flat, weights=outcomes[sample].ravel(),
+                                minlength=rows * (bins + 1)).reshape(rows, bins + 1)[:, :bins]
+        results[start:start + rows, 1] = np.abs(centers * counts - successes).sum(axis=1) / n
+
+        total_bet = bets[sample].sum(axis=1)
+        total_winnings = winnings[sample].sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            results[start:start + rows, 2] = np.where(total_bet > 0, total_winnings / total_bet * 100, 0.0)
+
+    return results
 
 
 class PerformanceAnalyzer:
     """Analyzes model performance metrics"""
-    
-    def __init__(self):
-        """Initialize performance analyzer"""
-        pass
+
+    METRICS = ('brier_score', 'calibration_error', 'roi')
+
+    # Resamples per task; fixed so a seed gives the same intervals for any worker count
+    BOOTSTRAP_CHUNK = 50
+
+    def __init__(self, n_resamples: int = CALIBRATION_BOOTSTRAP_RESAMPLES,
+                 confidence_level: float = CALIBRATION_CONFIDENCE_LEVEL,
+                 max_workers: int = CALIBRATION_MAX_WORKERS,
+                 parallel_min_work: int = CALIBRATION_PARALLEL_MIN_WORK):
+        """
+        Initialize performance analyzer
+
+        Args:
+            n_resamples: Bootstrap resamples per confidence interval
+            confidence_level: Width of the confidence intervals (e.g. 0.95)
+            max_workers: Processes used for bootstrap resampling (capped at the CPU count)
+            parallel_min_work: Resamples x predictions below which resampling
+                               runs in-process (a pool costs more than it saves)
+        """
+        self.n_resamples = n_resamples
+        self.confidence_level = confidence_level
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self.parallel_min_work = parallel_min_work
     
     def calculate_brier_score(self, predictions: List[Dict]) -> float:
         """
@@ -211,19 +424,10 @@ class PerformanceAnalyzer:
         """
         if not predictions:
             return 0.0
-        
-        total_score = 0.0
-        
-        for pred in predictions:
-            predicted_prob = pred['predicted_probability']
-            actual_outcome = pred['actual_outcome']
-            
-            # Brier score: (predicted_prob - actual_outcome)^2
-            actual_value = 1.0 if actual_outcome else 0.0
-            score = (predicted_prob - actual_value) ** 2
-            total_score += score
-        
-        return total_score / len(predictions)
+
+        probs, outcomes, _ = _prediction_arrays(predictions)
+        # Brier score: mean of (predicted_prob - actual_outcome)^2
+        return float(np.mean((probs - outcomes) ** 2))
     
     def calculate_calibration_error(self, predictions: List[Dict], bins: int = 10) -> Dict:
         """
@@ -242,55 +446,33 @@ class PerformanceAnalyzer:
         # Create probability bins
         bin_edges = np.linspace(0, 1, bins + 1)
         bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-        
-        bin_stats = []
-        total_error = 0.0
-        
-        for i in range(bins):
-            bin_min, bin_max = bin_edges[i], bin_edges[i + 1]
-            
-            # Find predictions in this bin
-            bin_predictions = [
-                pred for pred in predictions
-                if bin_min <= pred['predicted_probability'] < bin_max
-            ]
-            
-            if not bin_predictions:
-                bin_stats.append({
-                    'bin_min': bin_min,
-                    'bin_max': bin_max,
-                    'bin_center': bin_centers[i],
-                    'count': 0,
-                    'predicted_prob': bin_centers[i],
-                    'actual_rate': 0.0,
-                    'error': 0.0
-                })
-                continue
-            
-            # Calculate actual success rate
-            successes = sum(1 for pred in bin_predictions if pred['actual_outcome'])
-            actual_rate = successes / len(bin_predictions)
-            
-            # Calculate error
-            predicted_prob = bin_centers[i]
-            error = abs(predicted_prob - actual_rate)
-            total_error += error * len(bin_predictions)
-            
-            bin_stats.append({
-                'bin_min': bin_min,
-                'bin_max': bin_max,
+
+        # One pass: bin every prediction, then count predictions / successes per bin
+        probs, outcomes, _ = _prediction_arrays(predictions)
+        bin_index = _bin_index(probs, bins)
+        counts = np.bincount(bin_index, minlength=bins + 1)[:bins]
+        successes = np.bincount(bin_index, weights=outcomes, minlength=bins + 1)[:bins]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            actual_rates = np.where(counts > 0, successes / counts, 0.0)
+        errors = np.where(counts > 0, np.abs(bin_centers - actual_rates), 0.0)
+
+        bin_stats = [
+            {
+                'bin_min': bin_edges[i],
+                'bin_max': bin_edges[i + 1],
                 'bin_center': bin_centers[i],
-                'count': len(bin_predictions),
-                'predicted_prob': predicted_prob,
-                'actual_rate': actual_rate,
-                'error': error
-            })
-        
-        avg_error = total_error / len(predictions) if predictions else 0.0
+                'count': int(counts[i]),
+                'predicted_prob': bin_centers[i],
+                'actual_rate': float(actual_rates[i]),
+                'error': float(errors[i])
+            }
+            for i in range(bins)
+        ]
         
         return {
             'bins': bin_stats,
-            'calibration_error': avg_error,
+            'calibration_error': float((errors * counts).sum() / len(predictions)),
             'total_predictions': len(predictions)
         }
     
@@ -307,38 +489,12 @@ class PerformanceAnalyzer:
         """
         if not predictions:
             return {'total_bets': 0, 'total_winnings': 0, 'roi': 0.0}
-        
-        total_bet = 0.0
-        total_winnings = 0.0
-        
-        for pred in predictions:
-            # Calculate bet amount using Kelly Criterion
-            predicted_prob = pred['predicted_probability']
-            odds = pred['odds']
-            
-            # Convert American odds to decimal
-            if odds < 0:
-                decimal_odds = (100 / abs(odds)) + 1
-            else:
-                decimal_odds = (odds / 100) + 1
-            
-            # Kelly fraction calculation
-            b = decimal_odds - 1
-            p = predicted_prob
-            q = 1 - p
-            
-            kelly = (b * p - q) / b
-            kelly_fraction = max(0, kelly * 0.25)  # 25% Kelly
-            kelly_fraction = min(kelly_fraction, 0.05)  # Cap at 5%
-            
-            bet_amount = bankroll * kelly_fraction
-            total_bet += bet_amount
-            
-            # Calculate winnings
-            if pred['actual_outcome']:
-                winnings = bet_amount * (decimal_odds - 1)
-                total_winnings += winnings
-        
+
+        probs, outcomes, odds = _prediction_arrays(predictions)
+        bets, decimal_odds = _kelly_stakes(probs, odds, bankroll)
+
+        total_bet = float(bets.sum())
+        total_winnings = float((bets * (decimal_odds - 1) * outcomes).sum())
         roi = (total_winnings / total_bet) * 100 if total_bet > 0 else 0.0
         
         return {
@@ -349,6 +505,60 @@ class PerformanceAnalyzer:
             'num_predictions': len(predictions)
         }
 
+    def bootstrap_confidence_intervals(self, predictions: List[Dict], bins: int = 10,
+                                       bankroll: float = 1000, seed: Optional[int] = None) -> Dict:
+        """
+        Bootstrap confidence intervals for Brier score, calibration error and ROI
+
+        Resamples the predictions with replacement n_resamples times and takes
+        percentile intervals. Large jobs are split across a process pool, each
+        worker with its own independent random stream.
+
+        Args:
+            predictions: List of completed predictions
+            bins: Number of probability bins for calibration error
+            bankroll: Starting bankroll amount for ROI
+            seed: Random seed (same seed -> same intervals, whatever the worker count)
+
+        Returns:
+            Dictionary mapping metric -> {'lower', 'upper'}, plus 'confidence_level'
+            and 'n_resamples'; empty if there are no predictions
+        """
+        if not predictions:
+            return {}
+
+        probs, outcomes, odds = _prediction_arrays(predictions)
+        bets, decimal_odds = _kelly_stakes(probs, odds, bankroll)
+        arrays = (probs, outcomes, bets, bets * (decimal_odds - 1) * outcomes, _bin_index(probs, bins), bins)
+
+        # Fixed-size chunks, each with its own spawned seed
+        chunk = self.BOOTSTRAP_CHUNK
+        sizes = [min(chunk, self.n_resamples - start) for start in range(0, self.n_resamples, chunk)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if self.max_workers > 1 and len(sizes) > 1 and self.n_resamples * len(predictions) >= self.parallel_min_work:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = [pool.submit(_bootstrap_metrics, *arrays, size, s) for size, s in zip(sizes, seeds)]
+                    parts = [future.result() for future in futures]
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"⚠️  Bootstrap pool unavailable ({e}); resampling in-process")
+                parts = [_bootstrap_metrics(*arrays, size, s) for size, s in zip(sizes, seeds)]
+        else:
+            parts = [_bootstrap_metrics(*arrays, size, s) for size, s in zip(sizes, seeds)]
+
+        samples = np.vstack(parts)
+        tail = (1 - self.confidence_level) / 2 * 100
+        lower, upper = np.percentile(samples, [tail, 100 - tail], axis=0)
+
+        intervals = {
+            metric: {'lower': float(lower[i]), 'upper': float(upper[i])}
+            for i, metric in enumerate(self.METRICS)
+        }
+        intervals['confidence_level'] = self.confidence_level
+        intervals['n_resamples'] = self.n_resamples
+        return intervals
+
 
 class ModelCalibrator:
     """Main model calibration orchestrator"""
@@ -387,6 +597,7 @@ class ModelCalibrator:
         brier_score = self.performance_analyzer.calculate_brier_score(predictions)
         calibration = self.performance_analyzer.calculate_calibration_error(predictions)
         roi_analysis = self.performance_analyzer.calculate_roi(predictions)
+        intervals = self.performance_analyzer.bootstrap_confidence_intervals(predictions)
         
         # Model version breakdown
         model_versions = {}
@@ -415,6 +626,7 @@ class ModelCalibrator:
                 'roi': roi_analysis['roi'],
                 'net_profit': roi_analysis['net_profit']
             },
+            'confidence_intervals': intervals,
             'calibration_analysis': calibration,
             'roi_analysis': roi_analysis,
             'model_version_metrics': version_metrics,
@@ -485,6 +697,8 @@ def main():
     parser.add_argument('--export-report', help='Export performance report to file')
     parser.add_argument('--record-outcome', help='Record outcome for prediction ID')
     parser.add_argument('--outcome', choices=['win', 'loss'], help='Outcome (win/loss)')
+    parser.add_argument('--import-json', nargs='?', const='', metavar='DIR',
+                        help='Import legacy predictions_week_N.json files (default: historical/outcomes)')
     
     args = parser.parse_args()
     
@@ -514,6 +728,11 @@ def main():
             print(f"Calibration Error: {metrics['calibration_error']:.3f} (lower is better)")
             print(f"ROI: {metrics['roi']:.1f}%")
             print(f"Net Profit: ${metrics['net_profit']:.2f}")
+
+            intervals = analysis['confidence_intervals']
+            print(f"\n{intervals['confidence_level']:.0%} Confidence Intervals ({intervals['n_resamples']} bootstrap resamples):")
+            for metric in PerformanceAnalyzer.METRICS:
+                print(f"  {metric}: {intervals[metric]['lower']:.3f} – {intervals[metric]['upper']:.3f}")
             
             print(f"\nRecommendations:")
             for rec in analysis['recommendations']:
@@ -526,6 +745,10 @@ def main():
                     print(f"  {version}: {metrics['count']} predictions, "
                           f"Brier: {metrics['brier_score']:.3f}, ROI: {metrics['roi']:.1f}%")
         
+        elif args.import_json is not None:
+            imported = calibrator.outcome_tracker.import_json_history(Path(args.import_json) if args.import_json else None)
+            print(f"✅ Imported {imported} predictions")
+
         elif args.record_outcome and args.outcome:
             outcome_bool = args.outcome == 'win'
             success = calibrator.outcome_tracker.record_outcome(args.record_outcome, outcome_bool)
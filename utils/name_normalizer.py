@@ -8,12 +8,21 @@ Usage:
 
     normalized = normalize_player_name("Gardner Minshew II")  # -> "Gardner Minshew"
     is_match = fuzzy_match_names("Gardner  Minshew", "Gardner Minshew II")  # -> True
+
+    # Whole columns: each distinct name is normalized once
+    df['player_name'] = normalize_player_names(df['player_name'])
 """
 
+import heapq
 import re
-from typing import Optional
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Iterable, Optional
 from difflib import SequenceMatcher
 
+import numpy as np
+import pandas as pd
+
 
 # Common name suffixes to remove for normalization
 NAME_SUFFIXES = [
@@ -23,6 +32,17 @@ NAME_SUFFIXES = [
     '2nd', '3rd', '4th', '5th'
 ]
 
+# Distinct names remembered by normalize_player_name (a season of rosters is ~3k)
+NAME_CACHE_SIZE = 65536
+
+# Compiled once; previously the suffix pattern was rebuilt on every call
+_SUFFIX_PATTERN = re.compile(
+    r'\s+(' + '|'.join(re.escape(s) for s in NAME_SUFFIXES) + r')\.?$', re.IGNORECASE
+)
+_INITIALS_PATTERN = re.compile(r'([A-Z])\.(?=[A-Z]\.?\s)')
+_INITIAL_SPACE_PATTERN = re.compile(r'([A-Z])\.(\s)')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 def normalize_player_name(name: str) -> str:
     """
@@ -35,6 +55,9 @@ def normalize_player_name(name: str) -> str:
     4. Remove periods from initials (e.g., "A.J." -> "AJ")
     5. Title case (preserve existing case for acronyms)
 
+    Results are memoized for the most recent NAME_CACHE_SIZE distinct names.
+    For a whole column use normalize_player_names.
+
     Args:
         name: Raw player name
 
@@ -54,18 +77,21 @@ def normalize_player_name(name: str) -> str:
     if not name:
         return ""
 
+    return _normalize_cached(name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize_cached(name: str) -> str:
     # Step 1: Strip and collapse spaces
     normalized = ' '.join(name.strip().split())
 
     # Step 2: Remove suffixes
-    # Create regex pattern for suffix removal
-    suffix_pattern = r'\s+(' + '|'.join(re.escape(s) for s in NAME_SUFFIXES) + r')\.?$'
-    normalized = re.sub(suffix_pattern, '', normalized, flags=re.IGNORECASE)
+    normalized = _SUFFIX_PATTERN.sub('', normalized)
 
     # Step 3: Remove periods from initials but preserve spacing
     # This handles "A.J. Brown" -> "AJ Brown"
-    normalized = re.sub(r'([A-Z])\.(?=[A-Z]\.?\s)', r'\1', normalized)
-    normalized = re.sub(r'([A-Z])\.(\s)', r'\1\2', normalized)
+    normalized = _INITIALS_PATTERN.sub(r'\1', normalized)
+    normalized = _INITIAL_SPACE_PATTERN.sub(r'\1\2', normalized)
 
     # Step 4: Final cleanup - ensure single spaces
     normalized = ' '.join(normalized.split())
@@ -73,6 +99,46 @@ def normalize_player_name(name: str) -> str:
     return normalized.strip()
 
 
+def normalize_player_names(names: pd.Series) -> pd.Series:
+    """
+    Normalize a Series of player names.
+
+    Gives the same result as applying normalize_player_name to every value,
+    but runs the steps as .str operations over the distinct names only, then
+    maps them back onto the original positions. Game logs repeat each name
+    once per game, so this is far cheaper than a per-row apply.
+
+    Args:
+        names: Series of raw player names (missing values become "")
+
+    Returns:
+        Series of normalized names with the same index and name
+
+    Examples:
+        >>> normalize_player_names(pd.Series(["A.J. Brown", "Gardner Minshew II"])).tolist()
+        ['AJ Brown', 'Gardner Minshew']
+    """
+    codes, uniques = pd.factorize(names, use_na_sentinel=True)
+    distinct = pd.Series(uniques, dtype=object)
+
+    # Step 1: Strip and collapse spaces
+    distinct = distinct.str.strip().str.replace(_WHITESPACE_PATTERN, ' ', regex=True)
+
+    # Step 2: Remove suffixes
+    distinct = distinct.str.replace(_SUFFIX_PATTERN, '', regex=True)
+
+    # Step 3: Remove periods from initials but preserve spacing
+    distinct = distinct.str.replace(_INITIALS_PATTERN, r'\1', regex=True)
+    distinct = distinct.str.replace(_INITIAL_SPACE_PATTERN, r'\1\2', regex=True)
+
+    # Step 4: Final cleanup - ensure single spaces
+    distinct = distinct.str.strip().str.replace(_WHITESPACE_PATTERN, ' ', regex=True)
+
+    # Missing names (code -1) pick up the trailing ""
+    lookup = np.array(distinct.tolist() + [''], dtype=object)
+    return pd.Series(lookup[codes], index=names.index, name=names.name)
+
+
 def fuzzy_match_names(name1: str, name2: str, threshold: float = 0.85) -> bool:
     """
     Check if two player names are likely the same person using fuzzy matching.
@@ -151,7 +217,172 @@ def batch_normalize_names(names: list[str]) -> dict[str, str]:
         >>> batch_normalize_names(["Gardner Minshew II", "Patrick Mahomes Jr."])
         {'Gardner Minshew II': 'Gardner Minshew', 'Patrick Mahomes Jr.': 'Patrick Mahomes'}
     """
-    return {name: normalize_player_name(name) for name in names}
+    if not names:
+        return {}
+    return dict(zip(names, normalize_player_names(pd.Series(names, dtype=object))))
+
+
+class FuzzyNameIndex:
+    """
+    Fuzzy player-name lookup against a fixed list of names (e.g. a roster).
+
+    Scoring every query against every name is O(N x M) SequenceMatcher calls.
+    The index blocks on character trigrams and last names instead: a query is
+    scored only against the few names that share the most trigrams with it
+    (plus any name with the same last name), using the same normalization and
+    similarity as fuzzy_match_names.
+
+    Usage:
+        index = FuzzyNameIndex.from_database(season=2025, week=7, position='QB')
+        index.match("Gardner Minshew II")   # -> ('Gardner Minshew', 1.0)
+        index.top_k("Pat Mahomes", k=3)     # -> [('Patrick Mahomes', 0.846), ...]
+    """
+
+    NGRAM = 3
+
+    def __init__(self, names: Iterable[str], max_candidates: int = 20):
+        """
+        Build the index.
+
+        Args:
+            names: Names to match against (raw; normalized internally)
+            max_candidates: Most names scored per query after blocking
+        """
+        self.max_candidates = max_candidates
+        self._names: list[str] = []     # raw name, first spelling seen per normalized key
+        self._keys: list[str] = []      # normalized, lower case
+        self._by_key: dict[str, int] = {}
+        self._by_gram: dict[str, list[int]] = defaultdict(list)
+        self._by_last: dict[str, list[int]] = defaultdict(list)
+        self._gram_counts: list[int] = []
+
+        for name in names:
+            key = normalize_player_name(name).lower() if name else ''
+            if not key or key in self._by_key:
+                continue
+            i = len(self._names)
+            self._names.append(name)
+            self._keys.append(key)
+            self._by_key[key] = i
+            grams = self._grams(key)
+            for gram in grams:
+                self._by_gram[gram].append(i)
+            self._gram_counts.append(len(grams))
+            self._by_last[key.split()[-1]].append(i)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def _grams(cls, key: str) -> set[str]:
+        padded = f" {key} "
+        return {padded[i:i + cls.NGRAM] for i in range(len(padded) - cls.NGRAM + 1)}
+
+    def _candidates(self, key: str) -> list[int]:
+        """Ids of the names sharing the most trigrams with key, plus same last name"""
+        grams = self._grams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._by_gram.get(gram, ()))
+
+        # Rank by Dice overlap so short names are not crowded out by long ones
+        ids = heapq.nlargest(self.max_candidates, shared,
+                             key=lambda i: shared[i] / (len(grams) + self._gram_counts[i]))
+        for i in self._by_last.get(key.split()[-1], ()):
+            if i not in ids:
+                ids.append(i)
+        return ids
+
+    def top_k(self, name: str, k: int = 5) -> list[tuple[str, float]]:
+        """
+        Best-scoring names for a query.
+
+        Args:
+            name: Name to look up
+            k: Number of results
+
+        Returns:
+            Up to k (name, similarity) pairs, best first; an exact match after
+            normalization scores 1.0
+        """
+        key = normalize_player_name(name).lower() if name else ''
+        if not key:
+            return []
+
+        exact = self._by_key.get(key)
+        scored = []
+        for i in self._candidates(key):
+            score = 1.0 if i == exact else SequenceMatcher(None, key, self._keys[i]).ratio()
+            scored.append((score, i))
+        # Best score first; ties go to the name added first
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self._names[i], score) for score, i in scored[:k]]
+
+    def match(self, name: str, threshold: float = 0.85) -> Optional[tuple[str, float]]:
+        """
+        Best match for a name, if it is similar enough.
+
+        Args:
+            name: Name to look up
+            threshold: Minimum similarity (same meaning as in fuzzy_match_names)
+
+        Returns:
+            (name, similarity) or None
+        """
+        key = normalize_player_name(name).lower() if name else ''
+        exact = self._by_key.get(key)
+        if exact is not None:
+            return self._names[exact], 1.0
+
+        best = self.top_k(name, k=1)
+        if best and best[0][1] >= threshold:
+            return best[0]
+        return None
+
+    def match_many(self, names: Iterable[str], threshold: float = 0.85) -> dict[str, Optional[tuple[str, float]]]:
+        """
+        Match a batch of names (each distinct name is looked up once).
+
+        Args:
+            names: Names to look up
+            threshold: Minimum similarity
+
+        Returns:
+            Dictionary mapping each name -> (match, similarity) or None
+        """
+        results = {}
+        for name in names:
+            if name not in results:
+                results[name] = self.match(name, threshold)
+        return results
+
+    @classmethod
+    def from_database(cls, db_path=None, season: Optional[int] = None, week: Optional[int] = None,
+                      position: Optional[str] = None, **kwargs) -> 'FuzzyNameIndex':
+        """
+        Build the index from player_roster.
+
+        Args:
+            db_path: Path to SQLite database (default: config database path)
+            season: Only this season's rosters
+            week: Only this week's rosters
+            position: Only this position (e.g. 'QB')
+            **kwargs: Passed to FuzzyNameIndex()
+
+        Returns:
+            FuzzyNameIndex over the distinct roster names
+        """
+        from config import get_database_path
+        from utils.connection_pool import get_connection_pool
+
+        filters = [(column, value) for column, value in
+                   (('season', season), ('week', week), ('position', position)) if value is not None]
+        where = ' AND '.join(f"{column} = ?" for column, _ in filters)
+        query = "SELECT DISTINCT player_name FROM player_roster" + (f" WHERE {where}" if where else '')
+
+        conn = get_connection_pool(db_path or get_database_path()).reader()
+        rows = conn.execute(query, [value for _, value in filters]).fetchall()
+        return cls((row[0] for row in rows), **kwargs)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,235 @@
+"""
+Change-only line movement storage for the odds tables
+
+Every odds scrape sees the same lines for most books. Instead of appending a
+full copy each run, incoming rows are compared with odds_current (the latest
+line/price per book and selection) and only rows whose line or price moved
+are written:
+
+    odds_line_history - one row per change, all markets (the delta log)
+    odds_current      - latest line/price per (market, week, game, book, selection),
+                        updated in the same transaction
+    odds_last_seen    - when each odds table last received a scrape for a week,
+                        changed or not (scraped_at on the other tables is the
+                        time of the last change)
+
+A line that a book stops offering (while the game is still on that
+market's board) is recorded as a removal: a history row and odds_current row
+with NULL line and price. Lines for games that drop off the board entirely
+(e.g. after kickoff) are left as they were last seen.
+
+odds_spreads and odds_totals receive changed rows only, so they keep their
+history semantics without the duplicates; qb_props keeps its one row per
+QB / week / book. The full odds state at any moment is rebuilt from the
+history by DatabaseQueryTools.get_odds_at().
+"""
+import logging
+from typing import Dict, Iterable, Iterator, Tuple
+
+from utils.connection_pool import transaction
+
+logger = logging.getLogger(__name__)
+
+# Odds table -> (market, selection column, line column, price column)
+TRACKED_TABLES = {
+    'odds_spreads': ('spreads', 'team', 'spread', 'odds'),
+    'odds_totals': ('totals', 'line_type', 'total', 'odds'),
+    'qb_props': ('player_pass_tds', 'qb_name', None, 'odds_over_05_td'),
+}
+
+# Line stored for QB props (only the Over 0.5 TD outcome is kept)
+QB_PROP_LINE = 0.5
+
+# (line, price) stored when a book pulls a line
+REMOVED = (None, None)
+
+HISTORY_COLUMNS = ['market', 'week', 'game', 'home_team', 'away_team', 'sportsbook',
+                   'selection', 'line', 'price', 'game_time']
+
+
+class OddsHistory:
+    """Filters odds rows down to line/price changes and records them"""
+
+    # Columns written to the history tables (stream_insert adds scraped_at,
+    # which is the time of the change)
+    COLUMNS = {
+        'odds_line_history': HISTORY_COLUMNS,
+        'odds_current': HISTORY_COLUMNS,
+        'odds_last_seen': ['odds_table', 'week', 'rows_seen'],
+    }
+
+    def __init__(self, db_manager):
+        """
+        Initialize odds history
+
+        Args:
+            db_manager: Connected DatabaseManager whose writer connection is used
+        """
+        self.db_manager = db_manager
+        self.seen = {}
+        self.changed = {}
+        self.removed = 0
+
+    @staticmethod
+    def ensure_tables(conn):
+        """Create the history and current-odds tables if needed"""
+        with transaction(conn):
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS odds_line_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    market TEXT NOT NULL,
+                    week INTEGER,
+                    game TEXT,
+                    home_team TEXT,
+                    away_team TEXT,
+                    sportsbook TEXT,
+                    selection TEXT,
+                    line REAL,
+                    price INTEGER,
+                    game_time TIMESTAMP,
+                    scraped_at TIMESTAMP
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_odds_line_history_week
+                ON odds_line_history(week, market, scraped_at)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS odds_current (
+                    market TEXT NOT NULL,
+                    week INTEGER,
+                    game TEXT,
+                    home_team TEXT,
+                    away_team TEXT,
+                    sportsbook TEXT,
+                    selection TEXT,
+                    line REAL,
+                    price INTEGER,
+                    game_time TIMESTAMP,
+                    scraped_at TIMESTAMP,
+                    UNIQUE(market, week, game, sportsbook, selection)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS odds_last_seen (
+                    odds_table TEXT NOT NULL,
+                    week INTEGER,
+                    rows_seen INTEGER,
+                    scraped_at TIMESTAMP,
+                    UNIQUE(odds_table, week)
+                )
+            """)
+
+    def changes_only(self, rows: Iterable[Tuple[str, Dict]], week: int) -> Iterator[Tuple[str, Dict]]:
+        """
+        Drop rows whose line and price match the current odds
+
+        For each changed row, also yields the odds_line_history and
+        odds_current rows recording the change, so DatabaseManager.stream_insert()
+        writes everything in one transaction. Rows for untracked tables pass
+        through. Once all rows are read, lines missing from a (market, game)
+        that was scraped are yielded as removals, followed by one
+        odds_last_seen row per odds table that received rows. After the
+        iterator is exhausted, self.seen and self.changed hold per-table row
+        counts and self.removed the number of pulled lines.
+
+        The tables are created and the week's current odds loaded here, before
+        the caller's write transaction starts.
+
+        Args:
+            rows: (table_name, row) pairs
+            week: NFL week the rows belong to
+
+        Returns:
+            Iterator of (table_name, row) pairs to write
+        """
+        conn = self.db_manager._get_connection()
+        self.ensure_tables(conn)
+
+        current = {}
+        details = {}
+        for market, game, home_team, away_team, sportsbook, selection, line, price, game_time in conn.execute(
+            """
+            SELECT market, game, home_team, away_team, sportsbook, selection, line, price, game_time
+            FROM odds_current
+            WHERE week = ?
+            """,
+            (week,)
+        ):
+            key = (market, game, sportsbook, selection)
+            current[key] = (line, price)
+            details[key] = (home_team, away_team, game_time)
+
+        self.seen = {table: 0 for table in TRACKED_TABLES}
+        self.changed = {table: 0 for table in TRACKED_TABLES}
+        self.removed = 0
+
+        return self._filter(rows, week, current, details)
+
+    def _filter(self, rows, week, current, details) -> Iterator[Tuple[str, Dict]]:
+        scraped = set()
+        for table, row in rows:
+            if table not in TRACKED_TABLES:
+                yield table, row
+                continue
+
+            market, selection_col, line_col, price_col = TRACKED_TABLES[table]
+            line = row.get(line_col) if line_col else QB_PROP_LINE
+            price = row.get(price_col)
+            key = (market, row.get('game'), row.get('sportsbook'), row.get(selection_col))
+
+            self.seen[table] += 1
+            scraped.add(key)
+            if current.get(key) == (line, price):
+                continue
+
+            current[key] = (line, price)
+            self.changed[table] += 1
+
+            change = {
+                'market': market,
+                'week': week,
+                'game': row.get('game'),
+                'home_team': row.get('home_team'),
+                'away_team': row.get('away_team'),
+                'sportsbook': row.get('sportsbook'),
+                'selection': row.get(selection_col),
+                'line': line,
+                'price': price,
+                'game_time': row.get('game_time'),
+            }
+            yield table, row
+            yield 'odds_line_history', change
+            yield 'odds_current', change
+
+        # Only games present in this scrape: a failed fetch or a finished game is not a pull
+        games = {key[:2] for key in scraped}
+        for key, value in current.items():
+            if key in scraped or key[:2] not in games or value == REMOVED:
+                continue
+
+            market, game, sportsbook, selection = key
+            home_team, away_team, game_time = details[key]
+            removal = {
+                'market': market,
+                'week': week,
+                'game': game,
+                'home_team': home_team,
+                'away_team': away_team,
+                'sportsbook': sportsbook,
+                'selection': selection,
+                'line': None,
+                'price': None,
+                'game_time': game_time,
+            }
+            self.removed += 1
+            yield 'odds_line_history', removal
+            yield 'odds_current', removal
+
+        for table, rows_seen in self.seen.items():
+            if rows_seen:
+                yield 'odds_last_seen', {'odds_table': table, 'week': week, 'rows_seen': rows_seen}
+
+        unchanged = sum(self.seen.values()) - sum(self.changed.values())
+        logger.info(f"📉 Line movement: {sum(self.changed.values())} changed, {unchanged} unchanged rows skipped, "
+                    f"{self.removed} pulled")
@@ -0,0 +1,203 @@
+"""
+Kickoff-aware polling plan for the odds scheduler
+
+Lines move most in the hours before kickoff, so each game is polled on a
+schedule that tightens as its commence_time approaches (ODDS_POLL_TIERS).
+Games outside the widest tier, and games already started, are not polled.
+
+The plan is kept inside the monthly API quota: the planned request rate
+is compared with the remaining budget spread evenly over the rest of the
+month, and intervals are stretched when the plan would overspend. Player
+props (paid key) and spreads / totals (free keys) draw on separate budgets,
+so each gets its own stretch factor.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import ODDS_POLL_TIERS
+
+logger = logging.getLogger(__name__)
+
+# Requests per game-lines poll (spreads + totals, free tier keys)
+GAME_LINE_REQUESTS = 2
+
+
+def parse_commence_time(value: str) -> Optional[datetime]:
+    """
+    Parse an Odds API commence_time ('2024-10-20T17:00:00Z') as an aware UTC datetime
+
+    Returns:
+        Datetime, or None if the value is missing or invalid
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def hours_left_in_month(now: datetime) -> float:
+    """Hours until the quota period ends (start of next month, UTC)"""
+    now = now.astimezone(timezone.utc)
+    next_month = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                  + timedelta(days=32)).replace(day=1)
+    return max((next_month - now).total_seconds() / 3600, 1.0)
+
+
+class OddsPollPlanner:
+    """Decides which events are due for an odds refresh"""
+
+    def __init__(self, tiers: Sequence[Tuple[float, float]] = ODDS_POLL_TIERS):
+        """
+        Initialize polling plan
+
+        Args:
+            tiers: (hours before kickoff, minutes between polls) pairs
+        """
+        self.tiers = sorted(tiers)
+        self.window = timedelta(hours=self.tiers[-1][0]) if self.tiers else timedelta(0)
+        self.last_polled: Dict[str, datetime] = {}
+        self.last_game_lines: Optional[datetime] = None
+
+    def interval_for(self, kickoff: Optional[datetime], now: datetime) -> Optional[timedelta]:
+        """
+        Base polling interval for a game
+
+        Args:
+            kickoff: Game commence time
+            now: Current time (aware)
+
+        Returns:
+            Interval, or None if the game has started or is outside the window
+        """
+        if kickoff is None or kickoff <= now:
+            return None
+
+        hours_out = (kickoff - now).total_seconds() / 3600
+        for max_hours, minutes in self.tiers:
+            if hours_out <= max_hours:
+                return timedelta(minutes=minutes)
+        return None
+
+    def active_events(self, events: Iterable[Dict], now: datetime) -> List[Dict]:
+        """Events inside the polling window that have not kicked off"""
+        return [
+            event for event in events
+            if self.interval_for(parse_commence_time(event.get('commence_time')), now) is not None
+        ]
+
+    def planned_requests_per_hour(self, events: Iterable[Dict], now: datetime) -> Tuple[float, float]:
+        """
+        Request rate the unstretched plan would use
+
+        Args:
+            events: Events from the /events endpoint
+            now: Current time (aware)
+
+        Returns:
+            (player prop requests per hour, game line requests per hour)
+        """
+        intervals = [
+            self.interval_for(parse_commence_time(event.get('commence_time')), now)
+            for event in events
+        ]
+        intervals = [interval for interval in intervals if interval is not None]
+        if not intervals:
+            return 0.0, 0.0
+
+        props = sum(3600 / interval.total_seconds() for interval in intervals)
+        game_lines = GAME_LINE_REQUESTS * 3600 / min(intervals).total_seconds()
+        return props, game_lines
+
+    def quota_stretch(self, events: Iterable[Dict], now: datetime,
+                      paid_remaining: int, free_remaining: int) -> Tuple[float, float]:
+        """
+        Factors to multiply intervals by so the plan fits the monthly quota
+
+        Args:
+            events: Events from the /events endpoint
+            now: Current time (aware)
+            paid_remaining: Requests left on the paid key (player props)
+            free_remaining: Requests left on the free keys (spreads / totals)
+
+        Returns:
+            (player props stretch, game lines stretch): 1.0 when the plan fits,
+            larger to slow down, inf when that budget is exhausted
+        """
+        props_rate, lines_rate = self.planned_requests_per_hour(list(events), now)
+        hours = hours_left_in_month(now)
+
+        def stretch(planned, remaining):
+            if planned <= 0:
+                return 1.0
+            if remaining <= 0:
+                return float('inf')
+            return max(1.0, planned / (remaining / hours))
+
+        return stretch(props_rate, paid_remaining), stretch(lines_rate, free_remaining)
+
+    def due_events(self, events: Iterable[Dict], now: datetime, stretch: float = 1.0) -> List[Dict]:
+        """
+        Active events whose stretched interval has elapsed since their last poll
+
+        Args:
+            events: Events from the /events endpoint
+            now: Current time (aware)
+            stretch: Player props factor from quota_stretch()
+
+        Returns:
+            Events to refresh now (never-polled events first in list order)
+        """
+        due = []
+        for event in events:
+            interval = self.interval_for(parse_commence_time(event.get('commence_time')), now)
+            if interval is None or stretch == float('inf'):
+                continue
+            last = self.last_polled.get(event.get('id'))
+            if last is None or now - last >= interval * stretch:
+                due.append(event)
+        return due
+
+    def game_lines_due(self, events: Iterable[Dict], now: datetime, stretch: float = 1.0) -> bool:
+        """Whether spreads / totals should be refreshed (at the tightest active interval,
+        times the game lines factor from quota_stretch())"""
+        intervals = [
+            self.interval_for(parse_commence_time(event.get('commence_time')), now)
+            for event in events
+        ]
+        intervals = [interval for interval in intervals if interval is not None]
+        if not intervals or stretch == float('inf'):
+            return False
+        return self.last_game_lines is None or now - self.last_game_lines >= min(intervals) * stretch
+
+    def mark_polled(self, events: Iterable[Dict], now: datetime, game_lines: bool = False):
+        """Record a refresh of the given events (and of the game lines)"""
+        for event in events:
+            self.last_polled[event.get('id')] = now
+        if game_lines:
+            self.last_game_lines = now
+
+    def next_due(self, events: Iterable[Dict], now: datetime, stretch: float = 1.0) -> Optional[datetime]:
+        """
+        Earliest time any active event becomes due
+
+        Args:
+            events: Events from the /events endpoint
+            now: Current time (aware)
+            stretch: Player props factor from quota_stretch()
+
+        Returns:
+            Datetime, or None if nothing is active
+        """
+        if stretch == float('inf'):
+            return None
+
+        times = []
+        for event in events:
+            interval = self.interval_for(parse_commence_time(event.get('commence_time')), now)
+            if interval is None:
+                continue
+            last = self.last_polled.get(event.get('id'))
+            times.append(now if last is None else last + interval * stretch)
+        return min(times) if times else None
@@ -0,0 +1,151 @@
+"""
+Single-pass table parser for Pro Football Reference pages
+
+The scrapers used to parse each page with BeautifulSoup, serialize the
+stats table back to HTML and parse it a second time with pd.read_html.
+read_table() parses the page once with lxml, finds the table by id
+(including the tables PFR ships inside HTML comments and only renders
+client-side) and builds the DataFrame straight from the cell text.
+
+The result matches what pd.read_html gives for the same table once the
+scrapers' cleaning has run: header text from the last header row, empty
+cells as NaN, thousands separators dropped and all-numeric columns typed.
+Repeated header rows inside tbody (class "thead") are skipped rather than
+returned as data.
+"""
+import logging
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Rows that repeat or group the header rather than holding data
+SKIP_ROW_CLASSES = ('thead', 'over_header', 'spacer')
+
+
+def find_table(html: Union[bytes, str], *table_ids: str):
+    """
+    Locate the first of table_ids on a page, looking inside HTML comments too
+
+    Args:
+        html: Page source (bytes are decoded using the page's charset)
+        *table_ids: Table ids in order of preference
+
+    Returns:
+        lxml <table> element, or None if none of the tables is on the page
+    """
+    root = etree.fromstring(html, etree.HTMLParser())
+    if root is None:
+        return None
+
+    for table_id in table_ids:
+        found = root.xpath('//table[@id=$id]', id=table_id)
+        if found:
+            return found[0]
+
+        # PFR comments out every table but the first and unhides them with JavaScript
+        marker = f'id="{table_id}"'
+        for comment in root.iter(etree.Comment):
+            if comment.text and marker in comment.text:
+                fragment = etree.fromstring(comment.text, etree.HTMLParser())
+                found = fragment.xpath('//table[@id=$id]', id=table_id) if fragment is not None else []
+                if found:
+                    return found[0]
+
+    return None
+
+
+def read_table(html: Union[bytes, str], *table_ids: str) -> Optional[pd.DataFrame]:
+    """
+    Parse a PFR stats table into a DataFrame
+
+    Args:
+        html: Page source
+        *table_ids: Table ids in order of preference (first found is parsed)
+
+    Returns:
+        DataFrame with one column per header cell (duplicate names kept),
+        or None if none of the tables is on the page
+    """
+    table = find_table(html, *table_ids)
+    if table is None:
+        return None
+    return table_to_dataframe(table)
+
+
+def table_to_dataframe(table) -> pd.DataFrame:
+    """
+    Build a typed DataFrame from an lxml <table> element
+
+    Args:
+        table: lxml <table> element
+
+    Returns:
+        DataFrame with header text as column names
+    """
+    header_rows = table.xpath('./thead/tr')
+    body_rows = table.xpath('./tbody/tr | ./tfoot/tr | ./tr')
+    if not header_rows and body_rows:
+        # No <thead>: the first row is the header
+        header_rows, body_rows = body_rows[:1], body_rows[1:]
+    header = _row_cells(header_rows[-1]) if header_rows else []
+
+    width = len(header)
+    columns: List[List[str]] = [[] for _ in range(width)]
+    for tr in body_rows:
+        if _skip_row(tr):
+            continue
+        cells = _row_cells(tr)
+        for i in range(width):
+            columns[i].append(cells[i] if i < len(cells) else '')
+
+    df = pd.DataFrame({i: _typed(values) for i, values in enumerate(columns)})
+    df.columns = header
+    return df
+
+
+def _row_cells(tr) -> List[str]:
+    """Text of each th/td in a row, repeated across colspan like pd.read_html"""
+    cells = []
+    for cell in tr.iterchildren('th', 'td'):
+        text = ''.join(cell.itertext()).strip()
+        try:
+            span = max(int(cell.get('colspan', 1)), 1)
+        except ValueError:
+            span = 1
+        cells.extend([text] * span)
+    return cells
+
+
+def _skip_row(tr) -> bool:
+    classes = (tr.get('class') or '').split()
+    return any(name in classes for name in SKIP_ROW_CLASSES)
+
+
+def _typed(values: List[str]) -> pd.Series:
+    """Numeric series if every non-empty cell is a number, else strings with NaN for blanks"""
+    numbers = []
+    blanks = False
+    integers = True
+    for value in values:
+        if not value:
+            blanks = True
+            numbers.append(None)
+            continue
+
+        text = value.replace(',', '')
+        try:
+            numbers.append(int(text))
+        except ValueError:
+            try:
+                numbers.append(float(text))
+                integers = False
+            except ValueError:
+                return pd.Series([value or np.nan for value in values], dtype=object)
+
+    if integers and not blanks:
+        return pd.Series(numbers, dtype='int64')
+    return pd.Series(numbers, dtype='float64')
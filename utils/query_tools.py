@@ -13,6 +13,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import get_database_path
+from utils.connection_pool import get_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -31,18 +32,16 @@ class DatabaseQueryTools:
         self.conn = None
     
     def connect(self):
-        """Establish database connection"""
-        if not self.db_path.exists():
+        """Acquire this thread's pooled read-only connection"""
+        if not Path(self.db_path).exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
         
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = get_connection_pool(self.db_path).reader()
         logger.debug(f"Connected to database: {self.db_path}")
     
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Release the connection back to the pool"""
+        self.conn = None
     
     def __enter__(self):
         """Context manager entry"""
@@ -244,6 +243,9 @@ class DatabaseQueryTools:
     def get_line_movement(self, week: int, hours_back: int = 24) -> Dict[str, pd.DataFrame]:
         """
         Get line movement data for a specific week
+
+        Reads the change-only odds_line_history when it exists (one row per
+        line/price change), falling back to the raw odds tables otherwise.
         
         Args:
             week: NFL week number
@@ -254,6 +256,9 @@ class DatabaseQueryTools:
         """
         cutoff_time = datetime.now() - timedelta(hours=hours_back)
         cutoff_str = cutoff_time.isoformat()
+
+        if self._table_exists('odds_line_history'):
+            return self._line_movement_from_history(week, cutoff_str)
         
         movement_data = {}
         
@@ -294,11 +299,122 @@ class DatabaseQueryTools:
         )
         
         return movement_data
+
+    # History market -> (result key, column aliases for selection/line/price, ORDER BY)
+    _MOVEMENT_MARKETS = {
+        'player_pass_tds': ('qb_props', "selection AS qb_name, price AS odds_over_05_td",
+                            "selection, sportsbook, scraped_at"),
+        'spreads': ('spreads', "game, selection AS team, line AS spread, price AS odds",
+                    "game, sportsbook, scraped_at"),
+        'totals': ('totals', "game, selection AS line_type, line AS total, price AS odds",
+                   "game, sportsbook, scraped_at"),
+    }
+
+    def _line_movement_from_history(self, week: int, cutoff_str: str) -> Dict[str, pd.DataFrame]:
+        """Line movement per market from odds_line_history, in get_line_movement's column layout"""
+        movement_data = {}
+
+        for market, (key, columns, order_by) in self._MOVEMENT_MARKETS.items():
+            query = f"""
+                SELECT {columns}, sportsbook, scraped_at
+                FROM odds_line_history
+                WHERE week = ? AND market = ? AND scraped_at >= ? AND price IS NOT NULL
+                ORDER BY {order_by}
+            """
+            movement_data[key] = pd.read_sql_query(query, self.conn, params=(week, market, cutoff_str))
+
+        return movement_data
+
+    def get_current_odds(self, week: int, market: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the latest line and price for every book and selection
+
+        Args:
+            week: NFL week number
+            market: 'spreads', 'totals' or 'player_pass_tds' (optional)
+
+        Returns:
+            DataFrame from odds_current (scraped_at = when the line last changed);
+            lines a book has pulled are left out
+        """
+        query = """
+            SELECT market, game, home_team, away_team, sportsbook, selection,
+                   line, price, game_time, scraped_at
+            FROM odds_current
+            WHERE week = ? AND price IS NOT NULL
+        """
+
+        params = [week]
+
+        if market:
+            query += " AND market = ?"
+            params.append(market)
+
+        query += " ORDER BY market, game, sportsbook, selection"
+
+        return pd.read_sql_query(query, self.conn, params=params)
+
+    def get_odds_at(self, week: int, as_of: datetime, market: Optional[str] = None) -> pd.DataFrame:
+        """
+        Reconstruct the full odds board as it stood at a moment in time
+
+        Args:
+            week: NFL week number
+            as_of: Point in time (lines changed after it are ignored); naive values
+                   are local time like scraped_at, aware values are converted to it
+            market: 'spreads', 'totals' or 'player_pass_tds' (optional)
+
+        Returns:
+            DataFrame with the same columns as get_current_odds()
+        """
+        query = """
+            SELECT market, game, home_team, away_team, sportsbook, selection,
+                   line, price, game_time, scraped_at
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY market, game, sportsbook, selection
+                    ORDER BY scraped_at DESC, id DESC
+                ) AS rn
+                FROM odds_line_history
+                WHERE week = ? AND scraped_at <= ?
+        """
+
+        params = [week, self._scraped_at_format(as_of)]
+
+        if market:
+            query += " AND market = ?"
+            params.append(market)
+
+        query += """
+            )
+            WHERE rn = 1 AND price IS NOT NULL
+            ORDER BY market, game, sportsbook, selection
+        """
+
+        return pd.read_sql_query(query, self.conn, params=params)
+
+    @staticmethod
+    def _scraped_at_format(value) -> str:
+        """A datetime as stored in scraped_at: naive local time, ISO format"""
+        moment = pd.Timestamp(value).to_pydatetime()
+        if moment.tzinfo is not None:
+            moment = moment.astimezone().replace(tzinfo=None)
+        return moment.isoformat()
+
+    def _table_exists(self, table_name: str) -> bool:
+        """Check whether a table exists in the connected database"""
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone()
+        return row is not None
     
     def get_latest_snapshots(self, week: int) -> Dict[str, datetime]:
         """
         Get the latest snapshot time for each data type in a week
-        
+
+        Odds tables only receive rows whose line moved, so their time is the
+        last scrape that saw them (odds_last_seen), not the last line move.
+
         Args:
             week: NFL week number
             
@@ -306,6 +422,8 @@ class DatabaseQueryTools:
             Dictionary mapping table names to latest snapshot times
         """
         tables = ['defense_stats', 'qb_stats', 'matchups', 'odds_spreads', 'odds_totals', 'qb_props']
+        odds_tables = {'odds_spreads', 'odds_totals', 'qb_props'}
+        has_last_seen = self._table_exists('odds_last_seen')
         latest_times = {}
         
         for table in tables:
@@ -314,8 +432,23 @@ class DatabaseQueryTools:
                 FROM {table}
                 WHERE week = ?
             """
-            
-            result = pd.read_sql_query(query, self.conn, params=(week,))
+            params = (week,)
+            if table == 'qb_stats':
+                # Season totals have no week column; the latest scrape covers every week
+                query = "SELECT MAX(scraped_at) as latest_time FROM qb_stats"
+                params = ()
+            elif table in odds_tables and has_last_seen:
+                # Rows written before odds_last_seen existed still count
+                query = f"""
+                    SELECT MAX(latest_time) as latest_time FROM (
+                        SELECT MAX(scraped_at) as latest_time FROM {table} WHERE week = ?
+                        UNION ALL
+                        SELECT scraped_at FROM odds_last_seen WHERE odds_table = ? AND week = ?
+                    )
+                """
+                params = (week, table, week)
+
+            result = pd.read_sql_query(query, self.conn, params=params)
             if not result.empty and result['latest_time'].iloc[0]:
                 latest_times[table] = pd.to_datetime(result['latest_time'].iloc[0])
             else:
@@ -343,12 +476,13 @@ class DatabaseQueryTools:
         df = pd.read_sql_query(query, self.conn, params=(weeks_back,))
         return df
     
-    def find_qb_defense_matchups(self, week: int) -> pd.DataFrame:
+    def find_qb_defense_matchups(self, week: int, sportsbook: Optional[str] = 'FanDuel') -> pd.DataFrame:
         """
         Find QB vs Defense matchups for edge detection
         
         Args:
             week: NFL week number
+            sportsbook: Sportsbook for QB prop odds, or None for every sportsbook
             
         Returns:
             DataFrame with QB-Defense matchups and key metrics
@@ -358,6 +492,7 @@ class DatabaseQueryTools:
                 m.home_team,
                 m.away_team,
                 m.game_date,
+                m.week,
                 qb.qb_name as home_qb,
                 qb.team as home_qb_team,
                 qb.total_tds as home_qb_tds,
@@ -370,12 +505,13 @@ class DatabaseQueryTools:
             LEFT JOIN qb_stats qb ON qb.team = m.home_team AND qb.year = 2025 AND qb.is_starter = 1
             LEFT JOIN defense_stats def_home ON def_home.team_name = m.home_team AND def_home.week = ?
             LEFT JOIN defense_stats def_away ON def_away.team_name = m.away_team AND def_away.week = ?
-            LEFT JOIN qb_props prop ON prop.qb_name = qb.qb_name AND prop.week = ? AND prop.sportsbook = 'FanDuel'
+            LEFT JOIN qb_props prop ON prop.qb_name = qb.qb_name AND prop.week = ?
+                AND (? IS NULL OR prop.sportsbook = ?)
             WHERE m.week = ?
             ORDER BY def_away.tds_per_game DESC
         """
         
-        df = pd.read_sql_query(query, self.conn, params=(week, week, week, week))
+        df = pd.read_sql_query(query, self.conn, params=(week, week, week, sportsbook, sportsbook, week))
         return df
     
     def calculate_edge_opportunities(self, week: int) -> pd.DataFrame:
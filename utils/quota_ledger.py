@@ -0,0 +1,227 @@
+"""
+Persistent API quota ledger for The Odds API
+
+Stores per-key request counts and the server-reported remaining credits
+(x-requests-remaining / x-requests-used) in SQLite, one row per key per
+calendar month (UTC), so usage survives across the scheduler's main.py
+processes and resets automatically when the month rolls over.
+
+Every update is a single UPSERT statement, so concurrent processes sharing
+the database never lose an increment. Server figures are kept from the most
+recent report (highest x-requests-used, else latest time reported), so a
+mid-month top-up or plan upgrade shows up on the next response while a
+response recorded out of order cannot overwrite a newer one. Raw API keys are never written; rows
+are keyed by a short SHA-256 fingerprint.
+"""
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from utils.connection_pool import get_connection_pool, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier for an API key"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+# True when the incoming server report is at least as recent as the stored one.
+# x-requests-used only grows within a period, so it orders reports even when
+# concurrent responses are recorded out of order; report time is the fallback.
+_NEWER_REPORT = """
+    server_reported_at IS NULL OR CASE
+        WHEN excluded.server_used IS NOT NULL AND server_used IS NOT NULL
+            THEN excluded.server_used >= server_used
+        ELSE excluded.server_reported_at >= server_reported_at
+    END
+"""
+
+
+def current_period(now: Optional[datetime] = None) -> str:
+    """Quota period for a timestamp: 'YYYY-MM' in UTC"""
+    now = now or datetime.now(timezone.utc)
+    return now.strftime('%Y-%m')
+
+
+class QuotaLedger:
+    """SQLite-backed monthly usage and remaining-credit ledger per API key"""
+
+    def __init__(self, db_path=None):
+        """
+        Initialize quota ledger
+
+        Args:
+            db_path: Path to SQLite database (default: config database path)
+        """
+        if db_path is None:
+            from config import get_database_path
+            db_path = get_database_path()
+
+        self.db_path = Path(db_path)
+        self.pool = get_connection_pool(self.db_path)
+        self._table_ready = False
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = self.pool.writer()
+        if not self._table_ready:
+            with self._lock:
+                if not self._table_ready:
+                    self._ensure_table(conn)
+                    self._table_ready = True
+        return conn
+
+    def _ensure_table(self, conn):
+        """Create the ledger table if needed"""
+        with transaction(conn):
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_quota_ledger (
+                    key_id TEXT NOT NULL,
+                    period TEXT NOT NULL,
+                    tier TEXT NOT NULL,
+                    requests_used INTEGER NOT NULL DEFAULT 0,
+                    server_remaining INTEGER,
+                    server_used INTEGER,
+                    server_reported_at TIMESTAMP,
+                    updated_at TIMESTAMP,
+                    UNIQUE(key_id, period)
+                )
+            """)
+            # Ledgers created before server_reported_at existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(api_quota_ledger)")}
+            if 'server_reported_at' not in columns:
+                conn.execute("ALTER TABLE api_quota_ledger ADD COLUMN server_reported_at TIMESTAMP")
+
+    def record_usage(self, api_key: str, tier: str, remaining: Optional[int] = None,
+                     used: Optional[int] = None, period: Optional[str] = None,
+                     reported_at: Optional[datetime] = None):
+        """
+        Atomically count one successful request against a key
+
+        Args:
+            api_key: The API key that was used
+            tier: 'free' or 'paid'
+            remaining: x-requests-remaining reported by the server, if any
+            used: x-requests-used reported by the server, if any
+            period: Quota period (default: current month)
+            reported_at: When the server figures were received (default: now)
+        """
+        conn = self._connection()
+        now = datetime.now(timezone.utc)
+        reported = None
+        if remaining is not None or used is not None:
+            reported = (reported_at or now).astimezone(timezone.utc).isoformat()
+
+        # Server figures are replaced only by a newer report (see _NEWER_REPORT),
+        # which may be higher after a top-up. Without a server figure, assume the
+        # request cost one credit.
+        with transaction(conn):
+            conn.execute(f"""
+                INSERT INTO api_quota_ledger
+                    (key_id, period, tier, requests_used, server_remaining, server_used,
+                     server_reported_at, updated_at)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT(key_id, period) DO UPDATE SET
+                    requests_used = requests_used + 1,
+                    server_remaining = CASE
+                        WHEN excluded.server_reported_at IS NULL THEN server_remaining - 1
+                        WHEN {_NEWER_REPORT} THEN COALESCE(excluded.server_remaining, server_remaining - 1)
+                        ELSE server_remaining
+                    END,
+                    server_used = CASE
+                        WHEN excluded.server_reported_at IS NOT NULL AND ({_NEWER_REPORT})
+                            THEN COALESCE(excluded.server_used, server_used)
+                        ELSE server_used
+                    END,
+                    server_reported_at = CASE
+                        WHEN excluded.server_reported_at IS NOT NULL AND ({_NEWER_REPORT})
+                            THEN excluded.server_reported_at
+                        ELSE server_reported_at
+                    END,
+                    updated_at = excluded.updated_at
+            """, (
+                key_fingerprint(api_key), period or current_period(), tier,
+                remaining, used, reported, now.isoformat()
+            ))
+
+    def usage(self, api_keys: Iterable[str], period: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Stored usage for the given keys in a period
+
+        Args:
+            api_keys: API keys to look up
+            period: Quota period (default: current month)
+
+        Returns:
+            Dict of api_key -> {'requests_used', 'server_remaining', 'server_used'};
+            keys with no requests this period are omitted
+        """
+        by_id = {key_fingerprint(key): key for key in api_keys}
+        if not by_id:
+            return {}
+
+        placeholders = ','.join('?' * len(by_id))
+        rows = self._connection().execute(
+            f"""
+            SELECT key_id, requests_used, server_remaining, server_used
+            FROM api_quota_ledger
+            WHERE period = ? AND key_id IN ({placeholders})
+            """,
+            (period or current_period(), *by_id)
+        ).fetchall()
+
+        return {
+            by_id[key_id]: {
+                'requests_used': requests_used,
+                'server_remaining': server_remaining,
+                'server_used': server_used,
+            }
+            for key_id, requests_used, server_remaining, server_used in rows
+        }
+
+    def remaining(self, api_key: str, limit: int, period: Optional[str] = None) -> int:
+        """
+        Remaining budget for a key
+
+        Prefers the server-reported remaining credits; falls back to the
+        configured limit minus requests counted this period.
+
+        Args:
+            api_key: API key
+            limit: Configured monthly request limit for the key's tier
+            period: Quota period (default: current month)
+
+        Returns:
+            Remaining requests/credits (never negative)
+        """
+        row = self.usage([api_key], period).get(api_key)
+        if row is None:
+            return limit
+        if row['server_remaining'] is not None:
+            return max(0, row['server_remaining'])
+        return max(0, limit - row['requests_used'])
+
+    def reset(self, api_keys: Optional[Iterable[str]] = None, period: Optional[str] = None):
+        """
+        Delete ledger rows for a period (all keys, or only those given)
+
+        Args:
+            api_keys: Keys to reset (default: every key)
+            period: Quota period (default: current month)
+        """
+        conn = self._connection()
+        period = period or current_period()
+        with transaction(conn):
+            if api_keys is None:
+                conn.execute("DELETE FROM api_quota_ledger WHERE period = ?", (period,))
+            else:
+                conn.executemany(
+                    "DELETE FROM api_quota_ledger WHERE period = ? AND key_id = ?",
+                    [(period, key_fingerprint(key)) for key in api_keys]
+                )
+        logger.info(f"Reset API quota ledger for {period}")
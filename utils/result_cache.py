@@ -0,0 +1,175 @@
+"""Versioned LRU result cache for NFL Edge Finder
+
+Caches computed results (edge lists, counts) in memory, keyed by the request
+parameters plus a data version token. When the version changes (e.g. the
+scheduler commits new odds) every cached entry from the old version is dropped,
+so stale results are never served. Entries are stored pickled, which gives an
+exact size for the memory cap and hands every caller its own copy.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedResultCache:
+    """Thread-safe LRU cache invalidated by a data version token"""
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 32 MB
+
+    # Returned by lookup() when the key is not cached
+    MISS = object()
+
+    def __init__(self, version_fn: Callable[[], Optional[Hashable]],
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize result cache
+
+        Args:
+            version_fn: Returns the current data version; None disables caching
+                        for that call (e.g. database file missing)
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached results (pickled bytes)
+        """
+        self.version_fn = version_fn
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._version = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for key, computing and storing it on a miss
+
+        Args:
+            key: Request parameters (must be hashable)
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            The result (a fresh copy on every call)
+        """
+        version, result = self.lookup(key)
+        if result is not self.MISS:
+            return result
+
+        result = compute()
+        self.store(key, version, result)
+        return result
+
+    def lookup(self, key: Hashable):
+        """
+        Look up key under the current data version
+
+        Args:
+            key: Request parameters (must be hashable)
+
+        Returns:
+            tuple: (version, result or MISS). Pass the version back to store()
+            so a result computed from older data is never cached.
+        """
+        try:
+            version = self.version_fn()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read data version, bypassing cache: {e}")
+            version = None
+
+        with self._lock:
+            if version is None:
+                self.misses += 1
+                return None, self.MISS
+
+            self._check_version(version)
+            blob = self._entries.get(key)
+            if blob is None:
+                self.misses += 1
+                return version, self.MISS
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return version, pickle.loads(blob)
+
+    def _check_version(self, version: Hashable):
+        """Drop every entry if the data changed (caller holds the lock)"""
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                logger.info(f"🔄 Data version changed, dropping {len(self._entries)} cached results")
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def store(self, key: Hashable, version: Optional[Hashable], result: Any):
+        """
+        Cache result for key if the data version is still current
+
+        Args:
+            key: Request parameters
+            version: Version returned by lookup() before computing the result
+            result: Picklable result
+        """
+        if version is None:
+            return
+
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Result for {key} not cacheable: {e}")
+            return
+
+        if len(blob) > self.max_bytes:
+            return
+
+        with self._lock:
+            # Data changed while we were computing; don't cache a stale result
+            if version != self._version:
+                return
+
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+
+            self._entries[key] = blob
+            self._bytes += len(blob)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all cached results (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
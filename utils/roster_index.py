@@ -0,0 +1,222 @@
+"""
+In-memory player -> team index for resolving which side a player is on
+
+The Odds API names players but not their teams. RosterIndex is built once
+per scrape from player_roster (latest week per player) and qb_stats (latest
+scrape), keyed by a normalized name, so each prop outcome resolves to the
+home or away team with a dict lookup instead of a query or a fuzzy match.
+
+Team codes differ by source (PFR uses KAN/GNB/NWE, rosters KC/GB/NE, the
+Odds API full names), so every team is reduced to one canonical code before
+comparing. Names that cannot be resolved are collected and reported once per
+scrape rather than logged per outcome.
+"""
+import logging
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.connection_pool import get_connection_pool
+from utils.name_normalizer import normalize_player_name
+
+logger = logging.getLogger(__name__)
+
+# Canonical code -> full name as used by The Odds API
+TEAM_NAMES = {
+    'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons', 'BAL': 'Baltimore Ravens',
+    'BUF': 'Buffalo Bills', 'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns', 'DAL': 'Dallas Cowboys',
+    'DEN': 'Denver Broncos', 'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts', 'JAX': 'Jacksonville Jaguars',
+    'KC': 'Kansas City Chiefs', 'LV': 'Las Vegas Raiders', 'LAC': 'Los Angeles Chargers',
+    'LAR': 'Los Angeles Rams', 'MIA': 'Miami Dolphins', 'MIN': 'Minnesota Vikings',
+    'NE': 'New England Patriots', 'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
+    'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles', 'PIT': 'Pittsburgh Steelers',
+    'SF': 'San Francisco 49ers', 'SEA': 'Seattle Seahawks', 'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders',
+}
+
+# Other spellings of team codes seen across sources (PFR, ESPN, relocations)
+TEAM_CODE_ALIASES = {
+    'KAN': 'KC', 'GNB': 'GB', 'NWE': 'NE', 'NOR': 'NO', 'SFO': 'SF', 'TAM': 'TB',
+    'LVR': 'LV', 'OAK': 'LV', 'SDG': 'LAC', 'SD': 'LAC', 'STL': 'LAR', 'LA': 'LAR',
+    'RAM': 'LAR', 'WSH': 'WAS', 'JAC': 'JAX', 'HTX': 'HOU', 'CRD': 'ARI', 'RAV': 'BAL',
+    'CLT': 'IND', 'OTI': 'TEN',
+}
+
+# Odds API / sportsbook spelling -> name as stored in our stats tables
+PLAYER_ALIASES = {
+    'cam ward': 'cameron ward',
+    'josh dobbs': 'joshua dobbs',
+    'mitch trubisky': 'mitchell trubisky',
+    'hollywood brown': 'marquise brown',
+    'gabe davis': 'gabriel davis',
+    'chig okonkwo': 'chigoziem okonkwo',
+}
+
+_TEAM_LOOKUP = {code: code for code in TEAM_NAMES}
+_TEAM_LOOKUP.update(TEAM_CODE_ALIASES)
+_TEAM_LOOKUP.update({name.upper(): code for code, name in TEAM_NAMES.items()})
+
+
+def team_code(team: Optional[str]) -> Optional[str]:
+    """
+    Canonical code for a team given as a code, alias or full name
+
+    Args:
+        team: e.g. 'KAN', 'KC' or 'Kansas City Chiefs'
+
+    Returns:
+        Canonical code ('KC'), or None for unknown / multi-team ('2TM') values
+    """
+    if not team:
+        return None
+    return _TEAM_LOOKUP.get(str(team).strip().upper())
+
+
+def player_key(name: Optional[str]) -> str:
+    """
+    Lookup key for a player name: normalized, lower case, no apostrophes or periods
+
+    Args:
+        name: Player name from any source
+
+    Returns:
+        Key shared by all spellings of the name
+    """
+    if not name:
+        return ''
+    key = normalize_player_name(str(name)).lower()
+    key = re.sub(r"[.'’]", '', key)
+    key = ' '.join(key.split())
+    return PLAYER_ALIASES.get(key, key)
+
+
+class RosterIndex:
+    """Normalized player name -> canonical team code"""
+
+    def __init__(self, teams: Optional[Dict[str, str]] = None):
+        """
+        Initialize roster index
+
+        Args:
+            teams: Player name -> team (any spelling of either); later entries win
+        """
+        self._teams: Dict[str, str] = {}
+        self.unresolved: Counter = Counter()
+        # Events are parsed on several threads during one scrape
+        self._unresolved_lock = threading.Lock()
+        for name, team in (teams or {}).items():
+            self.add(name, team)
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+    def add(self, name: str, team: str):
+        """Map a player to a team (ignored if either is unusable)"""
+        key, code = player_key(name), team_code(team)
+        if key and code:
+            self._teams[key] = code
+
+    def team_for(self, name: str) -> Optional[str]:
+        """Canonical team code for a player, or None if not on the index"""
+        return self._teams.get(player_key(name))
+
+    def resolve(self, name: str, home_team: str, away_team: str) -> Tuple[str, str]:
+        """
+        Work out which side of a game a player is on
+
+        Args:
+            name: Player name as given by the sportsbook
+            home_team: Home team (full name as given by the API)
+            away_team: Away team
+
+        Returns:
+            (team, opponent) as given in the game, or ('', '') if the player is
+            unknown or listed with a team not playing in this game
+        """
+        code = self.team_for(name)
+        if code is not None:
+            if code == team_code(home_team):
+                return home_team, away_team
+            if code == team_code(away_team):
+                return away_team, home_team
+
+        with self._unresolved_lock:
+            self.unresolved[name] += 1
+        return '', ''
+
+    def report_unresolved(self, limit: int = 10) -> List[str]:
+        """
+        Log the players that could not be resolved since the last report, then reset
+
+        Args:
+            limit: Names to include in the log line
+
+        Returns:
+            Unresolved names, most frequent first
+        """
+        with self._unresolved_lock:
+            counts, self.unresolved = self.unresolved, Counter()
+
+        names = [name for name, _ in counts.most_common()]
+        if names:
+            shown = ', '.join(names[:limit]) + (f" (+{len(names) - limit} more)" if len(names) > limit else '')
+            logger.warning(f"⚠️  Could not resolve team for {len(names)} players "
+                           f"({sum(counts.values())} outcomes): {shown}")
+        return names
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, str]]) -> 'RosterIndex':
+        """Build from (player name, team) rows, later rows taking precedence"""
+        index = cls()
+        for name, team in rows:
+            index.add(name, team)
+        return index
+
+    @classmethod
+    def from_database(cls, db_path=None) -> 'RosterIndex':
+        """
+        Build from qb_stats (latest scrape) overlaid with player_roster (latest week)
+
+        Weekly rosters are the fresher source, so they are applied last. A
+        missing table or database leaves that source out.
+
+        Args:
+            db_path: Path to SQLite database (default: config database path)
+
+        Returns:
+            RosterIndex (possibly empty)
+        """
+        if db_path is None:
+            from config import get_database_path
+            db_path = get_database_path()
+
+        index = cls()
+        if not Path(db_path).exists():
+            logger.warning(f"⚠️  No database at {db_path}; roster index is empty")
+            return index
+
+        conn = get_connection_pool(db_path).reader()
+        queries = (
+            ('qb_stats', """
+                SELECT qb_name, team FROM qb_stats
+                ORDER BY year, scraped_at
+            """),
+            ('player_roster', """
+                SELECT player_name, team FROM player_roster
+                ORDER BY season, week
+            """),
+        )
+        for table, query in queries:
+            try:
+                for name, team in conn.execute(query):
+                    index.add(name, team)
+            except sqlite3.Error as e:
+                logger.debug(f"Skipping {table} for roster index: {e}")
+
+        logger.info(f"✓ Roster index: {len(index)} players")
+        return index
@@ -5,8 +5,13 @@ This module provides a single interface for accessing edges from multiple
 betting strategies, standardizing outputs and handling errors gracefully.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from enum import Enum
 import logging
+import threading
+import time
 from datetime import datetime
 import sys
 import os
@@ -14,13 +19,28 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from pathlib import Path
+
+from utils.connection_pool import get_connection_pool
 from utils.db_manager import DatabaseManager
+from utils.edge_calculator import EdgeCalculator
+from utils.result_cache import VersionedResultCache
+from utils.strategy_context import StrategyContext
 from utils.calculators.first_half_total_calculator import FirstHalfTotalCalculator
 from utils.calculators.qb_td_calculator_v2 import QBTDCalculatorV2
 
 logger = logging.getLogger(__name__)
 
 
+class Strategy(str, Enum):
+    """Stable strategy identifiers (API parameters and count keys)."""
+
+    FIRST_HALF = "first_half"
+    QB_TD_V1 = "qb_td_v1"
+    QB_TD_V2 = "qb_td_v2"
+    KICKER = "kicker"
+
+
 class StrategyAggregator:
     """
     Unified interface for all betting edge calculators.
@@ -30,11 +50,49 @@ class StrategyAggregator:
     - Normalize output format across strategies
     - Handle errors gracefully (don't let one strategy fail all)
     - Provide quick count queries for UI badges
+    - Share one StrategyContext per request so inputs are loaded once
+    - Cache results in memory until the database changes
+    - Run strategies concurrently, each with its own deadline
     """
 
-    def __init__(self, db_path: str = "data/database/nfl_betting.db"):
-        """Initialize with database connection."""
+    # Contexts kept for reuse across requests while the data version is unchanged
+    MAX_SHARED_CONTEXTS = 8
+
+    # Worker pool size and per-strategy deadline (seconds) for get_edges_report
+    DEFAULT_MAX_WORKERS = 3
+    DEFAULT_STRATEGY_TIMEOUT = 10.0
+
+    # Per-strategy status values reported by get_edges_report
+    STATUS_OK = "ok"
+    STATUS_TIMEOUT = "timeout"
+    STATUS_ERROR = "error"
+
+    def __init__(
+        self,
+        db_path: str = "data/database/nfl_betting.db",
+        enable_cache: bool = True,
+        cache_max_entries: int = VersionedResultCache.DEFAULT_MAX_ENTRIES,
+        cache_max_bytes: int = VersionedResultCache.DEFAULT_MAX_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        strategy_timeout: float = DEFAULT_STRATEGY_TIMEOUT,
+        strategy_timeouts: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize with database connection.
+
+        Args:
+            db_path: Path to SQLite database
+            enable_cache: Cache results until the database changes (PRAGMA data_version)
+            cache_max_entries: Maximum cached results (LRU eviction)
+            cache_max_bytes: Memory cap for cached results
+            max_workers: Strategy worker threads; 1 runs strategies inline on the
+                         calling thread (no deadlines)
+            strategy_timeout: Default deadline in seconds for each strategy
+            strategy_timeouts: Optional per-strategy overrides, e.g. {"qb_td_v2": 5.0}
+        """
         self.db_path = db_path
+        self.strategy_timeout = strategy_timeout
+        self.strategy_timeouts = dict(strategy_timeouts or {})
 
         try:
             # Initialize database manager
@@ -42,9 +100,32 @@ class StrategyAggregator:
 
             # Initialize calculators
             self.first_half_calc = FirstHalfTotalCalculator(self.db_manager)
+            self.qb_td_calc_v1 = EdgeCalculator(model_version="v1", db_path=Path(db_path))
             self.qb_td_calc_v2 = QBTDCalculatorV2(self.db_manager)
 
-            logger.info("StrategyAggregator initialized with 2 calculators")
+            # Shared per-week inputs, reused by edges and counts requests
+            self._contexts = OrderedDict()
+            self._contexts_version = None
+            self._contexts_lock = threading.Lock()
+
+            # Result cache, invalidated whenever any connection commits to the database
+            self.cache = None
+            if enable_cache:
+                self.cache = VersionedResultCache(
+                    get_connection_pool(db_path).data_version,
+                    max_entries=cache_max_entries,
+                    max_bytes=cache_max_bytes
+                )
+
+            # Bounded pool shared by all requests; a strategy that overruns its
+            # deadline keeps its worker until it finishes, but the request doesn't wait
+            self._executor = None
+            if max_workers > 1:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="strategy"
+                )
+
+            logger.info("StrategyAggregator initialized with 3 calculators")
 
         except Exception as e:
             logger.error(f"Error initializing StrategyAggregator: {e}")
@@ -69,31 +150,164 @@ class StrategyAggregator:
         Returns:
             List of edge dictionaries in standardized format
         """
-        all_edges = []
+        return self.get_edges_report(week, season, min_edge, strategy)['edges']
+
+    def get_edges_report(
+        self,
+        week: int,
+        season: int = 2024,
+        min_edge: float = 5.0,
+        strategy: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get edges plus per-strategy status and timing.
+
+        Strategies run concurrently on the worker pool. A strategy that misses
+        its deadline or raises is reported as "timeout"/"error" and the edges
+        from the others are still returned; such partial reports are not cached.
+
+        Args:
+            week: NFL week number (1-18)
+            season: NFL season year
+            min_edge: Minimum edge percentage (default: 5.0)
+            strategy: Optional filter - "first_half", "qb_td_v1", "qb_td_v2", or None for all
+
+        Returns:
+            {
+                "edges": [...],
+                "strategies": {"first_half": {"status": "ok", "elapsed_ms": 12.3,
+                                              "count": 2, "error": None}, ...},
+                "partial": False,
+                "elapsed_ms": 15.1,
+                "cached": False
+            }
+        """
+        strategy = strategy or 'all'
+
+        report, cached = self._cached(
+            ('edges', week, season, strategy, float(min_edge)),
+            week,
+            season,
+            lambda context: self._compute_all_edges(week, season, min_edge, strategy, context)
+        )
+        report['cached'] = cached
+
+        return report
+
+    def _compute_all_edges(
+        self,
+        week: int,
+        season: int,
+        min_edge: float,
+        strategy: str,
+        context: StrategyContext
+    ) -> Dict[str, Any]:
+        """Run the requested strategies against a shared context (uncached)."""
+        runners = {
+            Strategy.FIRST_HALF.value: self._get_first_half_edges,
+            Strategy.QB_TD_V1.value: self._get_qb_td_v1_edges,
+            Strategy.QB_TD_V2.value: self._get_qb_td_v2_edges,
+            # Note: Kicker strategy not yet implemented (kicker_stats table empty)
+        }
 
         # Determine which strategies to run
-        strategies_to_run = []
-        if strategy is None or strategy == 'all':
-            strategies_to_run = ['first_half', 'qb_td_v1', 'qb_td_v2']
+        if strategy == 'all':
+            strategies_to_run = list(runners)
         else:
-            strategies_to_run = [strategy]
-
-        # Run each strategy
-        if 'first_half' in strategies_to_run:
-            all_edges.extend(self._get_first_half_edges(week, season, min_edge))
+            strategies_to_run = [name for name in runners if name == strategy]
 
-        if 'qb_td_v1' in strategies_to_run:
-            all_edges.extend(self._get_qb_td_v1_edges(week, season, min_edge))
+        tasks = {
+            name: (lambda runner=runners[name]: runner(week, season, min_edge, context))
+            for name in strategies_to_run
+        }
 
-        if 'qb_td_v2' in strategies_to_run:
-            all_edges.extend(self._get_qb_td_v2_edges(week, season, min_edge))
+        started = time.perf_counter()
+        outcomes = self._run_strategies(tasks, context)
 
-        # Note: Kicker strategy not yet implemented (kicker_stats table empty)
+        all_edges = []
+        statuses = {}
+        for name, (status, edges, elapsed_ms, error) in outcomes.items():
+            all_edges.extend(edges)
+            statuses[name] = {
+                "status": status,
+                "elapsed_ms": elapsed_ms,
+                "count": len(edges),
+                "error": error
+            }
 
         # Sort by edge percentage (highest first)
         all_edges.sort(key=lambda x: x['edge_pct'], reverse=True)
 
-        return all_edges
+        return {
+            "edges": all_edges,
+            "strategies": statuses,
+            "partial": any(s["status"] != self.STATUS_OK for s in statuses.values()),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    def _run_strategies(
+        self,
+        tasks: Dict[str, Callable[[], List[Dict[str, Any]]]],
+        context: StrategyContext
+    ) -> Dict[str, tuple]:
+        """
+        Run strategy tasks, concurrently when a worker pool is configured.
+
+        Each deadline is measured from submission, so the request waits at most
+        max(deadlines) overall. Timeouts and errors are recorded on the context.
+
+        Args:
+            tasks: Strategy name -> zero-argument callable returning edges
+            context: Shared StrategyContext for the request
+
+        Returns:
+            Dict of strategy name -> (status, edges, elapsed_ms, error)
+        """
+        outcomes = {}
+
+        if self._executor is None:
+            for name, task in tasks.items():
+                outcomes[name] = self._run_strategy(name, task, context)
+            return outcomes
+
+        started = time.perf_counter()
+        futures = {
+            name: self._executor.submit(self._run_strategy, name, task, context)
+            for name, task in tasks.items()
+        }
+
+        for name, future in futures.items():
+            timeout = self.strategy_timeouts.get(name, self.strategy_timeout)
+            remaining = max(0.0, timeout - (time.perf_counter() - started))
+            try:
+                outcomes[name] = future.result(timeout=remaining)
+            except FuturesTimeoutError:
+                future.cancel()
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+                message = f"exceeded {timeout:.1f}s deadline"
+                logger.warning(f"⏱️  {name} {message}, returning partial results")
+                context.record_error(f"{name}: {message}")
+                outcomes[name] = (self.STATUS_TIMEOUT, [], elapsed_ms, message)
+
+        return outcomes
+
+    def _run_strategy(
+        self,
+        name: str,
+        task: Callable[[], List[Dict[str, Any]]],
+        context: StrategyContext
+    ) -> tuple:
+        """Run one strategy, timing it and turning exceptions into an error status."""
+        started = time.perf_counter()
+        try:
+            edges = task()
+            status, error = self.STATUS_OK, None
+        except Exception as e:
+            logger.error(f"Error getting {name} edges: {e}")
+            context.record_error(f"{name}: {e}")
+            edges, status, error = [], self.STATUS_ERROR, str(e)
+
+        return status, edges, round((time.perf_counter() - started) * 1000, 1), error
 
     def get_edge_counts(
         self,
@@ -103,215 +317,295 @@ class StrategyAggregator:
         """
         Quick count of edges per strategy (for tab badges).
 
+        Uses each calculator's count-only path (no reasoning, recommendation
+        or standardization work) and shares loaded inputs with get_all_edges.
+
         Args:
             week: NFL week number
             season: NFL season year
 
         Returns:
-            Dict with strategy counts: {"first_half": 3, "qb_td_v1": 5, "qb_td_v2": 4, "total": 12}
+            Dict keyed by Strategy value plus "total":
+            {"first_half": 3, "qb_td_v1": 5, "qb_td_v2": 4, "kicker": 0, "total": 12}
         """
-        # Get full edges (could optimize with count-only queries later)
-        edges = self.get_all_edges(week, season, min_edge=0.0)  # Get all, regardless of edge
-
-        counts = {
-            "first_half": 0,
-            "qb_td_v1": 0,
-            "qb_td_v2": 0,
-            "kicker": 0,
-            "total": 0
+        counts, _ = self._cached(
+            ('counts', week, season),
+            week,
+            season,
+            lambda context: self._compute_edge_counts(week, season, context)
+        )
+
+        return counts
+
+    def _compute_edge_counts(
+        self,
+        week: int,
+        season: int,
+        context: StrategyContext
+    ) -> Dict[str, int]:
+        """Count edges per strategy at min_edge 0.0 (uncached)."""
+        counters = {
+            Strategy.FIRST_HALF: lambda: self.first_half_calc.count_edges(
+                week, season, context=context
+            ),
+            Strategy.QB_TD_V1: lambda: self.qb_td_calc_v1.count_edges_for_week(
+                week, threshold=0.0, context=context
+            ),
+            Strategy.QB_TD_V2: lambda: self.qb_td_calc_v2.count_edges(
+                week, season, min_edge_threshold=0.0, context=context
+            ),
+            # Note: Kicker strategy not yet implemented (kicker_stats table empty)
         }
 
-        for edge in edges:
-            strategy = edge.get('strategy', '')
-            if 'First Half' in strategy:
-                counts['first_half'] += 1
-            elif 'Enhanced v2' in strategy or '(Enhanced v2)' in strategy or 'v2' in strategy.lower():
-                counts['qb_td_v2'] += 1
-            elif '(Simple v1)' in strategy or 'v1' in strategy.lower():
-                counts['qb_td_v1'] += 1
-            elif 'Kicker' in strategy:
-                counts['kicker'] += 1
-
-        counts['total'] = len(edges)
+        counts = {strategy.value: 0 for strategy in Strategy}
+
+        for strategy, count in counters.items():
+            try:
+                counts[strategy.value] = count()
+            except Exception as e:
+                logger.error(f"Error counting {strategy.value} edges: {e}")
+                context.record_error(f"{strategy.value}: {e}")
+
+        counts['total'] = sum(counts.values())
 
         return counts
 
+    def _cached(self, key, week: int, season: int, compute):
+        """
+        Serve key from the result cache, or compute it with the week's StrategyContext.
+
+        Results are only cached when every strategy ran cleanly, so a transient
+        failure or timeout is retried on the next request instead of being pinned.
+
+        Returns:
+            tuple: (result, served_from_cache)
+        """
+        if self.cache is None:
+            return compute(StrategyContext(self.db_manager, week, season)), False
+
+        version, result = self.cache.lookup(key)
+        if result is not VersionedResultCache.MISS:
+            return result, True
+
+        # Errors belong to this request; the shared context outlives it
+        context = self._get_context(week, season, version).for_request()
+        result = compute(context)
+
+        if not context.errors:
+            self.cache.store(key, version, result)
+
+        return result, False
+
+    def _get_context(self, week: int, season: int, version) -> StrategyContext:
+        """
+        StrategyContext for (week, season), shared while the data version holds.
+
+        Lets the edges and counts requests from one page load share matchups,
+        pricing and lookups instead of loading them twice.
+        """
+        if version is None:
+            return StrategyContext(self.db_manager, week, season)
+
+        with self._contexts_lock:
+            if version != self._contexts_version:
+                self._contexts.clear()
+                self._contexts_version = version
+
+            context = self._contexts.get((week, season))
+            if context is None:
+                context = StrategyContext(self.db_manager, week, season)
+                self._contexts[(week, season)] = context
+                while len(self._contexts) > self.MAX_SHARED_CONTEXTS:
+                    self._contexts.popitem(last=False)
+            else:
+                self._contexts.move_to_end((week, season))
+
+        return context
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Result cache counters (hits, misses, evictions, size).
+
+        Returns:
+            Dict of cache statistics, or {"enabled": False}
+        """
+        if self.cache is None:
+            return {"enabled": False}
+
+        return {"enabled": True, **self.cache.stats()}
+
     def _get_first_half_edges(
         self,
         week: int,
         season: int,
-        min_edge: float
+        min_edge: float,
+        context: Optional[StrategyContext] = None
     ) -> List[Dict[str, Any]]:
         """Get edges from First Half Total Under calculator."""
-        try:
-            # Call calculator
-            edges = self.first_half_calc.calculate_edges(week, season)
-
-            # Standardize format
-            standardized = []
-            for edge in edges:
-                # Map calculator output to standard format
-                std_edge = {
-                    "matchup": edge.get('matchup', 'Unknown'),
-                    "strategy": "First Half Total Under",
-                    "line": edge.get('line', 0.0),
-                    "recommendation": edge.get('recommendation', f"UNDER {edge.get('line', 0.0)}"),
-                    "edge_pct": edge.get('edge_pct', 0.0),
-                    "confidence": edge.get('confidence', 'MEDIUM'),
-                    "reasoning": edge.get('reasoning', 'No reasoning provided')
-                }
-
-                # Only include if meets minimum edge
-                if std_edge['edge_pct'] >= min_edge:
-                    standardized.append(std_edge)
-
-            logger.info(f"First Half Total: {len(standardized)} edges found (week {week})")
-            return standardized
+        # Call calculator
+        edges = self.first_half_calc.calculate_edges(week, season, context=context)
+
+        # Standardize format
+        standardized = []
+        for edge in edges:
+            # Map calculator output to standard format
+            std_edge = {
+                "matchup": edge.get('matchup', 'Unknown'),
+                "strategy": "First Half Total Under",
+                "line": edge.get('line', 0.0),
+                "recommendation": edge.get('recommendation', f"UNDER {edge.get('line', 0.0)}"),
+                "edge_pct": edge.get('edge_pct', 0.0),
+                "confidence": edge.get('confidence', 'MEDIUM'),
+                "reasoning": edge.get('reasoning', 'No reasoning provided')
+            }
+
+            # Only include if meets minimum edge
+            if std_edge['edge_pct'] >= min_edge:
+                standardized.append(std_edge)
+
+        logger.info(f"First Half Total: {len(standardized)} edges found (week {week})")
+        return standardized
 
-        except Exception as e:
-            logger.error(f"Error getting First Half Total edges: {e}")
-            return []
 
     def _get_qb_td_v1_edges(
         self,
         week: int,
         season: int,
-        min_edge: float
+        min_edge: float,
+        context: Optional[StrategyContext] = None
     ) -> List[Dict[str, Any]]:
         """Get edges from QB TD v1 Simple calculator with v2 metrics for comparison."""
-        try:
-            # Use the base EdgeCalculator directly with v1 model
-            from utils.edge_calculator import EdgeCalculator
-            from pathlib import Path
-            v1_calc = EdgeCalculator(model_version="v1", db_path=Path(self.db_path))
-
-            # Call v1 calculator
-            edges = v1_calc.find_edges_for_week(week, threshold=0.0)  # Get all, we'll filter by min_edge below
-
-            # Standardize format
-            standardized = []
-            for edge in edges:
-                # Map calculator output to standard format
-                qb_name = edge.get('qb_name', 'Unknown')
-                opponent = edge.get('opponent', 'Unknown')
-                matchup = f"{qb_name} vs {opponent}"
-
-                # Build reasoning if not present
-                reasoning = edge.get('reasoning', '')
-                if not reasoning:
-                    true_prob = edge.get('true_probability', 0.0)
-                    implied_prob = edge.get('implied_probability', 0.0)
-                    reasoning = (
-                        f"{qb_name} has true probability of {true_prob:.1%} "
-                        f"vs market implied probability of {implied_prob:.1%} "
-                        f"({opponent} defense). "
-                        f"Edge: {edge.get('edge_percentage', 0.0):.1f}%"
-                    )
-
-                v1_edge_pct = edge.get('edge_percentage', 0.0)
-
-                # Calculate v2 metrics for comparison
-                v2_edge_pct = None
-                red_zone_td_rate = None
-                try:
-                    red_zone_td_rate = self.qb_td_calc_v2._calculate_red_zone_td_rate(qb_name, season)
-                    opp_defense_quality = self.qb_td_calc_v2._get_opponent_defense_quality(opponent, season)
-                    v2_edge_pct = self.qb_td_calc_v2._adjust_edge_with_v2_metrics(
-                        base_edge_pct=v1_edge_pct,
-                        qb_stats={},  # Not used in adjustment
-                        red_zone_td_rate=red_zone_td_rate,
-                        opp_defense_quality=opp_defense_quality
-                    )
-                except Exception as e:
-                    logger.debug(f"Could not calculate v2 metrics for {qb_name}: {e}")
-
-                std_edge = {
-                    "matchup": matchup,
-                    "strategy": "QB TD 0.5+ (Simple v1)",
-                    "line": edge.get('line', 0.5),
-                    "recommendation": f"OVER {edge.get('line', 0.5)} TD",
-                    "edge_pct": v1_edge_pct,
-                    "confidence": edge.get('confidence', 'MEDIUM').upper(),
-                    "reasoning": reasoning,
-                    "opponent": opponent,
-
-                    # v2 comparison fields
-                    "v2_edge_pct": v2_edge_pct,
-                    "red_zone_td_rate": red_zone_td_rate
-                }
-
-                # Only include if meets minimum edge
-                if std_edge['edge_pct'] >= min_edge:
-                    standardized.append(std_edge)
-
-            logger.info(f"QB TD v1: {len(standardized)} edges found (week {week})")
-            return standardized
+        context = context or StrategyContext(self.db_manager, week, season)
+
+        # Call v1 calculator
+        edges = self.qb_td_calc_v1.find_edges_for_week(
+            week, threshold=0.0, context=context  # Get all, we'll filter by min_edge below
+        )
+
+        # v2 lookups are shared with the v2 strategy through the context
+        v2_lookups = None
+        if edges:
+            v2_lookups = self.qb_td_calc_v2.get_v2_lookups(week, season, context)
+
+        # Standardize format
+        standardized = []
+        for edge in edges:
+            # Map calculator output to standard format
+            qb_name = edge.get('qb_name', 'Unknown')
+            opponent = edge.get('opponent', 'Unknown')
+            matchup = f"{qb_name} vs {opponent}"
+
+            # Build reasoning if not present
+            reasoning = edge.get('reasoning', '')
+            if not reasoning:
+                true_prob = edge.get('true_probability', 0.0)
+                implied_prob = edge.get('implied_probability', 0.0)
+                reasoning = (
+                    f"{qb_name} has true probability of {true_prob:.1%} "
+                    f"vs market implied probability of {implied_prob:.1%} "
+                    f"({opponent} defense). "
+                    f"Edge: {edge.get('edge_percentage', 0.0):.1f}%"
+                )
+
+            v1_edge_pct = edge.get('edge_percentage', 0.0)
+
+            # Calculate v2 metrics for comparison
+            v2_edge_pct = None
+            red_zone_td_rate = None
+            try:
+                red_zone_td_rate = v2_lookups['red_zone_td_rates'].get(qb_name, 0.0)
+                opp_defense_quality = self.qb_td_calc_v2._lookup_defense_quality(v2_lookups, opponent)
+                v2_edge_pct = self.qb_td_calc_v2._adjust_edge_with_v2_metrics(
+                    base_edge_pct=v1_edge_pct,
+                    qb_stats={},  # Not used in adjustment
+                    red_zone_td_rate=red_zone_td_rate,
+                    opp_defense_quality=opp_defense_quality
+                )
+            except Exception as e:
+                logger.debug(f"Could not calculate v2 metrics for {qb_name}: {e}")
+
+            std_edge = {
+                "matchup": matchup,
+                "strategy": "QB TD 0.5+ (Simple v1)",
+                "line": edge.get('line', 0.5),
+                "recommendation": f"OVER {edge.get('line', 0.5)} TD",
+                "edge_pct": v1_edge_pct,
+                "confidence": edge.get('confidence', 'MEDIUM').upper(),
+                "reasoning": reasoning,
+                "opponent": opponent,
+
+                # v2 comparison fields
+                "v2_edge_pct": v2_edge_pct,
+                "red_zone_td_rate": red_zone_td_rate
+            }
+
+            # Only include if meets minimum edge
+            if std_edge['edge_pct'] >= min_edge:
+                standardized.append(std_edge)
+
+        logger.info(f"QB TD v1: {len(standardized)} edges found (week {week})")
+        return standardized
 
-        except Exception as e:
-            logger.error(f"Error getting QB TD v1 edges: {e}")
-            return []
 
     def _get_qb_td_v2_edges(
         self,
         week: int,
         season: int,
-        min_edge: float
+        min_edge: float,
+        context: Optional[StrategyContext] = None
     ) -> List[Dict[str, Any]]:
         """Get edges from QB TD v2 Enhanced calculator."""
-        try:
-            # Call calculator
-            edges = self.qb_td_calc_v2.calculate_edges(
-                week=week,
-                season=season,
-                min_edge_threshold=0.0  # Get all, we'll filter by min_edge below
-            )
-
-            # Standardize format
-            standardized = []
-            for edge in edges:
-                # Map calculator output to standard format
-                # QB TD v2 returns edges with qb_name, opponent, etc from EdgeCalculator
-                qb_name = edge.get('qb_name', 'Unknown')
-                opponent = edge.get('opponent', 'Unknown')
-                matchup = f"{qb_name} vs {opponent}"
-
-                # Build reasoning if not present
-                reasoning = edge.get('reasoning', '')
-                if not reasoning:
-                    true_prob = edge.get('true_probability', 0.0)
-                    implied_prob = edge.get('implied_probability', 0.0)
-                    reasoning = (
-                        f"{qb_name} has true probability of {true_prob:.1%} "
-                        f"vs market implied probability of {implied_prob:.1%} "
-                        f"({opponent} defense). "
-                        f"Edge: {edge.get('edge_percentage', 0.0):.1f}%"
-                    )
-
-                std_edge = {
-                    "matchup": matchup,
-                    "strategy": edge.get('strategy', 'QB TD 0.5+ (Enhanced v2)'),  # Use actual strategy from calculator
-                    "line": edge.get('line', 0.5),
-                    "recommendation": f"OVER {edge.get('line', 0.5)} TD",
-                    "edge_pct": edge.get('edge_percentage', 0.0),
-                    "confidence": edge.get('confidence', 'MEDIUM').upper(),
-                    "reasoning": reasoning,
-
-                    # v2-specific fields
-                    "v1_edge_pct": edge.get('v1_edge_percentage'),
-                    "red_zone_td_rate": edge.get('v2_metrics', {}).get('red_zone_td_rate'),
-                    "opponent": opponent
-                }
-
-                # Only include if meets minimum edge
-                if std_edge['edge_pct'] >= min_edge:
-                    standardized.append(std_edge)
-
-            logger.info(f"QB TD v2: {len(standardized)} edges found (week {week})")
-            return standardized
+        # Call calculator
+        edges = self.qb_td_calc_v2.calculate_edges(
+            week=week,
+            season=season,
+            min_edge_threshold=0.0,  # Get all, we'll filter by min_edge below
+            context=context
+        )
+
+        # Standardize format
+        standardized = []
+        for edge in edges:
+            # Map calculator output to standard format
+            # QB TD v2 returns edges with qb_name, opponent, etc from EdgeCalculator
+            qb_name = edge.get('qb_name', 'Unknown')
+            opponent = edge.get('opponent', 'Unknown')
+            matchup = f"{qb_name} vs {opponent}"
+
+            # Build reasoning if not present
+            reasoning = edge.get('reasoning', '')
+            if not reasoning:
+                true_prob = edge.get('true_probability', 0.0)
+                implied_prob = edge.get('implied_probability', 0.0)
+                reasoning = (
+                    f"{qb_name} has true probability of {true_prob:.1%} "
+                    f"vs market implied probability of {implied_prob:.1%} "
+                    f"({opponent} defense). "
+                    f"Edge: {edge.get('edge_percentage', 0.0):.1f}%"
+                )
+
+            std_edge = {
+                "matchup": matchup,
+                "strategy": edge.get('strategy', 'QB TD 0.5+ (Enhanced v2)'),  # Use actual strategy from calculator
+                "line": edge.get('line', 0.5),
+                "recommendation": f"OVER {edge.get('line', 0.5)} TD",
+                "edge_pct": edge.get('edge_percentage', 0.0),
+                "confidence": edge.get('confidence', 'MEDIUM').upper(),
+                "reasoning": reasoning,
+
+                # v2-specific fields
+                "v1_edge_pct": edge.get('v1_edge_percentage'),
+                "red_zone_td_rate": edge.get('v2_metrics', {}).get('red_zone_td_rate'),
+                "opponent": opponent
+            }
+
+            # Only include if meets minimum edge
+            if std_edge['edge_pct'] >= min_edge:
+                standardized.append(std_edge)
+
+        logger.info(f"QB TD v2: {len(standardized)} edges found (week {week})")
+        return standardized
 
-        except Exception as e:
-            logger.error(f"Error getting QB TD v2 edges: {e}")
-            return []
 
     def get_available_strategies(self) -> List[str]:
         """
@@ -320,7 +614,7 @@ class StrategyAggregator:
         Returns:
             List of strategy identifiers: ["first_half", "qb_td_v1", "qb_td_v2"]
         """
-        return ["first_half", "qb_td_v1", "qb_td_v2"]
+        return [Strategy.FIRST_HALF.value, Strategy.QB_TD_V1.value, Strategy.QB_TD_V2.value]
         # Note: "kicker" will be added when kicker_stats data is ready
 
     def validate_week(self, week: int, season: int = 2024) -> bool:
@@ -336,7 +630,7 @@ class StrategyAggregator:
         """
         try:
             # Quick check if any team metrics exist for this week
-            conn = self.db_manager._get_connection()
+            conn = self.db_manager.get_read_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
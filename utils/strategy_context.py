@@ -0,0 +1,131 @@
+"""
+Strategy Context - shared inputs for the edge calculators.
+
+StrategyAggregator builds one StrategyContext per (week, season) and data
+version and hands it to every calculator. Each input (matchups, QB/defense/prop matchup frame, team
+rankings, priced v1 edges, v2 rolling lookups) is loaded or computed once and
+reused by every strategy that needs it.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List
+import copy
+import logging
+import threading
+
+import pandas as pd
+
+from utils.query_tools import DatabaseQueryTools
+
+logger = logging.getLogger(__name__)
+
+
+class StrategyContext:
+    """
+    Compute-once cache of strategy inputs for a single (week, season) request.
+
+    Calculators call ``load(key, loader)`` for derived data; the loader runs
+    the first time a key is requested and the result is shared afterwards.
+    StrategyAggregator may reuse a context across requests for the same week
+    while the database is unchanged (each request gets a ``for_request()`` view
+    with its own error list); loaded values must be treated as read-only.
+    """
+
+    def __init__(self, db_manager, week: int, season: int = 2024):
+        """
+        Initialize an empty context
+
+        Args:
+            db_manager: DatabaseManager used for all reads
+            week: NFL week number
+            season: NFL season year
+        """
+        self.db_manager = db_manager
+        self.week = week
+        self.season = season
+
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self.stats = {'loads': 0, 'hits': 0}
+
+        # Failures seen while serving this request (results are then partial)
+        self.errors: List[str] = []
+
+    def load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the value for key, running loader only the first time
+
+        Safe to call from several threads; concurrent requests for the same
+        key wait for the first loader instead of running it again.
+
+        Args:
+            key: Cache key (unique per kind of input)
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            if key in self._values:
+                self.stats['hits'] += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.stats['hits'] += 1
+                    return self._values[key]
+
+            try:
+                value = loader()
+            except Exception as e:
+                self.record_error(f"{key}: {e}")
+                raise
+
+            with self._lock:
+                self._values[key] = value
+                self.stats['loads'] += 1
+
+        return value
+
+    def for_request(self) -> 'StrategyContext':
+        """
+        View for one request: shares loaded values, starts with no errors
+
+        Returns:
+            StrategyContext backed by the same cache and locks as this one
+        """
+        view = copy.copy(self)
+        view.errors = []
+        return view
+
+    def record_error(self, message: str):
+        """Note a failure so partial results are not cached"""
+        with self._lock:
+            self.errors.append(message)
+
+    def matchups(self) -> pd.DataFrame:
+        """Matchups for the week (home_team, away_team, game_date)"""
+        return self.load('matchups', self._load_matchups)
+
+    def qb_matchups(self) -> pd.DataFrame:
+        """QB vs defense frame: matchups joined with QB stats, defense stats and props"""
+        return self.load('qb_matchups', self._load_qb_matchups)
+
+    def _load_matchups(self) -> pd.DataFrame:
+        conn = self.db_manager.get_read_connection()
+        return pd.read_sql_query(
+            """
+            SELECT home_team, away_team, game_date
+            FROM matchups
+            WHERE week = ?
+            ORDER BY game_date
+            """,
+            conn,
+            params=(self.week,)
+        )
+
+    def _load_qb_matchups(self) -> pd.DataFrame:
+        with DatabaseQueryTools(self.db_manager.db_path) as db:
+            return db.find_qb_defense_matchups(self.week)
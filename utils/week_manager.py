@@ -10,10 +10,15 @@ data synchronization issues. It provides:
 - CLI interface for week management
 
 Usage:
-    from utils.week_manager import WeekManager
+    from utils.week_manager import get_week_manager
 
-    wm = WeekManager()
+    wm = get_week_manager()          # process-wide instance
     current_week = wm.get_current_week()
+    weeks = wm.weeks_for_dates(df['game_time'])
+
+The parsed current_week.json is cached and re-read only when the file's
+modification time changes, so calling get_current_week() on every request
+costs a stat() rather than an open and a JSON parse.
 
 Command Line:
     python utils/week_manager.py                    # Show current week
@@ -24,12 +29,31 @@ Command Line:
 
 import json
 import logging
+import re
+import threading
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Trailing UTC offset on an ISO 8601 timestamp ('Z', '+00:00', '-0500')
+_UTC_OFFSET = re.compile(r'(Z|[+-]\d\d:?\d\d)$')
+
+
+def _is_aware(value) -> bool:
+    """Whether a datetime or ISO 8601 string carries a UTC offset"""
+    if isinstance(value, str):
+        return bool(_UTC_OFFSET.search(value.strip()))
+    if isinstance(value, datetime):
+        return value.tzinfo is not None
+    return False
+
 
 class WeekManager:
     """Manages NFL week tracking and data synchronization"""
@@ -38,6 +62,8 @@ class WeekManager:
     SEASON_YEAR = 2025
     SEASON_START = datetime(2025, 9, 5)  # Week 1 starts Sept 5, 2025
     REGULAR_SEASON_WEEKS = 18
+    # Kickoff times are scheduled in Eastern time; aware datetimes are converted to it
+    SEASON_TIMEZONE = ZoneInfo('America/New_York')
 
     def __init__(self, config_path: Optional[Path] = None):
         """
@@ -53,6 +79,14 @@ class WeekManager:
 
         self.data_dir = Path(__file__).parent.parent / "data" / "raw"
 
+        # (st_mtime_ns, st_size, parsed config) of the last read of config_path
+        self._config_cache = None
+        self._config_lock = threading.Lock()
+
+        # Start of each regular-season week, for binary search
+        self._week_starts = [self.SEASON_START + timedelta(weeks=w) for w in range(self.REGULAR_SEASON_WEEKS)]
+        self._week_starts_np = np.array(self._week_starts, dtype='datetime64[ns]')
+
     def get_current_week(self) -> int:
         """
         Get the current NFL week number
@@ -68,12 +102,12 @@ class WeekManager:
         config = self._load_config()
         if config and 'current_week' in config:
             week = config['current_week']
-            logger.info(f"Week loaded from config: {week}")
+            logger.debug(f"Week loaded from config: {week}")
             return week
 
         # Fall back to date-based calculation
         week = self._calculate_week_from_date()
-        logger.info(f"Week calculated from date: {week}")
+        logger.debug(f"Week calculated from date: {week}")
         return week
 
     def get_week_info(self) -> Dict:
@@ -205,39 +239,53 @@ class WeekManager:
         Returns:
             Week number (1-18)
         """
-        now = datetime.now()
+        return self.calculate_week_from_game_date(datetime.now())
 
-        # Before season starts
-        if now < self.SEASON_START:
-            return 1
+    def calculate_week_from_game_date(self, game_date: datetime) -> int:
+        """
+        Calculate NFL week from an arbitrary game date
 
-        # During season
-        days_since_start = (now - self.SEASON_START).days
-        week = (days_since_start // 7) + 1
+        Args:
+            game_date: The date/datetime of the game (naive = Eastern time;
+                       aware datetimes are converted)
 
-        # Cap at final week
-        return min(week, self.REGULAR_SEASON_WEEKS)
+        Returns:
+            Week number (1-18); dates before the season count as week 1
+        """
+        if game_date.tzinfo is not None:
+            game_date = game_date.astimezone(self.SEASON_TIMEZONE).replace(tzinfo=None)
 
-    def calculate_week_from_game_date(self, game_date: datetime) -> int:
+        # Number of week starts on or before the date, capped to the season
+        week = bisect_right(self._week_starts, game_date)
+        return min(max(week, 1), self.REGULAR_SEASON_WEEKS)
+
+    def weeks_for_dates(self, dates: Iterable) -> pd.Series:
         """
-        Calculate NFL week from an arbitrary game date
+        Calculate NFL weeks for many game dates in one vectorized call
 
         Args:
-            game_date: The date/datetime of the game
+            dates: Datetimes or ISO 8601 strings (e.g. Odds API commence_time
+                   values like '2025-10-19T17:00:00Z'); a Series keeps its index
 
         Returns:
-            Week number (1-18)
+            Int64 Series of week numbers (1-18), <NA> where a date is missing
+            or unparseable
         """
-        # Before season starts
-        if game_date < self.SEASON_START:
-            return 1
+        dates = dates if isinstance(dates, pd.Series) else pd.Series(list(dates), dtype=object)
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            aware = pd.Series(True, index=dates.index)
+        else:
+            aware = dates.map(_is_aware).astype(bool)
 
-        # During season
-        days_since_start = (game_date - self.SEASON_START).days
-        week = (days_since_start // 7) + 1
+        # Parse everything as UTC, then put aware values on Eastern time and
+        # take naive ones at face value (they already are Eastern time)
+        parsed = pd.to_datetime(dates, errors='coerce', utc=True, format='ISO8601')
+        local = parsed.dt.tz_convert(self.SEASON_TIMEZONE).dt.tz_localize(None)
+        local = local.where(aware, parsed.dt.tz_localize(None))
 
-        # Cap at final week
-        return min(week, self.REGULAR_SEASON_WEEKS)
+        weeks = np.searchsorted(self._week_starts_np, local.to_numpy(dtype='datetime64[ns]'), side='right')
+        weeks = pd.Series(np.clip(weeks, 1, self.REGULAR_SEASON_WEEKS), index=dates.index, dtype='Int64')
+        return weeks.mask(local.isna())
 
     def _get_week_dates(self, week: int) -> Tuple[datetime, datetime]:
         """
@@ -279,19 +327,32 @@ class WeekManager:
         """
         Load week configuration from JSON file
 
+        The parsed file is cached and only re-read when its modification
+        time or size changes (edits by --set-week, other processes or hand).
+
         Returns:
-            Config dictionary or None if not found
+            Config dictionary (a copy) or None if not found
         """
-        if not self.config_path.exists():
-            return None
-
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            self._config_cache = None
             return None
 
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._config_lock:
+            if self._config_cache is None or self._config_cache[0] != signature:
+                try:
+                    with open(self.config_path, 'r') as f:
+                        config = json.load(f)
+                except Exception as e:
+                    logger.error(f"Error loading config: {e}")
+                    return None
+                self._config_cache = (signature, config)
+                logger.info(f"Week config loaded: week {config.get('current_week')} ({self.config_path.name})")
+
+            return dict(self._config_cache[1])
+
     def _save_config(self, config: Dict) -> bool:
         """
         Save week configuration to JSON file
@@ -306,12 +367,35 @@ class WeekManager:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
             logger.info(f"Week config saved: {self.config_path}")
+            # Next read sees the new mtime and reloads
+            self._config_cache = None
             return True
         except Exception as e:
             logger.error(f"Error saving config: {e}")
             return False
 
 
+_week_managers: Dict[Path, WeekManager] = {}
+_week_managers_lock = threading.Lock()
+
+
+def get_week_manager(config_path: Optional[Path] = None) -> WeekManager:
+    """
+    Get the process-wide WeekManager for a config file
+
+    Args:
+        config_path: Path to current_week.json (default: project root)
+
+    Returns:
+        Shared WeekManager (created on first use)
+    """
+    key = Path(config_path or Path(__file__).parent.parent / "current_week.json").resolve()
+    with _week_managers_lock:
+        if key not in _week_managers:
+            _week_managers[key] = WeekManager(config_path)
+        return _week_managers[key]
+
+
 def main():
     """CLI interface for week manager"""
     import argparse